@@ -0,0 +1,208 @@
+"""Off-event-loop DuckDB access for the dashboard API.
+
+The server runs one uvicorn worker and keeps every endpoint ``async def``.
+Endpoints that do heavy DuckDB work hand a plain sync function to
+``DbAccess`` instead of running it on the event loop:
+
+* ``read`` runs it on a bounded pool of reader threads;
+* ``write`` runs it on a single writer thread, so LinkStore writes routed
+  here are serialized;
+* ``write_soon`` queues it on that thread without waiting, for sync code
+  that has a write to make but no event loop to await it on.
+
+DuckDB connections are not thread-safe, so pool threads never touch the
+shared ``CorpusIndex`` / ``LinkStore`` connections.  ``view`` returns a
+per-thread shallow copy of the object whose ``_conn`` is a ``cursor()``
+(a separate connection to the same database); on any other thread —
+notably the event loop — it returns the object unchanged.
+
+Every call records how long it waited for a free thread and how long it
+ran, aggregated per endpoint name (see ``timings``).
+"""
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import copy
+import functools
+import os
+import threading
+import time
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, TypeVar
+
+T = TypeVar("T")
+
+DEFAULT_READ_WORKERS = max(2, min(8, os.cpu_count() or 2))
+
+
+@dataclass(slots=True)
+class EndpointTiming:
+    """Aggregated queue-wait / execution time for one endpoint."""
+
+    calls: int = 0
+    errors: int = 0
+    queue_wait_total_ms: float = 0.0
+    queue_wait_max_ms: float = 0.0
+    exec_total_ms: float = 0.0
+    exec_max_ms: float = 0.0
+
+    def add(self, queue_wait_ms: float, exec_ms: float, *, failed: bool) -> None:
+        self.calls += 1
+        self.errors += int(failed)
+        self.queue_wait_total_ms += queue_wait_ms
+        self.queue_wait_max_ms = max(self.queue_wait_max_ms, queue_wait_ms)
+        self.exec_total_ms += exec_ms
+        self.exec_max_ms = max(self.exec_max_ms, exec_ms)
+
+    def to_dict(self) -> dict[str, Any]:
+        calls = max(self.calls, 1)
+        return {
+            "calls": self.calls,
+            "errors": self.errors,
+            "queue_wait_avg_ms": round(self.queue_wait_total_ms / calls, 3),
+            "queue_wait_max_ms": round(self.queue_wait_max_ms, 3),
+            "exec_avg_ms": round(self.exec_total_ms / calls, 3),
+            "exec_max_ms": round(self.exec_max_ms, 3),
+        }
+
+
+class DbAccess:
+    """Reader pool + single writer for DuckDB-backed endpoint work.
+
+    Parameters
+    ----------
+    read_workers:
+        Number of reader threads (each holds its own cursors).
+    """
+
+    def __init__(self, *, read_workers: int = DEFAULT_READ_WORKERS) -> None:
+        self.read_workers = read_workers
+        self._readers = ThreadPoolExecutor(
+            max_workers=read_workers, thread_name_prefix="dashboard-db-read",
+        )
+        self._writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix="dashboard-db-write")
+        self._local = threading.local()
+        self._timings: dict[str, EndpointTiming] = {}
+        self._timings_lock = threading.Lock()
+
+    # ─── Execution ───────────────────────────────────────────────
+
+    async def read(
+        self, endpoint: str, fn: Callable[..., T], /, *args: Any, **kwargs: Any,
+    ) -> T:
+        """Run ``fn(*args, **kwargs)`` on a reader thread."""
+        return await self._submit(self._readers, endpoint, fn, args, kwargs)
+
+    async def write(
+        self, endpoint: str, fn: Callable[..., T], /, *args: Any, **kwargs: Any,
+    ) -> T:
+        """Run ``fn(*args, **kwargs)`` on the single writer thread."""
+        return await self._submit(self._writer, endpoint, fn, args, kwargs)
+
+    def write_soon(
+        self, endpoint: str, fn: Callable[..., Any], /, *args: Any, **kwargs: Any,
+    ) -> None:
+        """Queue ``fn(*args, **kwargs)`` on the writer thread; don't wait for it.
+
+        On the writer thread itself it runs inline.  Errors are counted in
+        ``timings`` and otherwise dropped, as is work queued after shutdown.
+        """
+        call = self._timed(self._writer, endpoint, fn, args, kwargs)
+        if getattr(self._local, "writer", False):
+            with contextlib.suppress(Exception):
+                call()
+            return
+        with contextlib.suppress(RuntimeError):
+            self._writer.submit(call)
+
+    async def _submit(
+        self,
+        executor: ThreadPoolExecutor,
+        endpoint: str,
+        fn: Callable[..., T],
+        args: tuple[Any, ...],
+        kwargs: dict[str, Any],
+    ) -> T:
+        call = self._timed(executor, endpoint, fn, args, kwargs)
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(executor, functools.partial(call))
+
+    def _timed(
+        self,
+        executor: ThreadPoolExecutor,
+        endpoint: str,
+        fn: Callable[..., T],
+        args: tuple[Any, ...],
+        kwargs: dict[str, Any],
+    ) -> Callable[[], T]:
+        """*fn* bound to its arguments, recording timings when run on *executor*."""
+        submitted = time.perf_counter()
+
+        def call() -> T:
+            started = time.perf_counter()
+            self._local.owned = True
+            self._local.writer = executor is self._writer
+            failed = True
+            try:
+                result = fn(*args, **kwargs)
+                failed = False
+                return result
+            finally:
+                finished = time.perf_counter()
+                self._record(
+                    endpoint,
+                    (started - submitted) * 1000.0,
+                    (finished - started) * 1000.0,
+                    failed=failed,
+                )
+
+        return call
+
+    def shutdown(self) -> None:
+        """Stop the pools (pending calls finish first)."""
+        self._readers.shutdown(wait=True)
+        self._writer.shutdown(wait=True)
+
+    # ─── Per-thread connections ──────────────────────────────────
+
+    def view(self, base: T) -> T:
+        """This thread's cursor-backed copy of *base*, or *base* off-pool.
+
+        *base* is any object holding its DuckDB connection in ``_conn``
+        (``CorpusIndex``, ``LinkStore``).  Copies are cached per thread and
+        rebuilt if the underlying object is replaced.
+        """
+        if base is None or not getattr(self._local, "owned", False):
+            return base
+        views: dict[int, tuple[Any, Any]] = self._local.__dict__.setdefault("views", {})
+        cached = views.get(id(base))
+        if cached is None or cached[0] is not base:
+            clone = copy.copy(base)
+            clone._conn = base._conn.cursor()  # noqa: SLF001
+            cached = (base, clone)
+            views[id(base)] = cached
+        return cached[1]
+
+    # ─── Timings ─────────────────────────────────────────────────
+
+    def _record(
+        self, endpoint: str, queue_wait_ms: float, exec_ms: float, *, failed: bool,
+    ) -> None:
+        with self._timings_lock:
+            timing = self._timings.get(endpoint)
+            if timing is None:
+                timing = EndpointTiming()
+                self._timings[endpoint] = timing
+            timing.add(queue_wait_ms, exec_ms, failed=failed)
+
+    def timings(self) -> dict[str, dict[str, Any]]:
+        """Per-endpoint timing summary, sorted by endpoint name."""
+        with self._timings_lock:
+            return {name: self._timings[name].to_dict() for name in sorted(self._timings)}
+
+    def reset_timings(self) -> None:
+        with self._timings_lock:
+            self._timings.clear()
@@ -0,0 +1,191 @@
+"""Corpus-version-keyed response cache for dashboard analytics endpoints.
+
+``corpus.duckdb`` is opened read-only and only changes on rebuild, so the
+full-table aggregates behind the overview / stats / quality endpoints are
+pure functions of (endpoint, query params, corpus run).  ``ResponseCache``
+memoizes their JSON payloads under that key:
+
+* in memory, bounded by ``max_entries`` with LRU eviction;
+* optionally on disk (``persist_dir``): one JSON file per entry in a
+  directory per corpus version, so a restarted server starts warm.  The
+  first time a version is used, directories of other versions are pruned.
+
+``cached`` wraps an ``async def`` FastAPI endpoint (its signature is kept,
+so FastAPI still sees the query parameters).  Errors are never cached.
+Hit / miss / eviction counters are reported by ``stats``.
+"""
+from __future__ import annotations
+
+import functools
+import hashlib
+import json
+import os
+import re
+import shutil
+import threading
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
+from pathlib import Path
+from typing import Any, TypeVar
+
+import orjson
+
+F = TypeVar("F", bound=Callable[..., Awaitable[Any]])
+
+DEFAULT_MAX_ENTRIES = 512
+
+_UNSAFE_PATH_CHARS = re.compile(r"[^A-Za-z0-9_.-]")
+
+
+class ResponseCache:
+    """LRU map of ``(corpus_version, endpoint, params) -> response payload``.
+
+    Parameters
+    ----------
+    max_entries:
+        In-memory entry bound; least recently used entries are evicted.
+    persist_dir:
+        Optional directory for the on-disk copy (None = memory only).
+    """
+
+    def __init__(
+        self,
+        *,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        persist_dir: Path | None = None,
+    ) -> None:
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[tuple[str, str, str], Any] = OrderedDict()
+        self.configure(max_entries=max_entries, persist_dir=persist_dir)
+
+    def configure(self, *, max_entries: int, persist_dir: Path | None) -> None:
+        """Change the bounds / persistence (clears memory and counters)."""
+        with self._lock:
+            self.max_entries = max(1, max_entries)
+            self.persist_dir = persist_dir
+            self._entries.clear()
+            self._pruned_versions: set[str] = set()
+            self._hits = 0
+            self._disk_hits = 0
+            self._misses = 0
+            self._evictions = 0
+
+    # ─── Lookup / store ──────────────────────────────────────────
+
+    @staticmethod
+    def _params_key(params: dict[str, Any]) -> str:
+        return json.dumps(params, sort_keys=True, default=str, separators=(",", ":"))
+
+    def get(self, version: str, endpoint: str, params: dict[str, Any]) -> tuple[bool, Any]:
+        """``(True, payload)`` on a hit (memory, then disk), else ``(False, None)``."""
+        key = (version, endpoint, self._params_key(params))
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self._hits += 1
+                return True, self._entries[key]
+        path = self._entry_path(key)
+        if path is not None and path.exists():
+            try:
+                value = orjson.loads(path.read_bytes())
+            except (OSError, orjson.JSONDecodeError):
+                pass
+            else:
+                with self._lock:
+                    self._disk_hits += 1
+                    self._insert(key, value)
+                return True, value
+        with self._lock:
+            self._misses += 1
+        return False, None
+
+    def put(self, version: str, endpoint: str, params: dict[str, Any], value: Any) -> None:
+        """Store *value*; also on disk when persistence is enabled."""
+        key = (version, endpoint, self._params_key(params))
+        with self._lock:
+            self._insert(key, value)
+        path = self._entry_path(key)
+        if path is None:
+            return
+        try:
+            payload = orjson.dumps(value)
+        except TypeError:
+            return  # not JSON-serializable: keep it in memory only
+        try:
+            self._prune_other_versions(version)
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+            tmp.write_bytes(payload)
+            os.replace(tmp, path)
+        except OSError:
+            pass  # the disk copy is best-effort
+
+    def _insert(self, key: tuple[str, str, str], value: Any) -> None:
+        self._entries[key] = value
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self._evictions += 1
+
+    def _entry_path(self, key: tuple[str, str, str]) -> Path | None:
+        if self.persist_dir is None:
+            return None
+        version, endpoint, params_key = key
+        digest = hashlib.sha256(f"{endpoint}\0{params_key}".encode()).hexdigest()[:32]
+        version_dir = _UNSAFE_PATH_CHARS.sub("_", version)
+        return self.persist_dir / version_dir / f"{endpoint}-{digest}.json"
+
+    def _prune_other_versions(self, version: str) -> None:
+        if self.persist_dir is None or version in self._pruned_versions:
+            return
+        self._pruned_versions.add(version)
+        keep = _UNSAFE_PATH_CHARS.sub("_", version)
+        if not self.persist_dir.is_dir():
+            return
+        for child in self.persist_dir.iterdir():
+            if child.is_dir() and child.name != keep:
+                shutil.rmtree(child, ignore_errors=True)
+
+    # ─── Endpoint decorator ──────────────────────────────────────
+
+    def cached(self, endpoint: str, version: Callable[[], str | None]) -> Callable[[F], F]:
+        """Serve an async endpoint from the cache, keyed by its kwargs.
+
+        *version* returns the current corpus version, or None to bypass the
+        cache (e.g. no corpus loaded — the endpoint then raises as usual).
+        """
+        def decorate(fn: F) -> F:
+            @functools.wraps(fn)
+            async def wrapper(**params: Any) -> Any:
+                corpus_version = version()
+                if corpus_version is None:
+                    return await fn(**params)
+                hit, value = self.get(corpus_version, endpoint, params)
+                if hit:
+                    return value
+                value = await fn(**params)
+                self.put(corpus_version, endpoint, params, value)
+                return value
+
+            return wrapper  # type: ignore[return-value]
+
+        return decorate
+
+    # ─── Reporting ───────────────────────────────────────────────
+
+    def stats(self) -> dict[str, Any]:
+        """Counters for ``/api/health``."""
+        with self._lock:
+            lookups = self._hits + self._disk_hits + self._misses
+            return {
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "hits": self._hits,
+                "disk_hits": self._disk_hits,
+                "misses": self._misses,
+                "evictions": self._evictions,
+                "hit_rate": (
+                    round((self._hits + self._disk_hits) / lookups, 3) if lookups else 0.0
+                ),
+                "persist_dir": str(self.persist_dir) if self.persist_dir else None,
+            }
@@ -30,7 +30,7 @@ from fastapi import Body, FastAPI, HTTPException, Query, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel, Field
-from starlette.responses import StreamingResponse
+from starlette.responses import FileResponse, StreamingResponse
 
 # Add Agent src to path so we can import agent modules
 _project_root = Path(__file__).resolve().parents[2]
@@ -42,6 +42,9 @@ if str(_agent_src) not in sys.path:
     sys.path.insert(0, str(_agent_src))
 
 from agent.corpus import CorpusIndex  # noqa: E402
+from dashboard.api.db_access import DbAccess  # noqa: E402
+from dashboard.api.response_cache import DEFAULT_MAX_ENTRIES, ResponseCache  # noqa: E402
+from agent.preview_engine import PreviewEngine, candidate_delta, corpus_version  # noqa: E402
 from agent.link_store import LinkStore  # noqa: E402
 from agent.conflict_matrix import (  # noqa: E402
     build_conflict_matrix,
@@ -62,24 +65,59 @@ from agent.query_filters import (  # noqa: E402
     meta_filter_to_json,
 )
 from agent.rule_dsl import (  # noqa: E402
+    ProximityOp,
     dsl_from_heading_ast,
     heading_ast_from_dsl,
     parse_dsl,
     validate_dsl,
 )
 from agent.query_filters import build_multi_field_sql  # noqa: E402
+from agent.edge_cases import (  # noqa: E402
+    DEEP_RESET_PREV_LEVEL,
+    DEF_TRUNC_CAP,
+    EDGE_CASE_CATEGORIES,
+    EDGE_CASE_COLUMNS,
+    EDGE_CASES_TABLE,
+    ROOT_REPEAT_THRESHOLD,
+    build_edge_case_union,
+    get_tier,
+)
+from agent.proximity import (  # noqa: E402
+    SECTION_TOKENS_TABLE,
+    build_proximity_prefilter_sql,
+    build_proximity_span_sql,
+    proximity_matches,
+)
 
 # ---------------------------------------------------------------------------
 # Globals
 #
 # IMPORTANT: DuckDB connections are NOT thread-safe. This server MUST run with
-# a single uvicorn worker (the default) and all endpoints MUST remain async def
-# so they execute on the single event loop thread. Do NOT convert endpoints to
-# sync def (which would use a thread pool) or use --workers N > 1.
+# a single uvicorn worker (the default) and all endpoints MUST remain async def.
+# Do NOT convert endpoints to sync def (which would use a thread pool with the
+# shared connections) or use --workers N > 1.
+#
+# Heavy endpoints instead pass a sync function to ``_db.read`` (reader thread
+# pool) or ``_db.write`` (single writer thread).  Every LinkStore mutation
+# goes through ``_db.write`` (or ``_db.write_soon`` from sync helpers), so
+# writes are serialized with each other.  Inside those threads
+# ``_get_corpus()`` / ``_get_link_store()`` return per-thread cursor-backed
+# views, so the shared connections are only ever used on the event loop.
 # ---------------------------------------------------------------------------
+_db = DbAccess()
 _corpus: CorpusIndex | None = None
 _corpus_db_path = Path(__file__).resolve().parents[2] / "corpus_index" / "corpus.duckdb"
 
+# Cached corpus-wide analytics responses, keyed by corpus version (see
+# response_cache.py).  Sized by DASHBOARD_RESPONSE_CACHE_SIZE; set
+# DASHBOARD_RESPONSE_CACHE_DIR to keep a disk copy across restarts.
+_response_cache = ResponseCache()
+_corpus_version_memo: tuple[CorpusIndex, str] | None = None
+
+# Section-key sets of rule sub-expressions, reused across link previews of
+# successive rule edits (see agent/preview_engine.py).
+_preview_engine = PreviewEngine()
+
 # Ontology in-memory data (loaded at startup from production JSON)
 _ontology_nodes: dict[str, dict[str, Any]] = {}
 _ontology_tree: list[dict[str, Any]] = []
@@ -96,6 +134,8 @@ _workspace_root = Path(__file__).resolve().parents[2] / "workspaces"
 
 # Link store globals
 _links_db_path = Path(__file__).resolve().parents[2] / "corpus_index" / "links.duckdb"
+# Export job files (written by the worker, served by /api/links/export/{job_id}).
+_links_export_dir = _links_db_path.parent / "exports"
 _link_store: LinkStore | None = None
 _conflict_policies: dict[tuple[str, str], ConflictPolicy] = {}
 _worker_proc: Any = None
@@ -118,7 +158,25 @@ def _get_corpus() -> CorpusIndex:
             status_code=503,
             detail="Corpus index not available. Run build_corpus_index.py first.",
         )
-    return _corpus
+    return _db.view(_corpus)
+
+
+def _corpus_version() -> str | None:
+    """Response-cache version of the loaded corpus (None when not loaded).
+
+    See ``agent.preview_engine.corpus_version``.
+    """
+    global _corpus_version_memo  # noqa: PLW0603
+    corpus = _corpus
+    if corpus is None:
+        return None
+    if _corpus_version_memo is not None and _corpus_version_memo[0] is corpus:
+        return _corpus_version_memo[1]
+    version = corpus_version(corpus, _corpus_db_path)
+    if version is None:
+        return None
+    _corpus_version_memo = (corpus, version)
+    return version
 
 
 def _get_ontology() -> None:
@@ -371,7 +429,13 @@ def _load_dotenv() -> None:
 async def lifespan(app: FastAPI):  # noqa: ARG001
     _load_dotenv()
 
-    global _corpus  # noqa: PLW0603
+    global _corpus, _db  # noqa: PLW0603
+    _db = DbAccess()
+    cache_dir = os.environ.get("DASHBOARD_RESPONSE_CACHE_DIR", "").strip()
+    _response_cache.configure(
+        max_entries=int(os.environ.get("DASHBOARD_RESPONSE_CACHE_SIZE", DEFAULT_MAX_ENTRIES)),
+        persist_dir=Path(cache_dir) if cache_dir else None,
+    )
     if _corpus_db_path.exists():
         try:
             _corpus = CorpusIndex(_corpus_db_path)
@@ -419,11 +483,9 @@ async def lifespan(app: FastAPI):  # noqa: ARG001
     try:
         _links_db_path.parent.mkdir(parents=True, exist_ok=True)
         _link_store = LinkStore(_links_db_path, create_if_missing=True)
-        if _ontology_nodes:
-            mapped = _bootstrap_legacy_family_aliases(_link_store)
-            if mapped:
-                print(f"[dashboard] Legacy scope aliases refreshed: {mapped}")
-        _link_store.run_cleanup()
+        mapped = await _db.write("startup", _prepare_link_store_sync)
+        if mapped:
+            print(f"[dashboard] Legacy scope aliases refreshed: {mapped}")
         print(f"[dashboard] Link store loaded: {_links_db_path}")
     except Exception as e:
         print(f"[dashboard] Warning: could not open link store: {e}")
@@ -437,13 +499,7 @@ async def lifespan(app: FastAPI):  # noqa: ARG001
             print(f"[dashboard] Conflict matrix: {len(_conflict_policies)} pairs")
             # Persist conflict policies to link store
             if _link_store is not None:
-                for p in policies:
-                    _link_store.save_conflict_policy({
-                        "family_a": p.family_a,
-                        "family_b": p.family_b,
-                        "policy": p.policy,
-                        "reason": p.reason,
-                    })
+                await _db.write("startup", _save_conflict_policies_sync, policies)
         except Exception as e:
             print(f"[dashboard] Warning: could not build conflict matrix: {e}")
 
@@ -455,6 +511,7 @@ async def lifespan(app: FastAPI):  # noqa: ARG001
                 sys.executable,
                 str(Path(__file__).resolve().parents[2] / "scripts" / "link_worker.py"),
                 "--links-db", str(_links_db_path),
+                "--export-dir", str(_links_export_dir),
             ]
             if _corpus_db_path.exists():
                 worker_cmd.extend(["--db", str(_corpus_db_path)])
@@ -477,6 +534,7 @@ async def lifespan(app: FastAPI):  # noqa: ARG001
         except Exception:
             _worker_proc.kill()
         print("[dashboard] Worker stopped")
+    _db.shutdown()
     if _link_store is not None:
         _link_store.close()
     if _corpus is not None:
@@ -1159,9 +1217,17 @@ async def health():
         "corpus_loaded": _corpus is not None,
         "doc_count": _corpus.doc_count if _corpus else 0,
         "links_loaded": _link_store is not None,
+        "response_cache": _response_cache.stats(),
+        "preview_engine": _preview_engine.stats(),
     }
 
 
+@app.get("/api/health/db-timing")
+async def health_db_timing():
+    """Per-endpoint queue-wait and execution time for off-loop DuckDB work."""
+    return {"read_workers": _db.read_workers, "endpoints": _db.timings()}
+
+
 # ---------------------------------------------------------------------------
 # Routes: Overview
 # ---------------------------------------------------------------------------
@@ -1171,6 +1237,7 @@ _DISTRIBUTION_METRICS = {
 }
 
 @app.get("/api/overview/kpis")
+@_response_cache.cached("overview_kpis", _corpus_version)
 async def overview_kpis(cohort_only: bool = Query(False)):
     """KPI cards for the overview page."""
     corpus = _get_corpus()
@@ -1214,6 +1281,7 @@ async def overview_kpis(cohort_only: bool = Query(False)):
 
 
 @app.get("/api/overview/distributions")
+@_response_cache.cached("overview_distributions", _corpus_version)
 async def overview_distributions(
     metric: str = Query(
         ...,
@@ -1283,6 +1351,7 @@ async def overview_distributions(
 
 
 @app.get("/api/overview/cohort-funnel")
+@_response_cache.cached("overview_cohort_funnel", _corpus_version)
 async def overview_cohort_funnel():
     """Cohort funnel: total -> by doc_type -> by market_segment."""
     corpus = _get_corpus()
@@ -1568,6 +1637,7 @@ async def scatter(
 # Routes: Corpus Statistics
 # ---------------------------------------------------------------------------
 @app.get("/api/stats/metric")
+@_response_cache.cached("stats_metric", _corpus_version)
 async def stats_metric(
     metric: str = Query(
         "word_count",
@@ -1704,18 +1774,7 @@ async def stats_metric(
 # ---------------------------------------------------------------------------
 # Routes: Corpus Text Search (KWIC)
 # ---------------------------------------------------------------------------
-@app.get("/api/search/text")
-async def search_text(
-    q: str = Query(
-        ...,
-        min_length=1,
-        max_length=500,
-        description="Search pattern (case-insensitive substring match)",
-    ),
-    context_chars: int = Query(200, ge=20, le=1000),
-    max_results: int = Query(100, ge=1, le=500),
-    cohort_only: bool = Query(True),
-):
+def _search_text_sync(q: str, context_chars: int, max_results: int, cohort_only: bool) -> Any:
     """Full-text KWIC search across all section text in the corpus.
 
     Returns keyword-in-context results with surrounding text for each match.
@@ -1771,10 +1830,29 @@ async def search_text(
     }
 
 
+@app.get("/api/search/text")
+async def search_text(
+    q: str = Query(
+        ...,
+        min_length=1,
+        max_length=500,
+        description="Search pattern (case-insensitive substring match)",
+    ),
+    context_chars: int = Query(200, ge=20, le=1000),
+    max_results: int = Query(100, ge=1, le=500),
+    cohort_only: bool = Query(True),
+):
+    """Full-text KWIC search across all section text in the corpus."""
+    return await _db.read(
+        "search_text", _search_text_sync, q, context_chars, max_results, cohort_only,
+    )
+
+
 # ---------------------------------------------------------------------------
 # Routes: Definition Explorer
 # ---------------------------------------------------------------------------
 @app.get("/api/definitions/frequency")
+@_response_cache.cached("definition_frequency", _corpus_version)
 async def definition_frequency(
     term_pattern: str | None = Query(
         None,
@@ -1899,6 +1977,7 @@ async def definition_variants(
 # Routes: Parsing Quality
 # ---------------------------------------------------------------------------
 @app.get("/api/quality/summary")
+@_response_cache.cached("quality_summary", _corpus_version)
 async def quality_summary():
     """Aggregate parsing quality metrics across the corpus."""
     corpus = _get_corpus()
@@ -2101,663 +2180,93 @@ async def quality_anomalies(
 # Routes: Edge Case Inspector
 # ---------------------------------------------------------------------------
 
-# Edge-case anomaly thresholds (calibrated on current corpus)
-_DEF_TRUNC_CAP = 1999
-_DEF_TRUNC_MIN_PER_DOC = 5
-_DEF_MALFORMED_MIN_PER_DOC = 20
-
-_ROOT_REPEAT_THRESHOLD = 200
-
-_DUP_BURST_MIN_STRUCTURAL = 200
-_DUP_BURST_RATIO = 0.90
-
-_DEEP_RESET_PREV_LEVEL = 4
-_DEEP_RESET_MIN_PER_SECTION = 2
-
-# Tier-based category registry (38 categories across 6 tiers)
-_EDGE_CASE_TIERS: dict[str, list[str]] = {
-    "structural": [
-        "missing_sections", "low_section_count", "excessive_section_count",
-        "section_fallback_used", "section_numbering_gap", "empty_section_headings",
-    ],
-    "clauses": [
-        "zero_clauses", "low_clause_density", "low_avg_clause_confidence",
-        "orphan_deep_clause", "inconsistent_sibling_depth",
-        "deep_nesting_outlier", "low_structural_ratio", "rootless_deep_clause",
-        "clause_root_label_repeat_explosion", "clause_dup_id_burst",
-        "clause_depth_reset_after_deep",
-    ],
-    "definitions": [
-        "low_definitions", "zero_definitions", "high_definition_count",
-        "duplicate_definitions", "single_engine_definitions",
-        "definition_truncated_at_cap", "definition_signature_leak",
-        "definition_malformed_term",
-    ],
-    "metadata": [
-        "extreme_facility", "missing_borrower", "missing_facility_size",
-        "missing_closing_date", "unknown_doc_type",
-    ],
-    "document": [
-        "extreme_word_count", "short_text", "extreme_text_ratio",
-        "very_short_document",
-    ],
-    "template": [
-        "orphan_template", "non_credit_agreement", "uncertain_market_segment",
-        "non_cohort_large_doc",
-    ],
-}
-
-_CATEGORY_TO_TIER: dict[str, str] = {
-    cat: tier for tier, cats in _EDGE_CASE_TIERS.items() for cat in cats
-}
-_EDGE_CASE_CATEGORIES = {"all"} | set(_CATEGORY_TO_TIER)
-
-
-def _get_tier(category: str) -> str:
-    return _CATEGORY_TO_TIER.get(category, "unknown")
-
-
-# Standard SELECT columns shared by all edge-case category queries
-_EC_COLS = (
-    "doc_id, borrower, {cat!r} as category, {sev!r} as severity, "
-    "{detail} as detail, "
-    "doc_type, market_segment, word_count, section_count, definition_count, "
-    "clause_count, facility_size_mm"
-)
-
-
-def _doc_q(cohort_where: str, cat: str, severity: str, detail: str, where: str) -> str:
-    """Build a simple documents-table-only category query."""
-    cols = _EC_COLS.format(cat=cat, sev=severity, detail=detail)
-    return f"SELECT {cols} FROM documents {cohort_where} {where}"
-
-
-def _build_doc_category_queries(cohort_where: str) -> list[tuple[str, list[Any]]]:
-    """Categories querying only the documents table (no JOINs)."""
-    queries: list[tuple[str, list[Any]]] = []
-
-    # --- Structural ---
-    # 1. missing_sections (existing, enriched detail)
-    queries.append((
-        f"SELECT doc_id, borrower, 'missing_sections' as category, 'high' as severity, "
-        f"CASE "
-        f"  WHEN word_count < 500 THEN 'Short document (' || word_count || ' words) — likely amendment or supplement' "
-        f"  WHEN doc_type NOT IN ('credit_agreement', 'other', '') "
-        f"    THEN 'Non-credit-agreement document (doc_type: ' || doc_type || ')' "
-        f"  WHEN word_count > 5000 "
-        f"    THEN 'Parser gap — ' || word_count || '-word CA with non-standard heading format' "
-        f"  ELSE 'No sections extracted from document' "
-        f"END as detail, "
-        f"doc_type, market_segment, word_count, section_count, definition_count, "
-        f"clause_count, facility_size_mm "
-        f"FROM documents {cohort_where} section_count = 0",
-        [],
-    ))
-    # 2. low_section_count
-    queries.append((_doc_q(
-        cohort_where, "low_section_count", "medium",
-        "'Only ' || section_count || ' sections in ' || word_count || '-word document'",
-        "section_count BETWEEN 1 AND 4 AND word_count > 5000",
-    ), []))
-    # 4. section_fallback_used
-    queries.append((_doc_q(
-        cohort_where, "section_fallback_used", "low",
-        "'Parser used fallback heuristic to detect ' || section_count || ' sections'",
-        "section_fallback_used = true AND section_count > 0",
-    ), []))
-
-    # --- Clauses ---
-    # 7. zero_clauses (existing)
-    queries.append((_doc_q(
-        cohort_where, "zero_clauses", "medium",
-        "'Sections exist but no clauses parsed'",
-        "clause_count = 0 AND section_count > 0",
-    ), []))
-    # 8. low_clause_density (uses only documents table columns)
-    queries.append((_doc_q(
-        cohort_where, "low_clause_density", "medium",
-        "'Clause density ' || ROUND(CAST(clause_count AS DOUBLE) / section_count, 1) || ' per section (expected >= 3)'",
-        "clause_count > 0 AND section_count > 0 AND CAST(clause_count AS DOUBLE) / section_count < 2.0",
-    ), []))
-
-    # --- Definitions ---
-    # 15. low_definitions (existing)
-    queries.append((_doc_q(
-        cohort_where, "low_definitions", "medium",
-        "'Fewer than 20 definitions in document with >10K words'",
-        "definition_count < 20 AND word_count > 10000",
-    ), []))
-    # 16. zero_definitions
-    queries.append((_doc_q(
-        cohort_where, "zero_definitions", "high",
-        "'No definitions extracted from ' || word_count || '-word document'",
-        "definition_count = 0 AND word_count > 5000",
-    ), []))
-    # 17. high_definition_count
-    queries.append((_doc_q(
-        cohort_where, "high_definition_count", "medium",
-        "definition_count || ' definitions detected — possible extraction noise'",
-        "definition_count > 500",
-    ), []))
-
-    # --- Metadata ---
-    # 20. extreme_facility (existing)
-    queries.append((_doc_q(
-        cohort_where, "extreme_facility", "low",
-        "'Facility size outside typical range'",
-        "facility_size_mm IS NOT NULL AND (facility_size_mm > 10000 OR facility_size_mm < 1)",
-    ), []))
-    # 21. missing_borrower
-    queries.append((_doc_q(
-        cohort_where, "missing_borrower", "medium",
-        "'No borrower name extracted from document'",
-        "borrower IS NULL OR TRIM(borrower) = ''",
-    ), []))
-    # 22. missing_facility_size
-    queries.append((_doc_q(
-        cohort_where, "missing_facility_size", "medium",
-        "'No facility size extracted from ' || word_count || '-word document'",
-        "facility_size_mm IS NULL AND word_count > 5000",
-    ), []))
-    # 23. missing_closing_date
-    queries.append((_doc_q(
-        cohort_where, "missing_closing_date", "low",
-        "'No closing date extracted from document'",
-        "closing_date IS NULL AND word_count > 5000",
-    ), []))
-    # 24. unknown_doc_type
-    queries.append((_doc_q(
-        cohort_where, "unknown_doc_type", "high",
-        "'Low-confidence doc type classification: ' || COALESCE(doc_type, 'NULL')",
-        "doc_type_confidence = 'low' OR doc_type IN ('', 'other') OR doc_type IS NULL",
-    ), []))
-
-    # --- Document Quality ---
-    # 26. short_text
-    queries.append((_doc_q(
-        cohort_where, "short_text", "medium",
-        "'Document text is only ' || text_length || ' characters (expected > 10K)'",
-        "text_length < 10000 AND text_length > 0",
-    ), []))
-    # 27. extreme_text_ratio
-    queries.append((_doc_q(
-        cohort_where, "extreme_text_ratio", "medium",
-        "'Text/word ratio ' || ROUND(CAST(text_length AS DOUBLE) / word_count, 1) || ' (expected ~6) — possible HTML artifact bloat'",
-        "word_count > 0 AND CAST(text_length AS DOUBLE) / word_count > 15.0",
-    ), []))
-    # 28. very_short_document
-    queries.append((_doc_q(
-        cohort_where, "very_short_document", "high",
-        "'Only ' || word_count || ' words — likely amendment/supplement'",
-        "word_count < 5000 AND word_count > 0",
-    ), []))
-
-    # --- Template/Structure ---
-    # 29. orphan_template
-    queries.append((_doc_q(
-        cohort_where, "orphan_template", "low",
-        "'Document not assigned to any template family'",
-        "template_family IS NULL OR TRIM(template_family) = ''",
-    ), []))
-    # 30. non_credit_agreement
-    queries.append((_doc_q(
-        cohort_where, "non_credit_agreement", "medium",
-        "'Document classified as ' || doc_type || ' (confidence: ' || COALESCE(doc_type_confidence, 'N/A') || ')'",
-        "doc_type NOT IN ('credit_agreement', '') AND doc_type IS NOT NULL AND word_count > 1000",
-    ), []))
-    # 31. uncertain_market_segment
-    queries.append((_doc_q(
-        cohort_where, "uncertain_market_segment", "low",
-        "'Market segment uncertain — could not determine leveraged vs. investment grade'",
-        "segment_confidence = 'low' AND market_segment = 'uncertain'",
-    ), []))
-    # 32. non_cohort_large_doc
-    queries.append((_doc_q(
-        cohort_where, "non_cohort_large_doc", "low",
-        "word_count || '-word document excluded from cohort'",
-        "cohort_included = false AND word_count > 10000",
-    ), []))
-
-    return queries
-
-
-def _build_join_category_queries(cohort_where: str) -> list[tuple[str, list[Any]]]:
-    """Categories requiring JOINs against clauses, definitions, or sections tables."""
-    queries: list[tuple[str, list[Any]]] = []
-    # Cohort filter for subqueries that start from non-documents tables
-    cohort_join = "JOIN documents d ON sub.doc_id = d.doc_id" if "cohort_included" not in cohort_where else (
-        "JOIN documents d ON sub.doc_id = d.doc_id WHERE d.cohort_included = true"
-    )
-    # Simpler: always JOIN documents, apply cohort filter if needed
-    cohort_doc_filter = " AND d.cohort_included = true" if "cohort_included" in cohort_where else ""
-
-    _cols = (
-        "sub.doc_id, d.borrower, {cat!r} as category, {sev!r} as severity, "
-        "{detail} as detail, "
-        "d.doc_type, d.market_segment, d.word_count, d.section_count, d.definition_count, "
-        "d.clause_count, d.facility_size_mm"
-    )
 
-    # --- Clause depth anomalies (user priority) ---
+def _edge_case_table_run_id(corpus: CorpusIndex) -> str | None:
+    """Run id to page the materialized ``edge_cases`` table by.
 
-    # 9. low_avg_clause_confidence
-    cols = _cols.format(
-        cat="low_avg_clause_confidence", sev="high",
-        detail="'Average clause confidence ' || sub.avg_conf || ' across ' || sub.n_clauses || ' clauses (threshold 0.4)'",
-    )
-    queries.append((
-        f"SELECT {cols} FROM ("
-        f"  SELECT c.doc_id, ROUND(AVG(c.parse_confidence), 3) as avg_conf, COUNT(*) as n_clauses"
-        f"  FROM clauses c JOIN documents dd ON c.doc_id = dd.doc_id"
-        f"  WHERE dd.clause_count > 10"
-        f"  GROUP BY c.doc_id HAVING AVG(c.parse_confidence) < 0.4"
-        f") sub JOIN documents d ON sub.doc_id = d.doc_id"
-        f"{cohort_doc_filter}",
-        [],
-    ))
-
-    # 10. orphan_deep_clause — uses tree_level >= 3 (from clause_id path)
-    cols = _cols.format(
-        cat="orphan_deep_clause", sev="high",
-        detail="sub.orphan_count || ' orphaned deep clauses (tree level >= 3, missing parent)'",
-    )
-    queries.append((
-        f"SELECT {cols} FROM ("
-        f"  SELECT ci.doc_id, COUNT(*) as orphan_count"
-        f"  FROM (SELECT *, ARRAY_LENGTH(STRING_SPLIT(clause_id, '.')) AS tree_level FROM clauses) ci"
-        f"  LEFT JOIN clauses p ON ci.doc_id = p.doc_id AND ci.section_number = p.section_number AND ci.parent_id = p.clause_id"
-        f"  WHERE ci.tree_level >= 3 AND ci.is_structural = true AND ci.parent_id != '' AND p.clause_id IS NULL"
-        f"  GROUP BY ci.doc_id"
-        f") sub JOIN documents d ON sub.doc_id = d.doc_id"
-        f"{cohort_doc_filter}",
-        [],
-    ))
-
-    # 12. inconsistent_sibling_depth — uses tree_level (from clause_id path)
-    cols = _cols.format(
-        cat="inconsistent_sibling_depth", sev="high",
-        detail="sub.bad_groups || ' parent groups with inconsistent tree levels (' || sub.affected || ' clauses)'",
-    )
-    queries.append((
-        f"SELECT {cols} FROM ("
-        f"  SELECT doc_id, COUNT(*) as bad_groups, SUM(n_siblings) as affected FROM ("
-        f"    SELECT doc_id, parent_id, section_number, COUNT(*) as n_siblings"
-        f"    FROM (SELECT *, ARRAY_LENGTH(STRING_SPLIT(clause_id, '.')) AS tree_level FROM clauses) c"
-        f"    WHERE c.is_structural = true AND c.parent_id != ''"
-        f"    GROUP BY doc_id, section_number, parent_id"
-        f"    HAVING COUNT(DISTINCT tree_level) > 1"
-        f"  ) g GROUP BY doc_id"
-        f") sub JOIN documents d ON sub.doc_id = d.doc_id"
-        f"{cohort_doc_filter}",
-        [],
-    ))
-
-    # 13. deep_nesting_outlier — uses tree_level > 4 (from clause_id path)
-    cols = _cols.format(
-        cat="deep_nesting_outlier", sev="low",
-        detail="'Max tree level ' || sub.max_level || ' with ' || sub.deep_count || ' clauses beyond level 4'",
-    )
-    queries.append((
-        f"SELECT {cols} FROM ("
-        f"  SELECT doc_id, MAX(tree_level) as max_level, COUNT(*) as deep_count"
-        f"  FROM (SELECT *, ARRAY_LENGTH(STRING_SPLIT(clause_id, '.')) AS tree_level FROM clauses) c"
-        f"  WHERE c.is_structural = true AND c.tree_level > 4"
-        f"  GROUP BY doc_id"
-        f") sub JOIN documents d ON sub.doc_id = d.doc_id"
-        f"{cohort_doc_filter}",
-        [],
-    ))
-
-    # 14. low_structural_ratio
-    cols = _cols.format(
-        cat="low_structural_ratio", sev="medium",
-        detail="'Only ' || sub.pct || '% structural (' || sub.structural || '/' || sub.total || ')'",
-    )
-    queries.append((
-        f"SELECT {cols} FROM ("
-        f"  SELECT doc_id, COUNT(*) as total,"
-        f"    SUM(CASE WHEN is_structural THEN 1 ELSE 0 END) as structural,"
-        f"    ROUND(100.0 * SUM(CASE WHEN is_structural THEN 1 ELSE 0 END) / COUNT(*), 1) as pct"
-        f"  FROM clauses GROUP BY doc_id HAVING COUNT(*) >= 10"
-        f") sub JOIN documents d ON sub.doc_id = d.doc_id"
-        f" WHERE sub.pct < 50.0{cohort_doc_filter}",
-        [],
-    ))
-
-    # 15. rootless_deep_clause — tree_level > 1 with empty parent_id
-    cols = _cols.format(
-        cat="rootless_deep_clause", sev="medium",
-        detail="sub.rootless_count || ' clauses with tree level > 1 but no parent link'",
-    )
-    queries.append((
-        f"SELECT {cols} FROM ("
-        f"  SELECT doc_id, COUNT(*) as rootless_count"
-        f"  FROM (SELECT *, ARRAY_LENGTH(STRING_SPLIT(clause_id, '.')) AS tree_level FROM clauses) c"
-        f"  WHERE c.tree_level > 1 AND c.is_structural = true AND (c.parent_id IS NULL OR c.parent_id = '')"
-        f"  GROUP BY doc_id"
-        f") sub JOIN documents d ON sub.doc_id = d.doc_id"
-        f"{cohort_doc_filter}",
-        [],
-    ))
-
-    # --- Definition JOINs ---
-
-    # 18. duplicate_definitions
-    cols = _cols.format(
-        cat="duplicate_definitions", sev="low",
-        detail="sub.dup_term_count || ' terms defined multiple times in same document'",
-    )
-    queries.append((
-        f"SELECT {cols} FROM ("
-        f"  SELECT doc_id, COUNT(*) as dup_term_count FROM ("
-        f"    SELECT doc_id, term FROM definitions GROUP BY doc_id, term HAVING COUNT(*) > 1"
-        f"  ) inner_sub GROUP BY doc_id"
-        f") sub JOIN documents d ON sub.doc_id = d.doc_id"
-        f"{cohort_doc_filter}",
-        [],
-    ))
-
-    # 19. single_engine_definitions
-    cols = _cols.format(
-        cat="single_engine_definitions", sev="low",
-        detail="'All ' || sub.def_count || ' definitions extracted by single engine: ' || sub.sole_engine",
-    )
-    queries.append((
-        f"SELECT {cols} FROM ("
-        f"  SELECT doc_id, MIN(pattern_engine) as sole_engine, COUNT(*) as def_count"
-        f"  FROM definitions GROUP BY doc_id"
-        f"  HAVING COUNT(DISTINCT pattern_engine) = 1 AND COUNT(*) >= 10"
-        f") sub JOIN documents d ON sub.doc_id = d.doc_id"
-        f"{cohort_doc_filter}",
-        [],
-    ))
-
-    # 33. definition_truncated_at_cap
-    cols = _cols.format(
-        cat="definition_truncated_at_cap", sev="high",
-        detail="sub.trunc_count || ' definitions hit extraction cap (>= ' || "
-        f"CAST({_DEF_TRUNC_CAP} AS VARCHAR) || ' chars)'",
-    )
-    queries.append((
-        f"SELECT {cols} FROM ("
-        f"  SELECT doc_id, COUNT(*) as trunc_count"
-        f"  FROM definitions"
-        f"  WHERE LENGTH(COALESCE(definition_text, '')) >= {_DEF_TRUNC_CAP}"
-        f"    AND pattern_engine IN ('quoted', 'smart_quote', 'parenthetical')"
-        f"    AND LENGTH(TRIM(COALESCE(term, ''))) >= 3"
-        f"  GROUP BY doc_id"
-        f"  HAVING COUNT(*) >= {_DEF_TRUNC_MIN_PER_DOC}"
-        f") sub JOIN documents d ON sub.doc_id = d.doc_id"
-        f"{cohort_doc_filter}",
-        [],
-    ))
-
-    # 34. definition_signature_leak
-    cols = _cols.format(
-        cat="definition_signature_leak", sev="high",
-        detail="sub.bad_count || ' definition terms contain signature-page markers'",
-    )
-    queries.append((
-        f"SELECT {cols} FROM ("
-        f"  SELECT doc_id, COUNT(*) as bad_count"
-        f"  FROM definitions"
-        f"  WHERE regexp_matches(lower(COALESCE(term, '')), "
-        f"    '(by\\\\s*:|name\\\\s*:|title\\\\s*:|in witness whereof|signature page|authorized signatory)')"
-        f"  GROUP BY doc_id"
-        f") sub JOIN documents d ON sub.doc_id = d.doc_id"
-        f"{cohort_doc_filter}",
-        [],
-    ))
-
-    # 35. definition_malformed_term
-    cols = _cols.format(
-        cat="definition_malformed_term", sev="medium",
-        detail="sub.bad_terms || ' malformed definition terms detected'",
-    )
-    queries.append((
-        f"SELECT {cols} FROM ("
-        f"  SELECT doc_id, COUNT(*) as bad_terms"
-        f"  FROM definitions"
-        f"  WHERE regexp_matches(COALESCE(term, ''), '\\\\n')"
-        f"     OR LENGTH(TRIM(COALESCE(term, ''))) > 80"
-        f"     OR regexp_matches(lower(TRIM(COALESCE(term, ''))), "
-        f"        '^(the borrower|the lenders?|the administrative agent|the company|the issuer)\\\\b')"
-        f"  GROUP BY doc_id"
-        f"  HAVING COUNT(*) >= {_DEF_MALFORMED_MIN_PER_DOC}"
-        f") sub JOIN documents d ON sub.doc_id = d.doc_id"
-        f"{cohort_doc_filter}",
-        [],
-    ))
-
-    # 36. clause_root_label_repeat_explosion
-    cols = _cols.format(
-        cat="clause_root_label_repeat_explosion", sev="high",
-        detail="'Root label repeated up to ' || sub.worst_repeat || ' times in one section'",
-    )
-    queries.append((
-        f"SELECT {cols} FROM ("
-        f"  WITH root_counts AS ("
-        f"    SELECT doc_id, section_number, "
-        f"      lower(regexp_extract(label, '\\(([A-Za-z0-9]+)\\)', 1)) as root_lbl, "
-        f"      COUNT(*) as n "
-        f"    FROM clauses "
-        f"    WHERE is_structural = true "
-        f"      AND array_length(string_split(clause_id, '.')) = 1 "
-        f"      AND regexp_extract(label, '\\(([A-Za-z0-9]+)\\)', 1) <> '' "
-        f"    GROUP BY 1, 2, 3"
-        f"  ), sec AS ("
-        f"    SELECT doc_id, section_number, MAX(n) as max_repeat "
-        f"    FROM root_counts "
-        f"    GROUP BY 1, 2 "
-        f"    HAVING MAX(n) >= {_ROOT_REPEAT_THRESHOLD}"
-        f"  ) "
-        f"  SELECT doc_id, MAX(max_repeat) as worst_repeat "
-        f"  FROM sec GROUP BY doc_id"
-        f") sub JOIN documents d ON sub.doc_id = d.doc_id"
-        f"{cohort_doc_filter}",
-        [],
-    ))
-
-    # 37. clause_dup_id_burst
-    cols = _cols.format(
-        cat="clause_dup_id_burst", sev="high",
-        detail="'Structural clause_id _dup ratio ' || ROUND(100.0 * sub.dup_ratio, 1) || '%'",
-    )
-    queries.append((
-        f"SELECT {cols} FROM ("
-        f"  SELECT doc_id, "
-        f"    COUNT(*) as structural_count, "
-        f"    1.0 * SUM(CASE WHEN clause_id LIKE '%\\_dup%' ESCAPE '\\' THEN 1 ELSE 0 END) / COUNT(*) as dup_ratio "
-        f"  FROM clauses "
-        f"  WHERE is_structural = true "
-        f"  GROUP BY doc_id "
-        f"  HAVING COUNT(*) >= {_DUP_BURST_MIN_STRUCTURAL} "
-        f"     AND 1.0 * SUM(CASE WHEN clause_id LIKE '%\\_dup%' ESCAPE '\\' THEN 1 ELSE 0 END) / COUNT(*) > {_DUP_BURST_RATIO}"
-        f") sub JOIN documents d ON sub.doc_id = d.doc_id"
-        f"{cohort_doc_filter}",
-        [],
-    ))
-
-    # 38. clause_depth_reset_after_deep
-    cols = _cols.format(
-        cat="clause_depth_reset_after_deep", sev="high",
-        detail="'Depth resets after deep nesting in ' || sub.flagged_sections || "
-        "' sections (' || sub.total_resets || ' resets)'",
-    )
-    queries.append((
-        f"SELECT {cols} FROM ("
-        f"  WITH ordered AS ("
-        f"    SELECT doc_id, section_number, span_start, "
-        f"      array_length(string_split(clause_id, '.')) as tree_level, "
-        f"      lower(regexp_extract(label, '\\(([A-Za-z0-9]+)\\)', 1)) as label_inner, "
-        f"      lag(array_length(string_split(clause_id, '.'))) "
-        f"        OVER (PARTITION BY doc_id, section_number ORDER BY span_start) as prev_tree_level "
-        f"    FROM clauses "
-        f"    WHERE is_structural = true"
-        f"  ), sec AS ("
-        f"    SELECT doc_id, section_number, COUNT(*) as reset_count "
-        f"    FROM ordered "
-        f"    WHERE prev_tree_level >= {_DEEP_RESET_PREV_LEVEL} "
-        f"      AND tree_level = 1 "
-        f"      AND length(label_inner) = 1 "
-        f"      AND label_inner BETWEEN 'm' AND 'z' "
-        f"    GROUP BY 1, 2 "
-        f"    HAVING COUNT(*) >= {_DEEP_RESET_MIN_PER_SECTION}"
-        f"  ) "
-        f"  SELECT doc_id, COUNT(*) as flagged_sections, SUM(reset_count) as total_resets "
-        f"  FROM sec GROUP BY doc_id"
-        f") sub JOIN documents d ON sub.doc_id = d.doc_id"
-        f"{cohort_doc_filter}",
-        [],
-    ))
-
-    # --- Section JOINs ---
-
-    # 5. section_numbering_gap
-    cols = _cols.format(
-        cat="section_numbering_gap", sev="medium",
-        detail="sub.gap_count || ' numbering gaps detected in section sequence'",
-    )
-    queries.append((
-        f"SELECT {cols} FROM ("
-        f"  SELECT doc_id, COUNT(*) as gap_count FROM ("
-        f"    SELECT doc_id, CAST(section_number AS DOUBLE) as sn,"
-        f"      LAG(CAST(section_number AS DOUBLE)) OVER (PARTITION BY doc_id ORDER BY CAST(section_number AS DOUBLE)) AS prev_sn"
-        f"    FROM sections WHERE section_number NOT LIKE '%.%'"
-        f"  ) numbered WHERE prev_sn IS NOT NULL AND sn - prev_sn > 1.0 AND sn > 1.0"
-        f"  GROUP BY doc_id"
-        f") sub JOIN documents d ON sub.doc_id = d.doc_id"
-        f"{cohort_doc_filter}",
-        [],
-    ))
-
-    # 6. empty_section_headings
-    cols = _cols.format(
-        cat="empty_section_headings", sev="medium",
-        detail="sub.empty_count || ' sections with missing or empty headings'",
-    )
-    queries.append((
-        f"SELECT {cols} FROM ("
-        f"  SELECT doc_id, COUNT(*) as empty_count"
-        f"  FROM sections WHERE heading IS NULL OR TRIM(heading) = ''"
-        f"  GROUP BY doc_id"
-        f") sub JOIN documents d ON sub.doc_id = d.doc_id"
-        f"{cohort_doc_filter}",
-        [],
-    ))
-
-    return queries
-
-
-def _build_iqr_category_queries(
-    corpus: Any, cohort_where: str, cohort_only: bool,
-) -> list[tuple[str, list[Any]]]:
-    """IQR-fence-based categories requiring pre-computation of percentiles."""
-    queries: list[tuple[str, list[Any]]] = []
-
-    def _compute_fences(col: str) -> tuple[float, float]:
-        base = "WHERE cohort_included = true AND" if cohort_only else "WHERE"
-        rows = corpus.query(f"SELECT {col} FROM documents {base} {col} IS NOT NULL")
-        vals = [float(r[0]) for r in rows if r[0] is not None]
-        if len(vals) < 4:
-            return 0.0, float("inf")
-        q1 = _percentile(vals, 0.25)
-        q3 = _percentile(vals, 0.75)
-        iqr = q3 - q1
-        if iqr <= 0:
-            return 0.0, float("inf")
-        return q1 - 1.5 * iqr, q3 + 1.5 * iqr
-
-    # 25. extreme_word_count (existing)
-    wc_lo, wc_hi = _compute_fences("word_count")
-    if wc_hi != float("inf"):
-        queries.append((
-            f"SELECT doc_id, borrower, 'extreme_word_count' as category, 'low' as severity, "
-            f"'Word count ' || word_count || ' outside IQR fences [' || CAST(ROUND(?, 0) AS INTEGER) || ', ' || CAST(ROUND(?, 0) AS INTEGER) || ']' as detail, "
-            f"doc_type, market_segment, word_count, section_count, definition_count, "
-            f"clause_count, facility_size_mm "
-            f"FROM documents {cohort_where} word_count IS NOT NULL "
-            f"AND (word_count < ? OR word_count > ?)",
-            [wc_lo, wc_hi, wc_lo, wc_hi],
-        ))
-
-    # 3. excessive_section_count
-    sc_lo, sc_hi = _compute_fences("section_count")
-    if sc_hi != float("inf"):
-        queries.append((
-            f"SELECT doc_id, borrower, 'excessive_section_count' as category, 'low' as severity, "
-            f"section_count || ' sections (IQR upper fence: ' || CAST(ROUND(?, 0) AS INTEGER) || ')' as detail, "
-            f"doc_type, market_segment, word_count, section_count, definition_count, "
-            f"clause_count, facility_size_mm "
-            f"FROM documents {cohort_where} section_count IS NOT NULL "
-            f"AND section_count > ?",
-            [sc_hi, sc_hi],
-        ))
-
-    return queries
+    None (use the live union) when the corpus was built without the table,
+    or when the table predates the corpus's current run manifest.
+    """
+    if not corpus.has_table(EDGE_CASES_TABLE):
+        return None
+    rows = corpus.query(f"SELECT run_id FROM {EDGE_CASES_TABLE} LIMIT 1")
+    if not rows:
+        return None
+    table_run_id = str(rows[0][0])
+    try:
+        manifest = corpus.get_run_manifest()
+    except (OSError, ValueError):
+        manifest = None
+    manifest_run_id = (manifest or {}).get("run_id")
+    if manifest_run_id and str(manifest_run_id) != table_run_id:
+        return None
+    return table_run_id
 
 
-@app.get("/api/edge-cases")
-async def edge_cases(
-    category: str = Query("all", description="Edge case category to filter"),
-    page: int = Query(0, ge=0),
-    page_size: int = Query(50, ge=1, le=200),
-    cohort_only: bool = Query(False),
-):
+def _edge_cases_sync(category: str, page: int, page_size: int, cohort_only: bool) -> Any:
     """Categorized edge case documents for inspection (38 categories, 6 tiers)."""
     corpus = _get_corpus()
 
-    if category not in _EDGE_CASE_CATEGORIES:
+    if category not in EDGE_CASE_CATEGORIES:
         raise HTTPException(
             400,
-            f"Invalid category: {category}. Must be one of: {', '.join(sorted(_EDGE_CASE_CATEGORIES))}",
+            f"Invalid category: {category}. Must be one of: {', '.join(sorted(EDGE_CASE_CATEGORIES))}",
         )
 
-    cohort_where = "WHERE cohort_included = true AND" if cohort_only else "WHERE"
-
-    # --- Build ALL category queries via builder functions ---
-    all_parts: list[tuple[str, list[Any]]] = []
-    all_parts.extend(_build_doc_category_queries(cohort_where))
-    all_parts.extend(_build_join_category_queries(cohort_where))
-    all_parts.extend(_build_iqr_category_queries(corpus, cohort_where, cohort_only))
-
-    # Merge into a single UNION ALL
-    all_queries = [p[0] for p in all_parts]
-    all_params: list[Any] = []
-    for p in all_parts:
-        all_params.extend(p[1])
-
-    all_union_sql = " UNION ALL ".join(all_queries)
+    offset = page * page_size
+    case_cols = ", ".join(EDGE_CASE_COLUMNS)
+    table_run_id = _edge_case_table_run_id(corpus)
+    if table_run_id is not None:
+        # Materialized at build time: every query is a primary-key range.
+        where = "WHERE run_id = ? AND scope = ?"
+        params: list[Any] = [table_run_id, "cohort" if cohort_only else "all"]
+        cat_rows = corpus.query(
+            f"SELECT category, COUNT(*) FROM {EDGE_CASES_TABLE} {where} "
+            f"GROUP BY category ORDER BY COUNT(*) DESC",
+            params,
+        )
+        if category != "all":
+            where += " AND category = ?"
+            params.append(category)
+        counts = {str(r[0]): int(r[1]) for r in cat_rows}
+        total = sum(counts.values()) if category == "all" else counts.get(category, 0)
+        rows = corpus.query(
+            f"SELECT {case_cols} FROM {EDGE_CASES_TABLE} {where} "
+            f"ORDER BY category, doc_id LIMIT ? OFFSET ?",
+            [*params, page_size, offset],
+        )
+    else:
+        all_union_sql, all_params = build_edge_case_union(corpus, cohort_only=cohort_only)
 
-    # Global category counts (always includes all categories for pill display)
-    cat_rows = corpus.query(
-        f"SELECT category, COUNT(*) FROM ({all_union_sql}) GROUP BY category ORDER BY COUNT(*) DESC",
-        all_params,
-    )
+        # Global category counts (always includes all categories for pill display)
+        cat_rows = corpus.query(
+            f"SELECT category, COUNT(*) FROM ({all_union_sql}) "
+            f"GROUP BY category ORDER BY COUNT(*) DESC",
+            all_params,
+        )
 
-    # --- Build filtered query (for the paginated case list) ---
-    if category == "all":
-        filtered_sql = all_union_sql
-        filtered_params = list(all_params)
-    else:
-        filtered_sql = f"SELECT * FROM ({all_union_sql}) WHERE category = ?"
-        filtered_params = [*all_params, category]
+        # --- Build filtered query (for the paginated case list) ---
+        if category == "all":
+            filtered_sql = all_union_sql
+            filtered_params = list(all_params)
+        else:
+            filtered_sql = f"SELECT * FROM ({all_union_sql}) WHERE category = ?"
+            filtered_params = [*all_params, category]
 
-    count_row = corpus.query(f"SELECT COUNT(*) FROM ({filtered_sql})", filtered_params)
-    total = int(count_row[0][0]) if count_row else 0
+        count_row = corpus.query(f"SELECT COUNT(*) FROM ({filtered_sql})", filtered_params)
+        total = int(count_row[0][0]) if count_row else 0
 
-    offset = page * page_size
-    rows = corpus.query(
-        f"SELECT * FROM ({filtered_sql}) ORDER BY category, doc_id LIMIT ? OFFSET ?",
-        [*filtered_params, page_size, offset],
-    )
+        rows = corpus.query(
+            f"SELECT {case_cols} FROM ({filtered_sql}) ORDER BY category, doc_id LIMIT ? OFFSET ?",
+            [*filtered_params, page_size, offset],
+        )
 
     return {
         "total": total,
         "page": page,
         "page_size": page_size,
         "categories": [
-            {"category": str(r[0]), "count": int(r[1]), "tier": _get_tier(str(r[0]))}
+            {"category": str(r[0]), "count": int(r[1]), "tier": get_tier(str(r[0]))}
             for r in cat_rows
         ],
         "cases": [
@@ -2780,6 +2289,17 @@ async def edge_cases(
     }
 
 
+@app.get("/api/edge-cases")
+async def edge_cases(
+    category: str = Query("all", description="Edge case category to filter"),
+    page: int = Query(0, ge=0),
+    page_size: int = Query(50, ge=1, le=200),
+    cohort_only: bool = Query(False),
+):
+    """Categorized edge case documents for inspection (38 categories, 6 tiers)."""
+    return await _db.read("edge_cases", _edge_cases_sync, category, page, page_size, cohort_only)
+
+
 # Clause anomaly categories that support drill-down
 _CLAUSE_ANOMALY_CATEGORIES = {
     "inconsistent_sibling_depth",
@@ -2909,7 +2429,7 @@ async def edge_case_clause_detail(
             f"    AND array_length(string_split(clause_id, '.')) = 1 "
             f"    AND regexp_extract(label, '\\(([A-Za-z0-9]+)\\)', 1) <> '' "
             f"  GROUP BY section_number, root_lbl "
-            f"  HAVING COUNT(*) >= {_ROOT_REPEAT_THRESHOLD}"
+            f"  HAVING COUNT(*) >= {ROOT_REPEAT_THRESHOLD}"
             f") "
             f"SELECT {_clause_cols} FROM clauses c "
             f"JOIN repeated_roots rr ON rr.section_number = c.section_number "
@@ -2945,7 +2465,7 @@ async def edge_case_clause_detail(
             f"SELECT section_number, clause_id, label, depth, level_type, parent_id, is_structural, "
             f"  parse_confidence, header_text, span_start, span_end, tree_level "
             f"FROM ordered "
-            f"WHERE prev_tree_level >= {_DEEP_RESET_PREV_LEVEL} "
+            f"WHERE prev_tree_level >= {DEEP_RESET_PREV_LEVEL} "
             f"  AND tree_level = 1 "
             f"  AND length(label_inner) = 1 "
             f"  AND label_inner BETWEEN 'm' AND 'z' "
@@ -3034,7 +2554,7 @@ async def edge_case_definition_detail(
 
     if category == "definition_truncated_at_cap":
         where_extra = (
-            f"AND LENGTH(COALESCE(d.definition_text, '')) >= {_DEF_TRUNC_CAP} "
+            f"AND LENGTH(COALESCE(d.definition_text, '')) >= {DEF_TRUNC_CAP} "
             "AND d.pattern_engine IN ('quoted', 'smart_quote', 'parenthetical') "
             "AND LENGTH(TRIM(COALESCE(d.term, ''))) >= 3 "
         )
@@ -3088,6 +2608,7 @@ async def edge_case_definition_detail(
 # Routes: Section Frequency
 # ---------------------------------------------------------------------------
 @app.get("/api/stats/section-frequency")
+@_response_cache.cached("section_frequency", _corpus_version)
 async def section_frequency(
     cohort_only: bool = Query(True),
     min_presence: float = Query(0.0, ge=0.0, le=1.0, description="Min fraction of docs"),
@@ -3210,8 +2731,7 @@ class CorpusQueryRequest(BaseModel):
     limit: int = Field(default=200, ge=1, le=2000)
 
 
-@app.post("/api/corpus/query")
-async def corpus_query(req: CorpusQueryRequest):
+def _corpus_query_sync(req: CorpusQueryRequest) -> Any:
     """Unified cross-level query across articles, sections, and clauses."""
     corpus = _get_corpus()
 
@@ -3516,6 +3036,12 @@ async def corpus_query(req: CorpusQueryRequest):
     }
 
 
+@app.post("/api/corpus/query")
+async def corpus_query(req: CorpusQueryRequest):
+    """Unified cross-level query across articles, sections, and clauses."""
+    return await _db.read("corpus_query", _corpus_query_sync, req)
+
+
 # ===========================================================================
 # Phase 6: Discovery Lab Endpoints
 # ===========================================================================
@@ -3597,6 +3123,7 @@ class LinkPreviewRequest(BaseModel):
     meta_filters: dict[str, Any] | None = None
     rule_id: str | None = Field(default=None, max_length=255)
     async_threshold: int = Field(default=10000, ge=1, le=50000)
+    base_preview_id: str | None = Field(default=None, max_length=255)
 
 
 class LinksImportRequest(BaseModel):
@@ -3743,6 +3270,30 @@ def _resolve_inherited_scope_sections(
     return []
 
 
+def _confirm_proximity_candidates(
+    corpus: CorpusIndex,
+    prox: ProximityOp,
+    candidates: list[dict[str, Any]],
+) -> list[dict[str, Any]]:
+    """Drop prefilter false positives when the corpus has no ``section_tokens``.
+
+    Clause-level rows are checked against their own ``clause_text``; section
+    rows against the full section text.
+    """
+    confirmed: list[dict[str, Any]] = []
+    section_cache: dict[tuple[str, str], str] = {}
+    for cand in candidates:
+        text = str(cand.get("clause_text") or "")
+        if not text:
+            key = (str(cand.get("doc_id", "")), str(cand.get("section_number", "")))
+            if key not in section_cache:
+                section_cache[key] = corpus.get_section_text(*key) or ""
+            text = section_cache[key]
+        if proximity_matches(prox, text):
+            confirmed.append(cand)
+    return confirmed
+
+
 def _match_value_against_text(value: str, text: str) -> bool:
     """Best-effort matcher used for scratchpad/why-not traffic-light visualization."""
     needle = (value or "").strip()
@@ -3899,8 +3450,7 @@ def _text_keyword_score(text: str, keywords: list[str]) -> float:
 # ---------------------------------------------------------------------------
 # Routes: Heading Discovery
 # ---------------------------------------------------------------------------
-@app.post("/api/lab/heading-discover")
-async def heading_discover(req: HeadingDiscoveryRequest):
+def _heading_discover_sync(req: HeadingDiscoveryRequest) -> Any:
     """Discover unique section headings and their frequency across the corpus."""
     # M2 RT3 FIX: Validate article_min <= article_max
     if req.article_min is not None and req.article_max is not None and req.article_min > req.article_max:
@@ -3968,11 +3518,16 @@ async def heading_discover(req: HeadingDiscoveryRequest):
     }
 
 
+@app.post("/api/lab/heading-discover")
+async def heading_discover(req: HeadingDiscoveryRequest):
+    """Discover unique section headings and their frequency across the corpus."""
+    return await _db.read("heading_discover", _heading_discover_sync, req)
+
+
 # ---------------------------------------------------------------------------
 # Routes: Pattern Testing
 # ---------------------------------------------------------------------------
-@app.post("/api/lab/pattern-test")
-async def pattern_test(req: PatternTestRequest):
+def _pattern_test_sync(req: PatternTestRequest) -> Any:
     """Test heading + keyword patterns against sections, report hit rate per document."""
     corpus = _get_corpus()
 
@@ -4141,6 +3696,12 @@ async def pattern_test(req: PatternTestRequest):
     }
 
 
+@app.post("/api/lab/pattern-test")
+async def pattern_test(req: PatternTestRequest):
+    """Test heading + keyword patterns against sections, report hit rate per document."""
+    return await _db.read("pattern_test", _pattern_test_sync, req)
+
+
 # L2 RT2 FIX: Named constants for DNA scoring weights
 _DNA_TFIDF_WEIGHT = 0.5       # Weight for TF-IDF component in combined score
 _DNA_LOG_ODDS_WEIGHT = 0.5    # Weight for log-odds component in combined score
@@ -4150,8 +3711,7 @@ _DNA_LOG_ODDS_SCALE = 5.0     # Normalization divisor for log-odds (caps at 1.0)
 # ---------------------------------------------------------------------------
 # Routes: DNA Discovery
 # ---------------------------------------------------------------------------
-@app.post("/api/lab/dna-discover")
-async def dna_discover(req: DnaDiscoveryRequest):
+def _dna_discover_sync(req: DnaDiscoveryRequest) -> Any:
     """Discover discriminating n-gram phrases by comparing positive vs background sections."""
     corpus = _get_corpus()
 
@@ -4297,11 +3857,16 @@ async def dna_discover(req: DnaDiscoveryRequest):
     }
 
 
+@app.post("/api/lab/dna-discover")
+async def dna_discover(req: DnaDiscoveryRequest):
+    """Discover discriminating n-gram phrases by comparing positive vs background sections."""
+    return await _db.read("dna_discover", _dna_discover_sync, req)
+
+
 # ---------------------------------------------------------------------------
 # Routes: Coverage Analysis
 # ---------------------------------------------------------------------------
-@app.post("/api/lab/coverage")
-async def coverage_analysis(req: CoverageRequest):
+def _coverage_analysis_sync(req: CoverageRequest) -> Any:
     """Test heading patterns against the corpus grouped by a dimension."""
     corpus = _get_corpus()
 
@@ -4419,11 +3984,16 @@ async def coverage_analysis(req: CoverageRequest):
     }
 
 
+@app.post("/api/lab/coverage")
+async def coverage_analysis(req: CoverageRequest):
+    """Test heading patterns against the corpus grouped by a dimension."""
+    return await _db.read("coverage_analysis", _coverage_analysis_sync, req)
+
+
 # ---------------------------------------------------------------------------
 # Routes: Clause Search
 # ---------------------------------------------------------------------------
-@app.post("/api/lab/clause-search")
-async def clause_search(req: ClauseSearchRequest):
+def _clause_search_sync(req: ClauseSearchRequest) -> Any:
     """Search clauses by keywords, heading pattern, depth range."""
     # M3 RT3 FIX: Validate min_depth <= max_depth
     if req.min_depth > req.max_depth:
@@ -4533,6 +4103,12 @@ async def clause_search(req: ClauseSearchRequest):
     }
 
 
+@app.post("/api/lab/clause-search")
+async def clause_search(req: ClauseSearchRequest):
+    """Search clauses by keywords, heading pattern, depth range."""
+    return await _db.read("clause_search", _clause_search_sync, req)
+
+
 # ===========================================================================
 # Phase 7: Ontology Explorer
 # ===========================================================================
@@ -5107,7 +4683,18 @@ def _get_link_store() -> LinkStore:
     """Get the link store, raising 503 if not available."""
     if _link_store is None:
         raise HTTPException(status_code=503, detail="Link store not available")
-    return _link_store
+    return _db.view(_link_store)
+
+
+def _submit_job_sync(job: dict[str, Any]) -> None:
+    """Queue a worker job (writer thread)."""
+    _get_link_store().submit_job(job)
+
+
+def _persist_scope_alias(alias: str, target: str) -> None:
+    """Record a scope alias resolved by ``_canonicalize_scope_id`` (writer thread)."""
+    with contextlib.suppress(Exception):
+        _get_link_store().upsert_family_alias(alias, target, source="server_token_map")
 
 
 def _get_embedding_manager() -> Any:
@@ -5160,6 +4747,26 @@ def _ontology_family_candidates_for_token(token: str) -> set[str]:
     return candidates
 
 
+def _prepare_link_store_sync() -> int:
+    """Startup link-store bookkeeping; returns the legacy aliases refreshed."""
+    store = _get_link_store()
+    mapped = _bootstrap_legacy_family_aliases(store) if _ontology_nodes else 0
+    store.run_cleanup()
+    return mapped
+
+
+def _save_conflict_policies_sync(policies: list[Any]) -> None:
+    """Persist the ontology conflict matrix to the link store."""
+    store = _get_link_store()
+    for p in policies:
+        store.save_conflict_policy({
+            "family_a": p.family_a,
+            "family_b": p.family_b,
+            "policy": p.policy,
+            "reason": p.reason,
+        })
+
+
 def _bootstrap_legacy_family_aliases(store: LinkStore) -> int:
     token_to_family_ids: dict[str, set[str]] = {}
     for node_id, node in _ontology_nodes.items():
@@ -5222,11 +4829,10 @@ def _canonicalize_scope_id(
         target = canonical or raw
 
     if store is not None and persist_alias and target and target != raw:
-        with contextlib.suppress(Exception):
-            store.upsert_family_alias(raw, target, source="server_token_map")
+        # Often reached from reads; the alias is queued on the writer thread.
+        _db.write_soon("scope_alias", _persist_scope_alias, raw, target)
         if canonical and canonical != raw and canonical != target:
-            with contextlib.suppress(Exception):
-                store.upsert_family_alias(canonical, target, source="server_token_map")
+            _db.write_soon("scope_alias", _persist_scope_alias, canonical, target)
 
     return target or raw
 
@@ -5596,19 +5202,18 @@ def _link_row_to_api(row: dict[str, Any]) -> dict[str, Any]:
 # ---------------------------------------------------------------------------
 # 1. GET /api/links — List links (paginated, filterable)
 # ---------------------------------------------------------------------------
-@app.get("/api/links")
-async def list_links(
-    family_id: str | None = Query(None),
-    doc_id: str | None = Query(None),
-    status: str | None = Query(None),
-    confidence_tier: str | None = Query(None),
-    template_family: str | None = Query(None),
-    vintage_year: int | None = Query(None),
-    page: int = Query(1, ge=1),
-    page_size: int = Query(50, ge=1, le=500),
-    sort_by: str = Query("created_at"),
-    sort_dir: str = Query("desc"),
-):
+def _list_links_sync(
+    family_id: str | None,
+    doc_id: str | None,
+    status: str | None,
+    confidence_tier: str | None,
+    template_family: str | None,
+    vintage_year: int | None,
+    page: int,
+    page_size: int,
+    sort_by: str,
+    sort_dir: str,
+) -> Any:
     """List links with filtering, pagination, and sorting."""
     store = _get_link_store()
     resolved_scope = _canonicalize_scope_id(store, family_id) if family_id else None
@@ -5651,8 +5256,37 @@ async def list_links(
     }
 
 
-@app.get("/api/links/summary")
-async def links_summary():
+@app.get("/api/links")
+async def list_links(
+    family_id: str | None = Query(None),
+    doc_id: str | None = Query(None),
+    status: str | None = Query(None),
+    confidence_tier: str | None = Query(None),
+    template_family: str | None = Query(None),
+    vintage_year: int | None = Query(None),
+    page: int = Query(1, ge=1),
+    page_size: int = Query(50, ge=1, le=500),
+    sort_by: str = Query("created_at"),
+    sort_dir: str = Query("desc"),
+):
+    """List links with filtering, pagination, and sorting."""
+    return await _db.read(
+        "list_links",
+        _list_links_sync,
+        family_id,
+        doc_id,
+        status,
+        confidence_tier,
+        template_family,
+        vintage_year,
+        page,
+        page_size,
+        sort_by,
+        sort_dir,
+    )
+
+
+def _links_summary_sync() -> Any:
     """Aggregate summary for links page KPIs and family sidebar."""
     store = _get_link_store()
     rows = store.get_links(limit=100000, offset=0)
@@ -5702,7 +5336,7 @@ async def links_summary():
         if doc_id:
             unique_docs.add(doc_id)
 
-    drift_alerts = 0
+    drift_alerts = len(store.get_drift_alerts(acknowledged=False))
 
     by_family = sorted(by_family_counter.values(), key=lambda x: int(x["count"]), reverse=True)
     by_status = [
@@ -5725,6 +5359,12 @@ async def links_summary():
     }
 
 
+@app.get("/api/links/summary")
+async def links_summary():
+    """Aggregate summary for links page KPIs and family sidebar."""
+    return await _db.read("links_summary", _links_summary_sync)
+
+
 @app.get("/api/links/{link_id}/why-matched")
 async def get_why_matched(link_id: str):
     """Return factor-level confidence evidence for a link."""
@@ -5810,11 +5450,7 @@ async def get_why_matched(link_id: str):
 # ---------------------------------------------------------------------------
 # 3. POST /api/links — Create single manual link
 # ---------------------------------------------------------------------------
-@app.post("/api/links", status_code=201)
-async def create_link(
-    request: Request,
-    body: ManualLinkCreateRequest = Body(...),
-):
+def _create_link_sync(request: Request, body: ManualLinkCreateRequest) -> Any:
     """Create a single manual link."""
     _require_links_admin(request)
     store = _get_link_store()
@@ -5826,15 +5462,19 @@ async def create_link(
     return {"created": created, "run_id": run_id}
 
 
+@app.post("/api/links", status_code=201)
+async def create_link(
+    request: Request,
+    body: ManualLinkCreateRequest = Body(...),
+):
+    """Create a single manual link."""
+    return await _db.write("create_link", _create_link_sync, request, body)
+
+
 # ---------------------------------------------------------------------------
 # 4. PATCH /api/links/{link_id}/unlink — Soft-unlink
 # ---------------------------------------------------------------------------
-@app.patch("/api/links/{link_id}/unlink")
-async def unlink_link(
-    request: Request,
-    link_id: str,
-    body: dict[str, Any] = Body(...),
-):
+def _unlink_link_sync(request: Request, link_id: str, body: dict[str, Any]) -> Any:
     """Soft-unlink a link with reason and optional note."""
     _require_links_admin(request)
     store = _get_link_store()
@@ -5846,11 +5486,20 @@ async def unlink_link(
     return {"status": "unlinked", "link_id": link_id}
 
 
+@app.patch("/api/links/{link_id}/unlink")
+async def unlink_link(
+    request: Request,
+    link_id: str,
+    body: dict[str, Any] = Body(...),
+):
+    """Soft-unlink a link with reason and optional note."""
+    return await _db.write("unlink_link", _unlink_link_sync, request, link_id, body)
+
+
 # ---------------------------------------------------------------------------
 # 5. PATCH /api/links/{link_id}/relink — Undo unlink
 # ---------------------------------------------------------------------------
-@app.patch("/api/links/{link_id}/relink")
-async def relink_link(request: Request, link_id: str):
+def _relink_link_sync(request: Request, link_id: str) -> Any:
     """Relink a previously unlinked link."""
     _require_links_admin(request)
     store = _get_link_store()
@@ -5860,8 +5509,13 @@ async def relink_link(request: Request, link_id: str):
     return {"status": "active", "link_id": link_id}
 
 
-@app.patch("/api/links/{link_id}/bookmark")
-async def bookmark_link(request: Request, link_id: str):
+@app.patch("/api/links/{link_id}/relink")
+async def relink_link(request: Request, link_id: str):
+    """Relink a previously unlinked link."""
+    return await _db.write("relink_link", _relink_link_sync, request, link_id)
+
+
+def _bookmark_link_sync(request: Request, link_id: str) -> Any:
     """Bookmark a link for review."""
     _require_links_admin(request)
     store = _get_link_store()
@@ -5873,22 +5527,32 @@ async def bookmark_link(request: Request, link_id: str):
     return {"status": "bookmarked", "link_id": link_id}
 
 
-@app.patch("/api/links/{link_id}/note")
-async def note_link(
-    request: Request,
-    link_id: str,
-    body: dict[str, Any] = Body(...),
-):
-    """Attach a note to a link via audit log."""
-    _require_links_admin(request)
-    store = _get_link_store()
+@app.patch("/api/links/{link_id}/bookmark")
+async def bookmark_link(request: Request, link_id: str):
+    """Bookmark a link for review."""
+    return await _db.write("bookmark_link", _bookmark_link_sync, request, link_id)
+
+
+def _note_link_sync(request: Request, link_id: str, body: dict[str, Any]) -> Any:
+    """Attach a note to a link via audit log."""
+    _require_links_admin(request)
+    store = _get_link_store()
     note = str(body.get("note", "")).strip()
     store.log_event(link_id, "note", "user", note=note)
     return {"updated": True, "link_id": link_id, "note": note}
 
 
-@app.patch("/api/links/{link_id}/defer")
-async def defer_link(request: Request, link_id: str):
+@app.patch("/api/links/{link_id}/note")
+async def note_link(
+    request: Request,
+    link_id: str,
+    body: dict[str, Any] = Body(...),
+):
+    """Attach a note to a link via audit log."""
+    return await _db.write("note_link", _note_link_sync, request, link_id, body)
+
+
+def _defer_link_sync(request: Request, link_id: str) -> Any:
     """Defer a link for later adjudication."""
     _require_links_admin(request)
     store = _get_link_store()
@@ -5900,14 +5564,16 @@ async def defer_link(request: Request, link_id: str):
     return {"status": "deferred", "link_id": link_id}
 
 
+@app.patch("/api/links/{link_id}/defer")
+async def defer_link(request: Request, link_id: str):
+    """Defer a link for later adjudication."""
+    return await _db.write("defer_link", _defer_link_sync, request, link_id)
+
+
 # ---------------------------------------------------------------------------
 # 6. POST /api/links/batch/unlink — Batch unlink
 # ---------------------------------------------------------------------------
-@app.post("/api/links/batch/unlink")
-async def batch_unlink(
-    request: Request,
-    body: dict[str, Any] = Body(...),
-):
+def _batch_unlink_sync(request: Request, body: dict[str, Any]) -> Any:
     """Batch unlink links by IDs or filter."""
     _require_links_admin(request)
     store = _get_link_store()
@@ -5918,14 +5584,19 @@ async def batch_unlink(
     return {"unlinked": count}
 
 
-# ---------------------------------------------------------------------------
-# 7. POST /api/links/batch/relink — Batch relink
-# ---------------------------------------------------------------------------
-@app.post("/api/links/batch/relink")
-async def batch_relink(
+@app.post("/api/links/batch/unlink")
+async def batch_unlink(
     request: Request,
     body: dict[str, Any] = Body(...),
 ):
+    """Batch unlink links by IDs or filter."""
+    return await _db.write("batch_unlink", _batch_unlink_sync, request, body)
+
+
+# ---------------------------------------------------------------------------
+# 7. POST /api/links/batch/relink — Batch relink
+# ---------------------------------------------------------------------------
+def _batch_relink_sync(request: Request, body: dict[str, Any]) -> Any:
     """Batch relink links by IDs."""
     _require_links_admin(request)
     store = _get_link_store()
@@ -5934,11 +5605,16 @@ async def batch_relink(
     return {"relinked": count}
 
 
-@app.post("/api/links/batch/bookmark")
-async def batch_bookmark(
+@app.post("/api/links/batch/relink")
+async def batch_relink(
     request: Request,
     body: dict[str, Any] = Body(...),
 ):
+    """Batch relink links by IDs."""
+    return await _db.write("batch_relink", _batch_relink_sync, request, body)
+
+
+def _batch_bookmark_sync(request: Request, body: dict[str, Any]) -> Any:
     """Batch bookmark links by IDs."""
     _require_links_admin(request)
     store = _get_link_store()
@@ -5955,11 +5631,19 @@ async def batch_bookmark(
     return {"bookmarked": len(link_ids)}
 
 
+@app.post("/api/links/batch/bookmark")
+async def batch_bookmark(
+    request: Request,
+    body: dict[str, Any] = Body(...),
+):
+    """Batch bookmark links by IDs."""
+    return await _db.write("batch_bookmark", _batch_bookmark_sync, request, body)
+
+
 # ---------------------------------------------------------------------------
 # 8. POST /api/links/batch/select-all — Server-side selection
 # ---------------------------------------------------------------------------
-@app.post("/api/links/batch/select-all")
-async def batch_select_all(body: dict[str, Any] = Body(...)):
+def _batch_select_all_sync(body: dict[str, Any]) -> Any:
     """Get all link IDs matching a filter (for batch operations)."""
     store = _get_link_store()
     family_id = body.get("family_id")
@@ -5969,11 +5653,16 @@ async def batch_select_all(body: dict[str, Any] = Body(...)):
     return {"link_ids": link_ids, "count": len(link_ids)}
 
 
+@app.post("/api/links/batch/select-all")
+async def batch_select_all(body: dict[str, Any] = Body(...)):
+    """Get all link IDs matching a filter (for batch operations)."""
+    return await _db.read("batch_select_all", _batch_select_all_sync, body)
+
+
 # ---------------------------------------------------------------------------
 # 9. GET /api/links/families — Per-family summary
 # ---------------------------------------------------------------------------
-@app.get("/api/links/families")
-async def list_link_families():
+def _list_link_families_sync() -> Any:
     """Per-family summary with counts, pending, unlinked, staleness."""
     store = _get_link_store()
     rows = store._conn.execute("""
@@ -6011,14 +5700,19 @@ async def list_link_families():
     return {"families": families}
 
 
+@app.get("/api/links/families")
+async def list_link_families():
+    """Per-family summary with counts, pending, unlinked, staleness."""
+    return await _db.read("list_link_families", _list_link_families_sync)
+
+
 # ---------------------------------------------------------------------------
 # 10. GET /api/links/dashboard — Cross-family matrix
 # ---------------------------------------------------------------------------
-@app.get("/api/links/dashboard")
-async def links_dashboard():
+def _links_dashboard_sync() -> Any:
     """Cross-family dashboard with matrix and staleness."""
     store = _get_link_store()
-    families_resp = await list_link_families()
+    families_resp = _list_link_families_sync()
     families = families_resp["families"]
     rules = store.get_rules()
     return {
@@ -6028,11 +5722,16 @@ async def links_dashboard():
     }
 
 
+@app.get("/api/links/dashboard")
+async def links_dashboard():
+    """Cross-family dashboard with matrix and staleness."""
+    return await _db.read("links_dashboard", _links_dashboard_sync)
+
+
 # ---------------------------------------------------------------------------
 # 11. GET /api/links/coverage — Coverage gaps
 # ---------------------------------------------------------------------------
-@app.get("/api/links/coverage")
-async def links_coverage(family_id: str | None = Query(None)):
+def _links_coverage_sync(family_id: str | None) -> Any:
     """Coverage gaps with prioritization and diagnostics."""
     store = _get_link_store()
     resolved_scope = _canonicalize_scope_id(store, family_id) if family_id else None
@@ -6103,14 +5802,50 @@ async def links_coverage(family_id: str | None = Query(None)):
     }
 
 
+@app.get("/api/links/coverage")
+async def links_coverage(family_id: str | None = Query(None)):
+    """Coverage gaps with prioritization and diagnostics."""
+    return await _db.read("links_coverage", _links_coverage_sync, family_id)
+
+
+def _preview_text_predicate(
+    corpus: CorpusIndex,
+    text_fields: Mapping[str, Any],
+    *,
+    positional_index: bool,
+    doc_ids: list[str] | None = None,
+) -> tuple[str, list[Any], bool]:
+    """WHERE fragment restricting ``sections s`` to rows matching *text_fields*.
+
+    Served from the preview engine's cached sub-expression sets, evaluated
+    within the candidate *doc_ids*, when the corpus version is known, so
+    re-previewing an edited rule only queries the terms that changed.  The
+    fields are compiled inline when the version is unknown or they match
+    too many sections to bind as a key list.  Returns ``(sql, params,
+    needs_article_join)``; *sql* is ``"1=1"`` when nothing is restricted.
+    """
+    version = _corpus_version()
+    keys = None
+    if version is not None:
+        keys = _preview_engine.section_keys(
+            corpus, version, text_fields, positional_index=positional_index, doc_ids=doc_ids,
+        )
+    if keys is None:
+        sql, params, joins = build_multi_field_sql(text_fields, positional_index=positional_index)
+        return sql, params, any("JOIN articles" in join_sql for join_sql in joins)
+    if not keys:
+        return "1=0", [], False
+    return (
+        "(s.doc_id || '::' || s.section_number) IN (SELECT UNNEST(?::VARCHAR[]))",
+        [sorted(keys)],
+        False,
+    )
+
+
 # ---------------------------------------------------------------------------
 # 12. POST /api/links/query/preview — Create preview
 # ---------------------------------------------------------------------------
-@app.post("/api/links/query/preview")
-async def create_preview(
-    request: Request,
-    body: LinkPreviewRequest = Body(...),
-):
+def _create_preview_sync(request: Request, body: LinkPreviewRequest) -> Any:
     """Create a link preview (sync for small queries, async for >500)."""
     _require_links_admin(request)
     store = _get_link_store()
@@ -6133,6 +5868,7 @@ async def create_preview(
         parent_family_id = _canonicalize_scope_id(store, parent_family_id)
     rule_id = body.rule_id
     threshold = body.async_threshold
+    base_preview_id = (body.base_preview_id or "").strip()
     parsed_heading_expr = None
 
     if not family_id and not rule_id:
@@ -6215,54 +5951,59 @@ async def create_preview(
     defined_term_expr: Any = None
     effective_result_granularity = str(body.result_granularity or "section").strip().lower()
 
+    scoped_section_keys: list[str] = []
+    if scope_mode == "inherited":
+        scoped_sections = _resolve_inherited_scope_sections(
+            store,
+            parent_run_id=parent_run_id,
+            parent_family_id=parent_family_id,
+        )
+        if scoped_sections:
+            scoped_section_keys = sorted({f"{doc_id}::{section_number}" for doc_id, section_number in scoped_sections})
+            scoped_doc_ids = sorted({doc_id for doc_id, _ in scoped_sections})
+            if doc_ids is None:
+                doc_ids = scoped_doc_ids
+            else:
+                allowed = set(scoped_doc_ids)
+                doc_ids = [doc_id for doc_id in doc_ids if doc_id in allowed]
+        else:
+            doc_ids = []
+
     # Prefer multi-field SQL from parsed DSL
+    positional_index = corpus.has_table(SECTION_TOKENS_TABLE)
     if dsl_text_fields:
-        multi_where, multi_params, multi_joins = build_multi_field_sql(dsl_text_fields)
-        if multi_where != "1=1":
-            where_parts.append(multi_where)
-            params.extend(multi_params)
-            need_article_join = any("JOIN articles" in j for j in multi_joins)
+        text_sql, text_params, need_article_join = _preview_text_predicate(
+            corpus, dsl_text_fields, positional_index=positional_index, doc_ids=doc_ids,
+        )
+        if text_sql != "1=1":
+            where_parts.append(text_sql)
+            params.extend(text_params)
         clause_expr = dsl_text_fields.get("clause")
         defined_term_expr = dsl_text_fields.get("defined_term")
     else:
         # Legacy path: heading_filter_ast only
+        legacy_fields: dict[str, Any] = {}
         if parsed_heading_expr is not None:
-            heading_sql, heading_params = build_filter_sql(
-                parsed_heading_expr, "s.heading", wrap_wildcards=True,
-            )
-            where_parts.append(heading_sql)
-            params.extend(heading_params)
+            legacy_fields["heading"] = parsed_heading_expr
 
         # Additional text fields from the body (legacy text_fields dict)
         extra_text_fields = body.text_fields or {}
 
         # article: match by number OR title (joins articles table)
-        raw_article_ast = extra_text_fields.get("article")
-        if raw_article_ast is not None and isinstance(raw_article_ast, dict):
-            try:
-                article_expr = filter_expr_from_json(raw_article_ast)
-                article_where, article_params, article_joins = build_multi_field_sql(
-                    {"article": article_expr},
-                )
-                if article_where != "1=1":
-                    where_parts.append(article_where)
-                    params.extend(article_params)
-                    need_article_join = need_article_join or any(
-                        "JOIN articles" in join_sql for join_sql in article_joins
-                    )
-            except (ValueError, KeyError, TypeError):
-                pass
-
         # section: match section_number
-        raw_section_ast = extra_text_fields.get("section")
-        if raw_section_ast is not None and isinstance(raw_section_ast, dict):
-            try:
-                section_expr = filter_expr_from_json(raw_section_ast)
-                sql_frag, sql_params = build_filter_sql(section_expr, "s.section_number")
-                where_parts.append(sql_frag)
-                params.extend(sql_params)
-            except (ValueError, KeyError, TypeError):
-                pass
+        for legacy_field in ("article", "section"):
+            raw_field_ast = extra_text_fields.get(legacy_field)
+            if raw_field_ast is not None and isinstance(raw_field_ast, dict):
+                with contextlib.suppress(ValueError, KeyError, TypeError):
+                    legacy_fields[legacy_field] = filter_expr_from_json(raw_field_ast)
+
+        if legacy_fields:
+            text_sql, text_params, need_article_join = _preview_text_predicate(
+                corpus, legacy_fields, positional_index=positional_index, doc_ids=doc_ids,
+            )
+            if text_sql != "1=1":
+                where_parts.append(text_sql)
+                params.extend(text_params)
 
         # clause: legacy support against clause header text
         raw_clause_ast = extra_text_fields.get("clause")
@@ -6306,24 +6047,6 @@ async def create_preview(
     if effective_result_granularity == "section" and defined_term_expr is not None:
         effective_result_granularity = "defined_term"
 
-    scoped_section_keys: list[str] = []
-    if scope_mode == "inherited":
-        scoped_sections = _resolve_inherited_scope_sections(
-            store,
-            parent_run_id=parent_run_id,
-            parent_family_id=parent_family_id,
-        )
-        if scoped_sections:
-            scoped_section_keys = sorted({f"{doc_id}::{section_number}" for doc_id, section_number in scoped_sections})
-            scoped_doc_ids = sorted({doc_id for doc_id, _ in scoped_sections})
-            if doc_ids is None:
-                doc_ids = scoped_doc_ids
-            else:
-                allowed = set(scoped_doc_ids)
-                doc_ids = [doc_id for doc_id in doc_ids if doc_id in allowed]
-        else:
-            doc_ids = []
-
     if doc_ids is not None:
         if not doc_ids:
             where_parts.append("1=0")
@@ -6353,7 +6076,27 @@ async def create_preview(
         clause_detail_params: list[Any] = []
         clause_detail_order = "s.doc_id, s.section_number"
         if effective_result_granularity == "clause":
-            if clause_expr is not None:
+            if isinstance(clause_expr, ProximityOp):
+                if positional_index:
+                    clause_prox_sql, clause_detail_params = build_proximity_span_sql(
+                        clause_expr, alias="clause_match",
+                    )
+                else:
+                    clause_prox_sql, clause_detail_params = build_proximity_prefilter_sql(
+                        clause_expr, "clause_match.clause_text",
+                    )
+                clause_detail_join = (
+                    " JOIN clauses clause_match "
+                    "ON clause_match.doc_id = s.doc_id "
+                    "AND clause_match.section_number = s.section_number "
+                    f"AND {clause_prox_sql}"
+                )
+                clause_detail_order = (
+                    "s.doc_id, s.section_number, "
+                    "clause_match.depth DESC, clause_match.is_structural DESC, "
+                    "clause_match.span_start ASC, clause_match.clause_id ASC"
+                )
+            elif clause_expr is not None:
                 clause_text_sql, clause_text_params = build_filter_sql(
                     clause_expr, "clause_match.clause_text", wrap_wildcards=True,
                 )
@@ -6455,6 +6198,8 @@ async def create_preview(
             }
             for r in rows
         ]
+        if isinstance(clause_expr, ProximityOp) and not positional_index:
+            candidates = _confirm_proximity_candidates(corpus, clause_expr, candidates)
     else:
         candidates = []
 
@@ -6484,6 +6229,7 @@ async def create_preview(
             "parent_rule_id": parent_rule_id,
             "parent_run_id": parent_run_id,
             "result_granularity": effective_result_granularity,
+            "base_preview_id": base_preview_id or None,
         },
         "candidate_count": len(candidates),
         "candidate_set_hash": candidate_set_hash,
@@ -6515,7 +6261,7 @@ async def create_preview(
     if preview_cands:
         store.save_preview_candidates(preview_id, preview_cands)
 
-    return {
+    response: dict[str, Any] = {
         "preview_id": preview_id,
         "family_id": family_id,
         "ontology_node_id": ontology_node_id or family_id,
@@ -6529,16 +6275,35 @@ async def create_preview(
         "parent_run_id": parent_run_id,
         "async": False,
     }
+    if base_preview_id:
+        # Candidates added / removed relative to the preview of the previous
+        # rule edit (None when that preview no longer exists).
+        delta: dict[str, Any] | None = None
+        if store.get_preview(base_preview_id) is not None:
+            delta = {
+                "base_preview_id": base_preview_id,
+                **candidate_delta(
+                    store.get_preview_candidate_index(base_preview_id),
+                    {c["candidate_id"]: c for c in preview_cands},
+                ),
+            }
+        response["delta"] = delta
+    return response
+
+
+@app.post("/api/links/query/preview")
+async def create_preview(
+    request: Request,
+    body: LinkPreviewRequest = Body(...),
+):
+    """Create a link preview (sync for small queries, async for >500)."""
+    return await _db.write("create_preview", _create_preview_sync, request, body)
 
 
 # ---------------------------------------------------------------------------
 # 13. POST /api/links/query/apply — Apply with preview guard
 # ---------------------------------------------------------------------------
-@app.post("/api/links/query/apply")
-async def apply_preview(
-    request: Request,
-    body: dict[str, Any] = Body(...),
-):
+def _apply_preview_sync(request: Request, body: dict[str, Any]) -> Any:
     """Apply preview, creating links from accepted candidates."""
     _require_links_admin(request)
     store = _get_link_store()
@@ -6577,14 +6342,19 @@ async def apply_preview(
     return {"job_id": job_id, "preview_id": preview_id}
 
 
-# ---------------------------------------------------------------------------
-# 14. POST /api/links/query/canary — Canary apply
-# ---------------------------------------------------------------------------
-@app.post("/api/links/query/canary")
-async def canary_apply(
+@app.post("/api/links/query/apply")
+async def apply_preview(
     request: Request,
     body: dict[str, Any] = Body(...),
 ):
+    """Apply preview, creating links from accepted candidates."""
+    return await _db.write("apply_preview", _apply_preview_sync, request, body)
+
+
+# ---------------------------------------------------------------------------
+# 14. POST /api/links/query/canary — Canary apply
+# ---------------------------------------------------------------------------
+def _canary_apply_sync(request: Request, body: dict[str, Any]) -> Any:
     """Canary apply: top N docs only."""
     _require_links_admin(request)
     store = _get_link_store()
@@ -6614,20 +6384,28 @@ async def canary_apply(
     }
 
 
+@app.post("/api/links/query/canary")
+async def canary_apply(
+    request: Request,
+    body: dict[str, Any] = Body(...),
+):
+    """Canary apply: top N docs only."""
+    return await _db.write("canary_apply", _canary_apply_sync, request, body)
+
+
 # ---------------------------------------------------------------------------
 # 15. GET /api/links/query/count
 # ---------------------------------------------------------------------------
-@app.get("/api/links/query/count")
-async def query_count(
-    family_id: str | None = Query(None),
-    status: str | None = Query(None),
-    heading_filter_ast: str | None = Query(None),
-    filter_dsl: str | None = Query(None),
-    meta_filters: str | None = Query(None),
-    scope_mode: str | None = Query(None),
-    parent_family_id: str | None = Query(None),
-    parent_run_id: str | None = Query(None),
-):
+def _query_count_sync(
+    family_id: str | None,
+    status: str | None,
+    heading_filter_ast: str | None,
+    filter_dsl: str | None,
+    meta_filters: str | None,
+    scope_mode: str | None,
+    parent_family_id: str | None,
+    parent_run_id: str | None,
+) -> Any:
     """Lightweight count for live match estimation.
 
     When ``filter_dsl`` is provided, queries the **corpus** (sections table)
@@ -6665,13 +6443,13 @@ async def query_count(
         dsl_result = parse_dsl(filter_dsl_text)
         if not dsl_result.ok:
             return {"count": 0, "query_cost": 0, "errors": [e.message for e in dsl_result.errors]}
+        # Query corpus sections
+        corpus = _get_corpus()
+        positional_index = corpus.has_table(SECTION_TOKENS_TABLE)
         multi_where, multi_params, multi_joins = build_multi_field_sql(
-            dict(dsl_result.text_fields),
+            dict(dsl_result.text_fields), positional_index=positional_index,
         )
         query_cost = dsl_result.query_cost
-
-        # Query corpus sections
-        corpus = _get_corpus()
         join_clause = " ".join(multi_joins)
         where_clause = multi_where if multi_where != "1=1" else "1=1"
         if doc_ids is not None:
@@ -6685,6 +6463,19 @@ async def query_count(
             placeholders = ", ".join("?" for _ in inherited_section_keys)
             where_clause += f" AND (s.doc_id || '::' || s.section_number) IN ({placeholders})"
             multi_params.extend(inherited_section_keys)
+        clause_prox = dsl_result.text_fields.get("clause")
+        if isinstance(clause_prox, ProximityOp) and not positional_index:
+            # Without section_tokens the SQL is a prefilter; confirm each section.
+            sql = (
+                f"SELECT DISTINCT s.doc_id, s.section_number FROM sections s {join_clause} "
+                f"WHERE {where_clause}"
+            )
+            section_rows = [
+                {"doc_id": str(r[0]), "section_number": str(r[1])}
+                for r in corpus._conn.execute(sql, multi_params).fetchall()
+            ]
+            count = len(_confirm_proximity_candidates(corpus, clause_prox, section_rows))
+            return {"count": count, "query_cost": query_cost}
         sql = f"SELECT COUNT(*) FROM sections s {join_clause} WHERE {where_clause}"
         count = corpus._conn.execute(sql, multi_params).fetchone()[0]
         return {"count": count, "query_cost": query_cost}
@@ -6706,19 +6497,48 @@ async def query_count(
     return {"count": count, "query_cost": query_cost}
 
 
+@app.get("/api/links/query/count")
+async def query_count(
+    family_id: str | None = Query(None),
+    status: str | None = Query(None),
+    heading_filter_ast: str | None = Query(None),
+    filter_dsl: str | None = Query(None),
+    meta_filters: str | None = Query(None),
+    scope_mode: str | None = Query(None),
+    parent_family_id: str | None = Query(None),
+    parent_run_id: str | None = Query(None),
+):
+    """Lightweight count for live match estimation.
+
+    When ``filter_dsl`` is provided, queries the **corpus** (sections table)
+    using multi-field SQL rather than counting existing links.
+    """
+    return await _db.read(
+        "query_count",
+        _query_count_sync,
+        family_id,
+        status,
+        heading_filter_ast,
+        filter_dsl,
+        meta_filters,
+        scope_mode,
+        parent_family_id,
+        parent_run_id,
+    )
+
+
 # ---------------------------------------------------------------------------
 # 16-18. Previews
 # ---------------------------------------------------------------------------
-@app.get("/api/links/previews/{preview_id}/candidates")
-async def get_preview_candidates(
+def _get_preview_candidates_sync(
     preview_id: str,
-    page: int = Query(1, ge=1),
-    page_size: int = Query(50, ge=1, le=10000),
-    confidence_tier: str | None = Query(None),
-    after_score: float | None = Query(None),
-    after_doc_id: str | None = Query(None),
-    after_candidate_id: str | None = Query(None),
-):
+    page: int,
+    page_size: int,
+    confidence_tier: str | None,
+    after_score: float | None,
+    after_doc_id: str | None,
+    after_candidate_id: str | None,
+) -> Any:
     """Paginated preview candidates."""
     store = _get_link_store()
     preview = store.get_preview(preview_id)
@@ -6804,12 +6624,33 @@ async def get_preview_candidates(
     }
 
 
-@app.patch("/api/links/previews/{preview_id}/candidates/verdict")
-async def update_candidate_verdicts(
-    request: Request,
+@app.get("/api/links/previews/{preview_id}/candidates")
+async def get_preview_candidates(
     preview_id: str,
-    body: dict[str, Any] = Body(...),
+    page: int = Query(1, ge=1),
+    page_size: int = Query(50, ge=1, le=10000),
+    confidence_tier: str | None = Query(None),
+    after_score: float | None = Query(None),
+    after_doc_id: str | None = Query(None),
+    after_candidate_id: str | None = Query(None),
 ):
+    """Paginated preview candidates."""
+    return await _db.read(
+        "get_preview_candidates",
+        _get_preview_candidates_sync,
+        preview_id,
+        page,
+        page_size,
+        confidence_tier,
+        after_score,
+        after_doc_id,
+        after_candidate_id,
+    )
+
+
+def _update_candidate_verdicts_sync(
+    request: Request, preview_id: str, body: dict[str, Any],
+) -> Any:
     """Batch set user_verdict on preview candidates."""
     _require_links_admin(request)
     store = _get_link_store()
@@ -6838,6 +6679,18 @@ async def update_candidate_verdicts(
     return {"updated": updated}
 
 
+@app.patch("/api/links/previews/{preview_id}/candidates/verdict")
+async def update_candidate_verdicts(
+    request: Request,
+    preview_id: str,
+    body: dict[str, Any] = Body(...),
+):
+    """Batch set user_verdict on preview candidates."""
+    return await _db.write(
+        "update_candidate_verdicts", _update_candidate_verdicts_sync, request, preview_id, body,
+    )
+
+
 def _upsert_links_from_preview_candidates(
     store: LinkStore,
     *,
@@ -7059,8 +6912,7 @@ def _upsert_links_from_preview_candidates(
     return run_id, created_count, updated_count
 
 
-@app.post("/api/links/previews/{preview_id}/promote")
-async def promote_preview(request: Request, preview_id: str):
+def _promote_preview_sync(request: Request, preview_id: str) -> Any:
     """Promote accepted candidates to family_links."""
     _require_links_admin(request)
     store = _get_link_store()
@@ -7085,6 +6937,12 @@ async def promote_preview(request: Request, preview_id: str):
     }
 
 
+@app.post("/api/links/previews/{preview_id}/promote")
+async def promote_preview(request: Request, preview_id: str):
+    """Promote accepted candidates to family_links."""
+    return await _db.write("promote_preview", _promote_preview_sync, request, preview_id)
+
+
 # Legacy preview endpoint aliases (kept for compatibility with older phase2 specs)
 def _normalize_heading_filter_ast_payload(
     payload: Any,
@@ -7130,7 +6988,9 @@ async def legacy_create_preview(
     # Old endpoint supported forcing async behavior.
     if bool(body.get("async")):
         job_id = str(uuid.uuid4())
-        store.submit_job(
+        await _db.write(
+            "legacy_create_preview",
+            _submit_job_sync,
             {
                 "job_id": job_id,
                 "job_type": "preview",
@@ -7198,13 +7058,9 @@ async def legacy_get_preview_candidates(
     return result
 
 
-@app.patch("/api/links/preview/{preview_id}/candidates/{candidate_id}")
-async def legacy_update_preview_candidate(
-    request: Request,
-    preview_id: str,
-    candidate_id: str,
-    body: dict[str, Any] = Body(...),
-):
+def _legacy_update_preview_candidate_sync(
+    request: Request, preview_id: str, candidate_id: str, body: dict[str, Any],
+) -> Any:
     _require_links_admin(request)
     try:
         parts = candidate_id.split("::", 2)
@@ -7229,12 +7085,24 @@ async def legacy_update_preview_candidate(
     return {"candidate_id": candidate_id, "user_verdict": verdict}
 
 
-@app.post("/api/links/preview/{preview_id}/apply")
-async def legacy_apply_preview(
+@app.patch("/api/links/preview/{preview_id}/candidates/{candidate_id}")
+async def legacy_update_preview_candidate(
     request: Request,
     preview_id: str,
+    candidate_id: str,
     body: dict[str, Any] = Body(...),
 ):
+    return await _db.write(
+        "legacy_update_preview_candidate",
+        _legacy_update_preview_candidate_sync,
+        request,
+        preview_id,
+        candidate_id,
+        body,
+    )
+
+
+def _legacy_apply_preview_sync(request: Request, preview_id: str, body: dict[str, Any]) -> Any:
     _require_links_admin(request)
     store = _get_link_store()
     preview = store.get_preview(preview_id)
@@ -7274,11 +7142,21 @@ async def legacy_apply_preview(
     }
 
 
+@app.post("/api/links/preview/{preview_id}/apply")
+async def legacy_apply_preview(
+    request: Request,
+    preview_id: str,
+    body: dict[str, Any] = Body(...),
+):
+    return await _db.write(
+        "legacy_apply_preview", _legacy_apply_preview_sync, request, preview_id, body,
+    )
+
+
 # ---------------------------------------------------------------------------
 # 19-21. Conflicts
 # ---------------------------------------------------------------------------
-@app.get("/api/links/conflicts")
-async def list_conflicts():
+def _list_conflicts_sync() -> Any:
     """Sections linked to multiple families with policy classification."""
     store = _get_link_store()
     rows = store._conn.execute(
@@ -7358,6 +7236,12 @@ async def list_conflicts():
     return {"conflicts": conflicts, "total": len(conflicts)}
 
 
+@app.get("/api/links/conflicts")
+async def list_conflicts():
+    """Sections linked to multiple families with policy classification."""
+    return await _db.read("list_conflicts", _list_conflicts_sync)
+
+
 @app.get("/api/links/conflict-policies")
 async def get_conflict_policies():
     """Return the conflict compatibility matrix."""
@@ -7370,16 +7254,21 @@ async def get_conflict_policies():
     return {"policies": policies, "total": len(policies)}
 
 
+def _create_conflict_policy_sync(request: Request, body: dict[str, Any]) -> Any:
+    """Create or update a conflict resolution meta-rule."""
+    _require_links_admin(request)
+    store = _get_link_store()
+    store.save_conflict_policy(body)
+    return {"status": "saved"}
+
+
 @app.post("/api/links/conflict-policies")
 async def create_conflict_policy(
     request: Request,
     body: dict[str, Any] = Body(...),
 ):
     """Create or update a conflict resolution meta-rule."""
-    _require_links_admin(request)
-    store = _get_link_store()
-    store.save_conflict_policy(body)
-    return {"status": "saved"}
+    return await _db.write("create_conflict_policy", _create_conflict_policy_sync, request, body)
 
 
 # ---------------------------------------------------------------------------
@@ -7500,11 +7389,7 @@ async def list_rules(
     return {"rules": rules, "total": len(rules)}
 
 
-@app.post("/api/links/rules", status_code=201)
-async def create_rule(
-    request: Request,
-    body: dict[str, Any] = Body(...),
-):
+def _create_rule_sync(request: Request, body: dict[str, Any]) -> Any:
     """Create or update a link rule."""
     _require_links_admin(request)
     store = _get_link_store()
@@ -7539,6 +7424,15 @@ async def create_rule(
     return {"status": "saved", "rule_id": payload["rule_id"]}
 
 
+@app.post("/api/links/rules", status_code=201)
+async def create_rule(
+    request: Request,
+    body: dict[str, Any] = Body(...),
+):
+    """Create or update a link rule."""
+    return await _db.write("create_rule", _create_rule_sync, request, body)
+
+
 @app.get("/api/links/rules/{rule_id}")
 async def get_rule(rule_id: str):
     """Fetch a single rule."""
@@ -7549,12 +7443,7 @@ async def get_rule(rule_id: str):
     return _rule_to_api(store, rule)
 
 
-@app.patch("/api/links/rules/{rule_id}")
-async def update_rule(
-    request: Request,
-    rule_id: str,
-    body: dict[str, Any] = Body(...),
-):
+def _update_rule_sync(request: Request, rule_id: str, body: dict[str, Any]) -> Any:
     """Patch a rule in place."""
     _require_links_admin(request)
     store = _get_link_store()
@@ -7566,8 +7455,17 @@ async def update_rule(
     return {"updated": True, "rule_id": rule_id}
 
 
-@app.post("/api/links/rules/{rule_id}/publish")
-async def publish_rule(request: Request, rule_id: str):
+@app.patch("/api/links/rules/{rule_id}")
+async def update_rule(
+    request: Request,
+    rule_id: str,
+    body: dict[str, Any] = Body(...),
+):
+    """Patch a rule in place."""
+    return await _db.write("update_rule", _update_rule_sync, request, rule_id, body)
+
+
+def _publish_rule_sync(request: Request, rule_id: str) -> Any:
     """Publish a rule."""
     _require_links_admin(request)
     store = _get_link_store()
@@ -7578,8 +7476,13 @@ async def publish_rule(request: Request, rule_id: str):
     return {"published": True, "rule_id": rule_id}
 
 
-@app.post("/api/links/rules/{rule_id}/archive")
-async def archive_rule(request: Request, rule_id: str):
+@app.post("/api/links/rules/{rule_id}/publish")
+async def publish_rule(request: Request, rule_id: str):
+    """Publish a rule."""
+    return await _db.write("publish_rule", _publish_rule_sync, request, rule_id)
+
+
+def _archive_rule_sync(request: Request, rule_id: str) -> Any:
     """Archive a rule."""
     _require_links_admin(request)
     store = _get_link_store()
@@ -7590,8 +7493,13 @@ async def archive_rule(request: Request, rule_id: str):
     return {"archived": True, "rule_id": rule_id}
 
 
-@app.delete("/api/links/rules/{rule_id}")
-async def delete_rule(request: Request, rule_id: str):
+@app.post("/api/links/rules/{rule_id}/archive")
+async def archive_rule(request: Request, rule_id: str):
+    """Archive a rule."""
+    return await _db.write("archive_rule", _archive_rule_sync, request, rule_id)
+
+
+def _delete_rule_sync(request: Request, rule_id: str) -> Any:
     """Permanently delete a rule."""
     _require_links_admin(request)
     store = _get_link_store()
@@ -7607,8 +7515,13 @@ async def delete_rule(request: Request, rule_id: str):
     return {"deleted": True, "rule_id": rule_id}
 
 
-@app.post("/api/links/rules/{rule_id}/lock")
-async def lock_rule(request: Request, rule_id: str):
+@app.delete("/api/links/rules/{rule_id}")
+async def delete_rule(request: Request, rule_id: str):
+    """Permanently delete a rule."""
+    return await _db.write("delete_rule", _delete_rule_sync, request, rule_id)
+
+
+def _lock_rule_sync(request: Request, rule_id: str) -> Any:
     _require_links_admin(request)
     store = _get_link_store()
     existing = store.get_rule(rule_id)
@@ -7630,8 +7543,12 @@ async def lock_rule(request: Request, rule_id: str):
     return {"locked": True, "rule_id": rule_id, "locked_by": actor}
 
 
-@app.post("/api/links/rules/{rule_id}/unlock")
-async def unlock_rule(request: Request, rule_id: str):
+@app.post("/api/links/rules/{rule_id}/lock")
+async def lock_rule(request: Request, rule_id: str):
+    return await _db.write("lock_rule", _lock_rule_sync, request, rule_id)
+
+
+def _unlock_rule_sync(request: Request, rule_id: str) -> Any:
     _require_links_admin(request)
     store = _get_link_store()
     existing = store.get_rule(rule_id)
@@ -7641,8 +7558,12 @@ async def unlock_rule(request: Request, rule_id: str):
     return {"unlocked": True, "rule_id": rule_id}
 
 
-@app.post("/api/links/rules/{rule_id}/clone", status_code=201)
-async def clone_rule(request: Request, rule_id: str):
+@app.post("/api/links/rules/{rule_id}/unlock")
+async def unlock_rule(request: Request, rule_id: str):
+    return await _db.write("unlock_rule", _unlock_rule_sync, request, rule_id)
+
+
+def _clone_rule_sync(request: Request, rule_id: str) -> Any:
     """Clone a rule as a new draft."""
     _require_links_admin(request)
     store = _get_link_store()
@@ -7654,13 +7575,18 @@ async def clone_rule(request: Request, rule_id: str):
         raise HTTPException(status_code=404, detail=str(e))
 
 
-@app.get("/api/links/rules/compare")
-async def compare_rules(
-    rule_a: str | None = Query(None),
-    rule_b: str | None = Query(None),
-    rule_id_a: str | None = Query(None),
-    rule_id_b: str | None = Query(None),
-):
+@app.post("/api/links/rules/{rule_id}/clone", status_code=201)
+async def clone_rule(request: Request, rule_id: str):
+    """Clone a rule as a new draft."""
+    return await _db.write("clone_rule", _clone_rule_sync, request, rule_id)
+
+
+def _compare_rules_sync(
+    rule_a: str | None,
+    rule_b: str | None,
+    rule_id_a: str | None,
+    rule_id_b: str | None,
+) -> Any:
     """Compare two rules: delta, added/removed/overlap."""
     store = _get_link_store()
     resolved_a = str(rule_a or rule_id_a or "")
@@ -7723,8 +7649,20 @@ async def compare_rules(
     }
 
 
-@app.post("/api/links/rules/{rule_id}/promote")
-async def promote_rule(request: Request, rule_id: str):
+@app.get("/api/links/rules/compare")
+async def compare_rules(
+    rule_a: str | None = Query(None),
+    rule_b: str | None = Query(None),
+    rule_id_a: str | None = Query(None),
+    rule_id_b: str | None = Query(None),
+):
+    """Compare two rules: delta, added/removed/overlap."""
+    return await _db.read(
+        "compare_rules", _compare_rules_sync, rule_a, rule_b, rule_id_a, rule_id_b,
+    )
+
+
+def _promote_rule_sync(request: Request, rule_id: str) -> Any:
     """Promote a rule with gate checks."""
     _require_links_admin(request)
     store = _get_link_store()
@@ -7741,6 +7679,12 @@ async def promote_rule(request: Request, rule_id: str):
     return {"promoted": True, "gates": gates}
 
 
+@app.post("/api/links/rules/{rule_id}/promote")
+async def promote_rule(request: Request, rule_id: str):
+    """Promote a rule with gate checks."""
+    return await _db.write("promote_rule", _promote_rule_sync, request, rule_id)
+
+
 @app.get("/api/links/rules/{rule_id}/promotion-gates")
 async def get_promotion_gates(rule_id: str):
     store = _get_link_store()
@@ -7792,8 +7736,7 @@ async def validate_rule_dsl(
 # ---------------------------------------------------------------------------
 # 32-36. Sessions & Marks
 # ---------------------------------------------------------------------------
-@app.post("/api/links/sessions")
-async def create_session(body: dict[str, Any] = Body(...)):
+def _create_session_sync(body: dict[str, Any]) -> Any:
     """Get or create a review session."""
     store = _get_link_store()
     scope_type = str(body.get("scope_type") or ("family" if body.get("family_id") else "global"))
@@ -7805,8 +7748,13 @@ async def create_session(body: dict[str, Any] = Body(...)):
     return session
 
 
-@app.get("/api/links/sessions/{session_id}")
-async def get_session(session_id: str):
+@app.post("/api/links/sessions")
+async def create_session(body: dict[str, Any] = Body(...)):
+    """Get or create a review session."""
+    return await _db.write("create_session", _create_session_sync, body)
+
+
+def _get_session_sync(session_id: str) -> Any:
     """Fetch a session with aggregate counters in frontend-friendly shape."""
     store = _get_link_store()
     row = store._conn.execute(  # noqa: SLF001
@@ -7855,8 +7803,13 @@ async def get_session(session_id: str):
     return {"session": session}
 
 
-@app.patch("/api/links/sessions/{session_id}/cursor")
-async def update_cursor(session_id: str, body: dict[str, Any] = Body(...)):
+@app.get("/api/links/sessions/{session_id}")
+async def get_session(session_id: str):
+    """Fetch a session with aggregate counters in frontend-friendly shape."""
+    return await _db.read("get_session", _get_session_sync, session_id)
+
+
+def _update_cursor_sync(session_id: str, body: dict[str, Any]) -> Any:
     """Update cursor position."""
     store = _get_link_store()
     cursor_link_id = body.get("cursor_link_id")
@@ -7876,8 +7829,13 @@ async def update_cursor(session_id: str, body: dict[str, Any] = Body(...)):
     }
 
 
-@app.post("/api/links/sessions/{session_id}/marks")
-async def add_mark(session_id: str, body: dict[str, Any] = Body(...)):
+@app.patch("/api/links/sessions/{session_id}/cursor")
+async def update_cursor(session_id: str, body: dict[str, Any] = Body(...)):
+    """Update cursor position."""
+    return await _db.write("update_cursor", _update_cursor_sync, session_id, body)
+
+
+def _add_mark_sync(session_id: str, body: dict[str, Any]) -> Any:
     """Add a viewed/bookmarked/flagged mark."""
     store = _get_link_store()
     action = str(body.get("action", "")).strip().lower()
@@ -7922,8 +7880,13 @@ async def add_mark(session_id: str, body: dict[str, Any] = Body(...)):
     }
 
 
-@app.get("/api/links/sessions/{session_id}/marks")
-async def get_session_marks(session_id: str):
+@app.post("/api/links/sessions/{session_id}/marks")
+async def add_mark(session_id: str, body: dict[str, Any] = Body(...)):
+    """Add a viewed/bookmarked/flagged mark."""
+    return await _db.write("add_mark", _add_mark_sync, session_id, body)
+
+
+def _get_session_marks_sync(session_id: str) -> Any:
     """List marks for a session."""
     store = _get_link_store()
     rows = store._conn.execute(  # noqa: SLF001
@@ -7935,16 +7898,26 @@ async def get_session_marks(session_id: str):
     return {"marks": marks, "total": len(marks)}
 
 
-@app.get("/api/links/sessions/{session_id}/bookmarks")
-async def get_bookmarks(session_id: str):
+@app.get("/api/links/sessions/{session_id}/marks")
+async def get_session_marks(session_id: str):
+    """List marks for a session."""
+    return await _db.read("get_session_marks", _get_session_marks_sync, session_id)
+
+
+def _get_bookmarks_sync(session_id: str) -> Any:
     """List bookmarked items in a session."""
     store = _get_link_store()
     marks = store.get_bookmarks(session_id)
     return {"bookmarks": marks, "total": len(marks)}
 
 
-@app.get("/api/links/sessions/{session_id}/progress")
-async def get_session_progress(session_id: str):
+@app.get("/api/links/sessions/{session_id}/bookmarks")
+async def get_bookmarks(session_id: str):
+    """List bookmarked items in a session."""
+    return await _db.read("get_bookmarks", _get_bookmarks_sync, session_id)
+
+
+def _get_session_progress_sync(session_id: str) -> Any:
     """Session progress stats."""
     store = _get_link_store()
     progress = store.session_progress(session_id)
@@ -7953,6 +7926,12 @@ async def get_session_progress(session_id: str):
     return {"session_id": session_id, **progress}
 
 
+@app.get("/api/links/sessions/{session_id}/progress")
+async def get_session_progress(session_id: str):
+    """Session progress stats."""
+    return await _db.read("get_session_progress", _get_session_progress_sync, session_id)
+
+
 @app.post("/api/links/review-sessions")
 async def legacy_create_review_session(body: dict[str, Any] = Body(...)):
     """Backward-compatible alias for /api/links/sessions."""
@@ -7980,8 +7959,7 @@ async def legacy_add_review_mark(body: dict[str, Any] = Body(...)):
     return await add_mark(session_id, body)
 
 
-@app.get("/api/links/review-marks")
-async def legacy_get_review_marks(mark_type: str = Query("bookmarked")):
+def _legacy_get_review_marks_sync(mark_type: str) -> Any:
     """Backward-compatible mark list endpoint across sessions."""
     store = _get_link_store()
     rows = store._conn.execute(  # noqa: SLF001
@@ -7993,11 +7971,16 @@ async def legacy_get_review_marks(mark_type: str = Query("bookmarked")):
     return {"marks": marks, "total": len(marks)}
 
 
+@app.get("/api/links/review-marks")
+async def legacy_get_review_marks(mark_type: str = Query("bookmarked")):
+    """Backward-compatible mark list endpoint across sessions."""
+    return await _db.read("legacy_get_review_marks", _legacy_get_review_marks_sync, mark_type)
+
+
 # ---------------------------------------------------------------------------
 # 37-39. Undo / Redo
 # ---------------------------------------------------------------------------
-@app.post("/api/links/undo")
-async def undo_action(request: Request):
+def _undo_action_sync(request: Request) -> Any:
     """Undo the last batch action."""
     _require_links_admin(request)
     store = _get_link_store()
@@ -8007,8 +7990,13 @@ async def undo_action(request: Request):
     return result
 
 
-@app.post("/api/links/redo")
-async def redo_action(request: Request):
+@app.post("/api/links/undo")
+async def undo_action(request: Request):
+    """Undo the last batch action."""
+    return await _db.write("undo_action", _undo_action_sync, request)
+
+
+def _redo_action_sync(request: Request) -> Any:
     """Redo the last undone action."""
     _require_links_admin(request)
     store = _get_link_store()
@@ -8018,6 +8006,12 @@ async def redo_action(request: Request):
     return result
 
 
+@app.post("/api/links/redo")
+async def redo_action(request: Request):
+    """Redo the last undone action."""
+    return await _db.write("redo_action", _redo_action_sync, request)
+
+
 @app.get("/api/links/undo-stack")
 async def get_undo_stack():
     """Recent undo batches."""
@@ -8029,8 +8023,7 @@ async def get_undo_stack():
 # ---------------------------------------------------------------------------
 # 40-44. Analytics & Monitoring
 # ---------------------------------------------------------------------------
-@app.get("/api/links/analytics/unlink-reasons")
-async def unlink_reasons():
+def _unlink_reasons_sync() -> Any:
     """Unlink reason taxonomy with counts."""
     store = _get_link_store()
     rows = store._conn.execute("""
@@ -8042,11 +8035,13 @@ async def unlink_reasons():
     return {"reasons": [{"reason": r[0], "count": r[1]} for r in rows]}
 
 
-@app.get("/api/links/analytics")
-async def links_analytics_dashboard(
-    family_id: str | None = Query(None),
-    scope_id: str | None = Query(None),
-):
+@app.get("/api/links/analytics/unlink-reasons")
+async def unlink_reasons():
+    """Unlink reason taxonomy with counts."""
+    return await _db.read("unlink_reasons", _unlink_reasons_sync)
+
+
+def _links_analytics_dashboard_sync(family_id: str | None, scope_id: str | None) -> Any:
     """Top-level analytics payload for the dashboard tab."""
     store = _get_link_store()
     requested_scope = str(scope_id or family_id or "").strip() or None
@@ -8171,6 +8166,17 @@ async def links_analytics_dashboard(
     }
 
 
+@app.get("/api/links/analytics")
+async def links_analytics_dashboard(
+    family_id: str | None = Query(None),
+    scope_id: str | None = Query(None),
+):
+    """Top-level analytics payload for the dashboard tab."""
+    return await _db.read(
+        "links_analytics_dashboard", _links_analytics_dashboard_sync, family_id, scope_id,
+    )
+
+
 @app.get("/api/links/intelligence/signals")
 async def links_intelligence_signals(
     scope_id: str | None = Query(None),
@@ -8370,14 +8376,13 @@ async def links_intelligence_evidence(
     }
 
 
-@app.get("/api/links/intelligence/ops")
-async def links_intelligence_ops(
-    scope_id: str | None = Query(None),
-    family_id: str | None = Query(None),
-    stale_minutes: int = Query(60, ge=1, le=24 * 60),
-    run_limit: int = Query(20, ge=1, le=200),
-    job_limit: int = Query(50, ge=1, le=200),
-):
+def _links_intelligence_ops_sync(
+    scope_id: str | None,
+    family_id: str | None,
+    stale_minutes: int,
+    run_limit: int,
+    job_limit: int,
+) -> Any:
     """Operational telemetry (agents, jobs, runs) scoped for ontology links."""
     requested_scope = str(scope_id or family_id or "").strip() or None
     scope_ctx, strategy_rows = _strategy_rows_for_scope(requested_scope)
@@ -8549,12 +8554,27 @@ async def links_intelligence_ops(
     }
 
 
-@app.post("/api/links/calibrate/{family_id}")
-async def calibrate_family(
-    request: Request,
-    family_id: str,
-    body: dict[str, Any] = Body(...),
+@app.get("/api/links/intelligence/ops")
+async def links_intelligence_ops(
+    scope_id: str | None = Query(None),
+    family_id: str | None = Query(None),
+    stale_minutes: int = Query(60, ge=1, le=24 * 60),
+    run_limit: int = Query(20, ge=1, le=200),
+    job_limit: int = Query(50, ge=1, le=200),
 ):
+    """Operational telemetry (agents, jobs, runs) scoped for ontology links."""
+    return await _db.read(
+        "links_intelligence_ops",
+        _links_intelligence_ops_sync,
+        scope_id,
+        family_id,
+        stale_minutes,
+        run_limit,
+        job_limit,
+    )
+
+
+def _calibrate_family_sync(request: Request, family_id: str, body: dict[str, Any]) -> Any:
     """Recalibrate confidence thresholds for a family."""
     _require_links_admin(request)
     store = _get_link_store()
@@ -8568,6 +8588,16 @@ async def calibrate_family(
     return thresholds
 
 
+@app.post("/api/links/calibrate/{family_id}")
+async def calibrate_family(
+    request: Request,
+    family_id: str,
+    body: dict[str, Any] = Body(...),
+):
+    """Recalibrate confidence thresholds for a family."""
+    return await _db.write("calibrate_family", _calibrate_family_sync, request, family_id, body)
+
+
 # ---------------------------------------------------------------------------
 # 45-46. Jobs
 # ---------------------------------------------------------------------------
@@ -8612,8 +8642,7 @@ async def get_link_job_status(job_id: str):
     return job
 
 
-@app.delete("/api/links/jobs/{job_id}")
-async def cancel_link_job(request: Request, job_id: str):
+def _cancel_link_job_sync(request: Request, job_id: str) -> Any:
     """Cancel a pending/claimed link job."""
     _require_links_admin(request)
     store = _get_link_store()
@@ -8626,15 +8655,17 @@ async def cancel_link_job(request: Request, job_id: str):
     return {"cancelled": True}
 
 
+@app.delete("/api/links/jobs/{job_id}")
+async def cancel_link_job(request: Request, job_id: str):
+    """Cancel a pending/claimed link job."""
+    return await _db.write("cancel_link_job", _cancel_link_job_sync, request, job_id)
+
+
 # ---------------------------------------------------------------------------
 # 47-51. Export / Import
 # ---------------------------------------------------------------------------
-@app.post("/api/links/export")
-async def export_links(
-    request: Request,
-    body: dict[str, Any] = Body(...),
-):
-    """Export links as CSV/JSONL (async job)."""
+def _export_links_sync(request: Request, body: dict[str, Any]) -> Any:
+    """Export links as CSV/JSONL/Parquet (async job)."""
     _require_links_admin(request)
     store = _get_link_store()
     job_id = str(uuid.uuid4())
@@ -8645,16 +8676,60 @@ async def export_links(
             "format": body.get("format", "csv"),
             "family_id": body.get("family_id"),
             "status": body.get("status"),
+            "include_evidence": bool(body.get("include_evidence")),
+            "include_defined_terms": bool(body.get("include_defined_terms")),
         },
     })
     return {"job_id": job_id}
 
 
-@app.post("/api/links/import")
-async def import_links(
+@app.post("/api/links/export")
+async def export_links(
     request: Request,
-    body: LinksImportRequest = Body(...),
+    body: dict[str, Any] = Body(...),
 ):
+    """Export links as CSV/JSONL/Parquet (async job).
+
+    The worker streams the file into the export directory; download it
+    from ``GET /api/links/export/{job_id}`` once the job completes.
+    """
+    return await _db.write("export_links", _export_links_sync, request, body)
+
+
+_EXPORT_MEDIA_TYPES = {
+    "csv": "text/csv",
+    "jsonl": "application/x-ndjson",
+    "parquet": "application/vnd.apache.parquet",
+}
+
+
+@app.get("/api/links/export/{job_id}")
+async def download_links_export(request: Request, job_id: str):
+    """Download the file written by a completed export job."""
+    _require_links_admin(request)
+    store = _get_link_store()
+    job = store.get_job(job_id)
+    if job is None or job.get("job_type") != "export":
+        raise HTTPException(status_code=404, detail=f"Export job not found: {job_id}")
+    if job.get("status") != "completed":
+        raise HTTPException(
+            status_code=409, detail=f"Export job is {job.get('status')}, not completed",
+        )
+    result_raw = job.get("result_json")
+    result = json.loads(result_raw) if isinstance(result_raw, str) and result_raw else {}
+    file_name = str(result.get("file_name") or "")
+    # Only serve files from the export directory, whatever the job recorded.
+    path = _links_export_dir / Path(file_name).name if file_name else None
+    if path is None or not path.is_file():
+        raise HTTPException(status_code=404, detail="Export file is no longer available")
+    return FileResponse(
+        path,
+        media_type=_EXPORT_MEDIA_TYPES.get(path.suffix.lstrip("."), "application/octet-stream"),
+        filename=path.name,
+    )
+
+
+def _import_links_sync(request: Request, body: LinksImportRequest) -> Any:
     """Import adjudicated labels."""
     _require_links_admin(request)
     store = _get_link_store()
@@ -8666,6 +8741,15 @@ async def import_links(
     return {"imported": created, "run_id": run_id}
 
 
+@app.post("/api/links/import")
+async def import_links(
+    request: Request,
+    body: LinksImportRequest = Body(...),
+):
+    """Import adjudicated labels."""
+    return await _db.write("import_links", _import_links_sync, request, body)
+
+
 @app.get("/api/links/rules/{rule_id}/export")
 async def export_rule(rule_id: str):
     """Export rule as JSON."""
@@ -8719,11 +8803,7 @@ async def batch_run(
     }
 
 
-@app.get("/api/links/runs")
-async def list_link_runs(
-    family_id: str | None = Query(None),
-    limit: int = Query(50, ge=1, le=500),
-):
+def _list_link_runs_sync(family_id: str | None, limit: int) -> Any:
     store = _get_link_store()
     run_rule_cache: dict[str, dict[str, Any] | None] = {}
     requested_scope = _canonicalize_scope_id(store, family_id) if family_id else ""
@@ -8812,6 +8892,14 @@ async def list_link_runs(
     return {"runs": runs, "total": len(runs)}
 
 
+@app.get("/api/links/runs")
+async def list_link_runs(
+    family_id: str | None = Query(None),
+    limit: int = Query(50, ge=1, le=500),
+):
+    return await _db.read("list_link_runs", _list_link_runs_sync, family_id, limit)
+
+
 @app.get("/api/links/runs/{run_id}/replay-bundle")
 async def get_replay_bundle(run_id: str):
     """Export durable replay bundle."""
@@ -9019,8 +9107,7 @@ async def definitions_peek(
 # ---------------------------------------------------------------------------
 # 54-55. Diagnostic
 # ---------------------------------------------------------------------------
-@app.post("/api/links/coverage/why-not")
-async def why_not_matched(body: dict[str, Any] = Body(...)):
+def _why_not_matched_sync(body: dict[str, Any]) -> Any:
     """Per-doc 'why not matched' with traffic-light AST evaluation."""
     doc_id = str(body.get("doc_id", ""))
     section_number = str(body.get("section_number", "") or "")
@@ -9113,8 +9200,13 @@ async def why_not_matched(body: dict[str, Any] = Body(...)):
     }
 
 
-@app.post("/api/links/coverage/counterfactual")
-async def counterfactual(body: dict[str, Any] = Body(...)):
+@app.post("/api/links/coverage/why-not")
+async def why_not_matched(body: dict[str, Any] = Body(...)):
+    """Per-doc 'why not matched' with traffic-light AST evaluation."""
+    return await _db.read("why_not_matched", _why_not_matched_sync, body)
+
+
+def _counterfactual_sync(body: dict[str, Any]) -> Any:
     """Counterfactual analysis: what if we mute a node?"""
     store = _get_link_store()
     family_id = str(body.get("family_id", ""))
@@ -9163,11 +9255,16 @@ async def counterfactual(body: dict[str, Any] = Body(...)):
         "fps_estimate": false_positives,
     }
 
+
+@app.post("/api/links/coverage/counterfactual")
+async def counterfactual(body: dict[str, Any] = Body(...)):
+    """Counterfactual analysis: what if we mute a node?"""
+    return await _db.read("counterfactual", _counterfactual_sync, body)
+
 # ---------------------------------------------------------------------------
 # 56. Queue
 # ---------------------------------------------------------------------------
-@app.post("/api/links/sessions/{session_id}/claim-batch")
-async def claim_batch(session_id: str, body: dict[str, Any] = Body(...)):
+def _claim_batch_sync(session_id: str, body: dict[str, Any]) -> Any:
     """Reserve N rows for current reviewer."""
     store = _get_link_store()
     try:
@@ -9209,15 +9306,16 @@ async def claim_batch(session_id: str, body: dict[str, Any] = Body(...)):
     }
 
 
+@app.post("/api/links/sessions/{session_id}/claim-batch")
+async def claim_batch(session_id: str, body: dict[str, Any] = Body(...)):
+    """Reserve N rows for current reviewer."""
+    return await _db.write("claim_batch", _claim_batch_sync, session_id, body)
+
+
 # ---------------------------------------------------------------------------
 # 57-58. Reassign
 # ---------------------------------------------------------------------------
-@app.post("/api/links/{link_id}/reassign")
-async def reassign_link(
-    request: Request,
-    link_id: str,
-    body: dict[str, Any] = Body(...),
-):
+def _reassign_link_sync(request: Request, link_id: str, body: dict[str, Any]) -> Any:
     """Move link to different family."""
     _require_links_admin(request)
     store = _get_link_store()
@@ -9228,6 +9326,16 @@ async def reassign_link(
     return result
 
 
+@app.post("/api/links/{link_id}/reassign")
+async def reassign_link(
+    request: Request,
+    link_id: str,
+    body: dict[str, Any] = Body(...),
+):
+    """Move link to different family."""
+    return await _db.write("reassign_link", _reassign_link_sync, request, link_id, body)
+
+
 @app.get("/api/links/{link_id}/reassign-suggestions")
 async def reassign_suggestions(link_id: str):
     """Top 5 likely families for reassignment."""
@@ -9315,6 +9423,15 @@ async def get_link_defined_terms(link_id: str):
     return {"terms": terms, "total": len(terms)}
 
 
+def _bind_defined_terms_sync(request: Request, link_id: str, body: dict[str, Any]) -> Any:
+    """Bind defined terms to a link."""
+    _require_links_admin(request)
+    store = _get_link_store()
+    terms = body.get("terms", [])
+    saved = store.save_link_defined_terms(link_id, terms)
+    return {"saved": saved}
+
+
 @app.post("/api/links/{link_id}/defined-terms")
 async def bind_defined_terms(
     request: Request,
@@ -9322,11 +9439,7 @@ async def bind_defined_terms(
     body: dict[str, Any] = Body(...),
 ):
     """Bind defined terms to a link."""
-    _require_links_admin(request)
-    store = _get_link_store()
-    terms = body.get("terms", [])
-    saved = store.save_link_defined_terms(link_id, terms)
-    return {"saved": saved}
+    return await _db.write("bind_defined_terms", _bind_defined_terms_sync, request, link_id, body)
 
 
 # ---------------------------------------------------------------------------
@@ -9360,7 +9473,7 @@ def _compute_embeddings_sync(
     sections: list[dict[str, str]] = []
     for link in links:
         if _corpus is not None:
-            text = _corpus.get_section_text(
+            text = _get_corpus().get_section_text(
                 link["doc_id"], link["section_number"],
             )
             if text:
@@ -9420,15 +9533,15 @@ async def compute_embeddings(
 ):
     """Compute embeddings in-process (bypasses worker due to DuckDB lock).
 
-    Returns immediately with a job_id. The computation runs in a background
-    thread.  Poll ``GET /api/links/embeddings/job/{job_id}`` for status.
+    Returns immediately with a job_id. The computation runs on the DuckDB
+    writer thread.  Poll ``GET /api/links/embeddings/job/{job_id}`` for status.
     """
     _require_links_admin(request)
     family_id = body.get("family_id")
     job_id = str(uuid.uuid4())
 
     async def _run() -> dict[str, Any]:
-        return await asyncio.to_thread(_compute_embeddings_sync, family_id)
+        return await _db.write("compute_embeddings", _compute_embeddings_sync, family_id)
 
     task = asyncio.create_task(_run())
     _embedding_jobs[job_id] = task
@@ -9536,19 +9649,13 @@ async def list_centroids():
     return {"centroids": centroids}
 
 
-@app.get("/api/links/embeddings/similar")
-async def similar_sections(
-    family_id: str = Query(...),
-    doc_id: str | None = Query(None),
-    top_k: int = Query(10, ge=1, le=50),
-):
+def _similar_sections_sync(family_id: str, doc_id: str | None, top_k: int) -> Any:
     """Top-K semantically similar sections using real cosine similarity.
 
-    Retrieves the family centroid, then scores all stored section embeddings
-    against it.  Falls back to active links if no centroid/embeddings exist.
+    Retrieves the family centroid, then queries the approximate
+    nearest-neighbour index over stored section embeddings.  Falls back to
+    active links if no centroid/embeddings exist.
     """
-    from agent.embeddings import cosine_similarity as _cosine_sim  # noqa: E402
-
     store = _get_link_store()
     conn = store._conn  # noqa: SLF001
 
@@ -9565,24 +9672,8 @@ async def similar_sections(
         centroid_bytes = bytes(centroid_row[0])
         model_ver = str(centroid_row[1])
 
-        # Retrieve all section embeddings for this model version
-        emb_rows = conn.execute(
-            "SELECT doc_id, section_number, embedding_vector "
-            "FROM section_embeddings WHERE model_version = ?",
-            [model_ver],
-        ).fetchall()
-
-        scored: list[tuple[str, str, float]] = []
-        for row in emb_rows:
-            try:
-                sim = _cosine_sim(centroid_bytes, bytes(row[2]))
-                scored.append((str(row[0]), str(row[1]), sim))
-            except ValueError:
-                continue
-
-        # Sort by similarity descending, take top_k
-        scored.sort(key=lambda x: x[2], reverse=True)
-        for s_doc_id, s_sec, sim in scored[:top_k]:
+        scored = store.embedding_index(model_ver).search(centroid_bytes, top_k=top_k)
+        for s_doc_id, s_sec, sim in scored:
             # Look up heading from sections in corpus or links
             heading = f"Section {s_sec}"
             heading_row = conn.execute(
@@ -9595,7 +9686,7 @@ async def similar_sections(
                 heading = str(heading_row[0])
             elif _corpus is not None:
                 try:
-                    sec_rows = _corpus.query(
+                    sec_rows = _get_corpus().query(
                         "SELECT heading FROM sections "
                         "WHERE doc_id = ? AND section_number = ?",
                         [s_doc_id, s_sec],
@@ -9630,11 +9721,17 @@ async def similar_sections(
     return {"candidates": candidates, "total": len(candidates)}
 
 
-@app.post("/api/links/centroids/recompute")
-async def recompute_centroids(
-    request: Request,
-    body: dict[str, Any] = Body(...),
+@app.get("/api/links/embeddings/similar")
+async def similar_sections(
+    family_id: str = Query(...),
+    doc_id: str | None = Query(None),
+    top_k: int = Query(10, ge=1, le=50),
 ):
+    """Top-K semantically similar sections using real cosine similarity."""
+    return await _db.read("similar_sections", _similar_sections_sync, family_id, doc_id, top_k)
+
+
+def _recompute_centroids_sync(request: Request, body: dict[str, Any]) -> Any:
     """Recompute family centroid from active link embeddings."""
     _require_links_admin(request)
     family_id = body.get("family_id", "")
@@ -9664,6 +9761,15 @@ async def recompute_centroids(
     }
 
 
+@app.post("/api/links/centroids/recompute")
+async def recompute_centroids(
+    request: Request,
+    body: dict[str, Any] = Body(...),
+):
+    """Recompute family centroid from active link embeddings."""
+    return await _db.write("recompute_centroids", _recompute_centroids_sync, request, body)
+
+
 # ---------------------------------------------------------------------------
 # 74-76. Starter Kits
 # ---------------------------------------------------------------------------
@@ -9719,8 +9825,7 @@ async def get_starter_kit(family_id: str):
     return _starter_kit_to_api(family_id, kit)
 
 
-@app.post("/api/links/starter-kit/{family_id}/generate")
-async def generate_starter_kit(request: Request, family_id: str):
+def _generate_starter_kit_sync(request: Request, family_id: str) -> Any:
     """Compute starter kit from corpus stats + ontology."""
     _require_links_admin(request)
     store = _get_link_store()
@@ -9744,8 +9849,13 @@ async def generate_starter_kit(request: Request, family_id: str):
     return _starter_kit_to_api(family_id, normalized_kit)
 
 
-@app.post("/api/links/starter-kit/{family_id}/generate-rule-draft")
-async def generate_rule_draft(request: Request, family_id: str):
+@app.post("/api/links/starter-kit/{family_id}/generate")
+async def generate_starter_kit(request: Request, family_id: str):
+    """Compute starter kit from corpus stats + ontology."""
+    return await _db.write("generate_starter_kit", _generate_starter_kit_sync, request, family_id)
+
+
+def _generate_rule_draft_sync(request: Request, family_id: str) -> Any:
     """Auto-scaffold a draft rule from starter kit."""
     _require_links_admin(request)
     store = _get_link_store()
@@ -9773,6 +9883,12 @@ async def generate_rule_draft(request: Request, family_id: str):
     return _rule_to_api(store, rule)
 
 
+@app.post("/api/links/starter-kit/{family_id}/generate-rule-draft")
+async def generate_rule_draft(request: Request, family_id: str):
+    """Auto-scaffold a draft rule from starter kit."""
+    return await _db.write("generate_rule_draft", _generate_rule_draft_sync, request, family_id)
+
+
 # ---------------------------------------------------------------------------
 # 77. Comparables
 # ---------------------------------------------------------------------------
@@ -9883,11 +9999,7 @@ async def list_template_baselines(family_id: str | None = Query(None)):
     return {"baselines": baselines, "total": len(baselines)}
 
 
-@app.post("/api/links/template-baselines")
-async def save_template_baseline(
-    request: Request,
-    body: dict[str, Any] = Body(...),
-):
+def _save_template_baseline_sync(request: Request, body: dict[str, Any]) -> Any:
     """Save a template baseline."""
     _require_links_admin(request)
     store = _get_link_store()
@@ -9917,6 +10029,15 @@ async def save_template_baseline(
     return {"status": "saved"}
 
 
+@app.post("/api/links/template-baselines")
+async def save_template_baseline(
+    request: Request,
+    body: dict[str, Any] = Body(...),
+):
+    """Save a template baseline."""
+    return await _db.write("save_template_baseline", _save_template_baseline_sync, request, body)
+
+
 @app.get("/api/links/template-baselines/text")
 async def get_template_baseline_text(
     family_id: str = Query(...),
@@ -9996,11 +10117,7 @@ async def validate_dsl_standalone(body: dict[str, Any] = Body(...)):
     }
 
 
-@app.post("/api/links/_test/seed")
-async def test_seed(
-    request: Request,
-    body: dict[str, Any] = Body(...),
-):
+def _test_seed_sync(request: Request, body: dict[str, Any]) -> Any:
     """Seed test data (only when LINKS_TEST_MODE=1)."""
     _require_test_endpoint_access(request)
     store = _get_link_store()
@@ -10035,8 +10152,16 @@ async def test_seed(
     }
 
 
-@app.post("/api/links/_test/reset")
-async def test_reset(request: Request):
+@app.post("/api/links/_test/seed")
+async def test_seed(
+    request: Request,
+    body: dict[str, Any] = Body(...),
+):
+    """Seed test data (only when LINKS_TEST_MODE=1)."""
+    return await _db.write("test_seed", _test_seed_sync, request, body)
+
+
+def _test_reset_sync(request: Request) -> Any:
     """Reset test data (only when LINKS_TEST_MODE=1)."""
     _require_test_endpoint_access(request)
     store = _get_link_store()
@@ -10044,8 +10169,13 @@ async def test_reset(request: Request):
     return {"status": "reset"}
 
 
-@app.post("/api/links/_test/expire-preview/{preview_id}")
-async def test_expire_preview(request: Request, preview_id: str):
+@app.post("/api/links/_test/reset")
+async def test_reset(request: Request):
+    """Reset test data (only when LINKS_TEST_MODE=1)."""
+    return await _db.write("test_reset", _test_reset_sync, request)
+
+
+def _test_expire_preview_sync(request: Request, preview_id: str) -> Any:
     """Force a preview to look expired for deterministic tests."""
     _require_test_endpoint_access(request)
     store = _get_link_store()
@@ -10056,6 +10186,12 @@ async def test_expire_preview(request: Request, preview_id: str):
     return {"preview_id": preview_id, "expired": True}
 
 
+@app.post("/api/links/_test/expire-preview/{preview_id}")
+async def test_expire_preview(request: Request, preview_id: str):
+    """Force a preview to look expired for deterministic tests."""
+    return await _db.write("test_expire_preview", _test_expire_preview_sync, request, preview_id)
+
+
 # ---------------------------------------------------------------------------
 # 2. GET /api/links/{link_id} — Single link with events
 # ---------------------------------------------------------------------------
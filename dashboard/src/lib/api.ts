@@ -1464,10 +1464,25 @@ export function submitLinkJob(data: { job_type: string; params: Record<string, u
 
 // ── Export ──────────────────────────────────────────────────────────────────
 
-export function exportLinks(format: string, familyId?: string) {
+export function exportLinks(
+  format: string,
+  familyId?: string,
+  options?: { includeEvidence?: boolean; includeDefinedTerms?: boolean },
+) {
   return postJson<import("./types").ExportJobResponse>("/api/links/export", {
     format,
     family_id: familyId,
+    include_evidence: options?.includeEvidence ?? false,
+    include_defined_terms: options?.includeDefinedTerms ?? false,
+  });
+}
+
+export function downloadLinksExport(jobId: string) {
+  return fetch(`${API_BASE}/api/links/export/${encodeURIComponent(jobId)}`, {
+    headers: { "X-Links-Token": LINKS_API_TOKEN },
+  }).then((r) => {
+    if (!r.ok) throw new Error(`Export download failed: ${r.status}`);
+    return r.blob();
   });
 }
 
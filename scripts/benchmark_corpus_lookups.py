@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""Benchmark CorpusIndex point lookups before and after the optimize stage.
+
+Copies ``corpus.duckdb`` to a scratch directory, times
+``get_section_text`` / ``get_clauses`` / ``get_section_features`` over a
+random sample of ``(doc_id, section_number)`` keys, runs
+``optimize_corpus_layout`` on the copy, and times the same keys again.
+The source database is never modified.
+
+Usage:
+    python3 scripts/benchmark_corpus_lookups.py \
+        --db corpus_index/corpus.duckdb --samples 2000
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+from agent.corpus import CorpusIndex
+from agent.corpus_layout import optimize_corpus_layout
+
+
+def _log(msg: str) -> None:
+    print(msg, file=sys.stderr)
+
+
+def _sample_keys(db_path: Path, samples: int, seed: int) -> list[tuple[str, str]]:
+    with CorpusIndex(db_path, enforce_schema=False) as corpus:
+        rows = corpus._conn.execute(  # noqa: SLF001
+            "SELECT doc_id, section_number FROM sections"
+        ).fetchall()
+    keys = [(str(r[0]), str(r[1])) for r in rows]
+    random.Random(seed).shuffle(keys)
+    return keys[:samples]
+
+
+def _time_lookups(
+    db_path: Path, keys: list[tuple[str, str]],
+) -> dict[str, dict[str, float]]:
+    with CorpusIndex(db_path, enforce_schema=False) as corpus:
+        lookups: dict[str, Callable[[str, str], Any]] = {
+            "get_section_text": corpus.get_section_text,
+            "get_clauses": corpus.get_clauses,
+            "get_section_features": lambda doc_id, _sn: corpus.get_section_features(doc_id),
+        }
+        report: dict[str, dict[str, float]] = {}
+        for name, fn in lookups.items():
+            latencies: list[float] = []
+            for doc_id, section_number in keys:
+                t0 = time.perf_counter()
+                fn(doc_id, section_number)
+                latencies.append((time.perf_counter() - t0) * 1000.0)
+            latencies.sort()
+            report[name] = {
+                "calls": len(latencies),
+                "mean_ms": round(statistics.fmean(latencies), 4) if latencies else 0.0,
+                "p50_ms": round(latencies[len(latencies) // 2], 4) if latencies else 0.0,
+                "p95_ms": (
+                    round(latencies[int(len(latencies) * 0.95)], 4) if latencies else 0.0
+                ),
+            }
+    return report
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Benchmark corpus point lookups before/after the optimize stage.",
+    )
+    parser.add_argument("--db", required=True, type=Path, help="Path to corpus.duckdb")
+    parser.add_argument("--samples", type=int, default=1000, help="Keys to look up.")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--output-json", type=Path, default=None)
+    args = parser.parse_args()
+
+    db_path: Path = args.db.resolve()
+    if not db_path.exists():
+        _log(f"ERROR: database not found: {db_path}")
+        sys.exit(1)
+
+    with tempfile.TemporaryDirectory(prefix="corpus_lookup_bench_") as tmpdir:
+        work_db = Path(tmpdir) / db_path.name
+        shutil.copy2(db_path, work_db)
+        keys = _sample_keys(work_db, max(1, args.samples), args.seed)
+        _log(f"Sampled {len(keys)} section keys from {db_path}")
+
+        before = _time_lookups(work_db, keys)
+
+        import duckdb
+
+        t0 = time.perf_counter()
+        conn = duckdb.connect(str(work_db))
+        try:
+            tables = optimize_corpus_layout(conn, verbose=True)
+        finally:
+            conn.close()
+        optimize_s = time.perf_counter() - t0
+
+        after = _time_lookups(work_db, keys)
+
+    report = {
+        "db": str(db_path),
+        "samples": len(keys),
+        "optimize_seconds": round(optimize_s, 3),
+        "optimized_tables": tables,
+        "before": before,
+        "after": after,
+        "speedup_p50": {
+            name: round(before[name]["p50_ms"] / after[name]["p50_ms"], 2)
+            if after[name]["p50_ms"] else None
+            for name in before
+        },
+    }
+    text = json.dumps(report, indent=2)
+    if args.output_json:
+        args.output_json.parent.mkdir(parents=True, exist_ok=True)
+        args.output_json.write_text(text)
+    print(text)
+
+
+if __name__ == "__main__":
+    main()
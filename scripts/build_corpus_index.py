@@ -7,8 +7,21 @@ parsing, definition extraction), and writes the results to a DuckDB
 database file.
 
 Supports full rebuild, incremental rebuild (``--incremental``), and
-table-specific rebuild (``--tables``).  Batched DuckDB writes with
-explicit transactions keep peak memory low and provide crash safety.
+table-specific rebuild (``--tables``).  In a full rebuild each worker
+writes its chunk of documents as per-table Parquet shards and the parent
+only merges them with ``read_parquet()``, so document payloads never
+cross the process pipe.  Incremental and table-specific runs use batched
+DuckDB writes with explicit transactions for crash safety.
+A full rebuild also builds the ``section_tokens`` postings table used by
+DSL proximity operators and full-text search (``--no-positional-index``
+skips it) and the ``ngram_df`` n-gram document-frequency table used by DNA
+discovery (``--no-ngram-df`` skips it).  A full rebuild
+ends with an "optimize" stage that re-sorts the corpus tables by document
+position and indexes their ``doc_id`` lookup keys (``--no-optimize`` skips
+it); incremental and ``--tables`` runs only optimize with ``--optimize``
+(``--tables`` runs then rewrite just the rebuilt tables).  Every run then
+materializes the dashboard's ``edge_cases`` table, stamped with the corpus
+run id (``--no-edge-cases`` skips it on corpora that do not have one yet).
 
 Usage:
     python3 scripts/build_corpus_index.py \
@@ -31,10 +44,12 @@ Usage:
 from __future__ import annotations
 
 import argparse
+import contextlib
 import importlib
 import json
 import os
 import platform
+import re
 import sys
 import time
 import traceback
@@ -51,22 +66,29 @@ except ImportError:  # Windows
 # Agent library imports
 # ---------------------------------------------------------------------------
 from agent.clause_parser import ClauseNode, parse_clauses
+from agent.corpus_layout import optimize_corpus_layout
 from agent.definitions import extract_definitions
 from agent.doc_parser import DocOutline
 from agent.document_processor import (
+    PipelineProfiler,
     SidecarMetadata,
     dedup_by_cik,
     extract_accession,
     process_document_text,
 )
+from agent.edge_cases import EDGE_CASES_TABLE, build_edge_case_table
 from agent.html_utils import normalize_html, read_file
-from agent.io_utils import load_json
+from agent.io_utils import copy_rows_into, load_json
 from agent.materialized_features import build_clause_feature, build_section_feature
+from agent.ngram_df import NGRAM_DF_TABLE, build_ngram_df_table
 from agent.parsing_types import OutlineSection
+from agent.proximity import SECTION_TOKENS_TABLE, build_section_token_index
 from agent.run_manifest import (
     build_manifest,
+    default_manifest_path_for_db,
     generate_run_id,
     git_commit_hash,
+    load_manifest,
     write_manifest,
 )
 
@@ -369,6 +391,16 @@ def _write_anomaly_report(
 # Single-document processing
 # ---------------------------------------------------------------------------
 
+# Per-process stage profiler (``--profile-stages``); set in each worker by
+# :func:`_init_stage_profiler`.
+_stage_profiler: PipelineProfiler | None = None
+
+
+def _init_stage_profiler(config: dict[str, Any] | None) -> None:
+    """Pool initializer: profile this process's documents when *config* is set."""
+    global _stage_profiler
+    _stage_profiler = PipelineProfiler(**config) if config is not None else None
+
 
 def _process_one_doc(
     args: tuple[Path, Path, int, int],
@@ -380,7 +412,8 @@ def _process_one_doc(
 
     Args is a tuple of (file_path, corpus_dir, file_index, total_files).
     Returns a dict with keys: doc, sections, clauses, definitions, section_texts,
-    section_features, clause_features.  Returns None on failure.
+    section_features, clause_features (plus ``timing`` when stage profiling
+    is on).  Returns None on failure.
     """
     file_path, corpus_dir, _file_index, _total_files = args
 
@@ -418,8 +451,14 @@ def _process_one_doc(
             filename=file_path.name,
             sidecar=sidecar,
             cohort_only_nlp=False,
+            profiler=_stage_profiler,
         )
-        return result.to_dict() if result is not None else None
+        if result is None:
+            return None
+        out = result.to_dict()
+        if _stage_profiler is not None and _stage_profiler.last_timing is not None:
+            out["timing"] = _stage_profiler.last_timing
+        return out
 
     except Exception as exc:
         print(
@@ -528,10 +567,29 @@ class _ProgressReporter:
 # ---------------------------------------------------------------------------
 
 
+_SUMMARY_DOC_FIELDS = ("doc_id", "path", "cohort_included", "doc_type", "market_segment")
+_SUMMARY_COUNT_KEYS = (
+    "sections", "clauses", "definitions", "section_features", "clause_features",
+)
+
+
+def _summarize_result(result: dict[str, Any]) -> dict[str, Any]:
+    """The few fields of a result that run stats need, without the payload."""
+    doc = result["doc"]
+    summary = {
+        "doc": {k: doc.get(k) for k in _SUMMARY_DOC_FIELDS},
+        "counts": {k: len(result.get(k, [])) for k in _SUMMARY_COUNT_KEYS},
+    }
+    if "timing" in result:
+        summary["timing"] = result["timing"]
+    return summary
+
+
 class _RunStats:
     """Incremental counters to replace post-hoc iteration over results."""
 
-    def __init__(self) -> None:
+    def __init__(self, profiler: PipelineProfiler | None = None) -> None:
+        self.profiler = profiler
         self.processed_docs: int = 0
         self.total_sections: int = 0
         self.total_clauses: int = 0
@@ -543,13 +601,18 @@ class _RunStats:
         self.segment_counts: dict[str, int] = {}
 
     def accumulate(self, result: dict[str, Any]) -> None:
+        self.accumulate_summary(_summarize_result(result))
+
+    def accumulate_summary(self, summary: dict[str, Any]) -> None:
+        """Count one document from its :func:`_summarize_result` summary."""
+        counts = summary["counts"]
         self.processed_docs += 1
-        self.total_sections += len(result.get("sections", []))
-        self.total_clauses += len(result.get("clauses", []))
-        self.total_definitions += len(result.get("definitions", []))
-        self.total_section_features += len(result.get("section_features", []))
-        self.total_clause_features += len(result.get("clause_features", []))
-        doc = result["doc"]
+        self.total_sections += counts["sections"]
+        self.total_clauses += counts["clauses"]
+        self.total_definitions += counts["definitions"]
+        self.total_section_features += counts["section_features"]
+        self.total_clause_features += counts["clause_features"]
+        doc = summary["doc"]
         if doc.get("cohort_included"):
             self.cohort_count += 1
         dt = doc.get("doc_type", "other")
@@ -557,6 +620,8 @@ class _RunStats:
         if dt == "credit_agreement":
             seg = doc.get("market_segment", "uncertain")
             self.segment_counts[seg] = self.segment_counts.get(seg, 0) + 1
+        if self.profiler is not None and "timing" in summary:
+            self.profiler.add_timing(summary["timing"])
 
 
 # ---------------------------------------------------------------------------
@@ -676,15 +741,6 @@ def _prepare_batch_tuples(
     Handles doc_id collision resolution, template family override,
     clause deduplication, and clause count recomputation.
     """
-    all_docs: list[dict[str, Any]] = []
-    all_articles: list[dict[str, Any]] = []
-    all_sections: list[dict[str, Any]] = []
-    all_clauses: list[dict[str, Any]] = []
-    all_definitions: list[dict[str, Any]] = []
-    all_section_texts: list[dict[str, Any]] = []
-    all_section_features: list[dict[str, Any]] = []
-    all_clause_features: list[dict[str, Any]] = []
-
     for result in results:
         doc = result["doc"]
         doc_id = doc["doc_id"]
@@ -725,7 +781,29 @@ def _prepare_batch_tuples(
             if family:
                 doc["template_family"] = family
 
-        all_docs.append(doc)
+    return _batch_table_rows(results)
+
+
+def _batch_table_rows(
+    results: list[dict[str, Any]],
+) -> dict[str, list[tuple[Any, ...]]]:
+    """Convert result dicts to insert-ready tuples in table column order.
+
+    Deduplicates clauses (and aligns clause_features with them) and
+    recomputes each document's clause count.  doc_ids are taken as-is;
+    collision handling is the caller's job.
+    """
+    all_docs: list[dict[str, Any]] = []
+    all_articles: list[dict[str, Any]] = []
+    all_sections: list[dict[str, Any]] = []
+    all_clauses: list[dict[str, Any]] = []
+    all_definitions: list[dict[str, Any]] = []
+    all_section_texts: list[dict[str, Any]] = []
+    all_section_features: list[dict[str, Any]] = []
+    all_clause_features: list[dict[str, Any]] = []
+
+    for result in results:
+        all_docs.append(result["doc"])
         all_articles.extend(result.get("articles", []))
         all_sections.extend(result.get("sections", []))
         all_clauses.extend(result.get("clauses", []))
@@ -928,6 +1006,261 @@ def _write_to_duckdb(  # pyright: ignore[reportUnusedFunction]  # used by tests
         conn.close()
 
 
+# ---------------------------------------------------------------------------
+# Worker-side Parquet shards (full rebuild)
+# ---------------------------------------------------------------------------
+
+# Extra shard column naming each row's source file, so the merge can tell
+# apart documents whose content-addressed doc_ids collide.
+_SHARD_DOC_PATH = "_doc_path"
+
+_SHARD_MERGE_ORDER = (
+    "documents", "articles", "sections", "clauses", "definitions",
+    "section_text", "section_features", "clause_features",
+)
+
+
+def _shard_glob(shard_dir: Path, table: str, shard_id: int | None = None) -> str:
+    suffix = "*" if shard_id is None else f"{shard_id:05d}"
+    return str(shard_dir / f"{table}_{suffix}.parquet")
+
+
+_SHARD_FILE_RE = re.compile(
+    rf"(?:{'|'.join(_SHARD_MERGE_ORDER)})_\d{{5,}}\.parquet",
+)
+
+
+def _foreign_shard_dir_entries(shard_dir: Path) -> list[str]:
+    """Names in *shard_dir* that are not build shards (empty if it is missing)."""
+    if not shard_dir.is_dir():
+        return []
+    return sorted(
+        path.name for path in shard_dir.iterdir()
+        if not (path.is_file() and _SHARD_FILE_RE.fullmatch(path.name))
+    )
+
+
+def _clear_doc_shards(shard_dir: Path) -> None:
+    """Delete the ``{table}_{shard_id}.parquet`` files in *shard_dir*.
+
+    Nothing else is touched; a user-supplied ``--shards-dir`` holding other
+    files is refused up front (see ``_foreign_shard_dir_entries``).
+    """
+    if not shard_dir.is_dir():
+        return
+    for path in shard_dir.iterdir():
+        if path.is_file() and _SHARD_FILE_RE.fullmatch(path.name):
+            path.unlink(missing_ok=True)
+
+
+def _write_doc_shard(
+    results: list[dict[str, Any]],
+    shard_dir: Path,
+    shard_id: int,
+) -> None:
+    """Write one chunk of results as ``{table}_{shard_id}.parquet`` files.
+
+    Rows are staged in an in-memory DuckDB whose staging tables take the
+    corpus column types (without constraints), so every shard carries the
+    final schema.  Tables with no rows get no file.
+    """
+    table_rows: dict[str, list[tuple[Any, ...]]] = {}
+    for result in results:
+        path = result["doc"]["path"]
+        for table, rows in _batch_table_rows([result]).items():
+            table_rows.setdefault(table, []).extend((*row, path) for row in rows)
+
+    conn: Any = _duckdb.connect(":memory:")
+    try:
+        conn.execute("SET threads = 1")
+        for stmt in _SCHEMA_DDL.split(";"):
+            stmt = stmt.strip()
+            if stmt:
+                conn.execute(stmt)
+        for table, rows in table_rows.items():
+            if not rows:
+                continue
+            stage = f"_shard_{table}"
+            conn.execute(
+                f"CREATE TABLE {stage} AS SELECT *, ''::VARCHAR AS {_SHARD_DOC_PATH} "
+                f"FROM {table} LIMIT 0"
+            )
+            copy_rows_into(conn, stage, rows)
+            out = _shard_glob(shard_dir, table, shard_id).replace("'", "''")
+            conn.execute(f"COPY {stage} TO '{out}' (FORMAT parquet, COMPRESSION zstd)")
+    finally:
+        conn.close()
+
+
+def _process_doc_chunk(
+    args: tuple[list[Path], Path, Path, int],
+) -> list[dict[str, Any] | None]:
+    """Process a chunk of files in a worker and write them as one shard.
+
+    Args is a tuple of (file_paths, corpus_dir, shard_dir, shard_id).
+    Returns one :func:`_summarize_result` summary per file (None on
+    failure), so only counts, not document payloads, cross the pipe.
+    """
+    file_paths, corpus_dir, shard_dir, shard_id = args
+    results: list[dict[str, Any]] = []
+    summaries: list[dict[str, Any] | None] = []
+    for i, file_path in enumerate(file_paths):
+        result = _process_one_doc((file_path, corpus_dir, i, len(file_paths)))
+        if result is None:
+            summaries.append(None)
+            continue
+        results.append(result)
+        summaries.append(_summarize_result(result))
+    if not results:
+        return summaries
+    try:
+        _write_doc_shard(results, shard_dir, shard_id)
+    except Exception as exc:
+        print(f"  ERROR writing shard {shard_id}: {exc}", file=sys.stderr)
+        traceback.print_exc(file=sys.stderr)
+        for table in _SHARD_MERGE_ORDER:
+            Path(_shard_glob(shard_dir, table, shard_id)).unlink(missing_ok=True)
+        return [None] * len(file_paths)
+    return summaries
+
+
+def _tally_chunk(
+    summaries: list[dict[str, Any] | None],
+    stats: _RunStats,
+    progress: _ProgressReporter,
+) -> int:
+    """Fold one chunk's summaries into *stats*/*progress*; return its errors."""
+    errors = 0
+    for summary in summaries:
+        if summary is None:
+            errors += 1
+        else:
+            stats.accumulate_summary(summary)
+        progress.tick(error=summary is None)
+    return errors
+
+
+def _merge_doc_shards(
+    conn: Any,
+    shard_dir: Path,
+    template_family_map: dict[str, str] | None,
+    verbose: bool,
+) -> dict[str, int]:
+    """Bulk-load every Parquet shard in *shard_dir* into the corpus tables.
+
+    doc_id collisions are resolved across all shards at once: per doc_id,
+    the document with the first path (in sort order) keeps it and the rest
+    get ``_1``, ``_2``, ... suffixes.  Rows that would repeat a primary
+    key keep their first occurrence, as the batched writer's single-row
+    fallback does.  Returns row counts per table.
+    """
+    counts = dict.fromkeys(_SHARD_MERGE_ORDER, 0)
+    if not any(shard_dir.glob("documents_*.parquet")):
+        return counts
+
+    docs_glob = _shard_glob(shard_dir, "documents").replace("'", "''")
+    conn.execute(
+        f"""
+        CREATE TEMP TABLE _shard_doc_ids AS
+        SELECT {_SHARD_DOC_PATH}, doc_id AS source_doc_id,
+               CASE WHEN rn = 1 THEN doc_id ELSE doc_id || '_' || (rn - 1) END AS doc_id
+        FROM (
+            SELECT {_SHARD_DOC_PATH}, doc_id,
+                   ROW_NUMBER() OVER (
+                       PARTITION BY doc_id ORDER BY {_SHARD_DOC_PATH}
+                   ) AS rn
+            FROM read_parquet('{docs_glob}')
+        )
+        """
+    )
+    if verbose:
+        renamed = conn.execute(
+            f"SELECT {_SHARD_DOC_PATH}, source_doc_id, doc_id FROM _shard_doc_ids "
+            f"WHERE doc_id <> source_doc_id ORDER BY 1"
+        ).fetchall()
+        for path, old_id, new_id in renamed:
+            print(
+                f"  WARN: doc_id collision for {path}, "
+                f"reassigned {old_id} -> {new_id}",
+                file=sys.stderr,
+            )
+
+    families = [
+        (doc_id, family)
+        for doc_id, family in (template_family_map or {}).items()
+        if family
+    ]
+    if families:
+        conn.execute(
+            "CREATE TEMP TABLE _shard_template_families "
+            "(doc_id VARCHAR, template_family VARCHAR)"
+        )
+        copy_rows_into(conn, "_shard_template_families", families)
+
+    for table in _SHARD_MERGE_ORDER:
+        if not any(shard_dir.glob(f"{table}_*.parquet")):
+            continue
+        columns = [
+            str(r[0])
+            for r in conn.execute(
+                "SELECT column_name FROM duckdb_columns() "
+                "WHERE schema_name = 'main' AND table_name = ? ORDER BY column_index",
+                [table],
+            ).fetchall()
+        ]
+        pk_row = conn.execute(
+            "SELECT constraint_column_names FROM duckdb_constraints() "
+            "WHERE schema_name = 'main' AND table_name = ? "
+            "AND constraint_type = 'PRIMARY KEY'",
+            [table],
+        ).fetchone()
+
+        def _expr(col: str) -> str:
+            if col == "doc_id":
+                return "m.doc_id"
+            if col == "template_family" and families:
+                return "COALESCE(tf.template_family, s.template_family)"
+            return f"s.{col}"
+
+        joins = f"JOIN _shard_doc_ids m ON m.{_SHARD_DOC_PATH} = s.{_SHARD_DOC_PATH}"
+        if table == "documents" and families:
+            joins += " LEFT JOIN _shard_template_families tf ON tf.doc_id = m.doc_id"
+        qualify = ""
+        if pk_row is not None:
+            partition = ", ".join(_expr(c) for c in pk_row[0])
+            qualify = (
+                f"QUALIFY ROW_NUMBER() OVER (PARTITION BY {partition} "
+                "ORDER BY s.filename, s.file_row_number) = 1"
+            )
+        table_glob = _shard_glob(shard_dir, table).replace("'", "''")
+        select_sql = f"""
+            SELECT {", ".join(_expr(c) for c in columns)}
+            FROM read_parquet(
+                '{table_glob}', filename = true, file_row_number = true
+            ) s
+            {joins}
+            {qualify}
+        """
+        try:
+            conn.execute(f"INSERT INTO {table} ({', '.join(columns)}) {select_sql}")
+        except Exception as exc:
+            if verbose:
+                print(
+                    f"  WARN: bulk merge of {table} failed ({exc}); "
+                    "falling back to single-row inserts",
+                    file=sys.stderr,
+                )
+            rows = [tuple(r) for r in conn.execute(select_sql).fetchall()]
+            _single_row_fallback(conn, {table: rows}, verbose)
+        counts[table] = int(conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0])
+        if verbose:
+            print(f"  Merged {table}: {counts[table]} rows", file=sys.stderr)
+
+    conn.execute("DROP TABLE IF EXISTS _shard_doc_ids")
+    conn.execute("DROP TABLE IF EXISTS _shard_template_families")
+    return counts
+
+
 # ---------------------------------------------------------------------------
 # Anomaly report from DuckDB (Step 3)
 # ---------------------------------------------------------------------------
@@ -1039,6 +1372,67 @@ def _diff_corpus(
     return new_files, changed_files, deleted_doc_ids
 
 
+def _has_table(conn: Any, table_name: str) -> bool:
+    """Whether *table_name* exists in the open DuckDB database."""
+    rows = conn.execute("SHOW TABLES").fetchall()
+    return any(str(r[0]) == table_name for r in rows)
+
+
+def _refresh_positional_index(
+    conn: Any,
+    doc_ids: list[str],
+    *,
+    enabled: bool,
+) -> int:
+    """Re-tokenize *doc_ids* into ``section_tokens`` when the index is in use.
+
+    An existing index is always kept in sync.  With an explicit
+    ``--positional-index`` on a corpus that lacks one, the whole index is
+    built on first use; otherwise corpora built without it stay without it.
+    """
+    if not doc_ids:
+        return 0
+    if not _has_table(conn, SECTION_TOKENS_TABLE):
+        return build_section_token_index(conn) if enabled else 0
+    return build_section_token_index(conn, doc_ids=doc_ids)
+
+
+def _refresh_edge_case_table(
+    conn: Any,
+    output_path: Path,
+    *,
+    fallback_run_id: str,
+    enabled: bool,
+) -> int:
+    """Rebuild ``edge_cases`` after an incremental or ``--tables`` run.
+
+    These runs keep the corpus's run manifest, so the table is stamped
+    with the manifest's run id (falling back to this invocation's) and the
+    dashboard keeps paging from it.  An existing table is always refreshed;
+    a missing one is only built when *enabled*.
+    """
+    if not _has_table(conn, EDGE_CASES_TABLE) and not enabled:
+        return 0
+    run_id = fallback_run_id
+    manifest_path = default_manifest_path_for_db(output_path)
+    if manifest_path.exists():
+        with contextlib.suppress(OSError, ValueError):
+            run_id = str(load_manifest(manifest_path).get("run_id") or run_id)
+    return build_edge_case_table(conn, run_id=run_id)
+
+
+def _refresh_ngram_df_table(conn: Any, *, enabled: bool) -> int:
+    """Rebuild ``ngram_df`` after an incremental or ``--tables`` run.
+
+    Document frequencies are corpus aggregates, so the table is rebuilt
+    rather than patched.  An existing table is always refreshed; a missing
+    one is only built when *enabled* (an explicit ``--ngram-df``).
+    """
+    if not _has_table(conn, NGRAM_DF_TABLE) and not enabled:
+        return 0
+    return build_ngram_df_table(conn)
+
+
 def _delete_doc_ids(conn: Any, doc_ids: list[str]) -> None:
     """Delete rows for given doc_ids from all data tables in a transaction."""
     if not doc_ids:
@@ -1050,6 +1444,8 @@ def _delete_doc_ids(conn: Any, doc_ids: list[str]) -> None:
             "clause_features", "section_features", "section_text",
             "clauses", "definitions", "sections", "articles", "documents",
         ]
+        if _has_table(conn, SECTION_TOKENS_TABLE):
+            tables.insert(0, SECTION_TOKENS_TABLE)
         for table in tables:
             placeholders = ", ".join("?" for _ in doc_ids)
             conn.execute(
@@ -1356,7 +1752,25 @@ def main() -> None:
         "--batch-size",
         type=int,
         default=100,
-        help="Number of documents per DuckDB write batch (default: 100)",
+        help=(
+            "Documents per Parquet shard in a full rebuild, or per DuckDB "
+            "write batch in incremental/--tables runs (default: 100)"
+        ),
+    )
+    parser.add_argument(
+        "--shards-dir",
+        type=Path,
+        default=None,
+        help=(
+            "Directory for the full rebuild's Parquet shards "
+            "(default: {output}.shards/). Must be empty or hold only a "
+            "previous build's {table}_{shard}.parquet shards, which are cleared."
+        ),
+    )
+    parser.add_argument(
+        "--keep-shards",
+        action="store_true",
+        help="Keep Parquet shard files after the merge (default: delete)",
     )
     parser.add_argument(
         "--incremental",
@@ -1382,6 +1796,47 @@ def main() -> None:
             "Incompatible with --incremental."
         ),
     )
+    parser.add_argument(
+        "--positional-index",
+        action=argparse.BooleanOptionalAction,
+        default=None,
+        help=(
+            "Build the section_tokens positional index used by DSL proximity "
+            "operators (/s, /p, /N) and full-text search. Default: on for full "
+            "rebuilds; incremental and --tables runs refresh an existing index "
+            "and only build a missing one with --positional-index."
+        ),
+    )
+    parser.add_argument(
+        "--ngram-df",
+        action=argparse.BooleanOptionalAction,
+        default=None,
+        help=(
+            "Build the ngram_df table of corpus-wide 1-3-gram document "
+            "frequencies used as the DNA discovery background. Default: on "
+            "for full rebuilds; incremental and --tables runs refresh an "
+            "existing table and only build a missing one with --ngram-df."
+        ),
+    )
+    parser.add_argument(
+        "--optimize",
+        action=argparse.BooleanOptionalAction,
+        default=None,
+        help=(
+            "Run the post-build optimize stage (sorted table layout + doc_id "
+            "indexes for point lookups). Default: on for full rebuilds, off "
+            "for incremental and --tables runs, which rewrite every table "
+            "(--tables: only the rebuilt ones)."
+        ),
+    )
+    parser.add_argument(
+        "--no-edge-cases",
+        action="store_true",
+        help=(
+            "Skip materializing the dashboard edge_cases table (an existing "
+            "table is still refreshed by incremental and --tables runs)."
+        ),
+    )
     parser.add_argument(
         "--one-per-cik",
         action="store_true",
@@ -1390,6 +1845,37 @@ def main() -> None:
             "Eliminates overweighting of borrowers with many filings."
         ),
     )
+    parser.add_argument(
+        "--profile-stages",
+        action="store_true",
+        help=(
+            "Time each pipeline stage per document (full rebuild only); adds a "
+            "pipeline_profile to the run manifest and writes "
+            "<output>.stages.folded for flamegraph tools."
+        ),
+    )
+    parser.add_argument(
+        "--profile-slowest",
+        type=int,
+        default=20,
+        help="Slowest documents to report with --profile-stages (default: 20)",
+    )
+    parser.add_argument(
+        "--cprofile-over",
+        type=float,
+        default=None,
+        metavar="SEC",
+        help=(
+            "With --profile-stages, re-run documents slower than SEC seconds "
+            "under cProfile and dump .prof files to --cprofile-dir."
+        ),
+    )
+    parser.add_argument(
+        "--cprofile-dir",
+        type=Path,
+        default=None,
+        help="Directory for --cprofile-over dumps (default: {output}.cprofile/)",
+    )
     args = parser.parse_args()
 
     corpus_dir: Path = args.corpus_dir.resolve()
@@ -1403,12 +1889,25 @@ def main() -> None:
     batch_size: int = args.batch_size
     incremental: bool = args.incremental
     one_per_cik: bool = args.one_per_cik
+    # None: build on full rebuilds only (see --positional-index)
+    positional_index: bool | None = args.positional_index
+    # None: build on full rebuilds only (see --ngram-df)
+    ngram_df: bool | None = args.ngram_df
+    # None: optimize full rebuilds only (see --optimize)
+    optimize: bool | None = args.optimize
+    edge_cases: bool = not args.no_edge_cases
     manifest_path: Path = (
         args.manifest.resolve()
         if args.manifest
         else Path(f"{output_path}.build_manifest.json")
     )
     tables_arg: str | None = args.tables
+    shard_dir: Path = (
+        args.shards_dir.resolve()
+        if args.shards_dir
+        else Path(f"{output_path}.shards")
+    )
+    keep_shards: bool = args.keep_shards
 
     # --- Flag compatibility checks ---
     if incremental and limit is not None:
@@ -1575,6 +2074,10 @@ def main() -> None:
                 except Exception:
                     conn.execute("ROLLBACK")
                     raise
+                if "section_text" in rebuild_tables:  # type: ignore[operator]
+                    _refresh_positional_index(
+                        conn, list(batch_doc_ids), enabled=bool(positional_index),
+                    )
                 batch_results.clear()
                 batch_doc_ids.clear()
 
@@ -1606,6 +2109,12 @@ def main() -> None:
 
             _flush_table_batch()
             progress.finish()
+            if optimize:
+                optimize_corpus_layout(conn, tables=rebuild_tables, verbose=verbose)
+            _refresh_edge_case_table(
+                conn, output_path, fallback_run_id=run_id, enabled=edge_cases,
+            )
+            _refresh_ngram_df_table(conn, enabled=bool(ngram_df))
 
             print(
                 f"Table-specific rebuild complete: "
@@ -1698,6 +2207,11 @@ def main() -> None:
                 if not batch:
                     return
                 _write_batch(conn, batch, seen_doc_ids, template_family_map, verbose)
+                _refresh_positional_index(
+                    conn,
+                    [str(res["doc"]["doc_id"]) for res in batch],
+                    enabled=bool(positional_index),
+                )
                 # Update manifest incrementally
                 files_map = manifest_data.setdefault("files", {})
                 for res in batch:
@@ -1743,6 +2257,12 @@ def main() -> None:
 
             _flush_incremental_batch()
             progress.finish()
+            if optimize:
+                optimize_corpus_layout(conn, verbose=verbose)
+            _refresh_edge_case_table(
+                conn, output_path, fallback_run_id=run_id, enabled=edge_cases,
+            )
+            _refresh_ngram_df_table(conn, enabled=bool(ngram_df))
 
             # Remove deleted files from manifest
             files_map = manifest_data.get("files", {})
@@ -1810,17 +2330,44 @@ def main() -> None:
     if verbose:
         print(f"Found {total} HTML files", file=sys.stderr)
 
-    # Step 2: Process all files with batched writes
-    work_items: list[tuple[Path, Path, int, int]] = [
-        (f, corpus_dir, i, total)
-        for i, f in enumerate(html_files)
+    # Step 2: Workers process chunks of files and write them as Parquet
+    # shards; only per-document summaries come back to this process.
+    # Chunks are capped so every worker gets several of them.
+    chunk_size = max(1, min(batch_size, -(-total // (max(workers, 1) * 4))))
+    # Remove the directory afterwards only if it is the default one or this
+    # run created it; a user-supplied --shards-dir only loses its shards.
+    foreign = _foreign_shard_dir_entries(shard_dir) if args.shards_dir else []
+    if foreign:
+        print(
+            f"ERROR: --shards-dir {shard_dir} holds files other than build "
+            f"shards (e.g. {foreign[0]}); use an empty directory.",
+            file=sys.stderr,
+        )
+        sys.exit(1)
+    owns_shard_dir = args.shards_dir is None or not shard_dir.exists()
+    shard_dir.mkdir(parents=True, exist_ok=True)
+    _clear_doc_shards(shard_dir)
+    work_chunks: list[tuple[list[Path], Path, Path, int]] = [
+        (html_files[start:start + chunk_size], corpus_dir, shard_dir, shard_id)
+        for shard_id, start in enumerate(range(0, total, chunk_size))
     ]
 
-    conn = _init_db(output_path)
-    batch: list[dict[str, Any]] = []
-    seen_doc_ids: set[str] = set()
+    profile_config: dict[str, Any] | None = None
+    if args.profile_stages:
+        profile_config = {
+            "slowest_n": args.profile_slowest,
+            "cprofile_over_sec": args.cprofile_over,
+            "cprofile_dir": (
+                (args.cprofile_dir or Path(f"{output_path}.cprofile")).resolve()
+                if args.cprofile_over is not None
+                else None
+            ),
+        }
+
     progress = _ProgressReporter(total)
-    stats = _RunStats()
+    stats = _RunStats(
+        PipelineProfiler(slowest_n=args.profile_slowest) if profile_config else None,
+    )
     errors = 0
 
     # Build manifest data structure (saved at end for full rebuild)
@@ -1832,40 +2379,25 @@ def main() -> None:
 
     try:
         if workers <= 1:
-            for item in work_items:
-                result = _process_one_doc(item)
-                if result is not None:
-                    batch.append(result)
-                    stats.accumulate(result)
-                else:
-                    errors += 1
-                progress.tick(error=result is None)
-                if len(batch) >= batch_size:
-                    _write_batch(conn, batch, seen_doc_ids, template_family_map, verbose)
-                    batch.clear()
+            _init_stage_profiler(profile_config)
+            for chunk in work_chunks:
+                errors += _tally_chunk(_process_doc_chunk(chunk), stats, progress)
         else:
             if verbose:
-                print(f"Processing with {workers} workers...", file=sys.stderr)
-            with Pool(processes=workers) as pool:
-                for result in pool.imap_unordered(
-                    _process_one_doc, work_items,
+                print(
+                    f"Processing with {workers} workers "
+                    f"({len(work_chunks)} shards of <= {chunk_size} docs)...",
+                    file=sys.stderr,
+                )
+            with Pool(
+                processes=workers,
+                initializer=_init_stage_profiler,
+                initargs=(profile_config,),
+            ) as pool:
+                for summaries in pool.imap_unordered(
+                    _process_doc_chunk, work_chunks,
                 ):
-                    if result is not None:
-                        batch.append(result)
-                        stats.accumulate(result)
-                    else:
-                        errors += 1
-                    progress.tick(error=result is None)
-                    if len(batch) >= batch_size:
-                        _write_batch(
-                            conn, batch, seen_doc_ids, template_family_map, verbose,
-                        )
-                        batch.clear()
-
-        # Final partial batch
-        if batch:
-            _write_batch(conn, batch, seen_doc_ids, template_family_map, verbose)
-            batch.clear()
+                    errors += _tally_chunk(summaries, stats, progress)
 
         progress.finish()
 
@@ -1874,11 +2406,56 @@ def main() -> None:
                 "ERROR: No documents were successfully processed.",
                 file=sys.stderr,
             )
-            conn.close()
             sys.exit(1)
 
         t_process_done = time.time()
 
+        # Step 3: Merge all shards into a fresh DuckDB file
+        if verbose:
+            print(f"Merging Parquet shards from {shard_dir}...", file=sys.stderr)
+        conn = _init_db(output_path)
+        try:
+            _merge_doc_shards(conn, shard_dir, template_family_map, verbose)
+        except Exception:
+            conn.close()
+            raise
+    finally:
+        if not keep_shards:
+            _clear_doc_shards(shard_dir)
+            if owns_shard_dir:
+                with contextlib.suppress(OSError):
+                    shard_dir.rmdir()
+
+    t_merge_done = time.time()
+
+    try:
+        section_token_rows = 0
+        if positional_index is not False:
+            if verbose:
+                print("Building section_tokens positional index...", file=sys.stderr)
+            section_token_rows = build_section_token_index(conn)
+        t_index_done = time.time()
+
+        ngram_df_rows = 0
+        if ngram_df is not False:
+            if verbose:
+                print("Building ngram_df document-frequency table...", file=sys.stderr)
+            ngram_df_rows = build_ngram_df_table(conn)
+        t_ngram_df_done = time.time()
+
+        if optimize is not False:
+            if verbose:
+                print("Optimizing corpus table layout...", file=sys.stderr)
+            optimize_corpus_layout(conn, verbose=verbose)
+        t_optimize_done = time.time()
+
+        edge_case_rows = 0
+        if edge_cases:
+            if verbose:
+                print("Materializing edge_cases table...", file=sys.stderr)
+            edge_case_rows = build_edge_case_table(conn, run_id=run_id)
+        t_edge_cases_done = time.time()
+
         # Anomaly report from DB
         anomaly_rows = _build_anomaly_rows_from_db(conn)
 
@@ -1968,10 +2545,25 @@ def main() -> None:
         for seg, count in sorted(stats.segment_counts.items()):
             print(f"    {seg}: {count}", file=sys.stderr)
 
+    pipeline_profile: dict[str, Any] | None = None
+    if stats.profiler is not None:
+        pipeline_profile = stats.profiler.summary()
+        folded_path = Path(f"{output_path}.stages.folded")
+        folded_path.write_text(stats.profiler.folded_stacks())
+        pipeline_profile["folded_stacks"] = str(folded_path)
+        print("\n--- Pipeline Profile ---", file=sys.stderr)
+        print(stats.profiler.report(), file=sys.stderr)
+        print(f"  Folded stacks: {folded_path}", file=sys.stderr)
+
     timings = {
         "discover": round(t_discover_done - t0, 3),
         "process": round(t_process_done - t_discover_done, 3),
-        "write": round(t_write_done - t_process_done, 3),
+        "merge": round(t_merge_done - t_process_done, 3),
+        "positional_index": round(t_index_done - t_merge_done, 3),
+        "ngram_df": round(t_ngram_df_done - t_index_done, 3),
+        "optimize": round(t_optimize_done - t_ngram_df_done, 3),
+        "edge_cases": round(t_edge_cases_done - t_optimize_done, 3),
+        "write": round(t_write_done - t_edge_cases_done, 3),
         "total": round(t_write_done - t0, 3),
     }
     run_manifest = build_manifest(
@@ -1979,10 +2571,14 @@ def main() -> None:
         db_path=output_path,
         input_source={
             "mode": "local_filesystem",
+            "pipeline": "parquet_sharded",
             "corpus_dir": str(corpus_dir),
             "limit": limit,
             "workers": workers,
             "batch_size": batch_size,
+            "shard_docs": chunk_size,
+            "shards_dir": str(shard_dir),
+            "keep_shards": keep_shards,
             "template_classifications": (
                 str(template_classifications.resolve())
                 if template_classifications is not None
@@ -1998,8 +2594,12 @@ def main() -> None:
             "excluded_docs": excluded_count,
             "section_features": stats.total_section_features,
             "clause_features": stats.total_clause_features,
+            "section_tokens": section_token_rows,
+            "ngram_df": ngram_df_rows,
+            "edge_cases": edge_case_rows,
             "parse_anomaly_count": len(anomaly_rows),
             "parse_anomaly_report": str(anomaly_report_path),
+            **({"pipeline_profile": pipeline_profile} if pipeline_profile else {}),
         },
         git_commit=git_commit_hash(search_from=Path(__file__).resolve().parents[1]),
     )
@@ -50,7 +50,7 @@ from agent.classifier import (
 from agent.clause_parser import ClauseNode, parse_clauses
 from agent.definitions import DefinedTerm, extract_definitions
 from agent.doc_parser import DocOutline
-from agent.html_utils import normalize_html, strip_html
+from agent.html_utils import normalize_html
 from agent.materialized_features import build_clause_feature, build_section_feature
 from agent.metadata import (
     extract_admin_agent,
@@ -567,13 +567,10 @@ def process_document(
         if not html or len(html) < 50:
             return None
 
-        # Step 2: Strip HTML for text length check
-        text = strip_html(html)
-        if not text or len(text) < 100:
-            return None
-
-        # Step 3: Normalize HTML
+        # Step 2-3: Normalize HTML (its text doubles as the length check)
         normalized_text, _inverse_map = normalize_html(html)
+        if len(normalized_text) < 100:
+            return None
 
         # Step 4: Content-addressed doc_id
         doc_id = _compute_doc_id(normalized_text)
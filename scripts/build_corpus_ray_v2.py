@@ -53,6 +53,7 @@ import ray
 # ---------------------------------------------------------------------------
 from agent.document_processor import (
     ACCESSION_RE,
+    PipelineProfiler,
     SidecarMetadata,
     dedup_by_cik,
     process_document_text,
@@ -435,11 +436,32 @@ def _list_local_document_keys(
     return pairs
 
 
+# Stage profiler of this Ray worker process (``--profile-stages``); Ray
+# reuses worker processes across tasks, so the cProfile budget is per worker.
+_worker_profiler: tuple[dict[str, Any], PipelineProfiler] | None = None
+
+
+def _get_worker_profiler(config: dict[str, Any] | None) -> PipelineProfiler | None:
+    """This process's profiler for *config* (None when profiling is off)."""
+    global _worker_profiler
+    if config is None:
+        return None
+    if _worker_profiler is None or _worker_profiler[0] != config:
+        profiler = PipelineProfiler(
+            slowest_n=0,
+            cprofile_over_sec=config.get("cprofile_over_sec"),
+            cprofile_dir=Path(config["cprofile_dir"]) if config.get("cprofile_dir") else None,
+        )
+        _worker_profiler = (config, profiler)
+    return _worker_profiler[1]
+
+
 @ray.remote(num_cpus=1, max_retries=2)
 def process_local_document(
     corpus_dir: str,
     doc_key: str,
     meta_key: str | None,
+    profile_config: dict[str, Any] | None = None,
 ) -> dict[str, Any] | None:
     """Process a local HTML document through the agent NLP pipeline.
 
@@ -480,18 +502,22 @@ def process_local_document(
                     pass
 
         # Step 3: Delegate to shared NLP pipeline
+        profiler = _get_worker_profiler(profile_config)
         result = process_document_text(
             html=html,
             path_or_key=doc_key,
             filename=doc_path.name,
             sidecar=sidecar,
             cohort_only_nlp=True,
+            profiler=profiler,
         )
         if result is None:
             return None
 
         d = result.to_dict()
         d["doc_key"] = doc_key
+        if profiler is not None and profiler.last_timing is not None:
+            d["timing"] = profiler.last_timing
         return d
 
     except Exception as exc:
@@ -615,6 +641,7 @@ def process_document(
     doc_key: str,
     meta_key: str | None,
     region: str,
+    profile_config: dict[str, Any] | None = None,
 ) -> dict[str, Any] | None:
     """Process a single S3-hosted HTML document through the agent NLP pipeline.
 
@@ -622,7 +649,8 @@ def process_document(
     that handles S3 I/O and sidecar loading.
 
     Creates a fresh boto3 client per invocation (not serializable across Ray).
-    Returns a result dict or None on failure.
+    Returns a result dict or None on failure; with *profile_config* the dict
+    carries the document's stage ``timing``.
     """
     import boto3
 
@@ -658,18 +686,22 @@ def process_document(
                 pass
 
         # Step 3: Delegate to shared NLP pipeline
+        profiler = _get_worker_profiler(profile_config)
         result = process_document_text(
             html=html,
             path_or_key=doc_key,
             filename=Path(doc_key).name,
             sidecar=sidecar,
             cohort_only_nlp=True,
+            profiler=profiler,
         )
         if result is None:
             return None
 
         d = result.to_dict()
         d["doc_key"] = doc_key
+        if profiler is not None and profiler.last_timing is not None:
+            d["timing"] = profiler.last_timing
         return d
 
     except Exception as exc:
@@ -1091,6 +1123,36 @@ def main() -> None:
             "(default: metadata-trimmed)"
         ),
     )
+    parser.add_argument(
+        "--profile-stages",
+        action="store_true",
+        help=(
+            "Time each pipeline stage per document; adds a pipeline_profile to "
+            "the run manifest and writes <output>.stages.folded for flamegraph tools."
+        ),
+    )
+    parser.add_argument(
+        "--profile-slowest",
+        type=int,
+        default=20,
+        help="Slowest documents to report with --profile-stages (default: 20)",
+    )
+    parser.add_argument(
+        "--cprofile-over",
+        type=float,
+        default=None,
+        metavar="SEC",
+        help=(
+            "With --profile-stages, re-run documents slower than SEC seconds "
+            "under cProfile and dump .prof files to --cprofile-dir."
+        ),
+    )
+    parser.add_argument(
+        "--cprofile-dir",
+        type=Path,
+        default=None,
+        help="Directory for --cprofile-over dumps (default: {output}.cprofile/)",
+    )
     args = parser.parse_args()
 
     # Configure logging
@@ -1313,6 +1375,19 @@ def main() -> None:
         start_time = time.time()
         last_log_time = start_time
 
+        profile_config: dict[str, Any] | None = None
+        stage_profiler: PipelineProfiler | None = None
+        if args.profile_stages:
+            profile_config = {
+                "cprofile_over_sec": args.cprofile_over,
+                "cprofile_dir": (
+                    str((args.cprofile_dir or Path(f"{output_path}.cprofile")).resolve())
+                    if args.cprofile_over is not None
+                    else None
+                ),
+            }
+            stage_profiler = PipelineProfiler(slowest_n=args.profile_slowest)
+
         if not merge_only:
             active_futures: list[ray.ObjectRef] = []  # type: ignore[type-arg]
             future_to_key: dict[ray.ObjectRef, str] = {}  # type: ignore[type-arg]
@@ -1329,11 +1404,11 @@ def main() -> None:
                     doc_key, meta_key = next(pair_iter)
                     if use_local_corpus:
                         ref = process_local_document.remote(  # type: ignore[attr-defined]
-                            str(local_corpus_dir), doc_key, meta_key,
+                            str(local_corpus_dir), doc_key, meta_key, profile_config,
                         )
                     else:
                         ref = process_document.remote(  # type: ignore[attr-defined]
-                            bucket, doc_key, meta_key, args.region,
+                            bucket, doc_key, meta_key, args.region, profile_config,
                         )
                     active_futures.append(ref)
                     future_to_key[ref] = doc_key
@@ -1363,6 +1438,9 @@ def main() -> None:
                         ckpt.mark_error(doc_key)
                         errors += 1
                     else:
+                        timing = result.pop("timing", None)
+                        if stage_profiler is not None and timing is not None:
+                            stage_profiler.add_timing(timing)
                         # Accumulate result for Parquet batch write
                         result_batch.append(result)
                         batch_keys.append(doc_key)
@@ -1434,6 +1512,15 @@ def main() -> None:
         else:
             processing_elapsed = 0.0
 
+        pipeline_profile: dict[str, Any] | None = None
+        if stage_profiler is not None:
+            pipeline_profile = stage_profiler.summary()
+            folded_path = Path(f"{output_path}.stages.folded")
+            folded_path.write_text(stage_profiler.folded_stacks())
+            pipeline_profile["folded_stacks"] = str(folded_path)
+            log.info("%s", stage_profiler.report())
+            log.info("Folded stacks: %s", folded_path)
+
         # -------------------------------------------------------------------
         # Step 6: Merge Parquet shards → DuckDB
         # -------------------------------------------------------------------
@@ -1501,6 +1588,7 @@ def main() -> None:
                 "shards_written": shard_counter,
                 "shard_totals": cumulative_stats,
                 "merge_stats": merge_stats,
+                **({"pipeline_profile": pipeline_profile} if pipeline_profile else {}),
             },
             git_commit=git_commit_hash(search_from=Path(__file__).resolve().parents[1]),
         )
@@ -27,6 +27,12 @@ Usage examples:
       --links-db corpus_index/links.duckdb \\
       --family debt_capacity.indebtedness
 
+    # All families in one corpus pass, sharded over 4 processes
+    python3 scripts/bulk_family_linker.py \\
+      --db corpus_index/corpus.duckdb \\
+      --links-db corpus_index/links.duckdb \\
+      --sweep --sweep-workers 4
+
 Output:
     --dry-run: structured JSON to stdout with candidates, tiers, conflicts
     Normal:    run summary JSON to stdout, progress to stderr
@@ -41,6 +47,7 @@ import re
 import sys
 import time
 from pathlib import Path
+from types import SimpleNamespace
 from typing import Any
 
 # orjson with stdlib fallback
@@ -384,9 +391,17 @@ def _article_expr_matches(
 def _text_expr_matches(expr: Any, text: str) -> bool:
     try:
         from agent.query_filters import FilterGroup, FilterMatch
+        from agent.rule_dsl import ProximityOp
     except Exception:
         return True
 
+    if isinstance(expr, ProximityOp):
+        from agent.proximity import proximity_matches
+        try:
+            return proximity_matches(expr, str(text or ""))
+        except ValueError:
+            return False
+
     if isinstance(expr, FilterMatch):
         needle = str(expr.value or "").strip().lower()
         haystack = str(text or "").lower()
@@ -402,24 +417,37 @@ def _text_expr_matches(expr: Any, text: str) -> bool:
     return True
 
 
-def _extract_text_fields_from_filter_dsl(filter_dsl: str) -> dict[str, Any]:
+def _parse_filter_dsl(filter_dsl: str) -> Any:
     text = str(filter_dsl or "").strip()
     if not text:
-        return {}
+        return None
     try:
         from agent.rule_dsl import parse_dsl
     except Exception:
-        return {}
+        return None
     try:
         parsed = parse_dsl(text)
     except Exception:
-        return {}
-    if not parsed.ok:
+        return None
+    return parsed if parsed.ok else None
+
+
+def _extract_text_fields_from_filter_dsl(filter_dsl: str) -> dict[str, Any]:
+    parsed = _parse_filter_dsl(filter_dsl)
+    if parsed is None:
         return {}
     fields = parsed.text_fields if isinstance(parsed.text_fields, dict) else {}
     return {str(k): v for k, v in fields.items() if v is not None}
 
 
+def _extract_meta_fields_from_filter_dsl(filter_dsl: str) -> dict[str, Any]:
+    parsed = _parse_filter_dsl(filter_dsl)
+    if parsed is None:
+        return {}
+    fields = parsed.meta_fields if isinstance(parsed.meta_fields, dict) else {}
+    return {str(k): v for k, v in fields.items() if v is not None}
+
+
 def _resolve_scoped_sections_from_text_fields(
     corpus: Any,
     text_fields: dict[str, Any],
@@ -429,11 +457,19 @@ def _resolve_scoped_sections_from_text_fields(
     if not text_fields:
         return None
     try:
+        from agent.proximity import SECTION_TOKENS_TABLE
         from agent.query_filters import build_multi_field_sql
+        from agent.rule_dsl import ProximityOp
     except Exception:
         return None
 
-    where_sql, where_params, joins = build_multi_field_sql(text_fields)
+    clause_prox = text_fields.get("clause")
+    if not isinstance(clause_prox, ProximityOp):
+        clause_prox = None
+    positional_index = clause_prox is None or bool(corpus.has_table(SECTION_TOKENS_TABLE))
+    where_sql, where_params, joins = build_multi_field_sql(
+        text_fields, positional_index=positional_index,
+    )
     if where_sql == "1=1":
         return None
 
@@ -457,6 +493,11 @@ def _resolve_scoped_sections_from_text_fields(
     for row in rows:
         doc_id = str(row[0])
         section_number = str(row[1])
+        if clause_prox is not None and not positional_index:
+            # Prefilter is a superset without the postings table; confirm in Python.
+            section_text = corpus.get_section_text(doc_id, section_number) or ""
+            if not _text_expr_matches(clause_prox, section_text):
+                continue
         scoped.setdefault(doc_id, set()).add(section_number)
     return scoped
 
@@ -676,6 +717,556 @@ def _resolve_section_text_hash(
     return text_hash
 
 
+# ---------------------------------------------------------------------------
+# Per-section candidate emission (shared by both scan paths)
+# ---------------------------------------------------------------------------
+
+class _RuleScorer:
+    """Confidence scoring for one rule, memoized on the factor inputs.
+
+    Within a rule every factor except heading, article concept and defined-term
+    coverage is constant, so sections sharing those inputs share one result.
+    """
+
+    def __init__(
+        self,
+        *,
+        heading_filter_expr: Any,
+        article_concepts: list[str],
+        expected_terms: list[str],
+        calibration: dict[str, Any] | None,
+    ) -> None:
+        self._heading_filter_expr = heading_filter_expr
+        self._article_concepts = article_concepts
+        self._expected_terms = expected_terms
+        self._expected_lower = frozenset(str(t).lower() for t in expected_terms)
+        self._calibration = calibration
+        self._cache: dict[tuple[Any, ...], Any] = {}
+
+    @property
+    def needs_defined_terms(self) -> bool:
+        """Whether document terms can change the score (grounding factor)."""
+        return bool(self._expected_lower)
+
+    def score(
+        self,
+        heading: str,
+        article_concept: str | None,
+        matched_value: str,
+        defined_terms_present: list[str],
+    ) -> Any:
+        from agent.link_confidence import compute_link_confidence
+        from agent.query_filters import FilterMatch
+
+        grounding = (
+            frozenset(t.lower() for t in defined_terms_present) & self._expected_lower
+            if self._expected_lower
+            else None
+        )
+        key = (
+            heading,
+            article_concept,
+            matched_value if self._heading_filter_expr is None else None,
+            grounding,
+        )
+        cached = self._cache.get(key)
+        if cached is not None:
+            return cached
+
+        # Fallback: create a minimal FilterMatch
+        rule_heading_ast = self._heading_filter_expr
+        if rule_heading_ast is None:
+            rule_heading_ast = FilterMatch(value=matched_value, negate=False)
+        result = compute_link_confidence(
+            heading=heading,
+            article_concept=article_concept,
+            rule_article_concepts=self._article_concepts,
+            rule_heading_ast=rule_heading_ast,
+            template_family=None,
+            defined_terms_present=defined_terms_present,
+            expected_defined_terms=self._expected_terms,
+            calibration=self._calibration,
+        )
+        self._cache[key] = result
+        return result
+
+
+class _RulePlan:
+    """Parsed, evaluation-ready form of one rule (shared by every scan path)."""
+
+    def __init__(self, rule: dict[str, Any], *, calibration: dict[str, Any] | None) -> None:
+        from agent.query_filters import filter_expr_from_json
+
+        self.rule = rule
+        self.family_id = str(rule.get("family_id", ""))
+        self.heading_ast_raw = rule.get("heading_filter_ast", {})
+        self.article_concepts = rule.get("article_concepts", [])
+        filter_dsl_text = str(rule.get("filter_dsl") or "").strip()
+        dsl_text_fields = _extract_text_fields_from_filter_dsl(filter_dsl_text)
+        self.meta_fields = _extract_meta_fields_from_filter_dsl(filter_dsl_text)
+        self.dsl_article_expr = dsl_text_fields.get("article")
+        self.dsl_heading_expr = dsl_text_fields.get("heading")
+        self.clause_expr = dsl_text_fields.get("clause")
+        dsl_defined_term_expr = dsl_text_fields.get("defined_term")
+        self.defined_term_scope_expr = dsl_defined_term_expr
+
+        granularity = str(rule.get("result_granularity") or "section").strip().lower()
+        if granularity not in {"section", "clause", "defined_term"}:
+            granularity = "section"
+        if granularity == "section" and dsl_defined_term_expr is not None:
+            granularity = "defined_term"
+        # Term-level candidates only when the rule asks for defined_term results.
+        self.defined_term_expr = dsl_defined_term_expr if granularity == "defined_term" else None
+
+        self.dsl_scope_expr_fields: dict[str, Any] = {}
+        if self.clause_expr is not None:
+            self.dsl_scope_expr_fields["clause"] = self.clause_expr
+        if dsl_defined_term_expr is not None:
+            self.dsl_scope_expr_fields["defined_term"] = dsl_defined_term_expr
+
+        # Parse the heading filter AST into a FilterExpression for confidence scoring
+        heading_filter_expr = None
+        try:
+            if self.heading_ast_raw:
+                heading_filter_expr = filter_expr_from_json(self.heading_ast_raw)
+        except (ValueError, KeyError):
+            heading_filter_expr = None
+        if heading_filter_expr is None and self.dsl_heading_expr is not None:
+            heading_filter_expr = self.dsl_heading_expr
+
+        # Expected defined terms for the defined_term_grounding factor
+        self.scoring = _RuleScorer(
+            heading_filter_expr=heading_filter_expr,
+            article_concepts=self.article_concepts,
+            expected_terms=rule.get("required_defined_terms") or [],
+            calibration=calibration,
+        )
+
+        try:
+            self.heading_values = _extract_ast_match_values(self.heading_ast_raw)
+        except ValueError:
+            self.heading_values = []
+        self.has_heading_constraint = (
+            bool(self.heading_values) or self.dsl_heading_expr is not None
+        )
+
+
+def _rule_heading_matches(
+    heading: str,
+    heading_ast_raw: Any,
+    heading_values: list[str],
+    dsl_heading_expr: Any,
+) -> tuple[bool, str, str]:
+    """Heading check for a rule with a heading constraint (AST values win over DSL)."""
+    if heading_values:
+        return heading_matches_ast(heading, heading_ast_raw)
+    if dsl_heading_expr is not None:
+        return (_text_expr_matches(dsl_heading_expr, str(heading)), "dsl", str(heading))
+    return (True, "none", "")
+
+
+def _emit_section_candidates(
+    section: Any,
+    rule: dict[str, Any],
+    *,
+    match_type: str,
+    matched_value: str,
+    article_concept: str | None,
+    confidence_result: Any,
+    doc_definitions: list[Any],
+    defined_term_expr: Any,
+    conflict_matrix: dict[tuple[str, str], Any] | None,
+    existing_links_by_section: dict[str, list[str]] | None,
+) -> list[dict[str, Any]]:
+    """Build the candidate(s) for one matched section.
+
+    With a ``defined_term`` expression, one candidate per matching definition
+    inside the section span; the section is dropped when the document has
+    definitions with spans but none match.
+    """
+    conflict_info = _detect_conflicts(
+        str(rule.get("family_id", "")),
+        section.doc_id,
+        section.section_number,
+        conflict_matrix,
+        existing_links_by_section,
+    )
+
+    if defined_term_expr is not None:
+        matched_terms: list[dict[str, Any]] = []
+        matched_term_without_span = False
+        section_start = int(getattr(section, "char_start", 0) or 0)
+        section_end = int(getattr(section, "char_end", 0) or 0)
+        for definition in doc_definitions:
+            term = str(getattr(definition, "term", "") or "").strip()
+            if not term or not _text_expr_matches(defined_term_expr, term):
+                continue
+            try:
+                def_start = int(getattr(definition, "char_start", None))
+                def_end = int(getattr(definition, "char_end", None))
+            except (TypeError, ValueError):
+                matched_term_without_span = True
+                continue
+            if not (section_start <= def_start and def_end <= section_end):
+                continue
+            matched_terms.append(
+                {
+                    "term": term,
+                    "char_start": def_start,
+                    "char_end": def_end,
+                    "definition_text": str(getattr(definition, "definition_text", "") or ""),
+                },
+            )
+        if not matched_terms and doc_definitions and not matched_term_without_span:
+            return []
+        if matched_terms:
+            term_candidates: list[dict[str, Any]] = []
+            for term_match in matched_terms:
+                candidate = _build_candidate(
+                    section,
+                    rule,
+                    match_type,
+                    matched_value,
+                    article_concept,
+                    confidence_result,
+                    conflict_info,
+                )
+                clause_id = (
+                    f"__def__:{term_match['char_start']}:{term_match['char_end']}:"
+                    f"{term_match['term']}"
+                )
+                candidate["clause_id"] = clause_id
+                candidate["clause_key"] = clause_id
+                candidate["clause_char_start"] = int(term_match["char_start"])
+                candidate["clause_char_end"] = int(term_match["char_end"])
+                candidate["clause_text"] = term_match["definition_text"]
+                candidate["defined_term"] = term_match["term"]
+                candidate["definition_char_start"] = int(term_match["char_start"])
+                candidate["definition_char_end"] = int(term_match["char_end"])
+                candidate["definition_text"] = term_match["definition_text"]
+                term_candidates.append(candidate)
+            return term_candidates
+
+    return [
+        _build_candidate(
+            section,
+            rule,
+            match_type,
+            matched_value,
+            article_concept,
+            confidence_result,
+            conflict_info,
+        ),
+    ]
+
+
+# ---------------------------------------------------------------------------
+# Set-at-a-time scanning
+# ---------------------------------------------------------------------------
+
+def _supports_set_scan(corpus: Any) -> bool:
+    """Whether *corpus* is a SQL-backed index the set-oriented plan can run on."""
+    has_table = getattr(corpus, "has_table", None)
+    if not callable(has_table) or getattr(corpus, "_conn", None) is None:
+        return False
+    return bool(has_table("sections")) and bool(has_table("documents"))
+
+
+def _fetch_columns(conn: Any, sql: str, params: list[Any]) -> dict[str, list[Any]]:
+    """Run *sql* and return the result as one columnar batch.
+
+    Uses DuckDB's Arrow export when pyarrow is available so the whole result
+    set crosses into Python in a single transfer; falls back to ``fetchall``.
+    """
+    result = conn.execute(sql, params)
+    try:
+        import pyarrow  # type: ignore[import-not-found]  # noqa: F401
+    except ImportError:
+        rows = result.fetchall()
+        names = [str(desc[0]) for desc in result.description]
+        return {name: [row[i] for row in rows] for i, name in enumerate(names)}
+    to_arrow = getattr(result, "to_arrow_table", None) or result.fetch_arrow_table
+    return to_arrow().to_pydict()
+
+
+def _heading_prefilter_sql(heading_values: list[str]) -> tuple[str, list[Any]]:
+    """Superset SQL prefilter for ``heading_matches_ast`` over ``s.heading``.
+
+    Exact, substring and partial (word-overlap) matches all require at least
+    one word of some value to occur in the heading, so an OR of per-word
+    ILIKEs never drops a true match. Python re-checks every surviving row.
+    """
+    from agent.query_filters import escape_like
+
+    words: list[str] = []
+    seen: set[str] = set()
+    for value in heading_values:
+        for word in str(value).lower().split():
+            if word not in seen:
+                seen.add(word)
+                words.append(word)
+    if not words:
+        return ("1=0", [])
+    clauses = " OR ".join("s.heading ILIKE ? ESCAPE '\\'" for _ in words)
+    return (f"({clauses})", [f"%{escape_like(w)}%" for w in words])
+
+
+def _scan_rule_set_at_a_time(
+    corpus: Any,
+    rule: dict[str, Any],
+    *,
+    doc_ids: list[str] | None,
+    allowed_sections_by_doc: dict[str, set[str]] | None,
+    heading_values: list[str],
+    dsl_heading_expr: Any,
+    dsl_article_expr: Any,
+    dsl_scope_expr_fields: dict[str, Any],
+    meta_fields: dict[str, Any],
+    defined_term_expr: Any,
+    scoring: _RuleScorer,
+    conflict_matrix: dict[tuple[str, str], Any] | None,
+    existing_links_by_section: dict[str, list[str]] | None,
+    preview_engine: Any = None,
+    corpus_version: str | None = None,
+) -> list[dict[str, Any]]:
+    """Evaluate one rule with a single SQL plan over the whole target set.
+
+    Document scope, heading prefilter, clause/defined_term scoping and meta
+    filters are compiled into one query joined to article metadata; the
+    candidate set comes back as one columnar batch. Exact heading/article
+    semantics are then checked in Python on that batch, definitions are
+    loaded in one query for the surviving documents, and confidence is
+    scored in bulk through the rule's memoized scorer.
+
+    With a ``PreviewEngine`` and the corpus version, the DSL heading and
+    clause/defined_term expressions are resolved to section keys of the
+    target documents through the engine's per-node cache instead of being
+    compiled into the query (unless they match too many sections).
+    """
+    from agent.corpus import SectionRecord
+    from agent.proximity import SECTION_TOKENS_TABLE
+    from agent.query_filters import build_filter_sql, build_multi_field_sql
+    from agent.rule_dsl import ProximityOp
+
+    if allowed_sections_by_doc is not None and not allowed_sections_by_doc:
+        return []
+
+    where_parts: list[str] = []
+    params: list[Any] = []
+    joins: set[str] = set()
+
+    if doc_ids is None:
+        where_parts.append("d.cohort_included = true")
+    else:
+        if not doc_ids:
+            return []
+        where_parts.append("s.doc_id IN (SELECT UNNEST(?::VARCHAR[]))")
+        params.append([str(d) for d in doc_ids])
+    if allowed_sections_by_doc is not None:
+        where_parts.append("s.doc_id IN (SELECT UNNEST(?::VARCHAR[]))")
+        params.append(sorted(allowed_sections_by_doc))
+
+    clause_prox = dsl_scope_expr_fields.get("clause")
+    if not isinstance(clause_prox, ProximityOp):
+        clause_prox = None
+    positional_index = clause_prox is None or bool(corpus.has_table(SECTION_TOKENS_TABLE))
+
+    text_fields = dict(dsl_scope_expr_fields)
+    if not heading_values and dsl_heading_expr is not None:
+        text_fields["heading"] = dsl_heading_expr
+    text_scope: frozenset[str] | None = None
+    if preview_engine is not None and corpus_version is not None and text_fields:
+        text_scope = preview_engine.section_keys(
+            corpus, corpus_version, text_fields,
+            positional_index=positional_index,
+            doc_ids=doc_ids if doc_ids is not None else allowed_sections_by_doc,
+            cohort_only=doc_ids is None,
+        )
+    if text_scope is not None:
+        if not text_scope:
+            return []
+        where_parts.append(
+            "(s.doc_id || '::' || s.section_number) IN (SELECT UNNEST(?::VARCHAR[]))",
+        )
+        params.append(sorted(text_scope))
+        dsl_scope_expr_fields = {}
+
+    if heading_values:
+        heading_sql, heading_params = _heading_prefilter_sql(heading_values)
+        where_parts.append(heading_sql)
+        params.extend(heading_params)
+    elif dsl_heading_expr is not None and text_scope is None:
+        heading_sql, heading_params = build_filter_sql(
+            dsl_heading_expr, "s.heading", wrap_wildcards=True,
+        )
+        where_parts.append(heading_sql)
+        params.extend(heading_params)
+
+    if dsl_scope_expr_fields or meta_fields:
+        scope_sql, scope_params, scope_joins = build_multi_field_sql(
+            dsl_scope_expr_fields, meta_fields, positional_index=positional_index,
+        )
+        if scope_sql != "1=1":
+            where_parts.append(scope_sql)
+            params.extend(scope_params)
+            joins.update(scope_joins)
+
+    if corpus.has_table("articles"):
+        # Articles numbered <= 0 contribute a concept only (matches the
+        # per-document path, which keys title/label by positive numbers).
+        article_cols = (
+            "a.concept AS article_concept, "
+            "CASE WHEN s.article_num > 0 THEN a.title END AS article_title, "
+            "CASE WHEN s.article_num > 0 THEN a.label END AS article_label"
+        )
+        article_join = (
+            "LEFT JOIN articles a ON a.doc_id = s.doc_id AND a.article_num = s.article_num"
+        )
+    else:
+        article_cols = (
+            "NULL AS article_concept, NULL AS article_title, NULL AS article_label"
+        )
+        article_join = ""
+    joins.discard("JOIN articles a ON a.doc_id = s.doc_id AND a.article_num = s.article_num")
+
+    join_sql = " ".join(part for part in [article_join, *sorted(joins)] if part)
+    sql = (
+        "SELECT s.doc_id, s.section_number, s.heading, s.char_start, s.char_end, "
+        f"s.article_num, s.word_count, {article_cols} "
+        "FROM sections s JOIN documents d ON d.doc_id = s.doc_id "
+        f"{join_sql} "
+        f"WHERE {' AND '.join(where_parts)} "
+        "ORDER BY s.doc_id, s.char_start"
+    )
+    batch = _fetch_columns(corpus._conn, sql, params)  # noqa: SLF001
+
+    has_heading_constraint = bool(heading_values) or dsl_heading_expr is not None
+    heading_ast_raw = rule.get("heading_filter_ast", {})
+    article_concepts = rule.get("article_concepts", [])
+
+    # Pass 1: exact heading/article semantics over the batch.
+    survivors: list[tuple[SectionRecord, str | None, str, str]] = []
+    columns = (
+        batch.get("doc_id", []),
+        batch.get("section_number", []),
+        batch.get("heading", []),
+        batch.get("char_start", []),
+        batch.get("char_end", []),
+        batch.get("article_num", []),
+        batch.get("word_count", []),
+        batch.get("article_concept", []),
+        batch.get("article_title", []),
+        batch.get("article_label", []),
+    )
+    for (
+        doc_id, section_number, heading, char_start, char_end,
+        article_num, word_count, raw_concept, raw_title, raw_label,
+    ) in zip(*columns, strict=True):
+        doc_key = str(doc_id)
+        section_key = str(section_number)
+        if allowed_sections_by_doc is not None and section_key not in allowed_sections_by_doc.get(
+            doc_key, set(),
+        ):
+            continue
+        art_concept = str(raw_concept or "").strip() or None
+        art_title = str(raw_title or "").strip() or None
+        art_label = str(raw_label or "").strip() or None
+        if not _article_matches_rule(
+            art_concept,
+            article_concepts,
+            article_filter_expr=dsl_article_expr,
+            article_num=int(article_num or 0),
+            article_title=art_title,
+            article_label=art_label,
+        ):
+            continue
+
+        match_type = "none"
+        matched_value = ""
+        if has_heading_constraint:
+            matched, match_type, matched_value = _rule_heading_matches(
+                str(heading or ""), heading_ast_raw, heading_values, dsl_heading_expr,
+            )
+            if not matched:
+                continue
+
+        if clause_prox is not None and not positional_index:
+            # Prefilter is a superset without the postings table; confirm in Python.
+            section_text = corpus.get_section_text(doc_key, section_key) or ""
+            if not _text_expr_matches(clause_prox, section_text):
+                continue
+
+        section = SectionRecord(
+            doc_id=doc_key,
+            section_number=section_key,
+            heading=str(heading or ""),
+            char_start=int(char_start or 0),
+            char_end=int(char_end or 0),
+            article_num=int(article_num or 0),
+            word_count=int(word_count or 0),
+        )
+        survivors.append((section, art_concept, match_type, matched_value))
+
+    if not survivors:
+        return []
+
+    # Pass 2: definitions for every surviving document in one query.
+    definitions_by_doc: dict[str, list[Any]] = {}
+    if (defined_term_expr is not None or scoring.needs_defined_terms) and corpus.has_table(
+        "definitions",
+    ):
+        survivor_docs = sorted({section.doc_id for section, _, _, _ in survivors})
+        defs = _fetch_columns(
+            corpus._conn,  # noqa: SLF001
+            "SELECT doc_id, term, definition_text, char_start, char_end FROM definitions "
+            "WHERE doc_id IN (SELECT UNNEST(?::VARCHAR[])) ORDER BY doc_id, char_start",
+            [survivor_docs],
+        )
+        for doc_id, term, definition_text, def_start, def_end in zip(
+            defs.get("doc_id", []),
+            defs.get("term", []),
+            defs.get("definition_text", []),
+            defs.get("char_start", []),
+            defs.get("char_end", []),
+            strict=True,
+        ):
+            definitions_by_doc.setdefault(str(doc_id), []).append(
+                SimpleNamespace(
+                    term=str(term or ""),
+                    definition_text=str(definition_text or ""),
+                    char_start=def_start,
+                    char_end=def_end,
+                ),
+            )
+    terms_by_doc = {
+        doc_id: [str(d.term) for d in definitions]
+        for doc_id, definitions in definitions_by_doc.items()
+    }
+
+    # Pass 3: bulk scoring + candidate emission.
+    candidates: list[dict[str, Any]] = []
+    for section, art_concept, match_type, matched_value in survivors:
+        doc_definitions = definitions_by_doc.get(section.doc_id, [])
+        confidence_result = scoring.score(
+            section.heading, art_concept, matched_value, terms_by_doc.get(section.doc_id, []),
+        )
+        candidates.extend(
+            _emit_section_candidates(
+                section,
+                rule,
+                match_type=match_type,
+                matched_value=matched_value,
+                article_concept=art_concept,
+                confidence_result=confidence_result,
+                doc_definitions=doc_definitions,
+                defined_term_expr=defined_term_expr,
+                conflict_matrix=conflict_matrix,
+                existing_links_by_section=existing_links_by_section,
+            ),
+        )
+    return candidates
+
+
 def scan_corpus_for_family(
     corpus: Any,
     rule: dict[str, Any],
@@ -685,9 +1276,15 @@ def scan_corpus_for_family(
     conflict_matrix: dict[tuple[str, str], Any] | None = None,
     existing_links_by_section: dict[str, list[str]] | None = None,
     calibration: dict[str, Any] | None = None,
+    preview_engine: Any = None,
+    corpus_version: str | None = None,
 ) -> list[dict[str, Any]]:
     """Scan the corpus to find sections matching a single rule.
 
+    SQL-backed corpora (a ``CorpusIndex``) are evaluated set-at-a-time via
+    ``_scan_rule_set_at_a_time``; other corpus objects fall back to the
+    per-document walk below, which does not evaluate DSL meta filters.
+
     Parameters
     ----------
     corpus:
@@ -702,46 +1299,44 @@ def scan_corpus_for_family(
         Dict of "doc_id::section_number" -> list[family_id] for conflict check.
     calibration:
         Per-family calibration overrides for confidence thresholds.
+    preview_engine, corpus_version:
+        Optional ``agent.preview_engine.PreviewEngine`` (and the version of
+        *corpus* it caches) whose per-node section sets scope the SQL scan,
+        so repeated previews of edited rules reuse unchanged terms.
 
     Returns
     -------
     list[dict[str, Any]]
         List of candidate link dicts.
     """
-    from agent.link_confidence import compute_link_confidence
-    from agent.query_filters import filter_expr_from_json
-
-    family_id = rule.get("family_id", "")
-    heading_ast_raw = rule.get("heading_filter_ast", {})
-    article_concepts = rule.get("article_concepts", [])
-    filter_dsl_text = str(rule.get("filter_dsl") or "").strip()
-    dsl_text_fields = _extract_text_fields_from_filter_dsl(filter_dsl_text)
-    dsl_article_expr = dsl_text_fields.get("article")
-    dsl_heading_expr = dsl_text_fields.get("heading")
-    dsl_defined_term_expr = dsl_text_fields.get("defined_term")
-    effective_result_granularity = str(rule.get("result_granularity") or "section").strip().lower()
-    if effective_result_granularity not in {"section", "clause", "defined_term"}:
-        effective_result_granularity = "section"
-    if effective_result_granularity == "section" and dsl_defined_term_expr is not None:
-        effective_result_granularity = "defined_term"
-    dsl_scope_expr_fields: dict[str, Any] = {}
-    if dsl_text_fields.get("clause") is not None:
-        dsl_scope_expr_fields["clause"] = dsl_text_fields["clause"]
-    if dsl_defined_term_expr is not None:
-        dsl_scope_expr_fields["defined_term"] = dsl_defined_term_expr
-
-    # Parse the heading filter AST into a FilterExpression for confidence scoring
-    heading_filter_expr = None
-    try:
-        if heading_ast_raw:
-            heading_filter_expr = filter_expr_from_json(heading_ast_raw)
-    except (ValueError, KeyError):
-        heading_filter_expr = None
-    if heading_filter_expr is None and dsl_heading_expr is not None:
-        heading_filter_expr = dsl_heading_expr
-
-    # Expected defined terms for the defined_term_grounding factor
-    expected_terms = rule.get("required_defined_terms") or []
+    plan = _RulePlan(rule, calibration=calibration)
+    heading_ast_raw = plan.heading_ast_raw
+    article_concepts = plan.article_concepts
+    heading_values = plan.heading_values
+    has_heading_constraint = plan.has_heading_constraint
+    dsl_heading_expr = plan.dsl_heading_expr
+    dsl_article_expr = plan.dsl_article_expr
+    dsl_scope_expr_fields = plan.dsl_scope_expr_fields
+    scoring = plan.scoring
+
+    if _supports_set_scan(corpus):
+        return _scan_rule_set_at_a_time(
+            corpus,
+            rule,
+            doc_ids=doc_ids,
+            allowed_sections_by_doc=allowed_sections_by_doc,
+            heading_values=heading_values,
+            dsl_heading_expr=dsl_heading_expr,
+            dsl_article_expr=dsl_article_expr,
+            dsl_scope_expr_fields=dsl_scope_expr_fields,
+            meta_fields=plan.meta_fields,
+            defined_term_expr=plan.defined_term_expr,
+            scoring=scoring,
+            conflict_matrix=conflict_matrix,
+            existing_links_by_section=existing_links_by_section,
+            preview_engine=preview_engine,
+            corpus_version=corpus_version,
+        )
 
     candidates: list[dict[str, Any]] = []
 
@@ -760,13 +1355,6 @@ def scan_corpus_for_family(
         doc_ids=target_docs,
     ) if dsl_scope_expr_fields else None
 
-    heading_values: list[str] = []
-    try:
-        heading_values = _extract_ast_match_values(heading_ast_raw)
-    except ValueError:
-        heading_values = []
-    has_heading_constraint = bool(heading_values) or dsl_heading_expr is not None
-
     for doc_id in target_docs:
         if allowed_sections_by_doc is not None and doc_id not in allowed_sections_by_doc:
             continue
@@ -844,115 +1432,508 @@ def scan_corpus_for_family(
             match_type = "none"
             matched_value = ""
             if has_heading_constraint:
-                if heading_values:
-                    matched, match_type, matched_value = heading_matches_ast(
-                        section.heading, heading_ast_raw,
-                    )
-                elif dsl_heading_expr is not None:
-                    matched = _text_expr_matches(dsl_heading_expr, str(section.heading))
-                    match_type = "dsl"
-                    matched_value = str(section.heading)
+                matched, match_type, matched_value = _rule_heading_matches(
+                    section.heading, heading_ast_raw, heading_values, dsl_heading_expr,
+                )
                 if not matched:
                     continue
 
             # Step 3: Compute confidence score
-            conf_kwargs: dict[str, Any] = {
-                "heading": section.heading,
-                "article_concept": art_concept,
-                "rule_article_concepts": article_concepts,
-                "template_family": None,
-                "defined_terms_present": doc_defined_terms,
-                "expected_defined_terms": expected_terms,
-                "calibration": calibration,
-            }
-            if heading_filter_expr is not None:
-                conf_kwargs["rule_heading_ast"] = heading_filter_expr
-            else:
-                # Fallback: create a minimal FilterMatch
-                from agent.query_filters import FilterMatch
-                conf_kwargs["rule_heading_ast"] = FilterMatch(
-                    value=matched_value, negate=False,
-                )
+            confidence_result = scoring.score(
+                section.heading, art_concept, matched_value, doc_defined_terms,
+            )
+
+            # Step 4: Detect conflicts + emit section/term candidates
+            candidates.extend(
+                _emit_section_candidates(
+                    section,
+                    rule,
+                    match_type=match_type,
+                    matched_value=matched_value,
+                    article_concept=art_concept,
+                    confidence_result=confidence_result,
+                    doc_definitions=doc_definitions,
+                    defined_term_expr=plan.defined_term_expr,
+                    conflict_matrix=conflict_matrix,
+                    existing_links_by_section=existing_links_by_section,
+                ),
+            )
+
+    return candidates
+
+
+# ---------------------------------------------------------------------------
+# Multi-rule sweep
+# ---------------------------------------------------------------------------
+
+SWEEP_BATCH_DOCS = 200
+_LINKABLE_TIERS = ("high", "medium")
+
+
+def _sweep_requirements(plans: list[_RulePlan]) -> dict[str, bool]:
+    """Which per-document tables the sweep must load for *plans*."""
+    from agent.rule_dsl import ProximityOp
+
+    return {
+        "definitions": any(
+            p.defined_term_scope_expr is not None or p.scoring.needs_defined_terms
+            for p in plans
+        ),
+        "clauses": any(
+            p.clause_expr is not None and not isinstance(p.clause_expr, ProximityOp)
+            for p in plans
+        ),
+        "section_text": any(isinstance(p.clause_expr, ProximityOp) for p in plans),
+    }
+
+
+def _load_sweep_batch(
+    corpus: Any,
+    doc_ids: list[str],
+    *,
+    requirements: dict[str, bool],
+) -> dict[str, dict[str, Any]]:
+    """Load sections/articles (+ definitions/clauses/text as needed) for *doc_ids*.
+
+    One query per table for the whole batch. Returns ``doc_id -> document``
+    where a document holds ``sections`` (in ``char_start`` order),
+    ``articles`` (``article_num -> (concept, title, label)``),
+    ``definitions``, ``clauses`` (``section_number -> [(header, text)]``) and
+    ``section_text`` (``section_number -> text``).
+    """
+    from agent.corpus import SectionRecord
+
+    docs: dict[str, dict[str, Any]] = {
+        doc_id: {
+            "sections": [],
+            "articles": {},
+            "definitions": [],
+            "clauses": {},
+            "section_text": {},
+        }
+        for doc_id in doc_ids
+    }
+    if not doc_ids:
+        return docs
+    conn = corpus._conn  # noqa: SLF001
+    doc_param = [list(doc_ids)]
+    in_batch = "doc_id IN (SELECT UNNEST(?::VARCHAR[]))"
+
+    sections = _fetch_columns(
+        conn,
+        "SELECT doc_id, section_number, heading, char_start, char_end, article_num, "
+        f"word_count FROM sections WHERE {in_batch} ORDER BY doc_id, char_start",
+        doc_param,
+    )
+    for doc_id, section_number, heading, char_start, char_end, article_num, word_count in zip(
+        sections.get("doc_id", []),
+        sections.get("section_number", []),
+        sections.get("heading", []),
+        sections.get("char_start", []),
+        sections.get("char_end", []),
+        sections.get("article_num", []),
+        sections.get("word_count", []),
+        strict=True,
+    ):
+        docs[str(doc_id)]["sections"].append(
+            SectionRecord(
+                doc_id=str(doc_id),
+                section_number=str(section_number),
+                heading=str(heading or ""),
+                char_start=int(char_start or 0),
+                char_end=int(char_end or 0),
+                article_num=int(article_num or 0),
+                word_count=int(word_count or 0),
+            ),
+        )
 
-            confidence_result = compute_link_confidence(**conf_kwargs)
+    if corpus.has_table("articles"):
+        articles = _fetch_columns(
+            conn,
+            f"SELECT doc_id, article_num, concept, title, label FROM articles WHERE {in_batch}",
+            doc_param,
+        )
+        for doc_id, article_num, concept, title, label in zip(
+            articles.get("doc_id", []),
+            articles.get("article_num", []),
+            articles.get("concept", []),
+            articles.get("title", []),
+            articles.get("label", []),
+            strict=True,
+        ):
+            docs[str(doc_id)]["articles"][int(article_num or 0)] = (
+                str(concept or "").strip() or None,
+                str(title or "").strip() or None,
+                str(label or "").strip() or None,
+            )
 
-            # Step 4: Detect conflicts
-            conflict_info = _detect_conflicts(
-                family_id,
-                doc_id,
-                section.section_number,
-                conflict_matrix,
-                existing_links_by_section,
+    if requirements.get("definitions") and corpus.has_table("definitions"):
+        defs = _fetch_columns(
+            conn,
+            "SELECT doc_id, term, definition_text, char_start, char_end FROM definitions "
+            f"WHERE {in_batch} ORDER BY doc_id, char_start",
+            doc_param,
+        )
+        for doc_id, term, definition_text, def_start, def_end in zip(
+            defs.get("doc_id", []),
+            defs.get("term", []),
+            defs.get("definition_text", []),
+            defs.get("char_start", []),
+            defs.get("char_end", []),
+            strict=True,
+        ):
+            docs[str(doc_id)]["definitions"].append(
+                SimpleNamespace(
+                    term=str(term or ""),
+                    definition_text=str(definition_text or ""),
+                    char_start=def_start,
+                    char_end=def_end,
+                ),
             )
 
-            if effective_result_granularity == "defined_term" and dsl_defined_term_expr is not None:
-                matched_terms: list[dict[str, Any]] = []
-                matched_term_without_span = False
-                section_start = int(getattr(section, "char_start", 0) or 0)
-                section_end = int(getattr(section, "char_end", 0) or 0)
-                for definition in doc_definitions:
-                    term = str(getattr(definition, "term", "") or "").strip()
-                    if not term or not _text_expr_matches(dsl_defined_term_expr, term):
-                        continue
-                    try:
-                        def_start = int(getattr(definition, "char_start", None))
-                        def_end = int(getattr(definition, "char_end", None))
-                    except (TypeError, ValueError):
-                        matched_term_without_span = True
-                        continue
-                    if not (section_start <= def_start and def_end <= section_end):
+    if requirements.get("clauses") and corpus.has_table("clauses"):
+        clause_cols = {
+            str(row[0])
+            for row in conn.execute(
+                "SELECT column_name FROM information_schema.columns "
+                "WHERE table_name = 'clauses'",
+            ).fetchall()
+        }
+        body_col = "clause_text" if "clause_text" in clause_cols else "''"
+        clauses = _fetch_columns(
+            conn,
+            f"SELECT doc_id, section_number, header_text, {body_col} AS body "
+            f"FROM clauses WHERE {in_batch}",
+            doc_param,
+        )
+        for doc_id, section_number, header_text, body in zip(
+            clauses.get("doc_id", []),
+            clauses.get("section_number", []),
+            clauses.get("header_text", []),
+            clauses.get("body", []),
+            strict=True,
+        ):
+            docs[str(doc_id)]["clauses"].setdefault(str(section_number), []).append(
+                (str(header_text or ""), str(body or "")),
+            )
+
+    if requirements.get("section_text") and corpus.has_table("section_text"):
+        texts = _fetch_columns(
+            conn,
+            f"SELECT doc_id, section_number, text FROM section_text WHERE {in_batch}",
+            doc_param,
+        )
+        for doc_id, section_number, text in zip(
+            texts.get("doc_id", []),
+            texts.get("section_number", []),
+            texts.get("text", []),
+            strict=True,
+        ):
+            docs[str(doc_id)]["section_text"][str(section_number)] = str(text or "")
+
+    return docs
+
+
+def _section_in_dsl_scope(plan: _RulePlan, document: dict[str, Any], section: Any) -> bool:
+    """In-memory equivalent of the clause/defined_term predicates of build_multi_field_sql."""
+    from agent.rule_dsl import ProximityOp
+
+    section_number = str(section.section_number)
+    if isinstance(plan.clause_expr, ProximityOp):
+        text = document["section_text"].get(section_number, "")
+        if not _text_expr_matches(plan.clause_expr, text):
+            return False
+    elif plan.clause_expr is not None:
+        if not any(
+            _text_expr_matches(plan.clause_expr, header)
+            or _text_expr_matches(plan.clause_expr, body)
+            for header, body in document["clauses"].get(section_number, [])
+        ):
+            return False
+
+    if plan.defined_term_scope_expr is not None:
+        start = int(section.char_start)
+        end = int(section.char_end)
+        found = False
+        for definition in document["definitions"]:
+            try:
+                def_start = int(definition.char_start)
+                def_end = int(definition.char_end)
+            except (TypeError, ValueError):
+                continue
+            if start <= def_start and def_end <= end and _text_expr_matches(
+                plan.defined_term_scope_expr, str(definition.term),
+            ):
+                found = True
+                break
+        if not found:
+            return False
+    return True
+
+
+def _evaluate_rule_on_document(
+    plan: _RulePlan,
+    document: dict[str, Any],
+    *,
+    allowed_sections: set[str] | None,
+    conflict_matrix: dict[tuple[str, str], Any] | None,
+    existing_links_by_section: dict[str, list[str]] | None,
+) -> list[dict[str, Any]]:
+    """Evaluate one rule against one in-memory document."""
+    doc_defined_terms = [str(d.term) for d in document["definitions"]]
+    candidates: list[dict[str, Any]] = []
+    for section in document["sections"]:
+        if allowed_sections is not None and str(section.section_number) not in allowed_sections:
+            continue
+        art_concept, art_title, art_label = document["articles"].get(
+            int(section.article_num), (None, None, None),
+        )
+        if int(section.article_num) <= 0:
+            # Title/label are keyed by positive article numbers only.
+            art_title, art_label = None, None
+        if not _article_matches_rule(
+            art_concept,
+            plan.article_concepts,
+            article_filter_expr=plan.dsl_article_expr,
+            article_num=int(section.article_num),
+            article_title=art_title,
+            article_label=art_label,
+        ):
+            continue
+
+        match_type = "none"
+        matched_value = ""
+        if plan.has_heading_constraint:
+            matched, match_type, matched_value = _rule_heading_matches(
+                section.heading, plan.heading_ast_raw, plan.heading_values, plan.dsl_heading_expr,
+            )
+            if not matched:
+                continue
+
+        if not _section_in_dsl_scope(plan, document, section):
+            continue
+
+        confidence_result = plan.scoring.score(
+            section.heading, art_concept, matched_value, doc_defined_terms,
+        )
+        candidates.extend(
+            _emit_section_candidates(
+                section,
+                plan.rule,
+                match_type=match_type,
+                matched_value=matched_value,
+                article_concept=art_concept,
+                confidence_result=confidence_result,
+                doc_definitions=document["definitions"],
+                defined_term_expr=plan.defined_term_expr,
+                conflict_matrix=conflict_matrix,
+                existing_links_by_section=existing_links_by_section,
+            ),
+        )
+    return candidates
+
+
+def _resolve_meta_doc_ids(corpus: Any, plan: _RulePlan) -> set[str] | None:
+    """Documents passing the rule's DSL meta filters (None = no meta filters)."""
+    if not plan.meta_fields:
+        return None
+    from agent.query_filters import build_multi_field_sql
+
+    meta_sql, meta_params, _ = build_multi_field_sql({}, plan.meta_fields)
+    if meta_sql == "1=1":
+        return None
+    rows = corpus._conn.execute(  # noqa: SLF001
+        f"SELECT d.doc_id FROM documents d WHERE {meta_sql}", meta_params,
+    ).fetchall()
+    return {str(r[0]) for r in rows}
+
+
+def sweep_corpus_for_rules(
+    corpus: Any,
+    rules: list[dict[str, Any]],
+    *,
+    doc_ids: list[str] | None = None,
+    static_scopes: dict[int, dict[str, set[str]]] | None = None,
+    dynamic_parents: dict[int, str] | None = None,
+    conflict_matrix: dict[tuple[str, str], Any] | None = None,
+    existing_links_by_section: dict[str, list[str]] | None = None,
+    calibration: dict[str, Any] | None = None,
+    workers: int = 1,
+) -> list[list[dict[str, Any]]]:
+    """Evaluate every rule in one pass over the corpus.
+
+    Documents are loaded once per batch of ``SWEEP_BATCH_DOCS`` and every rule
+    runs against each in-memory document in the given (hierarchy) order, so
+    corpus reads are O(corpus) instead of O(rules x corpus).
+
+    Parameters
+    ----------
+    rules:
+        Rules in evaluation order (see ``_order_rules_by_hierarchy``).
+    static_scopes:
+        Rule index -> inherited ``doc_id -> section_numbers`` resolved up front.
+    dynamic_parents:
+        Rule index -> parent family whose linkable (high/medium) candidates from
+        earlier rules in this sweep scope the rule, per document.
+    existing_links_by_section:
+        Conflict index; updated in place with every candidate as rules run.
+    workers:
+        Shard the sweep into contiguous doc_id ranges across this many
+        processes (requires a ``CorpusIndex`` opened from a file).
+
+    Returns
+    -------
+    list[list[dict[str, Any]]]
+        Candidates per rule, aligned with *rules*.
+    """
+    static_scopes = static_scopes or {}
+    dynamic_parents = dynamic_parents or {}
+    target_docs = doc_ids
+    if target_docs is None:
+        rows = corpus._conn.execute(  # noqa: SLF001
+            "SELECT doc_id FROM documents WHERE cohort_included = true ORDER BY doc_id",
+        ).fetchall()
+        target_docs = [str(r[0]) for r in rows]
+
+    db_path = getattr(corpus, "_db_path", None)
+    if workers > 1 and db_path is not None and len(target_docs) > 1:
+        return _sweep_sharded(
+            Path(db_path),
+            rules,
+            target_docs,
+            static_scopes=static_scopes,
+            dynamic_parents=dynamic_parents,
+            conflict_matrix=conflict_matrix,
+            existing_links_by_section=existing_links_by_section,
+            calibration=calibration,
+            workers=workers,
+        )
+
+    plans = [_RulePlan(rule, calibration=calibration) for rule in rules]
+    meta_doc_ids = [_resolve_meta_doc_ids(corpus, plan) for plan in plans]
+    requirements = _sweep_requirements(plans)
+    conflict_index = existing_links_by_section if existing_links_by_section is not None else {}
+    per_rule: list[list[dict[str, Any]]] = [[] for _ in plans]
+
+    for batch_start in range(0, len(target_docs), SWEEP_BATCH_DOCS):
+        batch_ids = target_docs[batch_start:batch_start + SWEEP_BATCH_DOCS]
+        documents = _load_sweep_batch(corpus, batch_ids, requirements=requirements)
+        for doc_id in batch_ids:
+            document = documents[doc_id]
+            if not document["sections"]:
+                continue
+            linked_by_family: dict[str, set[str]] = {}
+            for i, plan in enumerate(plans):
+                allowed: set[str] | None = None
+                if i in static_scopes:
+                    allowed = static_scopes[i].get(doc_id)
+                    if not allowed:
                         continue
-                    matched_terms.append(
-                        {
-                            "term": term,
-                            "char_start": def_start,
-                            "char_end": def_end,
-                            "definition_text": str(getattr(definition, "definition_text", "") or ""),
-                        },
-                    )
-                if not matched_terms:
-                    if doc_definitions and not matched_term_without_span:
+                elif i in dynamic_parents:
+                    allowed = linked_by_family.get(dynamic_parents[i])
+                    if not allowed:
                         continue
-                if matched_terms:
-                    for term_match in matched_terms:
-                        candidate = _build_candidate(
-                            section,
-                            rule,
-                            match_type,
-                            matched_value,
-                            art_concept,
-                            confidence_result,
-                            conflict_info,
-                        )
-                        clause_id = (
-                            f"__def__:{term_match['char_start']}:{term_match['char_end']}:"
-                            f"{term_match['term']}"
-                        )
-                        candidate["clause_id"] = clause_id
-                        candidate["clause_key"] = clause_id
-                        candidate["clause_char_start"] = int(term_match["char_start"])
-                        candidate["clause_char_end"] = int(term_match["char_end"])
-                        candidate["clause_text"] = term_match["definition_text"]
-                        candidate["defined_term"] = term_match["term"]
-                        candidate["definition_char_start"] = int(term_match["char_start"])
-                        candidate["definition_char_end"] = int(term_match["char_end"])
-                        candidate["definition_text"] = term_match["definition_text"]
-                        candidates.append(candidate)
+                if meta_doc_ids[i] is not None and doc_id not in meta_doc_ids[i]:
                     continue
+                candidates = _evaluate_rule_on_document(
+                    plan,
+                    document,
+                    allowed_sections=allowed,
+                    conflict_matrix=conflict_matrix,
+                    existing_links_by_section=conflict_index,
+                )
+                for cand in candidates:
+                    key = f"{cand['doc_id']}::{cand['section_number']}"
+                    families = conflict_index.setdefault(key, [])
+                    if cand["family_id"] not in families:
+                        families.append(cand["family_id"])
+                    if cand.get("confidence_tier") in _LINKABLE_TIERS:
+                        linked_by_family.setdefault(plan.family_id, set()).add(
+                            str(cand["section_number"]),
+                        )
+                per_rule[i].extend(candidates)
+    return per_rule
 
-            # Build candidate
-            candidate = _build_candidate(
-                section,
-                rule,
-                match_type,
-                matched_value,
-                art_concept,
-                confidence_result,
-                conflict_info,
-            )
-            candidates.append(candidate)
 
-    return candidates
+def _sweep_shard_worker(payload: dict[str, Any]) -> list[list[dict[str, Any]]]:
+    """Process-pool entry point: sweep one contiguous doc_id shard."""
+    agent_src = Path(__file__).resolve().parents[1] / "src"
+    if str(agent_src) not in sys.path:
+        sys.path.insert(0, str(agent_src))
+    from agent.corpus import CorpusIndex
+
+    with CorpusIndex(Path(payload["db_path"])) as corpus:
+        return sweep_corpus_for_rules(
+            corpus,
+            payload["rules"],
+            doc_ids=payload["doc_ids"],
+            static_scopes=payload["static_scopes"],
+            dynamic_parents=payload["dynamic_parents"],
+            conflict_matrix=payload["conflict_matrix"],
+            existing_links_by_section=payload["existing_links_by_section"],
+            calibration=payload["calibration"],
+        )
+
+
+def _sweep_sharded(
+    db_path: Path,
+    rules: list[dict[str, Any]],
+    target_docs: list[str],
+    *,
+    static_scopes: dict[int, dict[str, set[str]]],
+    dynamic_parents: dict[int, str],
+    conflict_matrix: dict[tuple[str, str], Any] | None,
+    existing_links_by_section: dict[str, list[str]] | None,
+    calibration: dict[str, Any] | None,
+    workers: int,
+) -> list[list[dict[str, Any]]]:
+    """Split *target_docs* into contiguous shards and sweep them in parallel.
+
+    Shard results are concatenated in doc order, so per-rule candidate order
+    matches a single-process sweep. Conflict state is per section, so shards
+    only need the pre-run links for their own documents.
+    """
+    import multiprocessing
+
+    shard_count = min(workers, len(target_docs))
+    shard_size = -(-len(target_docs) // shard_count)
+    payloads: list[dict[str, Any]] = []
+    for start in range(0, len(target_docs), shard_size):
+        shard_docs = target_docs[start:start + shard_size]
+        shard_set = set(shard_docs)
+        payloads.append({
+            "db_path": str(db_path),
+            "rules": rules,
+            "doc_ids": shard_docs,
+            "static_scopes": {
+                i: {d: secs for d, secs in scope.items() if d in shard_set}
+                for i, scope in static_scopes.items()
+            },
+            "dynamic_parents": dynamic_parents,
+            "conflict_matrix": conflict_matrix,
+            "existing_links_by_section": {
+                key: list(families)
+                for key, families in (existing_links_by_section or {}).items()
+                if key.split("::", 1)[0] in shard_set
+            },
+            "calibration": calibration,
+        })
+
+    per_rule: list[list[dict[str, Any]]] = [[] for _ in rules]
+    # Spawn rather than fork: the parent holds an open DuckDB connection.
+    with multiprocessing.get_context("spawn").Pool(processes=len(payloads)) as pool:
+        for shard_result in pool.map(_sweep_shard_worker, payloads):
+            for i, candidates in enumerate(shard_result):
+                per_rule[i].extend(candidates)
+
+    if existing_links_by_section is not None:
+        for candidates in per_rule:
+            for cand in candidates:
+                key = f"{cand['doc_id']}::{cand['section_number']}"
+                families = existing_links_by_section.setdefault(key, [])
+                if cand["family_id"] not in families:
+                    families.append(cand["family_id"])
+    return per_rule
 
 
 # ---------------------------------------------------------------------------
@@ -1006,9 +1987,15 @@ def run_bulk_linking(
     canary_n: int | None = None,
     dry_run: bool = False,
     conflict_matrix: dict[tuple[str, str], Any] | None = None,
+    sweep: bool = False,
+    sweep_workers: int = 1,
 ) -> dict[str, Any]:
     """Run the full bulk linking pipeline.
 
+    With ``sweep=True`` all rules are evaluated in one pass over the corpus
+    (``sweep_corpus_for_rules``, optionally sharded over ``sweep_workers``
+    processes) before links are persisted rule by rule in hierarchy order.
+
     Returns a summary dict with candidates, metrics, and run info.
     """
     start_time = time.time()
@@ -1091,6 +2078,44 @@ def run_bulk_linking(
 
     families_with_rules = {str(rule.get("family_id") or "") for rule in active_rules}
 
+    swept_candidates: list[list[dict[str, Any]]] | None = None
+    if sweep:
+        static_scopes: dict[int, dict[str, set[str]]] = {}
+        dynamic_parents: dict[int, str] = {}
+        for i, rule in enumerate(active_rules):
+            scope_mode = str(rule.get("scope_mode") or "corpus").strip().lower()
+            parent_family = _resolve_parent_family(rule, families_with_rules)
+            if scope_mode != "inherited" or not parent_family or store is None:
+                continue
+            parent_run_id = str(rule.get("parent_run_id") or "").strip() or None
+            pinned = _resolve_inherited_scope_sections(
+                store, parent_run_id=parent_run_id, parent_family_id=None, doc_ids=doc_ids,
+            ) if parent_run_id else {}
+            if pinned:
+                static_scopes[i] = pinned
+            elif dry_run:
+                # Nothing is persisted mid-run, so the parent's stored links are the scope.
+                static_scopes[i] = _resolve_inherited_scope_sections(
+                    store, parent_run_id=None, parent_family_id=parent_family, doc_ids=doc_ids,
+                )
+            else:
+                dynamic_parents[i] = parent_family
+        _log(
+            f"  Sweeping corpus once for {len(active_rules)} rules "
+            f"(workers={max(1, sweep_workers)})",
+        )
+        swept_candidates = sweep_corpus_for_rules(
+            corpus,
+            active_rules,
+            doc_ids=doc_ids,
+            static_scopes=static_scopes,
+            dynamic_parents=dynamic_parents,
+            conflict_matrix=conflict_matrix,
+            existing_links_by_section=existing_links_by_section,
+            calibration=None,
+            workers=max(1, sweep_workers),
+        )
+
     # Scan for each rule
     all_candidates: list[dict[str, Any]] = []
     links_created = 0
@@ -1108,7 +2133,9 @@ def run_bulk_linking(
         parent_family = _resolve_parent_family(rule, families_with_rules)
         parent_run_id = str(rule.get("parent_run_id") or "").strip() or None
         allowed_sections_by_doc: dict[str, set[str]] | None = None
-        if scope_mode == "inherited" and parent_family and store is not None:
+        if swept_candidates is not None:
+            _log(f"  [{i + 1}/{len(active_rules)}] Collecting family={family} from sweep")
+        elif scope_mode == "inherited" and parent_family and store is not None:
             allowed_sections_by_doc = _resolve_inherited_scope_sections(
                 store,
                 parent_run_id=parent_run_id,
@@ -1122,15 +2149,18 @@ def run_bulk_linking(
         else:
             _log(f"  [{i + 1}/{len(active_rules)}] Scanning family={family}")
 
-        candidates = scan_corpus_for_family(
-            corpus,
-            effective_rule,
-            doc_ids=doc_ids,
-            allowed_sections_by_doc=allowed_sections_by_doc,
-            conflict_matrix=conflict_matrix,
-            existing_links_by_section=existing_links_by_section,
-            calibration=None,
-        )
+        if swept_candidates is not None:
+            candidates = swept_candidates[i]
+        else:
+            candidates = scan_corpus_for_family(
+                corpus,
+                effective_rule,
+                doc_ids=doc_ids,
+                allowed_sections_by_doc=allowed_sections_by_doc,
+                conflict_matrix=conflict_matrix,
+                existing_links_by_section=existing_links_by_section,
+                calibration=None,
+            )
 
         _log(f"    Found {len(candidates)} candidates")
 
@@ -1396,6 +2426,18 @@ def build_parser() -> argparse.ArgumentParser:
         metavar="N",
         help="Apply to first N documents only (canary mode)",
     )
+    parser.add_argument(
+        "--sweep",
+        action="store_true",
+        help="Evaluate all rules in a single pass over the corpus",
+    )
+    parser.add_argument(
+        "--sweep-workers",
+        type=int,
+        default=1,
+        metavar="N",
+        help="Shard the --sweep pass across N processes by doc_id (default: 1)",
+    )
     parser.add_argument(
         "-v", "--verbose",
         action="store_true",
@@ -1491,6 +2533,8 @@ def main(argv: list[str] | None = None) -> int:
         canary_n=args.canary,
         dry_run=args.dry_run,
         conflict_matrix=conflict_matrix_dict,
+        sweep=args.sweep,
+        sweep_workers=args.sweep_workers,
     )
 
     # Output summary JSON to stdout
@@ -32,10 +32,11 @@ except ImportError:
         print()
 
 
-from agent.corpus import CorpusIndex, load_candidate_doc_ids
+from agent.corpus import CorpusIndex, DocBundle, load_candidate_doc_ids
 from agent.structural_fingerprint import build_section_fingerprint, summarize_fingerprints
 from agent.strategy import Strategy, load_strategy_with_views
-from agent.textmatch import heading_matches, keyword_density, section_dna_density, score_in_range
+from agent.strategy_matcher import strategy_matcher
+from agent.textmatch import score_in_range
 
 
 # ---------------------------------------------------------------------------
@@ -122,14 +123,16 @@ def score_section(
     best_score = 0.0
     method = "none"
 
+    signals = strategy_matcher(strategy).signals(heading, text_lower)
+
     # Heading match
-    heading_pat = heading_matches(heading, list(strategy.heading_patterns))
+    heading_pat = signals.heading_pattern
     if heading_pat is not None:
         best_score = HEADING_SCORE
         method = "heading"
 
     # Keyword density
-    kw_density, _ = keyword_density(text_lower, list(strategy.keyword_anchors))
+    kw_density = signals.keyword_density
     kw_score = score_in_range(KEYWORD_MIN, KEYWORD_MAX, kw_density)
     if kw_density > 0:
         composite = max(best_score, kw_score)
@@ -138,9 +141,7 @@ def score_section(
             method = "keyword"
 
     # DNA density
-    dna_density, _ = section_dna_density(
-        text_lower, list(strategy.dna_tier1), list(strategy.dna_tier2)
-    )
+    dna_density = signals.dna_density
     dna_score = score_in_range(DNA_MIN, DNA_MAX, dna_density)
     if dna_density > 0:
         composite = max(best_score, dna_score)
@@ -158,26 +159,15 @@ def score_section(
     return best_score, method
 
 
-def best_doc_match(
-    corpus: CorpusIndex,
-    doc_id: str,
-    strategy: Strategy,
-    *,
-    cohort_only: bool,
-) -> dict[str, Any]:
+def best_doc_match(bundle: DocBundle, strategy: Strategy) -> dict[str, Any]:
     """Return best section match details for a document."""
-    sections = corpus.search_sections(
-        doc_id=doc_id,
-        cohort_only=cohort_only,
-        limit=9999,
-    )
     best = 0.0
     best_section = ""
     best_heading = ""
     best_article_num = 0
     best_text = ""
-    for sec in sections:
-        text = corpus.get_section_text(doc_id, sec.section_number)
+    for sec in bundle.sections:
+        text = bundle.section_texts.get(sec.section_number)
         text_lower = text.lower() if text else ""
         score, _ = score_section(sec.heading, text_lower, strategy)
         if score > best:
@@ -260,12 +250,16 @@ def run(args: argparse.Namespace) -> None:
         total_hits = 0
         hit_doc_ids: list[str] = []
 
-        for i, doc_id in enumerate(doc_ids):
+        bundles = corpus.iter_doc_bundles(
+            doc_ids, cohort_only=cohort_only, include_features=False,
+        )
+        for i, bundle in enumerate(bundles):
             if (i + 1) % 100 == 0:
                 print(f"  Progress: {i + 1}/{len(doc_ids)}", file=sys.stderr)
 
             # Get group value
-            doc_rec = corpus.get_doc(doc_id)
+            doc_id = bundle.doc_id
+            doc_rec = bundle.doc
             classification = template_classifications.get(doc_id)
             template_family_from_doc = doc_rec.template_family if doc_rec else ""
             template_family_from_cls = (
@@ -300,12 +294,7 @@ def run(args: argparse.Namespace) -> None:
             group_totals[group_val] += 1
 
             # Score document
-            match = best_doc_match(
-                corpus,
-                doc_id,
-                strategy,
-                cohort_only=cohort_only,
-            )
+            match = best_doc_match(bundle, strategy)
             if float(match["score"]) > HIT_THRESHOLD:
                 group_hits[group_val] += 1
                 total_hits += 1
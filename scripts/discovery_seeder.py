@@ -25,17 +25,31 @@ Usage:
       --bootstrap data/bootstrap/bootstrap_all.json \\
       --family-notes docs/ontology_family_notes.json \\
       --workspace-root workspaces \\
+      [--jobs 8] [--seed 42] [--snapshot-dir /tmp/discovery_snapshot] \\
       [--exploratory-report plans/exploratory_report.json] \\
       [--dry-run]
 
+In ``--all`` mode the cohort's sections, texts and defined terms are loaded
+once into a memory-mapped snapshot (``DiscoverySnapshot``) and families
+run over it, ``--jobs`` at a time in worker processes.  Every family
+samples with its own seed derived from ``--seed`` and the family id, so
+results do not depend on ``--jobs`` or on which families run together.
+
 Structured JSON output goes to stdout; human messages go to stderr.
 """
 from __future__ import annotations
 
 import argparse
+import hashlib
 import json
+import math
+import multiprocessing
 import sys
+import tempfile
+import time
 from collections import Counter
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass
 from datetime import UTC, datetime
 from pathlib import Path
 from typing import Any
@@ -52,8 +66,13 @@ except ImportError:
         return json.dumps(obj, indent=2, default=str).encode()
 
 
+# Set in --all pool workers, whose step logs would interleave.
+_quiet = False
+
+
 def log(msg: str) -> None:
-    print(msg, file=sys.stderr, flush=True)
+    if not _quiet:
+        print(msg, file=sys.stderr, flush=True)
 
 
 # ---------------------------------------------------------------------------
@@ -136,15 +155,18 @@ def match_family_sections(
     non_matched: list[dict[str, Any]] = []
 
     for doc_id in doc_ids:
-        rows = corpus.query(
-            """
-            SELECT section_number, heading, article_num, char_start, word_count
-            FROM sections
-            WHERE doc_id = ?
-            ORDER BY char_start
-            """,
-            [doc_id],
-        )
+        if isinstance(corpus, DiscoverySnapshot):
+            rows = corpus.doc_sections(doc_id)
+        else:
+            rows = corpus.query(
+                """
+                SELECT section_number, heading, article_num, char_start, word_count
+                FROM sections
+                WHERE doc_id = ?
+                ORDER BY char_start
+                """,
+                [doc_id],
+            )
         for row in rows:
             sec = {
                 "doc_id": doc_id,
@@ -162,6 +184,172 @@ def match_family_sections(
     return matched, non_matched
 
 
+# ---------------------------------------------------------------------------
+# Shared corpus snapshot (--all mode)
+# ---------------------------------------------------------------------------
+
+_SNAPSHOT_INDEX = "index.json"
+_SNAPSHOT_TEXT = "text.bin"
+_SNAPSHOT_OFFSETS = "offsets.npy"
+# Tables whose presence discovery steps check with ``has_table``.
+_SNAPSHOT_TABLES = ("ngram_df",)
+
+
+@dataclass(frozen=True, slots=True)
+class _SnapshotDefinition:
+    term: str
+
+
+class DiscoverySnapshot:
+    """Read-only view of the cohort's sections for batch discovery.
+
+    Every family scans the same cohort sections, texts and defined terms,
+    so ``--all`` loads them from DuckDB once into a directory that worker
+    processes open without copying:
+
+    * ``text.bin`` — UTF-8 section texts back to back, memory-mapped.
+    * ``offsets.npy`` — byte offsets of each section's text (one more than
+      there are sections), memory-mapped.
+    * ``index.json`` — section rows and defined terms per document, the
+      corpus path and which of ``_SNAPSHOT_TABLES`` exist.
+
+    Provides the ``CorpusIndex`` methods the discovery steps use;
+    ``query`` (e.g. ``ngram_df`` lookups) goes to the corpus, opened
+    read-only on first use.
+    """
+
+    def __init__(self, directory: Path) -> None:
+        import mmap
+
+        import numpy as np
+
+        self.directory = directory
+        index = json.loads((directory / _SNAPSHOT_INDEX).read_bytes())
+        self._db_path = Path(index["db_path"])
+        self._doc_ids: list[str] = index["doc_ids"]
+        self._tables = frozenset(index["tables"])
+        self._sections: dict[str, list[list[Any]]] = {}
+        self._terms: dict[str, list[str]] = {}
+        self._positions: dict[tuple[str, str], int] = {}
+        position = 0
+        for doc_id, rows, terms in zip(
+            self._doc_ids, index["sections"], index["definitions"], strict=True,
+        ):
+            self._sections[doc_id] = rows
+            self._terms[doc_id] = terms
+            for row in rows:
+                self._positions.setdefault((doc_id, str(row[0])), position)
+                position += 1
+        self._offsets = np.load(directory / _SNAPSHOT_OFFSETS, mmap_mode="r")
+        self._file = (directory / _SNAPSHOT_TEXT).open("rb")
+        self._text: Any = b""
+        if int(self._offsets[-1]):
+            self._text = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        self._corpus: Any = None
+
+    @classmethod
+    def build(
+        cls,
+        corpus: Any,
+        directory: Path,
+        *,
+        batch_docs: int = 200,
+    ) -> DiscoverySnapshot:
+        """Write the snapshot of *corpus* (a ``CorpusIndex``) to *directory* and open it."""
+        import numpy as np
+
+        directory.mkdir(parents=True, exist_ok=True)
+        doc_ids: list[str] = corpus.doc_ids()
+        sections: dict[str, list[list[Any]]] = {doc_id: [] for doc_id in doc_ids}
+        terms: dict[str, list[str]] = {doc_id: [] for doc_id in doc_ids}
+        offsets = [0]
+        has_definitions = corpus.has_table("definitions")
+        with (directory / _SNAPSHOT_TEXT).open("wb") as text_file:
+            for i in range(0, len(doc_ids), batch_docs):
+                batch = doc_ids[i:i + batch_docs]
+                rows = corpus.query(
+                    """
+                    SELECT s.doc_id, s.section_number, s.heading, s.article_num,
+                           s.char_start, s.word_count, st.text
+                    FROM sections s
+                    LEFT JOIN section_text st
+                      ON st.doc_id = s.doc_id AND st.section_number = s.section_number
+                    WHERE s.doc_id IN (SELECT UNNEST(?::VARCHAR[]))
+                    ORDER BY s.doc_id, s.char_start, s.section_number
+                    """,
+                    [batch],
+                )
+                for doc_id, number, heading, article_num, char_start, word_count, text in rows:
+                    sections[str(doc_id)].append([
+                        str(number), str(heading), int(article_num or 0),
+                        int(char_start or 0), int(word_count or 0),
+                    ])
+                    encoded = str(text).encode("utf-8") if text else b""
+                    text_file.write(encoded)
+                    offsets.append(offsets[-1] + len(encoded))
+                if not has_definitions:
+                    continue
+                for doc_id, term in corpus.query(
+                    "SELECT doc_id, term FROM definitions "
+                    "WHERE doc_id IN (SELECT UNNEST(?::VARCHAR[])) "
+                    "ORDER BY doc_id, char_start",
+                    [batch],
+                ):
+                    terms[str(doc_id)].append(str(term))
+        np.save(directory / _SNAPSHOT_OFFSETS, np.asarray(offsets, dtype=np.int64))
+        index = {
+            "db_path": str(Path(corpus.db_path).resolve()),
+            "doc_ids": doc_ids,
+            "tables": [name for name in _SNAPSHOT_TABLES if corpus.has_table(name)],
+            "sections": [sections[doc_id] for doc_id in doc_ids],
+            "definitions": [terms[doc_id] for doc_id in doc_ids],
+        }
+        (directory / _SNAPSHOT_INDEX).write_text(json.dumps(index))
+        return cls(directory)
+
+    @property
+    def section_count(self) -> int:
+        return len(self._offsets) - 1
+
+    def doc_ids(self) -> list[str]:
+        return list(self._doc_ids)
+
+    def doc_sections(self, doc_id: str) -> list[list[Any]]:
+        """``(section_number, heading, article_num, char_start, word_count)`` rows."""
+        return self._sections.get(doc_id, [])
+
+    def get_section_text(self, doc_id: str, section_number: str) -> str | None:
+        position = self._positions.get((doc_id, section_number))
+        if position is None:
+            return None
+        start, end = int(self._offsets[position]), int(self._offsets[position + 1])
+        if start == end:
+            return None
+        return self._text[start:end].decode("utf-8")
+
+    def get_definitions(self, doc_id: str) -> list[_SnapshotDefinition]:
+        return [_SnapshotDefinition(term) for term in self._terms.get(doc_id, [])]
+
+    def has_table(self, table_name: str) -> bool:
+        return table_name in self._tables
+
+    def query(self, sql: str, params: list[Any] | None = None) -> list[tuple[Any, ...]]:
+        if self._corpus is None:
+            from agent.corpus import CorpusIndex
+
+            # The parent validated the schema when it built the snapshot.
+            self._corpus = CorpusIndex(self._db_path, enforce_schema=False)
+        return self._corpus.query(sql, params)
+
+    def close(self) -> None:
+        if self._corpus is not None:
+            self._corpus.close()
+            self._corpus = None
+        if not isinstance(self._text, bytes):
+            self._text.close()
+        self._file.close()
+
+
 # ---------------------------------------------------------------------------
 # Discovery steps
 # ---------------------------------------------------------------------------
@@ -207,6 +395,28 @@ def discover_headings(
     }
 
 
+def _load_section_texts(corpus: Any, sections: list[dict[str, Any]]) -> list[str]:
+    texts: list[str] = []
+    for sec in sections:
+        text = corpus.get_section_text(sec["doc_id"], sec["section_number"])
+        if text:
+            texts.append(text)
+    return texts
+
+
+def _cohort_ngram_counts(corpus: Any, **kwargs: Any) -> Any:
+    """Cohort-scope ``ngram_df`` counts, or None for corpora built without it.
+
+    ``match_family_sections`` splits the cohort's sections, so the cohort
+    scope minus the family's sections is exactly the non-family set.
+    """
+    from agent.ngram_df import NGRAM_DF_TABLE, load_ngram_counts
+
+    if not corpus.has_table(NGRAM_DF_TABLE):
+        return None
+    return load_ngram_counts(corpus, scope="cohort", **kwargs)
+
+
 def discover_dna_phrases(
     corpus: Any,
     matched: list[dict[str, Any]],
@@ -217,31 +427,31 @@ def discover_dna_phrases(
 ) -> dict[str, Any]:
     """Step 3: DNA phrase discovery via TF-IDF + Monroe log-odds.
 
+    The background is every non-family section, read from the corpus
+    ``ngram_df`` table; corpora without it fall back to a seeded sample
+    of *max_background* non-family sections.
+
     Returns tier1 and tier2 DNA phrases.
     """
-    from agent.dna import discover_dna_phrases as _discover_dna
-
-    # Load section texts
-    target_texts: list[str] = []
-    for sec in matched:
-        text = corpus.get_section_text(sec["doc_id"], sec["section_number"])
-        if text:
-            target_texts.append(text)
-
-    # Sample background texts (non-family sections)
-    import random
-    rng = random.Random(seed)
-    bg_sample = rng.sample(non_matched, min(max_background, len(non_matched)))
-    bg_texts: list[str] = []
-    for sec in bg_sample:
-        text = corpus.get_section_text(sec["doc_id"], sec["section_number"])
-        if text:
-            bg_texts.append(text)
+    from agent.dna import count_ngrams, rank_dna_phrases
+    from agent.ngram_df import subtract_counts
 
+    target_texts = _load_section_texts(corpus, matched)
     if not target_texts:
         return {"dna_tier1": [], "dna_tier2": []}
+    target = count_ngrams(target_texts)
+
+    cohort = _cohort_ngram_counts(corpus, phrases=target.tf.keys())
+    if cohort is not None:
+        background = subtract_counts(cohort, target)
+    else:
+        # Sample background texts (non-family sections)
+        import random
+        rng = random.Random(seed)
+        bg_sample = rng.sample(non_matched, min(max_background, len(non_matched)))
+        background = count_ngrams(_load_section_texts(corpus, bg_sample))
 
-    candidates = _discover_dna(target_texts, bg_texts, top_k=30)
+    candidates = rank_dna_phrases(target, background, top_k=30)
 
     # Split into tiers: top 10 → tier1, rest → tier2
     tier1 = [c.phrase for c in candidates[:10]]
@@ -251,6 +461,7 @@ def discover_dna_phrases(
         "dna_tier1": tier1,
         "dna_tier2": tier2,
         "dna_candidate_count": len(candidates),
+        "dna_background": "corpus" if cohort is not None else "sample",
     }
 
 
@@ -261,38 +472,48 @@ def discover_anti_dna(
     *,
     max_background: int = 500,
     seed: int = 42,
+    min_section_rate: float = 0.10,
 ) -> dict[str, Any]:
     """Step 4: Anti-DNA discovery — phrases that distinguish adjacent non-family sections.
 
-    Inverted: positive = adjacent non-family sections, background = family sections.
+    Inverted: positive = non-family sections, background = family sections.
+    With the corpus ``ngram_df`` table the positives are all non-family
+    sections (cohort counts minus the family's); only n-grams that can
+    pass *min_section_rate* are loaded, so percentile ranks are taken
+    among those.  Without it, a seeded sample of *max_background*
+    non-family sections is tokenized.
     """
-    # For anti-DNA: non-matched sections are "positive", matched are "background"
-    import random
-
-    from agent.dna import discover_dna_phrases as _discover_dna
-    rng = random.Random(seed)
-
-    # Sample from non-matched (they're the "target" for anti-DNA)
-    sample_nm = rng.sample(non_matched, min(max_background, len(non_matched)))
-    anti_target_texts: list[str] = []
-    for sec in sample_nm:
-        text = corpus.get_section_text(sec["doc_id"], sec["section_number"])
-        if text:
-            anti_target_texts.append(text)
+    from agent.dna import count_ngrams, rank_dna_phrases
+    from agent.ngram_df import subtract_counts
 
     # Family sections are the "background"
-    family_texts: list[str] = []
-    for sec in matched[:max_background]:
-        text = corpus.get_section_text(sec["doc_id"], sec["section_number"])
-        if text:
-            family_texts.append(text)
+    family_texts = _load_section_texts(corpus, matched[:max_background])
+    family = count_ngrams(family_texts)
 
-    if not anti_target_texts:
+    cohort = None
+    if non_matched:
+        cohort = _cohort_ngram_counts(
+            corpus, min_df=max(1, math.ceil(min_section_rate * len(non_matched))),
+        )
+    if cohort is not None:
+        all_family = (
+            family if len(matched) <= max_background
+            else count_ngrams(_load_section_texts(corpus, matched))
+        )
+        anti_target = subtract_counts(cohort, all_family)
+    else:
+        # For anti-DNA: non-matched sections are "positive", matched are "background"
+        import random
+        rng = random.Random(seed)
+        sample_nm = rng.sample(non_matched, min(max_background, len(non_matched)))
+        anti_target = count_ngrams(_load_section_texts(corpus, sample_nm))
+
+    if not anti_target.docs:
         return {"dna_negative_tier1": [], "dna_negative_tier2": []}
 
-    candidates = _discover_dna(
-        anti_target_texts, family_texts,
-        top_k=20, min_section_rate=0.10,
+    candidates = rank_dna_phrases(
+        anti_target, family,
+        top_k=20, min_section_rate=min_section_rate,
     )
 
     tier1 = [c.phrase for c in candidates[:8]]
@@ -309,11 +530,14 @@ def discover_keywords(
     matched: list[dict[str, Any]],
     non_matched: list[dict[str, Any]],
     cooccurrence_families: list[str] | None = None,
+    *,
+    seed: int = 42,
 ) -> dict[str, Any]:
     """Step 5: Keyword discovery via word/bigram frequency analysis.
 
     Finds words/bigrams that appear frequently in family sections but
-    rarely in non-family sections (discrimination ratio filtering).
+    rarely in non-family sections (discrimination ratio filtering) among
+    a seeded sample of 500 non-family sections.
     """
     # Collect word frequencies from matched sections
     import re
@@ -339,7 +563,7 @@ def discover_keywords(
             target_word_freq[bigram] += 1
 
     import random
-    rng = random.Random(42)
+    rng = random.Random(seed)
     bg_sample = rng.sample(non_matched, min(500, len(non_matched)))
     bg_doc_count = 0
     for sec in bg_sample:
@@ -662,6 +886,12 @@ def merge_and_validate(
 # Per-family pipeline
 # ---------------------------------------------------------------------------
 
+def family_seed(base_seed: int, family_id: str) -> int:
+    """Sampling seed of one family: stable across runs, processes and job counts."""
+    digest = hashlib.sha256(f"{base_seed}:{family_id}".encode()).digest()
+    return int.from_bytes(digest[:8], "big")
+
+
 def run_family_discovery(
     *,
     corpus: Any,
@@ -671,9 +901,13 @@ def run_family_discovery(
     exploratory_report: dict[str, Any] | None,
     workspace: Path,
     dry_run: bool,
+    seed: int = 42,
 ) -> dict[str, Any]:
     """Execute 10-step discovery pipeline for one family.
 
+    *seed* drives the background samples of steps 3-5 (see
+    :func:`family_seed`).
+
     Returns:
         Summary dict with discovery stats.
     """
@@ -722,19 +956,19 @@ def run_family_discovery(
 
     # Step 3: DNA discovery
     log("  Step 3: DNA phrase discovery...")
-    dna_result = discover_dna_phrases(corpus, matched, non_matched)
+    dna_result = discover_dna_phrases(corpus, matched, non_matched, seed=seed)
     discovery.update(dna_result)
     log(f"    {len(dna_result['dna_tier1'])} tier1, {len(dna_result['dna_tier2'])} tier2")
 
     # Step 4: Anti-DNA discovery
     log("  Step 4: Anti-DNA discovery...")
-    anti_dna_result = discover_anti_dna(corpus, matched, non_matched)
+    anti_dna_result = discover_anti_dna(corpus, matched, non_matched, seed=seed)
     discovery.update(anti_dna_result)
     log(f"    {len(anti_dna_result['dna_negative_tier1'])} negative tier1")
 
     # Step 5: Keyword discovery
     log("  Step 5: Keyword discovery...")
-    keyword_result = discover_keywords(corpus, matched, non_matched)
+    keyword_result = discover_keywords(corpus, matched, non_matched, seed=seed)
     discovery.update(keyword_result)
     log(f"    {len(keyword_result['keyword_anchors'])} keyword anchors")
 
@@ -773,7 +1007,7 @@ def run_family_discovery(
     # Step 10: Merge + validate
     log("  Step 10: Merge and validate...")
     # Remove internal stats keys before merging
-    for key in ["heading_distribution", "dna_candidate_count",
+    for key in ["heading_distribution", "dna_candidate_count", "dna_background",
                 "article_distribution", "section_distribution"]:
         discovery.pop(key, None)
 
@@ -797,6 +1031,90 @@ def run_family_discovery(
     return summary
 
 
+# ---------------------------------------------------------------------------
+# Batch runner (--all)
+# ---------------------------------------------------------------------------
+
+# Set in pool workers by _init_family_worker.
+_worker_snapshot: DiscoverySnapshot | None = None
+_worker_shared: dict[str, Any] = {}
+
+
+def _init_family_worker(snapshot_dir: Path, shared: dict[str, Any]) -> None:
+    global _quiet, _worker_shared, _worker_snapshot
+    _worker_snapshot = DiscoverySnapshot(snapshot_dir)
+    _worker_shared = shared
+    _quiet = True
+
+
+def _run_family_task(task: dict[str, Any]) -> tuple[dict[str, Any], float]:
+    assert _worker_snapshot is not None
+    started = time.perf_counter()
+    summary = run_family_discovery(corpus=_worker_snapshot, **_worker_shared, **task)
+    return summary, time.perf_counter() - started
+
+
+def run_families(
+    snapshot: DiscoverySnapshot,
+    tasks: list[dict[str, Any]],
+    *,
+    shared: dict[str, Any],
+    jobs: int = 1,
+) -> list[dict[str, Any]]:
+    """Run :func:`run_family_discovery` for every task over *snapshot*.
+
+    Each task holds the per-family keyword arguments (``family_id``,
+    ``concepts``, ``workspace``, ``seed``); *shared* holds the rest.  With
+    *jobs* > 1 families fan out over a process pool whose workers open the
+    snapshot directory themselves.  A failing family gets an ``error``
+    summary instead of stopping the batch.  Progress is logged per family;
+    summaries come back in task order.
+    """
+    results: dict[str, dict[str, Any]] = {}
+
+    def record(family_id: str, outcome: Any) -> None:
+        if isinstance(outcome, BaseException):
+            summary: dict[str, Any] = {
+                "family_id": family_id,
+                "status": "error",
+                "error": f"{type(outcome).__name__}: {outcome}",
+            }
+            elapsed = 0.0
+        else:
+            summary, elapsed = outcome
+        results[family_id] = summary
+        log(
+            f"[{len(results)}/{len(tasks)}] {family_id}: {summary['status']}, "
+            f"{summary.get('matched', 0)} matched ({elapsed:.1f}s)"
+        )
+
+    if jobs <= 1:
+        for task in tasks:
+            started = time.perf_counter()
+            try:
+                summary = run_family_discovery(corpus=snapshot, **shared, **task)
+            except Exception as exc:
+                record(task["family_id"], exc)
+            else:
+                record(task["family_id"], (summary, time.perf_counter() - started))
+    else:
+        # Spawn rather than fork: the parent holds an open DuckDB connection.
+        with ProcessPoolExecutor(
+            max_workers=min(jobs, len(tasks)) or 1,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_family_worker,
+            initargs=(snapshot.directory, shared),
+        ) as pool:
+            futures = {pool.submit(_run_family_task, task): task["family_id"] for task in tasks}
+            for future in as_completed(futures):
+                try:
+                    outcome: Any = future.result()
+                except Exception as exc:
+                    outcome = exc
+                record(futures[future], outcome)
+    return [results[task["family_id"]] for task in tasks]
+
+
 # ---------------------------------------------------------------------------
 # CLI
 # ---------------------------------------------------------------------------
@@ -842,6 +1160,18 @@ def main() -> None:
         "--dry-run", action="store_true",
         help="Show what would be done without writing files",
     )
+    parser.add_argument(
+        "--seed", type=int, default=42,
+        help="Base seed; each family samples with a seed derived from it (default: 42)",
+    )
+    parser.add_argument(
+        "--jobs", type=int, default=1,
+        help="Families run in parallel worker processes (--all mode, default: 1)",
+    )
+    parser.add_argument(
+        "--snapshot-dir", type=Path, default=None,
+        help="Directory for the --all corpus snapshot (default: a temporary directory)",
+    )
     args = parser.parse_args()
 
     from agent.corpus import CorpusIndex
@@ -871,24 +1201,44 @@ def main() -> None:
                     if f in active or any(f.startswith(a + ".") for a in active)
                 ]
 
-            log(f"Running discovery for {len(target_families)} families...")
+            tasks: list[dict[str, Any]] = []
             for fam_id in target_families:
                 concepts = family_concepts.get(fam_id, [])
                 if not concepts:
                     log(f"  Skipping {fam_id}: no bootstrap concepts")
                     continue
-
-                workspace = workspace_root / fam_id.replace(".", "_")
-                summary = run_family_discovery(
-                    corpus=corpus,
-                    family_id=fam_id,
-                    concepts=concepts,
-                    family_notes=notes,
-                    exploratory_report=exploratory,
-                    workspace=workspace,
-                    dry_run=args.dry_run,
+                tasks.append({
+                    "family_id": fam_id,
+                    "concepts": concepts,
+                    "workspace": workspace_root / fam_id.replace(".", "_"),
+                    "seed": family_seed(args.seed, fam_id),
+                })
+
+            with tempfile.TemporaryDirectory(prefix="discovery_snapshot_") as tmp:
+                log("Building corpus snapshot...")
+                started = time.perf_counter()
+                snapshot = DiscoverySnapshot.build(corpus, args.snapshot_dir or Path(tmp))
+                log(
+                    f"  {len(snapshot.doc_ids())} documents, {snapshot.section_count} "
+                    f"sections ({time.perf_counter() - started:.1f}s)"
+                )
+                log(
+                    f"Running discovery for {len(tasks)} families "
+                    f"({max(1, args.jobs)} job(s))..."
                 )
-                summaries.append(summary)
+                try:
+                    summaries = run_families(
+                        snapshot,
+                        tasks,
+                        shared={
+                            "family_notes": notes,
+                            "exploratory_report": exploratory,
+                            "dry_run": args.dry_run,
+                        },
+                        jobs=args.jobs,
+                    )
+                finally:
+                    snapshot.close()
 
             # Output summary
             result = {
@@ -924,6 +1274,7 @@ def main() -> None:
                 exploratory_report=exploratory,
                 workspace=workspace,
                 dry_run=args.dry_run,
+                seed=family_seed(args.seed, fam_id),
             )
 
             sys.stdout.buffer.write(_dumps(summary))
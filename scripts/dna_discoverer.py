@@ -7,6 +7,11 @@ Usage:
       --background-sections background.json \
       --top-k 30
 
+    # Background from the corpus-wide n-gram table instead of a text file:
+    python3 scripts/dna_discoverer.py \
+      --positive-sections positive_hits.json \
+      --db corpus_index/corpus.duckdb [--scope cohort] [--exclude-positives]
+
 Inputs can be JSON arrays of strings, JSON arrays of objects with a text-like
 field, or JSONL with one text/object per line.
 """
@@ -23,8 +28,10 @@ from agent.dna import (
     DEFAULT_MAX_BG_RATE,
     DEFAULT_MIN_SECTION_RATE,
     DEFAULT_TFIDF_WEIGHT,
+    NgramCounts,
     build_family_profile,
-    discover_dna_phrases,
+    count_ngrams,
+    rank_dna_phrases,
 )
 
 try:
@@ -118,6 +125,28 @@ def _load_texts(path: Path) -> list[str]:
     return texts
 
 
+def _corpus_background(
+    args: argparse.Namespace,
+    target: NgramCounts,
+    ngram_range: tuple[int, int],
+) -> NgramCounts | None:
+    from agent.corpus import CorpusIndex
+    from agent.ngram_df import load_ngram_counts, subtract_counts
+
+    with CorpusIndex(args.db) as corpus:
+        counts = load_ngram_counts(
+            corpus,
+            scope=args.scope,
+            scope_value=args.scope_value,
+            phrases=target.tf.keys(),
+            ngram_range=ngram_range,
+        )
+    if counts is None:
+        log(f"Error: {args.db} has no ngram_df counts for scope {args.scope!r}.")
+        sys.exit(1)
+    return subtract_counts(counts, target) if args.exclude_positives else counts
+
+
 def main() -> None:
     parser = argparse.ArgumentParser(
         description="Discover DNA phrases from positive vs background section text."
@@ -131,8 +160,36 @@ def main() -> None:
     parser.add_argument(
         "--background-sections",
         type=Path,
-        required=True,
-        help="JSON/JSONL file with background section texts.",
+        default=None,
+        help="JSON/JSONL file with background section texts (or use --db).",
+    )
+    parser.add_argument(
+        "--db",
+        type=Path,
+        default=None,
+        help=(
+            "Corpus DuckDB built with --ngram-df; its n-gram document "
+            "frequencies are the background."
+        ),
+    )
+    parser.add_argument(
+        "--scope",
+        choices=("all", "cohort", "template_family", "concept"),
+        default="cohort",
+        help="ngram_df scope used as background with --db (default: cohort).",
+    )
+    parser.add_argument(
+        "--scope-value",
+        default="",
+        help="Template family or article concept for --scope template_family/concept.",
+    )
+    parser.add_argument(
+        "--exclude-positives",
+        action="store_true",
+        help=(
+            "With --db, subtract the positive sections' counts from the scope "
+            "(when the positives are sections of that scope)."
+        ),
     )
     parser.add_argument("--top-k", type=int, default=30, help="Max candidates to return.")
     parser.add_argument(
@@ -177,9 +234,18 @@ def main() -> None:
         log("Error: invalid n-gram range. Expected 1 <= ngram-min <= ngram-max.")
         sys.exit(1)
 
+    if (args.background_sections is None) == (args.db is None):
+        log("Error: pass exactly one of --background-sections and --db.")
+        sys.exit(1)
+
+    ngram_range = (args.ngram_min, args.ngram_max)
     try:
         positives = _load_texts(args.positive_sections)
-        backgrounds = _load_texts(args.background_sections)
+        backgrounds = (
+            _load_texts(args.background_sections)
+            if args.background_sections is not None
+            else []
+        )
     except Exception as exc:
         log(f"Error loading inputs: {exc}")
         sys.exit(1)
@@ -187,23 +253,29 @@ def main() -> None:
     if not positives:
         log("Error: no positive section texts loaded.")
         sys.exit(1)
-    if not backgrounds:
+    target = count_ngrams(positives, ngram_range)
+
+    background: NgramCounts | None
+    if args.db is not None:
+        background = _corpus_background(args, target, ngram_range)
+    else:
+        background = count_ngrams(backgrounds, ngram_range)
+    if not background or not background.docs:
         log("Error: no background section texts loaded.")
         sys.exit(1)
 
     log(
-        f"Loaded {len(positives)} positive and {len(backgrounds)} background sections."
+        f"Loaded {len(positives)} positive and {background.docs} background sections."
     )
 
-    candidates = discover_dna_phrases(
-        positives,
-        backgrounds,
+    candidates = rank_dna_phrases(
+        target,
+        background,
         min_section_rate=args.min_section_rate,
         max_bg_rate=args.max_bg_rate,
         alpha=args.alpha,
         tfidf_weight=args.tfidf_weight,
         top_k=args.top_k,
-        ngram_range=(args.ngram_min, args.ngram_max),
     )
     family_profile = build_family_profile(positives, backgrounds, candidates)
 
@@ -237,7 +309,7 @@ def main() -> None:
     output: dict[str, Any] = {
         "status": "ok",
         "positive_count": len(positives),
-        "background_count": len(backgrounds),
+        "background_count": background.docs,
         "params": {
             "top_k": args.top_k,
             "min_section_rate": args.min_section_rate,
@@ -245,10 +317,16 @@ def main() -> None:
             "alpha": args.alpha,
             "tfidf_weight": args.tfidf_weight,
             "ngram_range": [args.ngram_min, args.ngram_max],
+            "background": (
+                {"db": str(args.db), "scope": args.scope, "scope_value": args.scope_value,
+                 "exclude_positives": args.exclude_positives}
+                if args.db is not None
+                else {"file": str(args.background_sections)}
+            ),
         },
         "family_profile": {
             "target_count": family_profile.target_count,
-            "background_count": family_profile.background_count,
+            "background_count": background.docs,
             "avg_target_words": round(family_profile.avg_target_words, 4),
             "avg_background_words": round(family_profile.avg_background_words, 4),
             "token_diversity_target": round(family_profile.token_diversity_target, 4),
@@ -1,8 +1,25 @@
 #!/usr/bin/env python3
 """Link worker subprocess — sole heavy writer for the linking system.
 
-Polls the ``job_queue`` table in ``links.duckdb`` and processes jobs. The API
-server submits jobs; this worker claims and executes them.
+Claims jobs from the ``job_queue`` table in ``links.duckdb`` and processes
+them. The API server submits jobs; this worker claims and executes them.
+
+**Dispatch**: ``LinkStore.submit_job`` / ``cancel_job`` poke the worker's
+FIFO (``agent.job_notify``), so an idle worker claims a new job as soon as
+it is queued and running handlers learn about cancellation without
+re-reading the job row.  As a safety net the queue is still re-read every
+``_NOTIFIED_RECHECK_SEC`` (recreating the FIFO if it went missing) and a
+running job's row every ``_CANCEL_RECHECK_SEC``; without a FIFO
+(unsupported platform) the worker falls back to polling every
+``--poll-interval``.
+Jobs are claimed by priority (``agent.link_store.JOB_PRIORITIES``:
+previews and applies before exports and drift checks before batch runs
+and embeddings), then age.
+
+**Concurrency**: ``--concurrency N`` runs N claim loops in this process,
+each with its own store connection; claims are atomic, so loops never
+share a job.  With N > 1 one loop only takes interactive jobs, so a
+preview never waits behind N batch runs.
 
 **Write discipline**: The API server only writes to ``job_queue``,
 ``review_sessions``, ``review_marks``, and ``undo_state``. All heavy writes
@@ -21,6 +38,9 @@ Usage:
 
     # Poll interval (seconds, default=2)
     python3 scripts/link_worker.py --links-db corpus_index/links.duckdb --poll-interval 1
+
+    # Three concurrent job loops
+    python3 scripts/link_worker.py --links-db corpus_index/links.duckdb --concurrency 3
 """
 from __future__ import annotations
 
@@ -30,7 +50,9 @@ import json
 import os
 import signal
 import sys
+import threading
 import time
+from collections import OrderedDict
 from pathlib import Path
 from typing import Any
 
@@ -73,6 +95,29 @@ def _preview_candidate_id(doc_id: Any, section_number: Any, clause_key: Any) ->
     )
 
 
+# Rule columns that do not affect which sections a rule matches.
+_RULE_BOOKKEEPING_KEYS = frozenset({
+    "name", "description", "version", "status", "owner",
+    "locked_by", "locked_at", "created_at", "updated_at",
+})
+
+# Total candidates kept in the per-rule-version preview scan memo (see
+# ``_scan_for_candidates``).
+_PREVIEW_SCAN_CACHE_CANDIDATES = 200_000
+
+# Idle re-read of job_queue when submitters notify the worker directly.
+_NOTIFIED_RECHECK_SEC = 30.0
+
+# Re-read of a running job's row, for cancel notifications that never arrived.
+_CANCEL_RECHECK_SEC = 5.0
+
+
+def _rule_version_key(rule: dict[str, Any]) -> str:
+    """Canonical JSON of the matching-relevant part of a rule."""
+    relevant = {k: v for k, v in rule.items() if k not in _RULE_BOOKKEEPING_KEYS}
+    return json.dumps(relevant, sort_keys=True, default=str)
+
+
 def _log(msg: str) -> None:
     """Write log message to stderr with timestamp."""
     import datetime
@@ -85,7 +130,7 @@ def _log(msg: str) -> None:
 # ---------------------------------------------------------------------------
 
 class LinkWorker:
-    """Worker subprocess that polls and processes link jobs.
+    """Worker subprocess that claims and processes link jobs.
 
     Parameters
     ----------
@@ -94,7 +139,13 @@ class LinkWorker:
     corpus_db_path:
         Optional path to corpus.duckdb (read-only). Required for preview/apply jobs.
     poll_interval:
-        Seconds between poll attempts when idle.
+        Seconds between poll attempts when idle and no notification
+        channel is available.
+    export_dir:
+        Directory export jobs write to (default: ``exports/`` next to
+        links.duckdb).
+    concurrency:
+        Number of claim loops run concurrently in this process.
     """
 
     def __init__(
@@ -102,14 +153,32 @@ class LinkWorker:
         links_db_path: Path,
         corpus_db_path: Path | None = None,
         poll_interval: float = 2.0,
+        export_dir: Path | None = None,
+        concurrency: int = 1,
     ) -> None:
         self._links_db_path = links_db_path
         self._corpus_db_path = corpus_db_path
         self._poll_interval = poll_interval
+        self._export_dir = export_dir or links_db_path.parent / "exports"
+        self._concurrency = max(1, concurrency)
         self._running = True
         self._pid = os.getpid()
         self._store: Any = None
         self._corpus: Any = None
+        self._listener: Any = None
+        # Last read of the running job's row (see ``_is_cancelled``).
+        self._cancel_checked_at = 0.0
+        # Highest job priority this loop claims (None: any).
+        self._max_priority: int | None = None
+        self._slots: list[LinkWorker] = []
+        # Version of the open corpus (None: unknown, preview scans are not cached)
+        # and the per-node preview cache shared by all claim loops.
+        self._corpus_version: str | None = None
+        self._preview_engine: Any = None
+        self._preview_scan_cache: OrderedDict[tuple[str, str], list[dict[str, Any]]] = (
+            OrderedDict()
+        )
+        self._preview_scan_cached = 0
 
     @staticmethod
     def _load_dotenv() -> None:
@@ -151,33 +220,95 @@ class LinkWorker:
         # Open corpus if provided
         if self._corpus_db_path and self._corpus_db_path.exists():
             from agent.corpus import CorpusIndex
+            from agent.preview_engine import PreviewEngine, corpus_version
             self._corpus = CorpusIndex(self._corpus_db_path)
+            self._corpus_version = corpus_version(self._corpus, self._corpus_db_path)
+            self._preview_engine = PreviewEngine()
 
         # Crash recovery: reset stale jobs
         self._recover_stale_jobs()
 
+        # Job notifications from submitters (falls back to polling)
+        from agent.job_notify import JobListener, job_notify_dir
+
+        listener = JobListener(job_notify_dir(self._links_db_path))
+        try:
+            listener.start()
+            self._listener = listener
+            _log(f"  notifications: {listener.path}")
+        except (OSError, AttributeError) as e:
+            listener.close()
+            _log(f"  notifications unavailable ({e}), polling every {self._poll_interval}s")
+
         # Install signal handlers for graceful shutdown
         signal.signal(signal.SIGTERM, self._handle_signal)
         signal.signal(signal.SIGINT, self._handle_signal)
 
+        # Extra claim loops; with several, this one keeps interactive jobs moving
+        if self._concurrency > 1:
+            from agent.link_store import JOB_PRIORITY_INTERACTIVE
+            self._max_priority = JOB_PRIORITY_INTERACTIVE
+            self._slots = [self._make_slot() for _ in range(self._concurrency - 1)]
+        threads = [
+            threading.Thread(target=slot._poll_loop, name=f"link-worker-{i}", daemon=True)
+            for i, slot in enumerate(self._slots, start=1)
+        ]
+        for thread in threads:
+            thread.start()
+
         # Main poll loop
-        _log("Worker ready, entering poll loop")
+        _log(f"Worker ready ({self._concurrency} job loop(s)), entering poll loop")
         self._poll_loop()
 
         # Shutdown
         _log("Worker shutting down")
-        self._store.close()
+        for thread in threads:
+            thread.join()
+        for slot in self._slots:
+            slot._close()
+        self._close()
+        if self._listener is not None:
+            self._listener.close()
         _log("Worker stopped")
 
+    def _make_slot(self) -> LinkWorker:
+        """A claim loop sharing this worker's config, pid, listener and preview cache."""
+        from agent.link_store import LinkStore
+
+        slot = LinkWorker(
+            self._links_db_path,
+            self._corpus_db_path,
+            poll_interval=self._poll_interval,
+            export_dir=self._export_dir,
+        )
+        slot._pid = self._pid
+        slot._listener = self._listener
+        slot._store = LinkStore(self._links_db_path)
+        if self._corpus is not None:
+            from agent.corpus import CorpusIndex
+            slot._corpus = CorpusIndex(self._corpus_db_path)
+            slot._corpus_version = self._corpus_version
+            slot._preview_engine = self._preview_engine
+        return slot
+
+    def _close(self) -> None:
+        self._store.close()
+        if self._corpus is not None:
+            self._corpus.close()
+
     def stop(self) -> None:
         """Signal the worker to stop after current job completes."""
         self._running = False
+        for slot in self._slots:
+            slot.stop()
+        if self._listener is not None:
+            self._listener.interrupt()
 
     def _handle_signal(self, signum: int, _frame: Any) -> None:
         """Handle SIGTERM/SIGINT for graceful shutdown."""
         sig_name = signal.Signals(signum).name
         _log(f"Received {sig_name}, stopping after current job...")
-        self._running = False
+        self.stop()
 
     # ─── Crash recovery ──────────────────────────────────────────
 
@@ -221,13 +352,19 @@ class LinkWorker:
     # ─── Poll loop ───────────────────────────────────────────────
 
     def _poll_loop(self) -> None:
-        """Main polling loop: claim and process jobs."""
+        """Main loop: claim and process jobs, waiting for notifications when idle."""
         idle_cycles = 0
         while self._running:
-            job = self._store.claim_job(self._pid)
+            # Read before claiming so a job submitted in between wakes us.
+            seen = self._listener.generation if self._listener is not None else 0
+            job = self._store.claim_job(self._pid, max_priority=self._max_priority)
 
             if job is None:
                 idle_cycles += 1
+                if self._listener is not None:
+                    if self._listener.wait(seen, _NOTIFIED_RECHECK_SEC) == seen:
+                        self._ensure_listener_fifo()
+                    continue
                 # Exponential backoff up to 5x poll interval
                 sleep_time = min(
                     self._poll_interval * (1 + idle_cycles * 0.2),
@@ -239,6 +376,14 @@ class LinkWorker:
             idle_cycles = 0
             self._process_job(job)
 
+    def _ensure_listener_fifo(self) -> None:
+        """Recreate the notification FIFO if it was removed from under us."""
+        try:
+            if self._listener.ensure_fifo():
+                _log(f"  Recreated missing notification FIFO {self._listener.path}")
+        except OSError as e:
+            _log(f"  Could not recreate notification FIFO ({e}); relying on re-checks")
+
     # ─── Job dispatch ────────────────────────────────────────────
 
     def _process_job(self, job: dict[str, Any]) -> None:
@@ -248,6 +393,7 @@ class LinkWorker:
         params = _json_loads(job.get("params_json", "{}"))
 
         _log(f"Processing job {job_id} (type={job_type})")
+        self._cancel_checked_at = time.monotonic()
 
         try:
             self._store.update_job_progress(job_id, 0.0, f"Starting {job_type}")
@@ -269,6 +415,10 @@ class LinkWorker:
                 self._store.fail_job(job_id, error_msg)
             _log(f"  Failed job {job_id}: {error_msg}")
 
+        finally:
+            if self._listener is not None:
+                self._listener.forget(job_id)
+
     def _get_handler(self, job_type: str) -> Any:
         """Return the handler function for a job type."""
         handlers: dict[str, Any] = {
@@ -283,7 +433,18 @@ class LinkWorker:
         return handlers.get(job_type)
 
     def _is_cancelled(self, job_id: str) -> bool:
-        """Check if a job has been cancelled."""
+        """Check if a job has been cancelled (notified, or from the job row).
+
+        With a listener the job row is only re-read every
+        ``_CANCEL_RECHECK_SEC``, in case the cancel notification was lost.
+        """
+        if self._listener is not None:
+            if self._listener.is_cancelled(job_id):
+                return True
+            now = time.monotonic()
+            if now - self._cancel_checked_at < _CANCEL_RECHECK_SEC:
+                return False
+            self._cancel_checked_at = now
         job = self._store.get_job(job_id)
         return job is not None and job.get("status") == "cancelled"
 
@@ -295,11 +456,16 @@ class LinkWorker:
         """Generate a link preview for a rule/query.
 
         Evaluates the rule against corpus sections, computes confidence,
-        and stores candidates in the preview tables.
+        and stores candidates in the preview tables.  With
+        ``base_preview_id`` (the preview of the previous rule edit) the
+        result also lists the candidates added and removed since then.
         """
+        from agent.preview_engine import candidate_delta
+
         family_id = params.get("family_id", "")
         rule_id = params.get("rule_id")
         heading_ast_raw = params.get("heading_filter_ast")
+        base_preview_id = str(params.get("base_preview_id") or "").strip()
 
         # Load rule if rule_id provided
         rule: dict[str, Any] | None = None
@@ -388,12 +554,24 @@ class LinkWorker:
 
         self._store.update_job_progress(job_id, 100.0, "Preview ready")
 
-        return {
+        result: dict[str, Any] = {
             "preview_id": preview_id,
             "candidate_count": len(candidates),
             "candidate_set_hash": candidate_set_hash,
             "by_confidence_tier": by_tier,
         }
+        if base_preview_id:
+            delta: dict[str, Any] | None = None
+            if self._store.get_preview(base_preview_id) is not None:
+                delta = {
+                    "base_preview_id": base_preview_id,
+                    **candidate_delta(
+                        self._store.get_preview_candidate_index(base_preview_id),
+                        {c["candidate_id"]: c for c in preview_candidates},
+                    ),
+                }
+            result["delta"] = delta
+        return result
 
     def _handle_apply(
         self, job_id: str, params: dict[str, Any],
@@ -836,39 +1014,90 @@ class LinkWorker:
     def _handle_check_drift(
         self, job_id: str, params: dict[str, Any],
     ) -> dict[str, Any]:
-        """Check for drift in a rule's match set."""
+        """Check one rule (``rule_id``) or every published rule for drift.
+
+        Link statistics for all rules are computed in SQL in one grouped
+        scan and compared with each rule's latest ``rule_baselines`` row;
+        results land in ``drift_checks`` / ``drift_alerts``
+        (see ``agent.drift_engine``).  Rules without a baseline are only
+        seeded from their current profile with ``promote_missing``.  A
+        single-rule check also compares the link count with a legacy
+        ``drift_baselines`` row if one exists.
+        """
+        from agent.drift_engine import run_drift_checks
+
         rule_id = params.get("rule_id", "")
+        promote_missing = bool(params.get("promote_missing", False))
 
         self._store.update_job_progress(job_id, 10.0, "Checking drift")
 
-        # Get current matches
-        rule = self._store.get_rule(rule_id)
-        if rule is None:
-            return {"error": f"Rule not found: {rule_id}"}
+        if rule_id:
+            rule = self._store.get_rule(rule_id)
+            if rule is None:
+                return {"error": f"Rule not found: {rule_id}"}
+            rules = [rule]
+        else:
+            rules = self._store.get_rules(status="published")
+
+        doc_templates: dict[str, str] | None = None
+        if self._corpus is not None:
+            rows = self._corpus.query(
+                "SELECT doc_id, COALESCE(NULLIF(TRIM(template_family), ''), 'unknown') "
+                "FROM documents WHERE cohort_included = true",
+            )
+            doc_templates = {str(doc_id): str(template) for doc_id, template in rows}
 
-        # Count current links for this rule
-        links = self._store.get_links(limit=100000)
-        rule_links = [lnk for lnk in links if lnk.get("rule_id") == rule_id]
+        self._store.update_job_progress(job_id, 30.0, "Computing statistics")
+
+        def on_progress(done: int, total: int) -> None:
+            self._store.update_job_progress(
+                job_id, 30.0 + 65.0 * done / max(total, 1),
+                f"Checked {done}/{total} rules",
+            )
 
-        self._store.update_job_progress(job_id, 50.0, "Computing statistics")
+        checks = run_drift_checks(
+            self._store, rules,
+            doc_templates=doc_templates,
+            promote_missing=promote_missing,
+            progress=on_progress,
+        )
 
-        # Simple drift detection: compare current count to expected
-        current_count = len(rule_links)
+        if not rule_id:
+            self._store.update_job_progress(job_id, 100.0, "Drift check complete")
+            return {
+                "rules_checked": len(checks),
+                "drift_detected_count": sum(1 for c in checks if c["drift_detected"]),
+                "baselines_created": sum(
+                    1 for c in checks if c["status"] == "baseline_created"
+                ),
+                "checks": checks,
+            }
 
+        check = checks[0]
         result: dict[str, Any] = {
-            "rule_id": rule_id,
-            "family_id": rule.get("family_id", ""),
-            "current_link_count": current_count,
-            "drift_detected": False,
-            "details": {},
+            **check,
+            "details": {
+                key: check[key]
+                for key in (
+                    "chi2_statistic", "p_value", "max_cell_delta",
+                    "heading_churn", "cells_affected", "message",
+                )
+                if key in check
+            },
         }
-
-        # If there's a drift baseline, compare
-        baselines = self._store._conn.execute(
-            "SELECT * FROM drift_baselines WHERE rule_id = ? "
-            "ORDER BY created_at DESC LIMIT 1",
-            [rule_id],
-        ).fetchone()
+        current_count = int(check["current_link_count"])
+
+        # Legacy count baseline, compared when that table is present
+        if self._store._conn.execute(
+            "SELECT COUNT(*) FROM duckdb_tables() WHERE table_name = 'drift_baselines'",
+        ).fetchone()[0]:
+            baselines = self._store._conn.execute(
+                "SELECT * FROM drift_baselines WHERE rule_id = ? "
+                "ORDER BY created_at DESC LIMIT 1",
+                [rule_id],
+            ).fetchone()
+        else:
+            baselines = None
 
         if baselines:
             cols = [d[0] for d in self._store._conn.description]
@@ -878,11 +1107,11 @@ class LinkWorker:
                 drift_pct = abs(current_count - expected) / expected
                 if drift_pct > 0.1:  # >10% drift
                     result["drift_detected"] = True
-                    result["details"] = {
+                    result["details"].update({
                         "expected_count": expected,
                         "actual_count": current_count,
                         "drift_pct": round(drift_pct * 100, 2),
-                    }
+                    })
 
         self._store.update_job_progress(job_id, 100.0, "Drift check complete")
         return result
@@ -890,54 +1119,52 @@ class LinkWorker:
     def _handle_export(
         self, job_id: str, params: dict[str, Any],
     ) -> dict[str, Any]:
-        """Export links data as CSV/JSONL."""
-        export_format = params.get("format", "csv")
+        """Export links to a CSV/JSONL/Parquet file in the export directory.
+
+        Rows are streamed by the store (``LinkStore.export_links``), never
+        held in memory; ``include_evidence`` / ``include_defined_terms`` add
+        per-link evidence spans and defined terms.  The file is served by
+        ``GET /api/links/export/{job_id}``.
+        """
+        from agent.link_store import EXPORT_FORMATS
+
+        export_format = str(params.get("format") or "csv").strip().lower()
+        if export_format == "json":
+            export_format = "jsonl"
+        if export_format not in EXPORT_FORMATS:
+            return {"error": f"Unsupported export format: {export_format}"}
         family_id = params.get("family_id")
         resolved_scope = self._store.get_canonical_scope_id(family_id) if family_id else None
         status = params.get("status")
 
-        self._store.update_job_progress(job_id, 10.0, "Fetching links")
+        self._store.update_job_progress(job_id, 10.0, "Exporting links")
 
-        links = self._store.get_links(
+        def report(written: int, total: int) -> None:
+            pct = 10.0 + 85.0 * (written / total if total else 1.0)
+            self._store.update_job_progress(
+                job_id, pct, f"Exported {written}/{total} links as {export_format}",
+            )
+
+        path = self._export_dir / f"links_{job_id}.{export_format}"
+        row_count = self._store.export_links(
+            path,
+            export_format=export_format,
             family_id=resolved_scope or family_id,
             status=status,
-            limit=1000000,
+            include_evidence=bool(params.get("include_evidence")),
+            include_defined_terms=bool(params.get("include_defined_terms")),
+            progress=report,
         )
-
-        self._store.update_job_progress(
-            job_id, 50.0, f"Exporting {len(links)} links as {export_format}",
-        )
-
-        if export_format == "csv":
-            import csv
-            import io
-            output = io.StringIO()
-            if links:
-                writer = csv.DictWriter(
-                    output,
-                    fieldnames=[
-                        "link_id", "family_id", "doc_id", "section_number",
-                        "heading", "confidence", "confidence_tier", "status",
-                    ],
-                )
-                writer.writeheader()
-                for lnk in links:
-                    writer.writerow({
-                        k: lnk.get(k, "") for k in writer.fieldnames  # type: ignore[union-attr]
-                    })
-            export_data = output.getvalue()
-        else:
-            rows = []
-            for lnk in links:
-                rows.append(_json_dumps(lnk))
-            export_data = "\n".join(rows)
+        size = path.stat().st_size
 
         self._store.update_job_progress(job_id, 100.0, "Export complete")
 
         return {
             "format": export_format,
-            "row_count": len(links),
-            "data_length": len(export_data),
+            "row_count": row_count,
+            "file_name": path.name,
+            "path": str(path),
+            "data_length": size,
         }
 
     # ─── Internal helpers ────────────────────────────────────────
@@ -949,7 +1176,14 @@ class LinkWorker:
         heading_ast_raw: dict[str, Any],
         rule: dict[str, Any] | None,
     ) -> list[dict[str, Any]]:
-        """Scan corpus sections matching a heading AST."""
+        """Scan corpus sections matching a heading AST.
+
+        Results are memoized per corpus version and rule version (the rule
+        minus bookkeeping columns), so re-previewing a rule whose edit did
+        not change what it matches skips the scan.  Other edits still reuse
+        the section sets of unchanged DSL terms from the shared
+        ``PreviewEngine``.
+        """
         from scripts.bulk_family_linker import scan_corpus_for_family
 
         if self._corpus is None:
@@ -960,12 +1194,28 @@ class LinkWorker:
         scan_rule.setdefault("family_id", family_id)
         scan_rule.setdefault("heading_filter_ast", heading_ast_raw)
 
-        candidates = scan_corpus_for_family(
-            self._corpus,
-            scan_rule,
-        )
+        if self._corpus_version is None:
+            return scan_corpus_for_family(self._corpus, scan_rule)
+
+        cache_key = (self._corpus_version, _rule_version_key(scan_rule))
+        cached = self._preview_scan_cache.get(cache_key)
+        if cached is None:
+            cached = scan_corpus_for_family(
+                self._corpus,
+                scan_rule,
+                preview_engine=self._preview_engine,
+                corpus_version=self._corpus_version,
+            )
+            if len(cached) <= _PREVIEW_SCAN_CACHE_CANDIDATES:
+                self._preview_scan_cache[cache_key] = cached
+                self._preview_scan_cached += len(cached)
+                while self._preview_scan_cached > _PREVIEW_SCAN_CACHE_CANDIDATES:
+                    _, evicted = self._preview_scan_cache.popitem(last=False)
+                    self._preview_scan_cached -= len(evicted)
+        else:
+            self._preview_scan_cache.move_to_end(cache_key)
 
-        return candidates
+        return [dict(c) for c in cached]
 
 
 # ---------------------------------------------------------------------------
@@ -988,7 +1238,7 @@ def _is_pid_alive(pid: int) -> bool:
 def build_parser() -> argparse.ArgumentParser:
     """Build the argument parser."""
     parser = argparse.ArgumentParser(
-        description="Link worker subprocess: polls job_queue and processes jobs",
+        description="Link worker subprocess: claims job_queue jobs and processes them",
         formatter_class=argparse.RawDescriptionHelpFormatter,
     )
     parser.add_argument(
@@ -1003,6 +1253,14 @@ def build_parser() -> argparse.ArgumentParser:
         "--poll-interval", type=float, default=2.0,
         help="Seconds between poll attempts (default: 2.0)",
     )
+    parser.add_argument(
+        "--export-dir", default=None,
+        help="Directory for export job files (default: exports/ next to --links-db)",
+    )
+    parser.add_argument(
+        "--concurrency", type=int, default=1,
+        help="Jobs processed concurrently (default: 1)",
+    )
     return parser
 
 
@@ -1030,6 +1288,8 @@ def main(argv: list[str] | None = None) -> int:
         links_db_path=links_db_path,
         corpus_db_path=corpus_db_path,
         poll_interval=args.poll_interval,
+        export_dir=Path(args.export_dir) if args.export_dir else None,
+        concurrency=args.concurrency,
     )
 
     worker.start()
@@ -15,9 +15,11 @@ import re
 import statistics
 import sys
 from collections import Counter
+from collections.abc import Sequence
+from dataclasses import fields
 from datetime import UTC, datetime
 from pathlib import Path
-from typing import Any
+from typing import Any, NamedTuple
 from uuid import uuid4
 
 try:
@@ -33,7 +35,7 @@ except ImportError:
         print()
 
 
-from agent.corpus import CorpusIndex, load_candidate_doc_ids
+from agent.corpus import CorpusIndex, DocBundle, load_candidate_doc_ids
 from agent.confidence import (
     resolve_components as resolve_confidence_components,
     weighted_confidence_score as weighted_confidence_score_runtime,
@@ -51,8 +53,14 @@ from agent.scope_parity import (
     passes_operator_requirements as passes_operator_requirements_runtime,
 )
 from agent.structural_fingerprint import build_section_fingerprint
-from agent.strategy import Strategy, load_strategy_with_views
-from agent.textmatch import heading_matches, keyword_density, section_dna_density, score_in_range
+from agent.strategy import (
+    Strategy,
+    load_strategy_with_views,
+    strategy_from_dict,
+    strategy_to_dict,
+)
+from agent.strategy_matcher import strategy_matcher
+from agent.textmatch import heading_matches, score_in_range
 
 
 # ---------------------------------------------------------------------------
@@ -525,16 +533,18 @@ def score_section(
         "negative_dna_hit": False,
     }
 
+    signals = strategy_matcher(strategy).signals(heading, text_lower, negatives=True)
+
     # Heading match
-    heading_pat = heading_matches(heading, list(strategy.heading_patterns))
+    heading_pat = signals.heading_pattern
     if heading_pat is not None:
         best_score = HEADING_SCORE
         method = "heading"
         signal_details["heading_hit"] = True
 
     # Keyword density
-    kw_density, kw_hits = keyword_density(text_lower, list(strategy.keyword_anchors))
-    kw_hit_count = len(kw_hits)
+    kw_density = signals.keyword_density
+    kw_hit_count = len(signals.keyword_hits)
     kw_score = score_in_range(KEYWORD_MIN, KEYWORD_MAX, kw_density)
     if kw_density > 0:
         signal_details["keyword_hit"] = True
@@ -544,9 +554,7 @@ def score_section(
             method = "keyword"
 
     # DNA density
-    dna_density, _ = section_dna_density(
-        text_lower, list(strategy.dna_tier1), list(strategy.dna_tier2)
-    )
+    dna_density = signals.dna_density
     dna_score = score_in_range(DNA_MIN, DNA_MAX, dna_density)
     if dna_density > 0:
         signal_details["dna_hit"] = True
@@ -573,16 +581,8 @@ def score_section(
     )
     signal_details["active_channels"] = active_channels
     signal_details["signal_channel_count"] = len(active_channels)
-    signal_details["negative_keyword_hits"] = _pattern_hits(
-        text_lower,
-        strategy.negative_keyword_patterns,
-    )
-    negative_dna_density, _ = section_dna_density(
-        text_lower,
-        list(strategy.dna_negative_tier1),
-        list(strategy.dna_negative_tier2),
-    )
-    signal_details["negative_dna_hit"] = negative_dna_density > 0
+    signal_details["negative_keyword_hits"] = signals.negative_keyword_hits
+    signal_details["negative_dna_hit"] = signals.negative_dna_density > 0
 
     return best_score, method, kw_hit_count, signal_details
 
@@ -1138,6 +1138,732 @@ def compute_log_odds_discriminators(
     return results[:top_n]
 
 
+# ---------------------------------------------------------------------------
+# Library API
+# ---------------------------------------------------------------------------
+
+BASELINE_SCHEMA_VERSION = "pattern_tester_baseline_v1"
+# Phrase channels compiled by ``strategy_matcher``.  Editing one of them can
+# only move docs whose text contains an added or removed phrase.
+_TEXT_VOCABULARY_FIELDS = (
+    "keyword_anchors",
+    "dna_tier1",
+    "dna_tier2",
+    "dna_negative_tier1",
+    "dna_negative_tier2",
+)
+# Fields no per-doc outcome reads: identity, provenance, validation metrics
+# and the policies that are only applied to the run summary.
+_OUTCOME_NEUTRAL_FIELDS = frozenset({
+    "concept_id",
+    "concept_name",
+    "family",
+    "profile_type",
+    "inherits_from",
+    "concept_notes",
+    "fallback_escalation",
+    "xref_follow",
+    "outlier_policy",
+    "template_stability_policy",
+    "did_not_find_policy",
+    "heading_hit_rate",
+    "keyword_precision",
+    "corpus_prevalence",
+    "cohort_coverage",
+    "dna_phrase_count",
+    "dropped_headings",
+    "false_positive_keywords",
+    "validation_status",
+    "version",
+    "last_updated",
+    "update_notes",
+})
+
+
+class ScoringSettings(NamedTuple):
+    """Run options that change per-doc outcomes (CLI flags)."""
+
+    hit_threshold: float = HIT_THRESHOLD
+    strict_keyword_gate: bool = True
+    min_keyword_hits: int = 3
+    cohort_only: bool = True
+
+
+class DocOutcome(NamedTuple):
+    """One document's best-section result under a strategy."""
+
+    doc_id: str
+    template_family: str
+    accepted: bool
+    record: dict[str, Any]           # HIT / NOT_FOUND record
+    headings: tuple[str, ...] = ()   # every section heading (log-odds input)
+    score: float = 0.0
+    confidence: float = 0.0
+    section_position: int = 0
+    has_sections: bool = False
+    has_features: bool = False
+
+
+class PatternTestResult(NamedTuple):
+    """``evaluate_strategy`` output: the CLI's JSON summary plus per-doc outcomes."""
+
+    strategy: Strategy
+    settings: ScoringSettings
+    summary: dict[str, Any]
+    outcomes: dict[str, DocOutcome]
+    hits: list[dict[str, Any]]
+    misses: list[dict[str, Any]]
+    rescored_doc_ids: list[str]
+
+
+def _new_run_id() -> str:
+    return f"pattern_tester_{datetime.now(UTC).strftime('%Y%m%dT%H%M%SZ')}_{uuid4().hex[:8]}"
+
+
+def score_document(
+    bundle: DocBundle,
+    strategy: Strategy,
+    *,
+    run_id: str,
+    settings: ScoringSettings,
+) -> DocOutcome:
+    """Pick *bundle*'s best section under *strategy* and apply the acceptance gates."""
+    doc_id = bundle.doc_id
+    doc_rec = bundle.doc
+    sections = bundle.sections
+    template = doc_rec.template_family if doc_rec else "unknown"
+    if not sections:
+        # No sections found -- count as miss
+        return DocOutcome(
+            doc_id=doc_id,
+            template_family=template,
+            accepted=False,
+            record={"doc_id": doc_id, "best_score": 0.0},
+        )
+    section_features_by_number = bundle.section_features
+
+    best_score = 0.0
+    best_section = ""
+    best_heading = ""
+    best_method = "none"
+    best_position = 0
+    best_text_lower = ""
+    best_kw_hit_count = 0
+    best_article_num = 0
+    best_section_word_count = 0
+    best_char_start = None
+    best_char_end = None
+    best_signal_details: dict[str, Any] = {
+        "active_channels": (),
+        "signal_channel_count": 0,
+        "negative_keyword_hits": 0,
+        "negative_dna_hit": False,
+    }
+    second_best_score = 0.0
+
+    for idx, sec in enumerate(sections):
+        text = bundle.section_texts.get(sec.section_number)
+        text_lower = text.lower() if text else ""
+        score, method, kw_hit_count, signal_details = score_section(
+            sec.heading,
+            text_lower,
+            strategy,
+        )
+        if score > best_score:
+            second_best_score = best_score
+            best_score = score
+            best_section = sec.section_number
+            best_heading = sec.heading
+            best_method = method
+            best_position = idx
+            best_text_lower = text_lower
+            best_kw_hit_count = kw_hit_count
+            best_article_num = sec.article_num
+            best_section_word_count = _to_int(sec.word_count, default=0)
+            best_char_start = _to_int(sec.char_start, default=0)
+            best_char_end = _to_int(sec.char_end, default=0)
+            best_signal_details = signal_details
+        elif score > second_best_score:
+            second_best_score = score
+
+    best_feature = section_features_by_number.get(best_section)
+    detected_functional_areas = _infer_functional_areas(best_heading, best_text_lower)
+    if best_feature and best_feature.definition_types:
+        detected_definition_types = set(best_feature.definition_types)
+    else:
+        detected_definition_types = _infer_definition_types(best_text_lower)
+    definition_dependency_overlap = _definition_dependency_overlap(
+        best_text_lower,
+        strategy.defined_term_dependencies,
+    )
+    if best_feature:
+        scope_parity = {
+            "label": best_feature.scope_label,
+            "permit_count": best_feature.scope_permit_count,
+            "restrict_count": best_feature.scope_restrict_count,
+            "operator_count": best_feature.scope_operator_count,
+            "estimated_depth": best_feature.scope_estimated_depth,
+        }
+        preemption_features = {
+            "override_count": best_feature.preemption_override_count,
+            "yield_count": best_feature.preemption_yield_count,
+            "estimated_depth": best_feature.preemption_estimated_depth,
+            "has_preemption": best_feature.preemption_has,
+            "edge_count": best_feature.preemption_edge_count,
+        }
+    else:
+        scope_parity = _compute_scope_parity(best_text_lower)
+        preemption_features = _compute_preemption_features(best_text_lower)
+    structural_fingerprint_tokens = set(
+        build_section_fingerprint(
+            template_family=template,
+            article_num=best_article_num,
+            section_number=best_section,
+            heading=best_heading,
+            text=best_text_lower,
+        ).tokens
+    )
+    confidence_components = _resolve_confidence_components(
+        score=best_score,
+        score_margin=max(0.0, best_score - second_best_score),
+        active_channels=tuple(best_signal_details.get("active_channels", ())),
+        signal_details=best_signal_details,
+        keyword_hit_count=best_kw_hit_count,
+    )
+    confidence_final = _weighted_confidence_score(
+        confidence_components,
+        strategy.confidence_policy if isinstance(strategy.confidence_policy, dict) else {},
+    )
+
+    accepted = should_accept_hit(
+        score=best_score,
+        score_margin=max(0.0, best_score - second_best_score),
+        method=best_method,
+        heading=best_heading,
+        text_lower=best_text_lower,
+        section_number=best_section,
+        article_num=best_article_num,
+        template_family=template,
+        section_word_count=best_section_word_count,
+        keyword_hit_count=best_kw_hit_count,
+        active_channels=tuple(best_signal_details.get("active_channels", ())),
+        signal_details=best_signal_details,
+        detected_functional_areas=detected_functional_areas,
+        detected_definition_types=detected_definition_types,
+        definition_dependency_overlap=definition_dependency_overlap,
+        scope_parity=scope_parity,
+        preemption_features=preemption_features,
+        structural_fingerprint_tokens=structural_fingerprint_tokens,
+        strategy=strategy,
+        strict_keyword_gate=settings.strict_keyword_gate,
+        hit_threshold=settings.hit_threshold,
+        min_keyword_hits=settings.min_keyword_hits,
+    )
+
+    if accepted:
+        record: dict[str, Any] = {
+            "record_type": "HIT",
+            "run_id": run_id,
+            "ontology_node_id": strategy.concept_id,
+            "strategy_version": strategy.version,
+            "doc_id": doc_id,
+            "section": best_section,
+            "section_number": best_section,
+            "heading": best_heading,
+            "char_start": best_char_start,
+            "char_end": best_char_end,
+            "score": round(best_score, 4),
+            "score_margin": round(max(0.0, best_score - second_best_score), 4),
+            "match_method": best_method,
+            "match_type": best_method,
+            "keyword_hit_count": best_kw_hit_count,
+            "article_num": best_article_num,
+            "template_family": template,
+            "section_word_count": best_section_word_count,
+            "signal_channels": _to_int(best_signal_details.get("signal_channel_count"), default=0),
+            "active_channels": list(best_signal_details.get("active_channels", ())),
+            "negative_keyword_hits": _to_int(
+                best_signal_details.get("negative_keyword_hits"),
+                default=0,
+            ),
+            "negative_dna_hit": bool(best_signal_details.get("negative_dna_hit")),
+            "functional_areas": sorted(detected_functional_areas),
+            "definition_types": sorted(detected_definition_types),
+            "definition_dependency_overlap": round(definition_dependency_overlap, 4),
+            "scope_parity": scope_parity,
+            "preemption": preemption_features,
+            "structural_fingerprint_tokens": sorted(structural_fingerprint_tokens),
+            "confidence_components": {
+                k: round(v, 4) for k, v in confidence_components.items()
+            },
+            "confidence_final": round(confidence_final, 4),
+            "section_rank": best_position + 1,
+            "section_count": len(sections),
+        }
+    else:
+        record = {
+            "record_type": "NOT_FOUND",
+            "run_id": run_id,
+            "ontology_node_id": strategy.concept_id,
+            "strategy_version": strategy.version,
+            "doc_id": doc_id,
+            "best_score": round(best_score, 4),
+            "best_section": best_section,
+            "section_number": best_section,
+            "best_heading": best_heading,
+            "best_method": best_method,
+            "keyword_hit_count": best_kw_hit_count,
+            "template_family": template,
+            "functional_areas": sorted(detected_functional_areas),
+            "definition_types": sorted(detected_definition_types),
+            "definition_dependency_overlap": round(definition_dependency_overlap, 4),
+            "scope_parity": scope_parity,
+            "preemption": preemption_features,
+            "structural_fingerprint_tokens": sorted(structural_fingerprint_tokens),
+            "confidence_components": {
+                k: round(v, 4) for k, v in confidence_components.items()
+            },
+            "confidence_final": round(confidence_final, 4),
+            "not_found_reason": "no_section_match_above_threshold",
+        }
+    return DocOutcome(
+        doc_id=doc_id,
+        template_family=template,
+        accepted=accepted,
+        record=record,
+        headings=tuple(sec.heading for sec in sections),
+        score=best_score,
+        confidence=confidence_final,
+        section_position=best_position,
+        has_sections=True,
+        has_features=bool(section_features_by_number),
+    )
+
+
+def docs_affected_by_change(
+    corpus: CorpusIndex,
+    old: Strategy,
+    new: Strategy,
+    doc_ids: Sequence[str],
+) -> set[str] | None:
+    """Docs among *doc_ids* whose outcome could differ between *old* and *new*.
+
+    Returns None when the diff can move any doc (a gate / acceptance field
+    or the negative keyword regexes changed).  Otherwise only vocabulary
+    changed, and a doc can move only if one of its headings contains an
+    added/removed heading pattern or its text contains an added/removed
+    phrase -- or any keyword anchor when the anchor count (the keyword
+    density denominator) changed.  Matching is the case-insensitive
+    substring test ``PhraseMatcher`` uses, run in SQL.
+    """
+    for strategy_field in fields(Strategy):
+        name = strategy_field.name
+        if name in _OUTCOME_NEUTRAL_FIELDS or name in _TEXT_VOCABULARY_FIELDS:
+            continue
+        if name == "heading_patterns":
+            continue
+        if getattr(old, name) != getattr(new, name):
+            return None
+
+    heading_phrases = (
+        {p.lower() for p in old.heading_patterns} ^ {p.lower() for p in new.heading_patterns}
+    )
+    text_phrases: set[str] = set()
+    for name in _TEXT_VOCABULARY_FIELDS:
+        before = Counter(p.lower() for p in getattr(old, name))
+        after = Counter(p.lower() for p in getattr(new, name))
+        if before == after:
+            continue
+        if name == "keyword_anchors" and before.total() != after.total():
+            text_phrases.update(before.keys() | after.keys())
+        else:
+            text_phrases.update((before - after).keys() | (after - before).keys())
+    if not doc_ids or not (heading_phrases or text_phrases):
+        return set()
+
+    from agent.query_filters import escape_like
+
+    doc_list = list(dict.fromkeys(doc_ids))
+    queries: list[str] = []
+    params: list[Any] = []
+    if heading_phrases:
+        conditions = [
+            "lower(heading) LIKE ? ESCAPE '\\' "
+            "OR replace(lower(heading), ' ', '') LIKE ? ESCAPE '\\'"
+            for _ in heading_phrases
+        ]
+        queries.append(
+            "SELECT doc_id FROM sections "
+            f"WHERE doc_id IN (SELECT UNNEST(?::VARCHAR[])) AND ({' OR '.join(conditions)})"
+        )
+        params.append(doc_list)
+        for phrase in sorted(heading_phrases):
+            params.extend([
+                f"%{escape_like(phrase)}%",
+                f"%{escape_like(phrase.replace(' ', ''))}%",
+            ])
+    if text_phrases:
+        conditions = ["lower(text) LIKE ? ESCAPE '\\'" for _ in text_phrases]
+        queries.append(
+            "SELECT doc_id FROM section_text "
+            f"WHERE doc_id IN (SELECT UNNEST(?::VARCHAR[])) AND ({' OR '.join(conditions)})"
+        )
+        params.append(doc_list)
+        params.extend(f"%{escape_like(phrase)}%" for phrase in sorted(text_phrases))
+    rows = corpus.query(" UNION ".join(queries), params)
+    return {str(row[0]) for row in rows}
+
+
+def _stamped(record: dict[str, Any], *, run_id: str, strategy: Strategy) -> dict[str, Any]:
+    """Copy of *record* carrying this run's provenance (reused outcomes keep older stamps)."""
+    if "record_type" not in record:
+        return dict(record)
+    return {
+        **record,
+        "run_id": run_id,
+        "ontology_node_id": strategy.concept_id,
+        "strategy_version": strategy.version,
+    }
+
+
+def evaluate_strategy(
+    corpus: CorpusIndex,
+    strategy: Strategy,
+    doc_ids: Sequence[str],
+    *,
+    raw_strategy: dict[str, Any] | None = None,
+    settings: ScoringSettings | None = None,
+    run_id: str | None = None,
+    source_doc_count: int | None = None,
+    candidate_input_count: int = 0,
+    baseline: PatternTestResult | None = None,
+) -> PatternTestResult:
+    """Score *doc_ids* against *strategy* and build the ``pattern_tester_v2`` summary.
+
+    With *baseline* (an earlier result on the same corpus, e.g. the previous
+    strategy version), outcomes of docs ``docs_affected_by_change`` rules
+    out are reused and only the rest are rescored.  The summary then gets
+    an ``incremental`` block with the reuse counts.
+    """
+    settings = settings or ScoringSettings()
+    run_id = run_id or _new_run_id()
+    doc_ids = list(doc_ids)
+
+    reusable: dict[str, DocOutcome] = {}
+    full_rescore = True
+    if baseline is not None and baseline.settings == settings:
+        known = [doc_id for doc_id in dict.fromkeys(doc_ids) if doc_id in baseline.outcomes]
+        affected = docs_affected_by_change(corpus, baseline.strategy, strategy, known)
+        if affected is not None:
+            full_rescore = False
+            reusable = {
+                doc_id: baseline.outcomes[doc_id] for doc_id in known if doc_id not in affected
+            }
+
+    rescore = [doc_id for doc_id in dict.fromkeys(doc_ids) if doc_id not in reusable]
+    scored: dict[str, DocOutcome] = {}
+    bundles = corpus.iter_doc_bundles(rescore, cohort_only=settings.cohort_only)
+    for i, bundle in enumerate(bundles):
+        if (i + 1) % 100 == 0:
+            print(f"  Progress: {i + 1}/{len(rescore)}", file=sys.stderr)
+        scored[bundle.doc_id] = score_document(
+            bundle, strategy, run_id=run_id, settings=settings,
+        )
+    ordered = [scored.get(doc_id) or reusable[doc_id] for doc_id in doc_ids]
+
+    summary, hits, misses = _summarize_outcomes(
+        ordered,
+        strategy=strategy,
+        raw_strategy=raw_strategy,
+        settings=settings,
+        run_id=run_id,
+        source_doc_count=len(doc_ids) if source_doc_count is None else source_doc_count,
+        candidate_input_count=candidate_input_count,
+        section_features_present=corpus.has_table("section_features"),
+    )
+    if baseline is not None:
+        summary["incremental"] = {
+            "baseline_strategy_version": baseline.strategy.version,
+            "full_rescore": full_rescore,
+            "rescored_docs": len(rescore),
+            "reused_docs": len(reusable),
+        }
+    return PatternTestResult(
+        strategy=strategy,
+        settings=settings,
+        summary=summary,
+        outcomes={outcome.doc_id: outcome for outcome in ordered},
+        hits=hits,
+        misses=misses,
+        rescored_doc_ids=rescore,
+    )
+
+
+def _summarize_outcomes(
+    outcomes: list[DocOutcome],
+    *,
+    strategy: Strategy,
+    raw_strategy: dict[str, Any] | None,
+    settings: ScoringSettings,
+    run_id: str,
+    source_doc_count: int,
+    candidate_input_count: int,
+    section_features_present: bool,
+) -> tuple[dict[str, Any], list[dict[str, Any]], list[dict[str, Any]]]:
+    hits: list[dict[str, Any]] = []
+    misses: list[dict[str, Any]] = []
+    all_scores: list[float] = []
+    all_confidence_scores: list[float] = []
+    heading_hit_count = 0
+    section_positions: list[float] = []
+    docs_with_sections = 0
+    docs_with_materialized_features = 0
+
+    # For miss analysis
+    miss_headings: Counter[str] = Counter()
+    hit_headings: Counter[str] = Counter()
+    miss_templates: Counter[str] = Counter()
+    miss_articles: Counter[str] = Counter()
+    nearest_misses: list[dict[str, Any]] = []
+
+    for outcome in outcomes:
+        record = _stamped(outcome.record, run_id=run_id, strategy=strategy)
+        if not outcome.has_sections:
+            misses.append(record)
+            miss_templates[outcome.template_family] += 1
+            continue
+        docs_with_sections += 1
+        if outcome.has_features:
+            docs_with_materialized_features += 1
+
+        if outcome.accepted:
+            all_scores.append(outcome.score)
+            all_confidence_scores.append(outcome.confidence)
+            if record["match_method"] in ("heading", "composite"):
+                heading_hit_count += 1
+            section_positions.append(outcome.section_position)
+            hits.append(record)
+            # Collect hit headings for log-odds
+            hit_headings.update(outcome.headings)
+            continue
+
+        misses.append(record)
+        miss_templates[outcome.template_family] += 1
+        # Collect miss headings for log-odds
+        miss_headings.update(outcome.headings)
+
+        # Structural deviation: which article had the best score
+        best_section = record["best_section"]
+        if best_section:
+            # Extract article from section_number (e.g. "7.01" -> "article_7")
+            article_part = best_section.split(".")[0] if "." in best_section else best_section
+            try:
+                article_key = f"article_{int(article_part)}"
+            except ValueError:
+                article_key = "no_article"
+        else:
+            article_key = "no_article"
+        miss_articles[article_key] += 1
+
+        # Track nearest misses
+        nearest_misses.append({
+            key: record[key]
+            for key in (
+                "doc_id",
+                "best_score",
+                "best_section",
+                "best_heading",
+                "best_method",
+                "keyword_hit_count",
+            )
+        })
+
+    # Compute summary statistics
+    total = len(outcomes)
+    n_hits = len(hits)
+    n_misses = len(misses)
+    hit_rate = round(n_hits / total, 4) if total > 0 else 0.0
+
+    # Hit summary
+    avg_score = round(sum(all_scores) / len(all_scores), 4) if all_scores else 0.0
+    heading_hr = round(heading_hit_count / n_hits, 4) if n_hits > 0 else 0.0
+    avg_pos = round(sum(section_positions) / len(section_positions), 2) if section_positions else 0.0
+
+    # Confidence distribution
+    conf_high = sum(1 for s in all_confidence_scores if s >= 0.7)
+    conf_medium = sum(1 for s in all_confidence_scores if 0.4 <= s < 0.7)
+    conf_low = sum(1 for s in all_confidence_scores if s < 0.4)
+
+    # Miss analysis: top headings
+    top_miss_headings = [
+        {"heading": h, "count": c}
+        for h, c in miss_headings.most_common(20)
+    ]
+
+    # Log-odds discriminators
+    log_odds = compute_log_odds_discriminators(
+        miss_headings, hit_headings, n_misses, n_hits
+    )
+
+    # Structural deviation
+    structural_dev = dict(miss_articles.most_common(20))
+
+    # Nearest misses (top 10)
+    nearest_misses.sort(key=lambda x: x["best_score"], reverse=True)
+    nearest_misses = nearest_misses[:10]
+
+    # Template breakdown
+    by_template = dict(miss_templates.most_common(20))
+    outlier_summary = _compute_outliers(hits, strategy=strategy)
+    did_not_find_summary = _evaluate_did_not_find_policy(
+        policy=strategy.did_not_find_policy if isinstance(strategy.did_not_find_policy, dict) else {},
+        total_docs=total,
+        docs_with_sections=docs_with_sections,
+        misses=misses,
+        hit_threshold=settings.hit_threshold,
+    )
+
+    summary: dict[str, Any] = {
+        "schema_version": "pattern_tester_v2",
+        "run_id": run_id,
+        "ontology_node_id": strategy.concept_id,
+        "strategy": strategy.concept_id,
+        "strategy_version": strategy.version,
+        "config": {
+            "hit_threshold": settings.hit_threshold,
+            "strict_keyword_gate": settings.strict_keyword_gate,
+            "min_keyword_hits": settings.min_keyword_hits,
+            "acceptance_policy_version": strategy.acceptance_policy_version,
+            "min_score_by_method": strategy.min_score_by_method,
+            "min_score_margin": strategy.min_score_margin,
+            "min_signal_channels": strategy.min_signal_channels,
+            "channel_requirements": strategy.channel_requirements,
+            "section_shape_bounds": strategy.section_shape_bounds,
+            "heading_quality_policy": strategy.heading_quality_policy,
+            "outlier_policy": strategy.outlier_policy,
+            "canonical_heading_labels": list(strategy.canonical_heading_labels),
+            "functional_area_hints": list(strategy.functional_area_hints),
+            "definition_type_allowlist": list(strategy.definition_type_allowlist),
+            "definition_type_blocklist": list(strategy.definition_type_blocklist),
+            "min_definition_dependency_overlap": strategy.min_definition_dependency_overlap,
+            "scope_parity_allow": list(strategy.scope_parity_allow),
+            "scope_parity_block": list(strategy.scope_parity_block),
+            "boolean_operator_requirements": strategy.boolean_operator_requirements,
+            "preemption_requirements": strategy.preemption_requirements,
+            "max_preemption_depth": strategy.max_preemption_depth,
+            "template_module_constraints": strategy.template_module_constraints,
+            "structural_fingerprint_allowlist": list(strategy.structural_fingerprint_allowlist),
+            "structural_fingerprint_blocklist": list(strategy.structural_fingerprint_blocklist),
+            "confidence_policy": strategy.confidence_policy,
+            "confidence_components_min": strategy.confidence_components_min,
+            "did_not_find_policy": strategy.did_not_find_policy,
+            "profile_type": strategy.profile_type,
+            "inherits_from": strategy.inherits_from,
+            "inheritance_active": bool(
+                isinstance(raw_strategy, dict)
+                and isinstance(raw_strategy.get("inherits_from"), str)
+                and raw_strategy.get("inherits_from", "").strip()
+            ),
+        },
+        "total_docs": total,
+        "docs_with_sections": docs_with_sections,
+        "hits": n_hits,
+        "misses": n_misses,
+        "hit_rate": hit_rate,
+        "hit_summary": {
+            "avg_score": avg_score,
+            "heading_hit_rate": heading_hr,
+            "avg_section_position": avg_pos,
+            "confidence_distribution": {
+                "high": conf_high,
+                "medium": conf_medium,
+                "low": conf_low,
+            },
+        },
+        "miss_summary": {
+            "by_template": by_template,
+            "top_headings_in_misses": top_miss_headings,
+            "log_odds_discriminators": log_odds,
+            "structural_deviation": structural_dev,
+            "nearest_misses": nearest_misses,
+        },
+        "outlier_summary": outlier_summary,
+        "did_not_find_summary": did_not_find_summary,
+        "candidate_set": {
+            "input_doc_count": source_doc_count,
+            "candidate_input_count": candidate_input_count,
+            "evaluated_doc_count": total,
+            "pruning_ratio": (
+                round(1.0 - (total / source_doc_count), 4)
+                if source_doc_count > 0
+                else 0.0
+            ),
+        },
+        "feature_tables": {
+            "section_features_present": section_features_present,
+            "docs_with_section_features": docs_with_materialized_features,
+            "docs_with_section_features_rate": (
+                round(docs_with_materialized_features / total, 4)
+                if total > 0
+                else 0.0
+            ),
+        },
+    }
+    return summary, hits, misses
+
+
+def _corpus_identity(corpus: CorpusIndex) -> dict[str, Any]:
+    path = corpus.db_path.resolve()
+    stat = path.stat()
+    return {"db_path": str(path), "mtime_ns": stat.st_mtime_ns, "size": stat.st_size}
+
+
+def save_baseline(result: PatternTestResult, path: Path, corpus: CorpusIndex) -> None:
+    """Persist *result*'s per-doc outcomes as a baseline for a later incremental run."""
+    payload = {
+        "schema_version": BASELINE_SCHEMA_VERSION,
+        "generated_at": datetime.now(UTC).isoformat(),
+        "corpus": _corpus_identity(corpus),
+        "settings": result.settings._asdict(),
+        "strategy": strategy_to_dict(result.strategy),
+        "outcomes": [outcome._asdict() for outcome in result.outcomes.values()],
+    }
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(f"{path.name}.tmp")
+    tmp_path.write_text(json.dumps(payload))
+    tmp_path.replace(path)
+
+
+def load_baseline(path: Path, corpus: CorpusIndex) -> PatternTestResult | None:
+    """Load a ``save_baseline`` file; None if missing, unreadable or from another corpus build."""
+    try:
+        payload = json.loads(path.read_text())
+    except (OSError, ValueError):
+        return None
+    if (
+        not isinstance(payload, dict)
+        or payload.get("schema_version") != BASELINE_SCHEMA_VERSION
+        or payload.get("corpus") != _corpus_identity(corpus)
+    ):
+        return None
+    try:
+        outcomes: dict[str, DocOutcome] = {}
+        for item in payload["outcomes"]:
+            outcome = DocOutcome(**{**item, "headings": tuple(item.get("headings", ()))})
+            outcomes[outcome.doc_id] = outcome
+        return PatternTestResult(
+            strategy=strategy_from_dict(payload["strategy"]),
+            settings=ScoringSettings(**payload["settings"]),
+            summary={},
+            outcomes=outcomes,
+            hits=[],
+            misses=[],
+            rescored_doc_ids=[],
+        )
+    except (KeyError, TypeError, ValueError):
+        return None
+
+
 # ---------------------------------------------------------------------------
 # Main
 # ---------------------------------------------------------------------------
@@ -1146,8 +1872,11 @@ def run(args: argparse.Namespace) -> None:
     strategy, raw_strategy, _resolved_strategy = load_strategy_with_views(Path(args.strategy))
     print(f"Loaded strategy: {strategy.concept_id} v{strategy.version}", file=sys.stderr)
     cohort_only = not args.include_all
-    run_id = args.run_id or (
-        f"pattern_tester_{datetime.now(UTC).strftime('%Y%m%dT%H%M%SZ')}_{uuid4().hex[:8]}"
+    settings = ScoringSettings(
+        hit_threshold=args.hit_threshold,
+        strict_keyword_gate=not args.no_strict_keyword_gate,
+        min_keyword_hits=args.min_keyword_hits,
+        cohort_only=cohort_only,
     )
 
     with CorpusIndex(Path(args.db)) as corpus:
@@ -1185,431 +1914,65 @@ def run(args: argparse.Namespace) -> None:
                 file=sys.stderr,
             )
 
-        # Per-doc scoring
-        hits: list[dict[str, Any]] = []
-        misses: list[dict[str, Any]] = []
-        all_scores: list[float] = []
-        all_confidence_scores: list[float] = []
-        heading_hit_count = 0
-        section_positions: list[float] = []
-        docs_with_sections = 0
-        docs_with_materialized_features = 0
-
-        # For miss analysis
-        miss_headings: Counter[str] = Counter()
-        hit_headings: Counter[str] = Counter()
-        miss_templates: Counter[str] = Counter()
-        miss_articles: Counter[str] = Counter()
-        nearest_misses: list[dict[str, Any]] = []
-
-        for i, doc_id in enumerate(doc_ids):
-            if (i + 1) % 100 == 0:
-                print(f"  Progress: {i + 1}/{len(doc_ids)}", file=sys.stderr)
-
-            sections = corpus.search_sections(
-                doc_id=doc_id,
-                cohort_only=cohort_only,
-                limit=9999,
-            )
-            if not sections:
-                # No sections found -- count as miss
-                doc_rec = corpus.get_doc(doc_id)
-                template = doc_rec.template_family if doc_rec else "unknown"
-                misses.append({"doc_id": doc_id, "best_score": 0.0})
-                miss_templates[template] += 1
-                continue
-            docs_with_sections += 1
-            section_features_by_number = corpus.get_section_features(doc_id)
-            if section_features_by_number:
-                docs_with_materialized_features += 1
-
-            best_score = 0.0
-            best_section = ""
-            best_heading = ""
-            best_method = "none"
-            best_position = 0
-            best_text_lower = ""
-            best_kw_hit_count = 0
-            best_article_num = 0
-            best_section_word_count = 0
-            best_char_start = None
-            best_char_end = None
-            best_signal_details: dict[str, Any] = {
-                "active_channels": (),
-                "signal_channel_count": 0,
-                "negative_keyword_hits": 0,
-                "negative_dna_hit": False,
-            }
-            second_best_score = 0.0
-
-            for idx, sec in enumerate(sections):
-                text = corpus.get_section_text(doc_id, sec.section_number)
-                text_lower = text.lower() if text else ""
-                score, method, kw_hit_count, signal_details = score_section(
-                    sec.heading,
-                    text_lower,
-                    strategy,
+        baseline = None
+        if args.baseline_in:
+            baseline = load_baseline(Path(args.baseline_in), corpus)
+            if baseline is None:
+                print(
+                    f"Baseline {args.baseline_in} is missing or stale; scoring all docs",
+                    file=sys.stderr,
                 )
-                if score > best_score:
-                    second_best_score = best_score
-                    best_score = score
-                    best_section = sec.section_number
-                    best_heading = sec.heading
-                    best_method = method
-                    best_position = idx
-                    best_text_lower = text_lower
-                    best_kw_hit_count = kw_hit_count
-                    best_article_num = sec.article_num
-                    best_section_word_count = _to_int(sec.word_count, default=0)
-                    best_char_start = _to_int(sec.char_start, default=0)
-                    best_char_end = _to_int(sec.char_end, default=0)
-                    best_signal_details = signal_details
-                elif score > second_best_score:
-                    second_best_score = score
-
-            doc_rec = corpus.get_doc(doc_id)
-            template = doc_rec.template_family if doc_rec else "unknown"
-            best_feature = section_features_by_number.get(best_section)
-            detected_functional_areas = _infer_functional_areas(best_heading, best_text_lower)
-            if best_feature and best_feature.definition_types:
-                detected_definition_types = set(best_feature.definition_types)
-            else:
-                detected_definition_types = _infer_definition_types(best_text_lower)
-            definition_dependency_overlap = _definition_dependency_overlap(
-                best_text_lower,
-                strategy.defined_term_dependencies,
-            )
-            if best_feature:
-                scope_parity = {
-                    "label": best_feature.scope_label,
-                    "permit_count": best_feature.scope_permit_count,
-                    "restrict_count": best_feature.scope_restrict_count,
-                    "operator_count": best_feature.scope_operator_count,
-                    "estimated_depth": best_feature.scope_estimated_depth,
-                }
-                preemption_features = {
-                    "override_count": best_feature.preemption_override_count,
-                    "yield_count": best_feature.preemption_yield_count,
-                    "estimated_depth": best_feature.preemption_estimated_depth,
-                    "has_preemption": best_feature.preemption_has,
-                    "edge_count": best_feature.preemption_edge_count,
-                }
-            else:
-                scope_parity = _compute_scope_parity(best_text_lower)
-                preemption_features = _compute_preemption_features(best_text_lower)
-            structural_fingerprint_tokens = set(
-                build_section_fingerprint(
-                    template_family=template,
-                    article_num=best_article_num,
-                    section_number=best_section,
-                    heading=best_heading,
-                    text=best_text_lower,
-                ).tokens
-            )
-            confidence_components = _resolve_confidence_components(
-                score=best_score,
-                score_margin=max(0.0, best_score - second_best_score),
-                active_channels=tuple(best_signal_details.get("active_channels", ())),
-                signal_details=best_signal_details,
-                keyword_hit_count=best_kw_hit_count,
-            )
-            confidence_final = _weighted_confidence_score(
-                confidence_components,
-                strategy.confidence_policy if isinstance(strategy.confidence_policy, dict) else {},
-            )
 
-            accepted = should_accept_hit(
-                score=best_score,
-                score_margin=max(0.0, best_score - second_best_score),
-                method=best_method,
-                heading=best_heading,
-                text_lower=best_text_lower,
-                section_number=best_section,
-                article_num=best_article_num,
-                template_family=template,
-                section_word_count=best_section_word_count,
-                keyword_hit_count=best_kw_hit_count,
-                active_channels=tuple(best_signal_details.get("active_channels", ())),
-                signal_details=best_signal_details,
-                detected_functional_areas=detected_functional_areas,
-                detected_definition_types=detected_definition_types,
-                definition_dependency_overlap=definition_dependency_overlap,
-                scope_parity=scope_parity,
-                preemption_features=preemption_features,
-                structural_fingerprint_tokens=structural_fingerprint_tokens,
-                strategy=strategy,
-                strict_keyword_gate=not args.no_strict_keyword_gate,
-                hit_threshold=args.hit_threshold,
-                min_keyword_hits=args.min_keyword_hits,
-            )
-
-            if accepted:
-                # Hit
-                all_scores.append(best_score)
-                all_confidence_scores.append(confidence_final)
-                if best_method == "heading" or best_method == "composite":
-                    heading_hit_count += 1
-                section_positions.append(best_position)
-
-                hit_info: dict[str, Any] = {
-                    "record_type": "HIT",
-                    "run_id": run_id,
-                    "ontology_node_id": strategy.concept_id,
-                    "strategy_version": strategy.version,
-                    "doc_id": doc_id,
-                    "section": best_section,
-                    "section_number": best_section,
-                    "heading": best_heading,
-                    "char_start": best_char_start,
-                    "char_end": best_char_end,
-                    "score": round(best_score, 4),
-                    "score_margin": round(max(0.0, best_score - second_best_score), 4),
-                    "match_method": best_method,
-                    "match_type": best_method,
-                    "keyword_hit_count": best_kw_hit_count,
-                    "article_num": best_article_num,
-                    "template_family": template,
-                    "section_word_count": best_section_word_count,
-                    "signal_channels": _to_int(best_signal_details.get("signal_channel_count"), default=0),
-                    "active_channels": list(best_signal_details.get("active_channels", ())),
-                    "negative_keyword_hits": _to_int(
-                        best_signal_details.get("negative_keyword_hits"),
-                        default=0,
-                    ),
-                    "negative_dna_hit": bool(best_signal_details.get("negative_dna_hit")),
-                    "functional_areas": sorted(detected_functional_areas),
-                    "definition_types": sorted(detected_definition_types),
-                    "definition_dependency_overlap": round(definition_dependency_overlap, 4),
-                    "scope_parity": scope_parity,
-                    "preemption": preemption_features,
-                    "structural_fingerprint_tokens": sorted(structural_fingerprint_tokens),
-                    "confidence_components": {
-                        k: round(v, 4) for k, v in confidence_components.items()
-                    },
-                    "confidence_final": round(confidence_final, 4),
-                    "section_rank": best_position + 1,
-                    "section_count": len(sections),
-                }
-                hits.append(hit_info)
-
-                # Collect hit headings for log-odds
-                for sec in sections:
-                    hit_headings[sec.heading] += 1
-            else:
-                # Miss
-                misses.append({
-                    "record_type": "NOT_FOUND",
-                    "run_id": run_id,
-                    "ontology_node_id": strategy.concept_id,
-                    "strategy_version": strategy.version,
-                    "doc_id": doc_id,
-                    "best_score": round(best_score, 4),
-                    "best_section": best_section,
-                    "section_number": best_section,
-                    "best_heading": best_heading,
-                    "best_method": best_method,
-                    "keyword_hit_count": best_kw_hit_count,
-                    "template_family": template,
-                    "functional_areas": sorted(detected_functional_areas),
-                    "definition_types": sorted(detected_definition_types),
-                    "definition_dependency_overlap": round(definition_dependency_overlap, 4),
-                    "scope_parity": scope_parity,
-                    "preemption": preemption_features,
-                    "structural_fingerprint_tokens": sorted(structural_fingerprint_tokens),
-                    "confidence_components": {
-                        k: round(v, 4) for k, v in confidence_components.items()
-                    },
-                    "confidence_final": round(confidence_final, 4),
-                    "not_found_reason": "no_section_match_above_threshold",
-                })
-                miss_templates[template] += 1
-
-                # Collect miss headings for log-odds
-                for sec in sections:
-                    miss_headings[sec.heading] += 1
-
-                # Structural deviation: which article had the best score
-                if best_section:
-                    # Extract article from section_number (e.g. "7.01" -> "article_7")
-                    article_part = best_section.split(".")[0] if "." in best_section else best_section
-                    try:
-                        article_key = f"article_{int(article_part)}"
-                    except ValueError:
-                        article_key = "no_article"
-                else:
-                    article_key = "no_article"
-                miss_articles[article_key] += 1
-
-                # Track nearest misses
-                nearest_misses.append({
-                    "doc_id": doc_id,
-                    "best_score": round(best_score, 4),
-                    "best_section": best_section,
-                    "best_heading": best_heading,
-                    "best_method": best_method,
-                    "keyword_hit_count": best_kw_hit_count,
-                })
-
-        # Compute summary statistics
-        total = len(doc_ids)
-        n_hits = len(hits)
-        n_misses = len(misses)
-        hit_rate = round(n_hits / total, 4) if total > 0 else 0.0
-
-        # Hit summary
-        avg_score = round(sum(all_scores) / len(all_scores), 4) if all_scores else 0.0
-        heading_hr = round(heading_hit_count / n_hits, 4) if n_hits > 0 else 0.0
-        avg_pos = round(sum(section_positions) / len(section_positions), 2) if section_positions else 0.0
-
-        # Confidence distribution
-        conf_high = sum(1 for s in all_confidence_scores if s >= 0.7)
-        conf_medium = sum(1 for s in all_confidence_scores if 0.4 <= s < 0.7)
-        conf_low = sum(1 for s in all_confidence_scores if s < 0.4)
-
-        # Miss analysis: top headings
-        top_miss_headings = [
-            {"heading": h, "count": c}
-            for h, c in miss_headings.most_common(20)
-        ]
-
-        # Log-odds discriminators
-        log_odds = compute_log_odds_discriminators(
-            miss_headings, hit_headings, n_misses, n_hits
-        )
-
-        # Structural deviation
-        structural_dev = dict(miss_articles.most_common(20))
-
-        # Nearest misses (top 10)
-        nearest_misses.sort(key=lambda x: x["best_score"], reverse=True)
-        nearest_misses = nearest_misses[:10]
-
-        # Template breakdown
-        by_template = dict(miss_templates.most_common(20))
-        outlier_summary = _compute_outliers(hits, strategy=strategy)
-        did_not_find_summary = _evaluate_did_not_find_policy(
-            policy=strategy.did_not_find_policy if isinstance(strategy.did_not_find_policy, dict) else {},
-            total_docs=total,
-            docs_with_sections=docs_with_sections,
-            misses=misses,
-            hit_threshold=args.hit_threshold,
+        result = evaluate_strategy(
+            corpus,
+            strategy,
+            doc_ids,
+            raw_strategy=raw_strategy,
+            settings=settings,
+            run_id=args.run_id,
+            source_doc_count=source_doc_count,
+            candidate_input_count=candidate_input_count,
+            baseline=baseline,
         )
-
-        # Build output
-        output: dict[str, Any] = {
-            "schema_version": "pattern_tester_v2",
-            "run_id": run_id,
+        if baseline is not None:
+            print(
+                f"Incremental: rescored {len(result.rescored_doc_ids)}/{len(doc_ids)} docs",
+                file=sys.stderr,
+            )
+        if args.baseline_out:
+            save_baseline(result, Path(args.baseline_out), corpus)
+
+    output = result.summary
+    hits = result.hits
+    total = output["total_docs"]
+    n_hits = output["hits"]
+    if args.family_candidates_out:
+        out_path = Path(args.family_candidates_out)
+        out_path.parent.mkdir(parents=True, exist_ok=True)
+        candidate_payload = {
+            "schema_version": "family_candidates_v1",
+            "generated_at": datetime.now(UTC).isoformat(),
+            "run_id": output["run_id"],
             "ontology_node_id": strategy.concept_id,
-            "strategy": strategy.concept_id,
             "strategy_version": strategy.version,
-            "config": {
-                "hit_threshold": args.hit_threshold,
-                "strict_keyword_gate": not args.no_strict_keyword_gate,
-                "min_keyword_hits": args.min_keyword_hits,
-                "acceptance_policy_version": strategy.acceptance_policy_version,
-                "min_score_by_method": strategy.min_score_by_method,
-                "min_score_margin": strategy.min_score_margin,
-                "min_signal_channels": strategy.min_signal_channels,
-                "channel_requirements": strategy.channel_requirements,
-                "section_shape_bounds": strategy.section_shape_bounds,
-                "heading_quality_policy": strategy.heading_quality_policy,
-                "outlier_policy": strategy.outlier_policy,
-                "canonical_heading_labels": list(strategy.canonical_heading_labels),
-                "functional_area_hints": list(strategy.functional_area_hints),
-                "definition_type_allowlist": list(strategy.definition_type_allowlist),
-                "definition_type_blocklist": list(strategy.definition_type_blocklist),
-                "min_definition_dependency_overlap": strategy.min_definition_dependency_overlap,
-                "scope_parity_allow": list(strategy.scope_parity_allow),
-                "scope_parity_block": list(strategy.scope_parity_block),
-                "boolean_operator_requirements": strategy.boolean_operator_requirements,
-                "preemption_requirements": strategy.preemption_requirements,
-                "max_preemption_depth": strategy.max_preemption_depth,
-                "template_module_constraints": strategy.template_module_constraints,
-                "structural_fingerprint_allowlist": list(strategy.structural_fingerprint_allowlist),
-                "structural_fingerprint_blocklist": list(strategy.structural_fingerprint_blocklist),
-                "confidence_policy": strategy.confidence_policy,
-                "confidence_components_min": strategy.confidence_components_min,
-                "did_not_find_policy": strategy.did_not_find_policy,
-                "profile_type": strategy.profile_type,
-                "inherits_from": strategy.inherits_from,
-                "inheritance_active": bool(
-                    isinstance(raw_strategy, dict)
-                    and isinstance(raw_strategy.get("inherits_from"), str)
-                    and raw_strategy.get("inherits_from", "").strip()
-                ),
-            },
-            "total_docs": total,
-            "docs_with_sections": docs_with_sections,
-            "hits": n_hits,
-            "misses": n_misses,
-            "hit_rate": hit_rate,
-            "hit_summary": {
-                "avg_score": avg_score,
-                "heading_hit_rate": heading_hr,
-                "avg_section_position": avg_pos,
-                "confidence_distribution": {
-                    "high": conf_high,
-                    "medium": conf_medium,
-                    "low": conf_low,
-                },
-            },
-            "miss_summary": {
-                "by_template": by_template,
-                "top_headings_in_misses": top_miss_headings,
-                "log_odds_discriminators": log_odds,
-                "structural_deviation": structural_dev,
-                "nearest_misses": nearest_misses,
-            },
-            "outlier_summary": outlier_summary,
-            "did_not_find_summary": did_not_find_summary,
-            "candidate_set": {
-                "input_doc_count": source_doc_count,
-                "candidate_input_count": candidate_input_count,
-                "evaluated_doc_count": total,
-                "pruning_ratio": (
-                    round(1.0 - (total / source_doc_count), 4)
-                    if source_doc_count > 0
-                    else 0.0
-                ),
-            },
-            "feature_tables": {
-                "section_features_present": corpus.has_table("section_features"),
-                "docs_with_section_features": docs_with_materialized_features,
-                "docs_with_section_features_rate": (
-                    round(docs_with_materialized_features / total, 4)
-                    if total > 0
-                    else 0.0
-                ),
-            },
+            "doc_ids": sorted({str(hit["doc_id"]) for hit in hits}),
+            "source_doc_count": source_doc_count,
+            "evaluated_doc_count": total,
+            "hit_count": n_hits,
         }
+        out_path.write_text(json.dumps(candidate_payload, indent=2))
+        output["family_candidates_out"] = str(out_path)
 
-        if args.family_candidates_out:
-            out_path = Path(args.family_candidates_out)
-            out_path.parent.mkdir(parents=True, exist_ok=True)
-            candidate_payload = {
-                "schema_version": "family_candidates_v1",
-                "generated_at": datetime.now(UTC).isoformat(),
-                "run_id": run_id,
-                "ontology_node_id": strategy.concept_id,
-                "strategy_version": strategy.version,
-                "doc_ids": sorted({str(hit["doc_id"]) for hit in hits}),
-                "source_doc_count": source_doc_count,
-                "evaluated_doc_count": total,
-                "hit_count": n_hits,
-            }
-            out_path.write_text(json.dumps(candidate_payload, indent=2))
-            output["family_candidates_out"] = str(out_path)
-
-        if args.verbose:
-            output["matches"] = hits
-        if args.include_miss_records:
-            output["miss_records"] = misses
+    if args.verbose:
+        output["matches"] = hits
+    if args.include_miss_records:
+        output["miss_records"] = result.misses
 
-        dump_json(output)
+    dump_json(output)
 
     print(
-        f"Done: {n_hits}/{total} hits ({hit_rate:.1%}), "
-        f"{n_misses} misses",
+        f"Done: {n_hits}/{total} hits ({output['hit_rate']:.1%}), "
+        f"{output['misses']} misses",
         file=sys.stderr,
     )
 
@@ -1669,6 +2032,19 @@ def main() -> None:
         default=None,
         help="Optional path to persist hit doc_ids as a family candidate set JSON.",
     )
+    parser.add_argument(
+        "--baseline-in",
+        default=None,
+        help=(
+            "Optional per-doc outcome baseline (from --baseline-out) of an earlier "
+            "strategy; only docs the strategy diff can affect are rescored."
+        ),
+    )
+    parser.add_argument(
+        "--baseline-out",
+        default=None,
+        help="Optional path to persist this run's per-doc outcomes as a baseline.",
+    )
     args = parser.parse_args()
     run(args)
 
@@ -15,17 +15,22 @@ Outputs structured JSON to stdout, human messages to stderr.
 import argparse
 import contextlib
 import glob
+import importlib.util
 import json
 import os
 import re
-import subprocess
 import sys
 from datetime import UTC, datetime
 from pathlib import Path
+from types import ModuleType
 from typing import Any
 
-from agent.corpus import SchemaVersionError, ensure_schema_version
-from agent.strategy import normalize_template_overrides, resolve_strategy_dict
+from agent.corpus import CorpusIndex, SchemaVersionError, ensure_schema_version
+from agent.strategy import (
+    load_strategy_with_views,
+    normalize_template_overrides,
+    resolve_strategy_dict,
+)
 
 try:
     import orjson
@@ -778,6 +783,21 @@ def evaluate_confidence_summary_against_policy(
     return False, reason, details
 
 
+def _load_pattern_tester() -> ModuleType:
+    """Import the sibling ``pattern_tester`` script for its library API."""
+    module_name = "_strategy_writer_pattern_tester"
+    module = sys.modules.get(module_name)
+    if module is None:
+        path = Path(__file__).with_name("pattern_tester.py")
+        spec = importlib.util.spec_from_file_location(module_name, path)
+        if spec is None or spec.loader is None:
+            raise ImportError(f"cannot load pattern_tester: {path}")
+        module = importlib.util.module_from_spec(spec)
+        sys.modules[module_name] = module
+        spec.loader.exec_module(module)
+    return module
+
+
 def run_outlier_policy_probe(
     strategy_path: Path,
     db_path: Path,
@@ -786,58 +806,54 @@ def run_outlier_policy_probe(
     confidence_policy: dict[str, Any],
     *,
     include_all: bool,
+    baseline_path: Path | None = None,
 ) -> tuple[bool, str, dict[str, Any]]:
-    """Run pattern_tester probe and enforce outlier/did-not-find policy limits."""
-    sample_size = max(25, _to_int(outlier_policy.get("sample_size"), default=200))
-    cmd = [
-        sys.executable,
-        str(Path(__file__).with_name("pattern_tester.py")),
-        "--db",
-        str(db_path),
-        "--strategy",
-        str(strategy_path),
-        "--sample",
-        str(sample_size),
-    ]
-    if include_all:
-        cmd.append("--include-all")
-    if bool(outlier_policy.get("no_strict_keyword_gate", False)):
-        cmd.append("--no-strict-keyword-gate")
-    if "hit_threshold" in outlier_policy:
-        cmd.extend(["--hit-threshold", str(outlier_policy["hit_threshold"])])
-    if "min_keyword_hits" in outlier_policy:
-        cmd.extend(["--min-keyword-hits", str(outlier_policy["min_keyword_hits"])])
-
-    result = subprocess.run(
-        cmd,
-        capture_output=True,
-        text=True,
-        check=False,
-    )
-    if result.returncode != 0:
-        reason = "Outlier policy probe failed (pattern_tester returned non-zero)."
-        details = {
-            "cmd": cmd,
-            "returncode": result.returncode,
-            "stderr_tail": result.stderr.strip().splitlines()[-20:],
-            "stdout_tail": result.stdout.strip().splitlines()[-20:],
-        }
-        return False, reason, details
+    """Run pattern_tester probe and enforce outlier/did-not-find policy limits.
 
+    The probe runs in-process.  With *baseline_path*, the previous probe's
+    per-doc outcomes are reused for docs the strategy diff cannot affect,
+    and this probe's outcomes replace them.
+    """
+    sample_size = max(25, _to_int(outlier_policy.get("sample_size"), default=200))
     try:
-        payload = json.loads(result.stdout or "{}")
-    except json.JSONDecodeError:
-        reason = "Outlier policy probe failed: invalid JSON from pattern_tester."
-        details = {
-            "cmd": cmd,
-            "stdout_head": (result.stdout or "")[:2000],
-            "stderr_tail": result.stderr.strip().splitlines()[-20:],
+        pattern_tester = _load_pattern_tester()
+        settings = pattern_tester.ScoringSettings(
+            hit_threshold=float(
+                outlier_policy.get("hit_threshold", pattern_tester.HIT_THRESHOLD)
+            ),
+            strict_keyword_gate=not bool(outlier_policy.get("no_strict_keyword_gate", False)),
+            min_keyword_hits=int(outlier_policy.get("min_keyword_hits", 3)),
+            cohort_only=not include_all,
+        )
+        strategy, raw_strategy, _resolved = load_strategy_with_views(strategy_path)
+        with CorpusIndex(db_path) as corpus:
+            doc_ids = corpus.sample_docs(sample_size, cohort_only=not include_all)
+            baseline = (
+                pattern_tester.load_baseline(baseline_path, corpus)
+                if baseline_path is not None
+                else None
+            )
+            result = pattern_tester.evaluate_strategy(
+                corpus,
+                strategy,
+                doc_ids,
+                raw_strategy=raw_strategy,
+                settings=settings,
+                baseline=baseline,
+            )
+            if baseline_path is not None:
+                pattern_tester.save_baseline(result, baseline_path, corpus)
+    except Exception as exc:
+        reason = "Outlier policy probe failed (pattern_tester raised an error)."
+        return False, reason, {
+            "sample_size": sample_size,
+            "error": f"{type(exc).__name__}: {exc}",
         }
-        return False, reason, details
+    payload = result.summary
 
     outlier_summary = payload.get("outlier_summary")
     if not isinstance(outlier_summary, dict):
-        return False, "Outlier policy probe failed: missing outlier_summary.", {"cmd": cmd}
+        return False, "Outlier policy probe failed: missing outlier_summary.", {}
 
     ok, reason, details = evaluate_outlier_summary_against_policy(outlier_summary, outlier_policy)
     details["sample_size"] = sample_size
@@ -847,6 +863,8 @@ def run_outlier_policy_probe(
     if not isinstance(hit_summary, dict):
         hit_summary = {}
     details["hit_summary"] = hit_summary
+    if "incremental" in payload:
+        details["incremental"] = payload["incremental"]
 
     did_details: dict[str, Any] = {"enforced": False}
     if did_not_find_policy:
@@ -855,10 +873,7 @@ def run_outlier_policy_probe(
             return (
                 False,
                 "Did-not-find policy probe failed: missing did_not_find_summary.",
-                {
-                    "sample_size": sample_size,
-                    "cmd": cmd,
-                },
+                {"sample_size": sample_size},
             )
         did_ok, did_reason, did_details = evaluate_did_not_find_summary_against_policy(
             did_not_find_summary,
@@ -1403,6 +1418,7 @@ def main() -> None:
             did_not_find_policy,
             confidence_policy,
             include_all=args.include_all,
+            baseline_path=workspace / "results" / f"outlier_probe_baseline.{args.concept_id}.json",
         )
         policy_checks["outlier_policy"] = outlier_details
         if not ok:
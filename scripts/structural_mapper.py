@@ -236,15 +236,15 @@ def run(args: argparse.Namespace) -> None:
         matched_docs = 0
         examples: list[dict[str, Any]] = []
 
-        for i, doc_id in enumerate(doc_ids):
+        bundles = corpus.iter_doc_bundles(
+            doc_ids, cohort_only=cohort_only, include_features=False,
+        )
+        for i, bundle in enumerate(bundles):
             if (i + 1) % 100 == 0:
                 print(f"  Progress: {i + 1}/{len(doc_ids)}", file=sys.stderr)
 
-            sections = corpus.search_sections(
-                doc_id=doc_id,
-                cohort_only=cohort_only,
-                limit=9999,
-            )
+            doc_id = bundle.doc_id
+            sections = bundle.sections
             if not sections:
                 continue
 
@@ -256,7 +256,7 @@ def run(args: argparse.Namespace) -> None:
             best_text = ""
 
             for sec in sections:
-                text = corpus.get_section_text(doc_id, sec.section_number)
+                text = bundle.section_texts.get(sec.section_number)
                 text_lower = text.lower() if text else ""
                 score, method = score_section(
                     sec.heading,
@@ -297,7 +297,7 @@ def run(args: argparse.Namespace) -> None:
                 "score": round(best_score, 4),
                 "match_method": best_method,
             })
-            doc_rec = corpus.get_doc(doc_id)
+            doc_rec = bundle.doc
             template_family = doc_rec.template_family if doc_rec else "unknown"
             fp = build_section_fingerprint(
                 template_family=template_family or "unknown",
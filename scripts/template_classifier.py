@@ -23,6 +23,7 @@ from pathlib import Path
 from typing import Any
 
 from agent.corpus import SchemaVersionError, ensure_schema_version
+from agent.edge_cases import build_edge_case_table, edge_case_table_run_id
 
 try:
     import orjson
@@ -903,6 +904,10 @@ def main() -> None:
             "UPDATE documents SET template_family = ? WHERE doc_id = ?",
             updates,
         )
+        # orphan_template rows depend on template_family; keep the run id.
+        edge_case_run_id = edge_case_table_run_id(con)
+        if edge_case_run_id is not None:
+            build_edge_case_table(con, run_id=edge_case_run_id)
         wrote_db = True
 
     con.close()
@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+"""Run a corpus CLI tool through the tool daemon.
+
+Takes the tool's script name followed by exactly the flags the script
+itself takes, and reproduces its stdout, stderr and exit code.  When no
+daemon is running, or the daemon does not serve that tool, the script is
+run directly instead, so the shim is always safe to use.  A connection
+that breaks after the request was sent is an error, not a fallback: the
+daemon may already have run the tool.
+
+Usage:
+    python3 scripts/tool_client.py section_reader \
+        --db corpus_index/corpus.duckdb --doc-id abc123 --section 7.01
+
+    # equivalent to:
+    python3 scripts/section_reader.py \
+        --db corpus_index/corpus.duckdb --doc-id abc123 --section 7.01
+"""
+from __future__ import annotations
+
+import os
+import sys
+
+from agent.tool_client import ToolRequestLost, call_tool
+
+
+def main() -> None:
+    if len(sys.argv) < 2 or sys.argv[1] in ("-h", "--help"):
+        print(
+            "usage: tool_client.py TOOL [TOOL ARGS...]\n"
+            "Runs scripts/TOOL.py via the tool daemon (or directly if none).",
+            file=sys.stderr,
+        )
+        sys.exit(2)
+    tool, argv = sys.argv[1], sys.argv[2:]
+
+    try:
+        result = call_tool(tool, argv)
+    except ToolRequestLost as exc:
+        print(f"Error: {exc} (the tool may have run; not retrying)", file=sys.stderr)
+        sys.exit(1)
+    except OSError:
+        result = None
+    if result is None or result.unknown_tool:
+        script = os.path.join(os.path.dirname(os.path.abspath(__file__)), f"{tool}.py")
+        if not os.path.isfile(script):
+            print(f"Error: unknown tool: {tool}", file=sys.stderr)
+            sys.exit(2)
+        os.execv(sys.executable, [sys.executable, script, *argv])
+
+    sys.stdout.buffer.write(result.stdout)
+    sys.stdout.buffer.flush()
+    sys.stderr.buffer.write(result.stderr)
+    sys.stderr.buffer.flush()
+    sys.exit(result.exit_code)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""Run, inspect or stop the corpus tool daemon.
+
+The daemon keeps the corpus CLI tools imported (and their ``--db``
+databases open) in pre-forked workers, so ``scripts/tool_client.py``
+invocations skip interpreter startup, imports and DuckDB opens.
+
+Usage:
+    # Foreground server (swarm/launch.sh starts one in a "tools" window)
+    python3 scripts/tool_daemon.py serve --workers 4
+
+    python3 scripts/tool_daemon.py status
+    python3 scripts/tool_daemon.py stop
+
+The socket defaults to ``$AGENT_TOOL_DAEMON_SOCKET`` or a per-user path in
+the temp directory; pass ``--socket`` to override.
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import signal
+import sys
+from pathlib import Path
+
+from agent.tool_client import PING, call_tool, default_socket_path
+from agent.tool_daemon import DEFAULT_TOOLS, ToolDaemon
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="Corpus tool daemon control.")
+    parser.add_argument(
+        "--socket",
+        type=Path,
+        default=None,
+        help="Unix socket path (default: $AGENT_TOOL_DAEMON_SOCKET or a temp-dir path)",
+    )
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    serve = sub.add_parser("serve", help="Run the daemon in the foreground.")
+    serve.add_argument("--workers", type=int, default=4, help="Worker processes (default: 4)")
+    serve.add_argument(
+        "--tools",
+        default=",".join(DEFAULT_TOOLS),
+        help="Comma-separated script names to serve (default: read-only corpus tools)",
+    )
+    serve.add_argument(
+        "--max-requests",
+        type=int,
+        default=500,
+        help="Recycle a worker after this many requests; 0 = never (default: 500)",
+    )
+    serve.add_argument(
+        "--idle-release",
+        type=float,
+        default=60.0,
+        help="Close a worker's pinned databases after this many idle seconds (default: 60)",
+    )
+
+    sub.add_parser("status", help="Print daemon status JSON (exit 1 if not running).")
+    sub.add_parser("stop", help="Stop a running daemon.")
+    return parser
+
+
+def _ping(socket_path: Path) -> dict[str, object] | None:
+    try:
+        result = call_tool(PING, [], socket_path=socket_path)
+    except OSError:
+        return None
+    return json.loads(result.stdout)
+
+
+def main() -> None:
+    args = build_parser().parse_args()
+    socket_path = Path(args.socket or default_socket_path())
+
+    if args.command == "serve":
+        tools = [t.strip() for t in args.tools.split(",") if t.strip()]
+        daemon = ToolDaemon(
+            socket_path,
+            workers=args.workers,
+            tools=tools,
+            max_requests=args.max_requests,
+            idle_release_seconds=args.idle_release,
+        )
+        print(
+            f"Tool daemon serving {len(tools)} tools with {daemon.workers} workers "
+            f"on {socket_path}",
+            file=sys.stderr,
+        )
+        try:
+            daemon.serve_forever()
+        except RuntimeError as exc:
+            print(f"Error: {exc}", file=sys.stderr)
+            sys.exit(1)
+        return
+
+    status = _ping(socket_path)
+    if status is None:
+        print(f"Tool daemon not running at {socket_path}", file=sys.stderr)
+        sys.exit(1)
+    if args.command == "status":
+        print(json.dumps(status, indent=2))
+        return
+    os.kill(int(status["pid"]), signal.SIGTERM)  # type: ignore[arg-type]
+    print(f"Stopped tool daemon (pid {status['pid']})", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
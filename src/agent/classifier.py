@@ -395,33 +395,12 @@ def _extract_title(text: str, max_chars: int = 2000) -> str:
 # ── Public API ──────────────────────────────────────────────────────────
 
 
-def extract_classification_signals(
-    normalized_text: str,
-    filename: str = "",
-) -> ClassificationSignals:
-    """Extract 15 classification signals from normalized text.
-
-    Returns a frozen dataclass — NOT a dict.  All downstream code
-    accesses signals via typed attribute access, eliminating
-    ``cast()``/``isinstance()`` noise under pyright strict.
+def count_definitions(text: str) -> int:
+    """Count distinct defined terms in *text* with the three definition patterns.
 
-    Args:
-        normalized_text: HTML-stripped, whitespace-collapsed CA text.
-        filename: Source filename (reserved for future heuristics).
-
-    Returns:
-        Strongly-typed ``ClassificationSignals`` instance.
+    Unquoted definitions are only counted in the first 40% of the text and
+    only when they are the dominant format.
     """
-    _ = filename  # reserved — prevents pyright "unused parameter" warning
-    text = normalized_text
-
-    # Word count
-    word_count = len(text.split())
-
-    # Title
-    title_text = _extract_title(text)
-
-    # ── Definition counting ──
     # Pattern 1: "Term" means
     means_defs: set[str] = set()
     for m in RE_DEFINITION.finditer(text):
@@ -452,9 +431,43 @@ def extract_classification_signals(
 
     # Unquoted: only activate if dominant format (>20 matches AND >2x quoted)
     if len(unquoted_defs) >= 20 and len(unquoted_defs) > quoted_total * 2:
-        definition_count = quoted_total + len(unquoted_defs)
-    else:
-        definition_count = quoted_total
+        return quoted_total + len(unquoted_defs)
+    return quoted_total
+
+
+def extract_classification_signals(
+    normalized_text: str,
+    filename: str = "",
+    *,
+    definition_count: int | None = None,
+) -> ClassificationSignals:
+    """Extract 15 classification signals from normalized text.
+
+    Returns a frozen dataclass — NOT a dict.  All downstream code
+    accesses signals via typed attribute access, eliminating
+    ``cast()``/``isinstance()`` noise under pyright strict.
+
+    Args:
+        normalized_text: HTML-stripped, whitespace-collapsed CA text.
+        filename: Source filename (reserved for future heuristics).
+        definition_count: Defined-term count already extracted by the
+            caller (the document pipeline's definitions stage).  When
+            given, ``count_definitions`` is not run over the text.
+
+    Returns:
+        Strongly-typed ``ClassificationSignals`` instance.
+    """
+    _ = filename  # reserved — prevents pyright "unused parameter" warning
+    text = normalized_text
+
+    # Word count
+    word_count = len(text.split())
+
+    # Title
+    title_text = _extract_title(text)
+
+    if definition_count is None:
+        definition_count = count_definitions(text)
 
     # Article count
     article_count = len(RE_ARTICLE.findall(text))
@@ -10,13 +10,16 @@ Tables:
     clauses     — clause AST nodes (FK to sections)
     definitions — defined terms (FK to documents)
     section_text — full section text (lazy-loaded)
+    section_tokens — optional word postings (``--positional-index``)
+    ngram_df    — optional n-gram document frequencies (``--ngram-df``)
     _schema_version — schema version tracking
 """
 from __future__ import annotations
 
 import importlib
 import json
-from dataclasses import dataclass
+from collections.abc import Iterator, Sequence
+from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any
 
@@ -200,6 +203,68 @@ class ClauseFeatureRecord:
     is_structural: bool
 
 
+@dataclass(frozen=True, slots=True)
+class DocBundle:
+    """Everything per-document scorers read, loaded in bulk.
+
+    Produced by ``CorpusIndex.iter_doc_bundles``.  ``sections`` are ordered
+    by ``char_start`` (as ``search_sections``); ``section_texts`` and
+    ``section_features`` are keyed by section_number and omit sections
+    without a row in the corresponding table.
+    """
+
+    doc_id: str
+    doc: DocRecord | None
+    sections: list[SectionRecord] = field(default_factory=list)
+    section_texts: dict[str, str] = field(default_factory=dict)
+    section_features: dict[str, SectionFeatureRecord] = field(default_factory=dict)
+
+
+def _section_from_row(r: tuple[Any, ...]) -> SectionRecord:
+    return SectionRecord(
+        doc_id=str(r[0]), section_number=str(r[1]), heading=str(r[2]),
+        char_start=int(r[3]), char_end=int(r[4]),
+        article_num=int(r[5]), word_count=int(r[6]),
+    )
+
+
+_SECTION_FEATURE_COLUMNS = """
+    doc_id, section_number, article_num, char_start, char_end,
+    word_count, char_count, heading_lower, scope_label,
+    scope_operator_count, scope_permit_count, scope_restrict_count,
+    scope_estimated_depth, preemption_override_count,
+    preemption_yield_count, preemption_estimated_depth,
+    preemption_has, preemption_edge_count, definition_types,
+    definition_type_primary, definition_type_confidence
+"""
+
+
+def _section_feature_from_row(row: tuple[Any, ...]) -> SectionFeatureRecord:
+    return SectionFeatureRecord(
+        doc_id=str(row[0]),
+        section_number=str(row[1]),
+        article_num=int(row[2] or 0),
+        char_start=int(row[3] or 0),
+        char_end=int(row[4] or 0),
+        word_count=int(row[5] or 0),
+        char_count=int(row[6] or 0),
+        heading_lower=str(row[7] or ""),
+        scope_label=str(row[8] or ""),
+        scope_operator_count=int(row[9] or 0),
+        scope_permit_count=int(row[10] or 0),
+        scope_restrict_count=int(row[11] or 0),
+        scope_estimated_depth=int(row[12] or 0),
+        preemption_override_count=int(row[13] or 0),
+        preemption_yield_count=int(row[14] or 0),
+        preemption_estimated_depth=int(row[15] or 0),
+        preemption_has=bool(row[16]),
+        preemption_edge_count=int(row[17] or 0),
+        definition_types=_decode_string_tuple(row[18]),
+        definition_type_primary=str(row[19] or ""),
+        definition_type_confidence=float(row[20] or 0.0),
+    )
+
+
 def _decode_string_tuple(value: Any) -> tuple[str, ...]:
     if value is None:
         return ()
@@ -302,6 +367,11 @@ class CorpusIndex:
     def __exit__(self, *_args: object) -> None:
         self.close()
 
+    @property
+    def db_path(self) -> Path:
+        """Path this index was opened from."""
+        return self._db_path
+
     @property
     def schema_version(self) -> str:
         """Get the schema version of this corpus index."""
@@ -474,14 +544,7 @@ class CorpusIndex:
         params.append(limit)
         rows = self._conn.execute(query, params).fetchall()
 
-        return [
-            SectionRecord(
-                doc_id=str(r[0]), section_number=str(r[1]), heading=str(r[2]),
-                char_start=int(r[3]), char_end=int(r[4]),
-                article_num=int(r[5]), word_count=int(r[6]),
-            )
-            for r in rows
-        ]
+        return [_section_from_row(r) for r in rows]
 
     def get_section_text(self, doc_id: str, section_number: str) -> str | None:
         """Get the full text of a section."""
@@ -606,45 +669,12 @@ class CorpusIndex:
         if not self.has_table("section_features"):
             return {}
         rows = self._conn.execute(
-            """
-            SELECT
-                doc_id, section_number, article_num, char_start, char_end,
-                word_count, char_count, heading_lower, scope_label,
-                scope_operator_count, scope_permit_count, scope_restrict_count,
-                scope_estimated_depth, preemption_override_count,
-                preemption_yield_count, preemption_estimated_depth,
-                preemption_has, preemption_edge_count, definition_types,
-                definition_type_primary, definition_type_confidence
-            FROM section_features
-            WHERE doc_id = ?
-            """,
+            f"SELECT {_SECTION_FEATURE_COLUMNS} FROM section_features WHERE doc_id = ?",
             [doc_id],
         ).fetchall()
         out: dict[str, SectionFeatureRecord] = {}
         for row in rows:
-            record = SectionFeatureRecord(
-                doc_id=str(row[0]),
-                section_number=str(row[1]),
-                article_num=int(row[2] or 0),
-                char_start=int(row[3] or 0),
-                char_end=int(row[4] or 0),
-                word_count=int(row[5] or 0),
-                char_count=int(row[6] or 0),
-                heading_lower=str(row[7] or ""),
-                scope_label=str(row[8] or ""),
-                scope_operator_count=int(row[9] or 0),
-                scope_permit_count=int(row[10] or 0),
-                scope_restrict_count=int(row[11] or 0),
-                scope_estimated_depth=int(row[12] or 0),
-                preemption_override_count=int(row[13] or 0),
-                preemption_yield_count=int(row[14] or 0),
-                preemption_estimated_depth=int(row[15] or 0),
-                preemption_has=bool(row[16]),
-                preemption_edge_count=int(row[17] or 0),
-                definition_types=_decode_string_tuple(row[18]),
-                definition_type_primary=str(row[19] or ""),
-                definition_type_confidence=float(row[20] or 0.0),
-            )
+            record = _section_feature_from_row(row)
             out[record.section_number] = record
         return out
 
@@ -697,18 +727,42 @@ class CorpusIndex:
     ) -> list[dict[str, Any]]:
         """Full-text search across section text.
 
+        When the corpus was built with ``--positional-index``, candidate
+        sections come from the ``section_tokens`` inverted index and only
+        those are verified against their text; otherwise every section is
+        scanned with ILIKE.
+
         Args:
-            pattern: Search pattern (SQL LIKE with % wildcards).
+            pattern: Literal search string (case-insensitive substring).
             context_chars: Number of context characters to return.
-            max_results: Maximum number of results.
+            max_results: Maximum number of hits (not sections).
             doc_ids: Optional list of doc_ids to restrict search to.
             cohort_only: If True, only search cohort-included documents.
 
         Returns:
-            List of dicts with doc_id, section_number, matched text, context.
+            One dict per occurrence with doc_id, section_number, char_offset,
+            matched text and context.  A section contributes every hit.
         """
-        conditions = ["st.text ILIKE ?"]
-        params: list[Any] = [f"%{pattern}%"]
+        from agent.proximity import SECTION_TOKENS_TABLE, build_substring_candidates_sql
+        from agent.query_filters import escape_like
+
+        candidates = (
+            build_substring_candidates_sql(pattern)
+            if self.has_table(SECTION_TOKENS_TABLE) else None
+        )
+        conditions: list[str] = []
+        params: list[Any] = []
+        source = "section_text st"
+        if candidates is not None:
+            cand_sql, cand_params = candidates
+            source = (
+                f"({cand_sql}) cand JOIN section_text st "
+                "ON st.doc_id = cand.doc_id AND st.section_number = cand.section_number"
+            )
+            params.extend(cand_params)
+        else:
+            conditions.append("st.text ILIKE ? ESCAPE '\\'")
+            params.append(f"%{escape_like(pattern)}%")
 
         if cohort_only:
             conditions.append(
@@ -720,42 +774,136 @@ class CorpusIndex:
             conditions.append(f"st.doc_id IN ({placeholders})")
             params.extend(doc_ids)
 
-        where = " AND ".join(conditions)
+        where = " AND ".join(conditions) if conditions else "TRUE"
+        order = " ORDER BY st.doc_id, st.section_number" if candidates is not None else ""
         query = f"""
             SELECT st.doc_id, st.section_number, st.text,
                    s.heading, s.article_num
-            FROM section_text st
+            FROM {source}
             JOIN sections s ON st.doc_id = s.doc_id
                            AND st.section_number = s.section_number
-            WHERE {where}
-            LIMIT ?
+            WHERE {where}{order}
         """
-        params.append(max_results)
-        rows = self._conn.execute(query, params).fetchall()
-
-        results: list[dict[str, Any]] = []
-        pattern_lower = pattern.lower()
-        for r in rows:
-            text = str(r[2])
-            text_lower = text.lower()
-            pos = text_lower.find(pattern_lower)
-            if pos < 0:
-                continue
-            ctx_start = max(0, pos - context_chars)
-            ctx_end = min(len(text), pos + len(pattern) + context_chars)
-            results.append({
-                "doc_id": str(r[0]),
-                "section_number": str(r[1]),
-                "heading": str(r[3]),
-                "article_num": int(r[4]),
-                "char_offset": pos,
-                "matched_text": text[pos:pos + len(pattern)],
-                "context_before": text[ctx_start:pos],
-                "context_after": text[pos + len(pattern):ctx_end],
-            })
+        cursor = self._conn.cursor()
+        try:
+            cursor.execute(query, params)
+            results: list[dict[str, Any]] = []
+            pattern_lower = pattern.lower()
+            width = len(pattern)
+            while len(results) < max_results:
+                rows = cursor.fetchmany(max(64, max_results))
+                if not rows:
+                    break
+                for r in rows:
+                    text = str(r[2])
+                    text_lower = text.lower()
+                    pos = text_lower.find(pattern_lower)
+                    while pos >= 0 and len(results) < max_results:
+                        ctx_start = max(0, pos - context_chars)
+                        ctx_end = min(len(text), pos + width + context_chars)
+                        results.append({
+                            "doc_id": str(r[0]),
+                            "section_number": str(r[1]),
+                            "heading": str(r[3]),
+                            "article_num": int(r[4]),
+                            "char_offset": pos,
+                            "matched_text": text[pos:pos + width],
+                            "context_before": text[ctx_start:pos],
+                            "context_after": text[pos + width:ctx_end],
+                        })
+                        pos = text_lower.find(pattern_lower, pos + max(1, width))
+                    if len(results) >= max_results:
+                        break
+        finally:
+            cursor.close()
 
         return results
 
+    def iter_doc_bundles(
+        self,
+        doc_ids: Sequence[str],
+        *,
+        cohort_only: bool = True,
+        chunk_size: int = 64,
+        include_text: bool = True,
+        include_features: bool = True,
+    ) -> Iterator[DocBundle]:
+        """Stream per-document bundles for *doc_ids*, loaded in chunks.
+
+        Replaces the per-document ``get_doc`` / ``search_sections`` /
+        ``get_section_features`` / per-section ``get_section_text`` round
+        trips with three joined queries per chunk of ``chunk_size`` docs.
+        One bundle is yielded per input doc_id, in input order.
+
+        Args:
+            doc_ids: Documents to load; every entry yields a bundle.
+            cohort_only: Same as ``search_sections``: sections of documents
+                outside the cohort are not returned (``doc`` still is).
+            chunk_size: Documents per round trip; bounds memory for text.
+            include_text: Load ``section_text`` alongside sections.
+            include_features: Load ``section_features`` when present.
+        """
+        step = max(1, chunk_size)
+        want_features = include_features and self.has_table("section_features")
+        for start in range(0, len(doc_ids), step):
+            chunk = list(doc_ids[start:start + step])
+            keys = list(dict.fromkeys(chunk))
+            placeholders = ", ".join("?" for _ in keys)
+
+            docs: dict[str, DocRecord] = {}
+            cur = self._conn.execute(
+                f"SELECT * FROM documents WHERE doc_id IN ({placeholders})", keys,
+            )
+            cols = [desc[0] for desc in cur.description]
+            for row in cur.fetchall():
+                record = self._doc_from_row(dict(zip(cols, row, strict=True)))
+                docs[record.doc_id] = record
+
+            cohort = (
+                " AND s.doc_id IN (SELECT doc_id FROM documents WHERE cohort_included = true)"
+                if cohort_only else ""
+            )
+            text_col, text_join = (
+                (", t.text", "LEFT JOIN section_text t "
+                 "ON t.doc_id = s.doc_id AND t.section_number = s.section_number")
+                if include_text else ("", "")
+            )
+            sections: dict[str, list[SectionRecord]] = {}
+            texts: dict[str, dict[str, str]] = {}
+            for row in self._conn.execute(
+                f"""
+                SELECT s.doc_id, s.section_number, s.heading, s.char_start, s.char_end,
+                       s.article_num, s.word_count{text_col}
+                FROM sections s {text_join}
+                WHERE s.doc_id IN ({placeholders}){cohort}
+                ORDER BY s.doc_id, s.char_start
+                """,
+                keys,
+            ).fetchall():
+                sec = _section_from_row(row)
+                sections.setdefault(sec.doc_id, []).append(sec)
+                if include_text and row[7] is not None:
+                    texts.setdefault(sec.doc_id, {})[sec.section_number] = str(row[7])
+
+            features: dict[str, dict[str, SectionFeatureRecord]] = {}
+            if want_features:
+                for row in self._conn.execute(
+                    f"SELECT {_SECTION_FEATURE_COLUMNS} FROM section_features "
+                    f"WHERE doc_id IN ({placeholders})",
+                    keys,
+                ).fetchall():
+                    feat = _section_feature_from_row(row)
+                    features.setdefault(feat.doc_id, {})[feat.section_number] = feat
+
+            for doc_id in chunk:
+                yield DocBundle(
+                    doc_id=doc_id,
+                    doc=docs.get(doc_id),
+                    sections=sections.get(doc_id, []),
+                    section_texts=texts.get(doc_id, {}),
+                    section_features=features.get(doc_id, {}),
+                )
+
     def query(self, sql: str, params: list[Any] | None = None) -> list[tuple[Any, ...]]:
         """Execute a raw SQL query against the corpus index.
 
@@ -0,0 +1,172 @@
+"""Physical layout optimization for ``corpus.duckdb`` (post-build "optimize" stage).
+
+Rows land in the corpus tables in whatever order worker processes finish
+documents, so every ``(doc_id, section_number)`` point lookup —
+``CorpusIndex.get_section_text``, ``get_clauses``, ``get_section_features``
+and friends — has to consult row groups from all over the file.  This
+stage rewrites each table physically sorted by ``(doc_id, char_start)``
+(clauses by ``span_start``; text/feature tables follow their parent
+section's position), which makes DuckDB's per-row-group min/max zone maps
+on ``doc_id`` prune nearly every row group, and adds ART indexes on the
+lookup keys.
+
+Tables are rebuilt with their original DDL (so primary keys survive), then
+swapped in by rename.  The stage is idempotent and safe to rerun after an
+incremental build appends rows out of order.
+
+Functions:
+
+* ``optimize_corpus_layout`` — sort + index all present corpus tables.
+* ``corpus_layout_plan`` — the ``(table, order_by, indexes)`` plan.
+"""
+from __future__ import annotations
+
+import re
+import sys
+from collections.abc import Collection
+from dataclasses import dataclass
+from typing import Any
+
+
+@dataclass(frozen=True, slots=True)
+class TableLayout:
+    """Sort order and secondary indexes for one corpus table.
+
+    ``order_by`` is a SELECT suffix over the table aliased ``t``; ``join``
+    optionally brings in the parent table (aliased ``p``) whose position
+    defines the order of rows that carry no offsets of their own.
+    """
+
+    table: str
+    order_by: str
+    indexes: tuple[tuple[str, tuple[str, ...]], ...] = ()
+    join: str = ""
+
+
+_LAYOUTS: tuple[TableLayout, ...] = (
+    TableLayout("documents", "t.doc_id"),
+    TableLayout("articles", "t.doc_id, t.char_start, t.article_num"),
+    TableLayout(
+        "sections",
+        "t.doc_id, t.char_start, t.section_number",
+        indexes=(("idx_sections_doc", ("doc_id",)),),
+    ),
+    TableLayout(
+        "section_text",
+        "t.doc_id, p.char_start, t.section_number",
+        indexes=(("idx_section_text_doc", ("doc_id",)),),
+        join=(
+            "LEFT JOIN sections p "
+            "ON p.doc_id = t.doc_id AND p.section_number = t.section_number"
+        ),
+    ),
+    TableLayout(
+        "section_features",
+        "t.doc_id, t.char_start, t.section_number",
+        indexes=(("idx_section_features_doc", ("doc_id",)),),
+    ),
+    TableLayout(
+        "clauses",
+        "t.doc_id, t.span_start, t.section_number, t.clause_id",
+        indexes=(("idx_clauses_doc", ("doc_id",)),),
+    ),
+    TableLayout(
+        "clause_features",
+        "t.doc_id, p.span_start, t.section_number, t.clause_id",
+        indexes=(("idx_clause_features_doc", ("doc_id",)),),
+        join=(
+            "LEFT JOIN clauses p ON p.doc_id = t.doc_id "
+            "AND p.section_number = t.section_number AND p.clause_id = t.clause_id"
+        ),
+    ),
+    TableLayout(
+        "definitions",
+        "t.doc_id, t.char_start, t.term",
+        indexes=(("idx_definitions_doc", ("doc_id",)),),
+    ),
+)
+
+
+def corpus_layout_plan() -> tuple[TableLayout, ...]:
+    """Tables rewritten by ``optimize_corpus_layout``, in rewrite order."""
+    return _LAYOUTS
+
+
+def _table_ddl(conn: Any, table: str) -> str | None:
+    row = conn.execute(
+        "SELECT sql FROM duckdb_tables() "
+        "WHERE table_name = ? AND schema_name = current_schema()",
+        [table],
+    ).fetchone()
+    return str(row[0]) if row and row[0] else None
+
+
+def _rewrite_sorted(conn: Any, layout: TableLayout, ddl: str) -> int:
+    staging = f"_{layout.table}_sorted"
+    staging_ddl, n = re.subn(
+        rf'^CREATE TABLE\s+(?:"?{re.escape(layout.table)}"?)',
+        f"CREATE TABLE {staging}",
+        ddl.strip(),
+        count=1,
+    )
+    if n != 1:
+        raise ValueError(f"Unexpected DDL for {layout.table}: {ddl[:80]}")
+    conn.execute("BEGIN")
+    try:
+        conn.execute(f"DROP TABLE IF EXISTS {staging}")
+        conn.execute(staging_ddl)
+        conn.execute(
+            f"INSERT INTO {staging} SELECT t.* FROM {layout.table} t {layout.join} "
+            f"ORDER BY {layout.order_by}"
+        )
+        conn.execute(f"DROP TABLE {layout.table}")
+        conn.execute(f"ALTER TABLE {staging} RENAME TO {layout.table}")
+        conn.execute("COMMIT")
+    except Exception:
+        conn.execute("ROLLBACK")
+        raise
+    row = conn.execute(f"SELECT COUNT(*) FROM {layout.table}").fetchone()
+    return int(row[0]) if row else 0
+
+
+def optimize_corpus_layout(
+    conn: Any,
+    *,
+    tables: Collection[str] | None = None,
+    verbose: bool = False,
+) -> dict[str, int]:
+    """Sort corpus tables by document position and create lookup indexes.
+
+    Parameters
+    ----------
+    conn:
+        Writable DuckDB connection to a corpus database.
+    tables:
+        Only rewrite these tables (default: every table in the layout plan).
+    verbose:
+        Print one progress line per table to stderr.
+
+    Returns
+    -------
+    dict[str, int]
+        Row count per rewritten table (tables absent from the DB are skipped).
+    """
+    rewritten: dict[str, int] = {}
+    for layout in _LAYOUTS:
+        if tables is not None and layout.table not in tables:
+            continue
+        ddl = _table_ddl(conn, layout.table)
+        if ddl is None:
+            continue
+        rewritten[layout.table] = _rewrite_sorted(conn, layout, ddl)
+        for name, columns in layout.indexes:
+            conn.execute(
+                f"CREATE INDEX IF NOT EXISTS {name} ON {layout.table} ({', '.join(columns)})"
+            )
+        if verbose:
+            print(
+                f"  optimize: {layout.table} sorted ({rewritten[layout.table]} rows)",
+                file=sys.stderr,
+            )
+    conn.execute("CHECKPOINT")
+    return rewritten
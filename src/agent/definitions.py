@@ -528,6 +528,23 @@ def extract_definitions(
     return annotated
 
 
+def extract_span_definitions(
+    text: str,
+    span: tuple[int, int] | None,
+) -> list[DefinedTerm]:
+    """Run ``extract_definitions`` over ``text[start:end]`` only.
+
+    *span* is typically ``DocOutline.definitions_span`` — the definitions
+    article the outline already located — so the five engines scan that
+    article instead of the whole document.  Offsets are global.  Falls back
+    to the full text when *span* is None.
+    """
+    if span is None:
+        return extract_definitions(text)
+    start, end = span
+    return extract_definitions(text[start:end], global_offset=start)
+
+
 def find_term(text: str, term: str) -> DefinedTerm | None:
     """Find a specific defined term in text. Returns None if not found."""
     all_defs = extract_definitions(text)
@@ -5,6 +5,11 @@ distinguish concept sections from background text. Uses Monroe et al. (2008)
 log-odds ratio with informative Dirichlet prior combined with TF-IDF
 percentile ranking.
 
+Scoring works on :class:`NgramCounts` (document and term frequencies of a
+set of sections), so the background can come from tokenized texts
+(:func:`count_ngrams`) or from the corpus-wide ``ngram_df`` table
+(:mod:`agent.ngram_df`) without tokenizing any background section.
+
 Ported from vantage_platform/l1/discovery/section_analyzer.py.
 """
 from __future__ import annotations
@@ -12,6 +17,7 @@ from __future__ import annotations
 import math
 import re
 from collections import Counter
+from collections.abc import Mapping
 from dataclasses import dataclass
 
 
@@ -40,6 +46,22 @@ class DnaCandidate:
     rejection_reason: str       # "" if passed; e.g., "section_rate<0.20"
 
 
+@dataclass(frozen=True, slots=True)
+class NgramCounts:
+    """N-gram statistics of a set of sections.
+
+    ``df`` is the number of sections containing each n-gram, ``tf`` its
+    total occurrences and ``total`` the occurrences of all n-grams (the
+    log-odds denominator).  ``df``/``tf`` may be restricted to the phrases
+    being scored; ``docs`` and ``total`` always cover the whole set.
+    """
+
+    docs: int
+    df: Mapping[str, int]
+    tf: Mapping[str, int]
+    total: int
+
+
 @dataclass(frozen=True, slots=True)
 class FamilyProfile:
     """Family-level orchestration summary for DNA candidate quality."""
@@ -94,48 +116,73 @@ def discover_dna_phrases(
     if not target_texts:
         return []
 
-    # Step 1: Build n-gram document frequency maps
-    min_n, max_n = ngram_range
-    target_ngrams = [_extract_ngrams(t, min_n, max_n) for t in target_texts]
-    bg_ngrams = [_extract_ngrams(t, min_n, max_n) for t in background_texts]
-
-    # Step 2: Compute document frequency
-    target_df: Counter[str] = Counter()
-    for ngrams in target_ngrams:
-        for ng in set(ngrams):
-            target_df[ng] += 1
+    # Steps 1-2: n-gram document and term frequencies
+    return rank_dna_phrases(
+        count_ngrams(target_texts, ngram_range),
+        count_ngrams(background_texts, ngram_range),
+        min_section_rate=min_section_rate,
+        max_bg_rate=max_bg_rate,
+        alpha=alpha,
+        tfidf_weight=tfidf_weight,
+        top_k=top_k,
+    )
 
-    bg_df: Counter[str] = Counter()
-    for ngrams in bg_ngrams:
-        for ng in set(ngrams):
-            bg_df[ng] += 1
 
-    n_target = len(target_texts)
-    n_bg = max(len(background_texts), 1)
+def count_ngrams(
+    texts: list[str],
+    ngram_range: tuple[int, int] = (1, 3),
+) -> NgramCounts:
+    """Document / term frequencies of the word n-grams in *texts*."""
+    min_n, max_n = ngram_range
+    df: Counter[str] = Counter()
+    tf: Counter[str] = Counter()
+    for text in texts:
+        ngrams = extract_ngrams(text, min_n, max_n)
+        tf.update(ngrams)
+        df.update(set(ngrams))
+    return NgramCounts(docs=len(texts), df=df, tf=tf, total=sum(tf.values()))
+
+
+def rank_dna_phrases(
+    target: NgramCounts,
+    background: NgramCounts,
+    *,
+    min_section_rate: float = DEFAULT_MIN_SECTION_RATE,
+    max_bg_rate: float = DEFAULT_MAX_BG_RATE,
+    alpha: float = DEFAULT_ALPHA,
+    tfidf_weight: float = DEFAULT_TFIDF_WEIGHT,
+    top_k: int = DEFAULT_TOP_K,
+) -> list[DnaCandidate]:
+    """Steps 3-7 of :func:`discover_dna_phrases` on precomputed counts.
 
-    # Step 3: Compute TF-IDF and log-odds for each candidate
-    all_target_ngrams: Counter[str] = Counter()
-    for ngrams in target_ngrams:
-        all_target_ngrams.update(ngrams)
+    Every n-gram in ``target.tf`` is a candidate; *background* only needs
+    ``df``/``tf`` entries for those n-grams.
+    """
+    if not target.docs:
+        return []
 
-    all_bg_ngrams: Counter[str] = Counter()
-    for ngrams in bg_ngrams:
-        all_bg_ngrams.update(ngrams)
+    target_df = target.df
+    bg_df = background.df
+    all_target_ngrams = target.tf
+    all_bg_ngrams = background.tf
+    n_target = target.docs
+    n_bg = max(background.docs, 1)
 
-    total_target_tokens = sum(all_target_ngrams.values()) or 1
-    total_bg_tokens = sum(all_bg_ngrams.values()) or 1
+    # Step 3: Compute TF-IDF and log-odds for each candidate
+    total_target_tokens = target.total or 1
+    total_bg_tokens = background.total or 1
     total_docs = n_target + n_bg
 
     candidates: dict[str, dict[str, float]] = {}
 
     for phrase, tf_count in all_target_ngrams.items():
-        df = target_df[phrase] + bg_df.get(phrase, 0)
+        df = target_df.get(phrase, 0) + bg_df.get(phrase, 0)
         idf = math.log(total_docs / (1 + df))
         tf = tf_count / total_target_tokens
         tfidf = tf * idf
 
         # Monroe et al. (2008) log-odds ratio with Dirichlet prior
-        y_target = all_target_ngrams[phrase]
+        y_target = tf_count
         y_bg = all_bg_ngrams.get(phrase, 0)
         n_t = total_target_tokens
         n_b = total_bg_tokens
@@ -146,7 +193,7 @@ def discover_dna_phrases(
             - math.log((y_bg + alpha) / (n_b + alpha * total_docs))
         )
 
-        sec_rate = target_df[phrase] / n_target
+        sec_rate = target_df.get(phrase, 0) / n_target
         bg_rate = bg_df.get(phrase, 0) / n_bg
 
         candidates[phrase] = {
@@ -213,7 +260,7 @@ def discover_dna_phrases(
     return passed[:top_k]
 
 
-def _extract_ngrams(text: str, min_n: int, max_n: int) -> list[str]:
+def extract_ngrams(text: str, min_n: int, max_n: int) -> list[str]:
     """Extract word n-grams from text."""
     words = _tokenize(text)
     ngrams: list[str] = []
@@ -1044,7 +1044,7 @@ class DocOutline:
     """
     __slots__ = (
         "_text", "_filename",
-        "_articles", "_sections", "_definitions",
+        "_articles", "_sections", "_definitions", "_definitions_span",
         "_synthetic_article_nums",
         "_article_by_num", "_section_by_num", "_def_by_name",
         "_sorted_section_starts", "_sorted_section_nums",
@@ -1065,6 +1065,7 @@ class DocOutline:
 
         # Phase 3: definition index
         self._definitions: list[_DefinitionEntry] = []
+        self._definitions_span: tuple[int, int] | None = None
         self._def_by_name: dict[str, _DefinitionEntry] = {}
         self._synthetic_article_nums: set[int] = set()
 
@@ -2348,6 +2349,7 @@ class DocOutline:
         if not def_article:
             return
 
+        self._definitions_span = (def_article.char_start, def_article.char_end)
         text_slice = self._text[def_article.char_start:def_article.char_end]
 
         for m in _DEF_RE.finditer(text_slice):
@@ -2576,6 +2578,15 @@ class DocOutline:
         """All defined term names found in the definitions article."""
         return [d.term_name for d in self._definitions]
 
+    @property
+    def definitions_span(self) -> tuple[int, int] | None:
+        """``(char_start, char_end)`` of the span the definition index scanned.
+
+        The definitions article, or the section / leading text inferred to
+        hold the definitions; None when no definitions span was found.
+        """
+        return self._definitions_span
+
     # ── Public API: cross-reference resolution ─────────────────
 
     def resolve_xref(self, ref: str) -> Ok[XrefSpan] | Err[XrefResolutionError]:
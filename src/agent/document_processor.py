@@ -13,11 +13,15 @@ section_features, clause_features).
 from __future__ import annotations
 
 import hashlib
+import heapq
 import json
+import os
 import re
 import sys
+import time
+from collections.abc import Callable
 from dataclasses import dataclass
-from pathlib import PurePosixPath
+from pathlib import Path, PurePosixPath
 from typing import Any
 
 from agent.classifier import (
@@ -26,9 +30,9 @@ from agent.classifier import (
     extract_classification_signals,
 )
 from agent.clause_parser import ClauseNode, parse_clauses
-from agent.definitions import DefinedTerm, extract_definitions
+from agent.definitions import DefinedTerm, extract_span_definitions
 from agent.doc_parser import DocOutline
-from agent.html_utils import normalize_html, strip_html
+from agent.html_utils import normalize_html
 from agent.materialized_features import build_clause_feature, build_section_feature
 from agent.metadata import (
     extract_admin_agent,
@@ -257,6 +261,237 @@ class DocumentResult:
         }
 
 
+# ---------------------------------------------------------------------------
+# Opt-in stage profiling
+# ---------------------------------------------------------------------------
+
+# Stages of process_document_text, in pipeline order.
+PIPELINE_STAGES: tuple[str, ...] = (
+    "normalize_html",
+    "classify",
+    "outline",
+    "definitions",
+    "clauses",
+    "metadata",
+    "records",
+    "features",
+)
+# Counters recorded per document.
+_PROFILE_COUNTERS: tuple[str, ...] = (
+    "text_length", "sections", "clauses", "definitions",
+)
+
+
+def _no_lap(_stage: str) -> None:
+    return None
+
+
+class PipelineProfiler:
+    """Opt-in per-stage timers and counters for :func:`process_document_text`.
+
+    Pass one to ``process_document_text(profiler=...)``; every document it
+    processes yields a timing record (``last_timing``) with seconds per
+    :data:`PIPELINE_STAGES` entry, the document's counters and the worker
+    pid.  Records are plain dicts so they can cross process boundaries;
+    the build drivers ship them back with each result and fold them into
+    one profiler with :meth:`add_timing`.
+
+    :meth:`summary` aggregates stage totals, per-worker totals and the
+    slowest documents with their stage breakdown (for the run manifest);
+    :meth:`folded_stacks` renders stage totals in the collapsed-stack
+    format flamegraph tools read.
+
+    With *cprofile_over_sec*, a document slower than that is re-run under
+    ``cProfile`` and its stats dumped to *cprofile_dir* (at most
+    *max_cprofiles* per profiler, i.e. per worker).
+    """
+
+    def __init__(
+        self,
+        *,
+        slowest_n: int = 20,
+        cprofile_over_sec: float | None = None,
+        cprofile_dir: Path | None = None,
+        max_cprofiles: int = 5,
+    ) -> None:
+        self.slowest_n = max(0, slowest_n)
+        self.cprofile_over_sec = cprofile_over_sec
+        self.cprofile_dir = cprofile_dir
+        self.max_cprofiles = max_cprofiles
+        self.last_timing: dict[str, Any] | None = None
+        self._cprofiles_written = 0
+        self._docs = 0
+        self._total_sec = 0.0
+        self._stage_sec: dict[str, float] = dict.fromkeys(PIPELINE_STAGES, 0.0)
+        self._stage_max: dict[str, float] = dict.fromkeys(PIPELINE_STAGES, 0.0)
+        self._counters: dict[str, int] = dict.fromkeys(_PROFILE_COUNTERS, 0)
+        self._workers: dict[str, dict[str, float]] = {}
+        self._slowest: list[tuple[float, int, dict[str, Any]]] = []
+        self._current: dict[str, float] = {}
+        self._lap_start = 0.0
+
+    def config(self) -> dict[str, Any]:
+        """Constructor arguments, for building a worker-side profiler."""
+        return {
+            "slowest_n": self.slowest_n,
+            "cprofile_over_sec": self.cprofile_over_sec,
+            "cprofile_dir": self.cprofile_dir,
+            "max_cprofiles": self.max_cprofiles,
+        }
+
+    # ── Timing one document ─────────────────────────────────────
+
+    def profile_document(
+        self,
+        key: str,
+        process: Callable[[Callable[[str], None], list[int]], DocumentResult | None],
+        rerun: Callable[[], object],
+    ) -> DocumentResult | None:
+        """Time one document through *process* and record its timing.
+
+        ``process(lap, text_length_out)`` runs the pipeline, calling *lap*
+        after each stage and storing the normalized text length in
+        ``text_length_out[0]``.  If the document qualifies for cProfile,
+        *rerun* repeats it (untimed) under the profiler.
+        """
+        text_length = [0]
+        self._begin()
+        result = process(self.lap, text_length)
+        timing = self._end(key, result, text_length[0])
+        if self._should_cprofile(timing["total_sec"]):
+            timing["cprofile"] = self._write_cprofile(key, rerun)
+        return result
+
+    def _begin(self) -> None:
+        self._current = dict.fromkeys(PIPELINE_STAGES, 0.0)
+        self._lap_start = time.perf_counter()
+
+    def lap(self, stage: str) -> None:
+        """Attribute the time since the previous lap to *stage*."""
+        now = time.perf_counter()
+        self._current[stage] = self._current.get(stage, 0.0) + now - self._lap_start
+        self._lap_start = now
+
+    def _end(self, key: str, result: DocumentResult | None, text_length: int) -> dict[str, Any]:
+        stages = {name: round(sec, 6) for name, sec in self._current.items()}
+        timing: dict[str, Any] = {
+            "key": key,
+            "worker": os.getpid(),
+            "total_sec": round(sum(self._current.values()), 6),
+            "stages": stages,
+            "counters": {
+                "text_length": text_length,
+                "sections": len(result.sections) if result else 0,
+                "clauses": len(result.clauses) if result else 0,
+                "definitions": len(result.definitions) if result else 0,
+            },
+        }
+        self.last_timing = timing
+        self.add_timing(timing)
+        return timing
+
+    def _should_cprofile(self, total_sec: float) -> bool:
+        return (
+            self.cprofile_over_sec is not None
+            and self.cprofile_dir is not None
+            and total_sec >= self.cprofile_over_sec
+            and self._cprofiles_written < self.max_cprofiles
+        )
+
+    def _write_cprofile(self, key: str, run: Any) -> str:
+        import cProfile
+
+        assert self.cprofile_dir is not None
+        self.cprofile_dir.mkdir(parents=True, exist_ok=True)
+        safe = re.sub(r"[^A-Za-z0-9._-]+", "_", key).strip("_")[-120:] or "doc"
+        out = self.cprofile_dir / f"{safe}.{os.getpid()}.prof"
+        prof = cProfile.Profile()
+        prof.runcall(run)
+        prof.dump_stats(str(out))
+        self._cprofiles_written += 1
+        return str(out)
+
+    # ── Aggregation ─────────────────────────────────────────────
+
+    def add_timing(self, timing: dict[str, Any]) -> None:
+        """Fold one document timing record (possibly from another process) in."""
+        total = float(timing.get("total_sec", 0.0))
+        self._docs += 1
+        self._total_sec += total
+        for name, sec in (timing.get("stages") or {}).items():
+            self._stage_sec[name] = self._stage_sec.get(name, 0.0) + float(sec)
+            self._stage_max[name] = max(self._stage_max.get(name, 0.0), float(sec))
+        for name, value in (timing.get("counters") or {}).items():
+            self._counters[name] = self._counters.get(name, 0) + int(value)
+        worker = self._workers.setdefault(
+            str(timing.get("worker", "")), {"docs": 0, "total_sec": 0.0},
+        )
+        worker["docs"] += 1
+        worker["total_sec"] += total
+        if self.slowest_n:
+            entry = (total, self._docs, timing)
+            if len(self._slowest) < self.slowest_n:
+                heapq.heappush(self._slowest, entry)
+            elif total > self._slowest[0][0]:
+                heapq.heapreplace(self._slowest, entry)
+
+    def slowest(self) -> list[dict[str, Any]]:
+        """The slowest documents, slowest first, with their stage breakdown."""
+        return [t for _total, _seq, t in sorted(self._slowest, key=lambda e: (-e[0], e[1]))]
+
+    def summary(self) -> dict[str, Any]:
+        """JSON-ready aggregate for the run manifest."""
+        total = self._total_sec
+        return {
+            "docs": self._docs,
+            "total_sec": round(total, 3),
+            "mean_doc_sec": round(total / self._docs, 6) if self._docs else 0.0,
+            "stages": {
+                name: {
+                    "total_sec": round(sec, 3),
+                    "share": round(sec / total, 4) if total else 0.0,
+                    "max_sec": round(self._stage_max.get(name, 0.0), 6),
+                }
+                for name, sec in self._stage_sec.items()
+            },
+            "counters": dict(self._counters),
+            "workers": {
+                pid: {"docs": int(w["docs"]), "total_sec": round(w["total_sec"], 3)}
+                for pid, w in sorted(self._workers.items())
+            },
+            "slowest_docs": self.slowest(),
+        }
+
+    def folded_stacks(self) -> str:
+        """Stage totals as collapsed stacks (``frame;frame microseconds``)."""
+        return "".join(
+            f"process_document_text;{name} {round(sec * 1_000_000)}\n"
+            for name, sec in self._stage_sec.items()
+            if sec > 0
+        )
+
+    def report(self) -> str:
+        """Human-readable stage table and slowest-documents list."""
+        summary = self.summary()
+        lines = [
+            f"Pipeline stages ({summary['docs']} docs, {summary['total_sec']:.1f}s):",
+        ]
+        for name, stage in sorted(
+            summary["stages"].items(), key=lambda kv: -kv[1]["total_sec"],
+        ):
+            lines.append(
+                f"  {name:<15} {stage['total_sec']:>10.2f}s {stage['share']:>7.1%}"
+                f"  max {stage['max_sec']:.3f}s"
+            )
+        if summary["slowest_docs"]:
+            lines.append("Slowest documents:")
+        for timing in summary["slowest_docs"]:
+            top = sorted(timing["stages"].items(), key=lambda kv: -kv[1])[:3]
+            breakdown = ", ".join(f"{name} {sec:.2f}s" for name, sec in top)
+            lines.append(f"  {timing['total_sec']:>8.2f}s  {timing['key']}  ({breakdown})")
+        return "\n".join(lines)
+
+
 # ---------------------------------------------------------------------------
 # Core processing function
 # ---------------------------------------------------------------------------
@@ -269,6 +504,7 @@ def process_document_text(
     filename: str,
     sidecar: SidecarMetadata | None = None,
     cohort_only_nlp: bool = False,
+    profiler: PipelineProfiler | None = None,
 ) -> DocumentResult | None:
     """Process an HTML document through the shared NLP pipeline.
 
@@ -281,30 +517,80 @@ def process_document_text(
         filename: Basename of the file (used for classification, filing date).
         sidecar: Optional metadata sidecar (company_name, cik, accession).
         cohort_only_nlp: If True, skip expensive NLP for non-cohort documents
-            (section parsing, clause parsing, definitions, metadata extraction).
-            Non-cohort docs still get classification and basic counts.
+            (section records, clause parsing, definitions records, metadata
+            extraction).  Non-cohort docs still get the outline and
+            definitions-span scan that classification counts from, the
+            classification itself and basic counts.
+        profiler: Optional :class:`PipelineProfiler`; records per-stage
+            timings for this document (``profiler.last_timing``).
 
     Returns:
         A DocumentResult with all 7 record lists, or None on empty/short input.
     """
-    # Step 1: Strip HTML for text length check
-    text = strip_html(html)
-    if not text or len(text) < 100:
-        return None
+    if profiler is None:
+        return _process_document_text(
+            html=html, path_or_key=path_or_key, filename=filename,
+            sidecar=sidecar, cohort_only_nlp=cohort_only_nlp, lap=_no_lap,
+        )
+    return profiler.profile_document(
+        path_or_key,
+        lambda lap, text_length_out: _process_document_text(
+            html=html, path_or_key=path_or_key, filename=filename,
+            sidecar=sidecar, cohort_only_nlp=cohort_only_nlp,
+            lap=lap, text_length_out=text_length_out,
+        ),
+        lambda: _process_document_text(
+            html=html, path_or_key=path_or_key, filename=filename,
+            sidecar=sidecar, cohort_only_nlp=cohort_only_nlp, lap=_no_lap,
+        ),
+    )
+
 
-    # Step 2: Normalize HTML
+def _process_document_text(
+    *,
+    html: str,
+    path_or_key: str,
+    filename: str,
+    sidecar: SidecarMetadata | None,
+    cohort_only_nlp: bool,
+    lap: Callable[[str], None],
+    text_length_out: list[int] | None = None,
+) -> DocumentResult | None:
+    """Body of :func:`process_document_text`; *lap* marks stage boundaries."""
+    # Steps 1-2: Normalize HTML; the normalized text doubles as the
+    # length check (same text strip_html would produce)
     normalized_text, _inverse_map = normalize_html(html)
+    lap("normalize_html")
+    if text_length_out is not None:
+        text_length_out[0] = len(normalized_text)
+    if len(normalized_text) < 100:
+        return None
 
     # Step 3: Content-addressed doc_id
     doc_id = compute_doc_id(normalized_text)
 
+    # Steps 6 + 8 (run first): parse the outline and extract definitions from
+    # its definitions span.  That one extraction feeds the definitions table
+    # and the classifier's definition count, in both pipeline modes, so a
+    # document classifies the same with or without cohort_only_nlp.
+    outline = DocOutline.from_text(normalized_text, filename=filename)
+    lap("outline")
+    definitions: list[DefinedTerm] = extract_span_definitions(
+        normalized_text, outline.definitions_span,
+    )
+    lap("definitions")
+
     # Step 4: Classification (runs for ALL documents)
-    signals = extract_classification_signals(normalized_text, filename)
+    signals = extract_classification_signals(
+        normalized_text, filename,
+        definition_count=len({d.term.lower() for d in definitions}),
+    )
     doc_type, dt_confidence, _dt_reasons = classify_document_type(
         filename, signals,
     )
     market_segment, seg_confidence, _seg_reasons = classify_market_segment(signals)
     cohort = is_cohort_included(doc_type, dt_confidence, market_segment, seg_confidence)
+    lap("classify")
 
     # Step 5: CIK + accession from path, optionally overridden by sidecar
     cik = extract_cik(path_or_key)
@@ -360,8 +646,7 @@ def process_document_text(
 
     # --- FULL NLP PIPELINE ---
 
-    # Step 6: Parse outline (articles and sections)
-    outline = DocOutline.from_text(normalized_text, filename=filename)
+    # Step 6: Sections from the outline parsed above
     all_sections: list[OutlineSection] = outline.sections
     section_parser_mode = "doc_outline"
     section_fallback_used = False
@@ -390,6 +675,7 @@ def process_document_text(
         }
         for a in outline.articles
     ]
+    lap("outline")
 
     # Step 7: Parse clauses per section
     all_clauses: list[tuple[str, ClauseNode]] = []
@@ -425,9 +711,7 @@ def process_document_text(
                 all_clauses = fallback_clauses
                 section_parser_mode = "regex_fallback"
                 section_fallback_used = True
-
-    # Step 8: Extract definitions
-    definitions: list[DefinedTerm] = extract_definitions(normalized_text)
+    lap("clauses")
 
     # Step 9: Metadata extraction
     borrower_info = extract_borrower(normalized_text)
@@ -451,6 +735,7 @@ def process_document_text(
     effective_date_info = extract_effective_date(normalized_text)
     effective_date = normalize_date_value(effective_date_info.get("closing_date"))
     filing_date = normalize_date_value(extract_filing_date(filename))
+    lap("metadata")
 
     # Step 10: Build document record
     doc_record = {
@@ -506,6 +791,7 @@ def process_document_text(
                 "text": sec_text,
             }
         )
+        lap("records")
         section_feature_records.append(
             build_section_feature(
                 doc_id=doc_id,
@@ -518,6 +804,7 @@ def process_document_text(
                 word_count=section.word_count,
             )
         )
+        lap("features")
 
     # Step 12: Build clause records
     clause_records: list[dict[str, Any]] = []
@@ -543,6 +830,7 @@ def process_document_text(
                 "parse_confidence": clause.parse_confidence,
             }
         )
+        lap("records")
         clause_feature_records.append(
             build_clause_feature(
                 doc_id=doc_id,
@@ -555,6 +843,7 @@ def process_document_text(
                 is_structural=clause.is_structural_candidate,
             )
         )
+        lap("features")
 
     # Step 13: Build definition records
     def_records: list[dict[str, Any]] = []
@@ -581,6 +870,7 @@ def process_document_text(
                 ),
             }
         )
+    lap("records")
 
     return DocumentResult(
         doc=doc_record,
@@ -0,0 +1,316 @@
+"""Drift checks of published link rules against their promoted baselines.
+
+A rule's *profile* summarizes its active links: link counts by confidence
+tier, a confidence histogram, link counts by (normalized) heading and the
+per-template hit rate — the share of a template family's documents that
+carry at least one link.  The statistics come from one grouped scan of
+``family_links`` for all rules (``LinkStore.rule_drift_stats``); profiles
+are compared against the latest ``rule_baselines`` row of each rule:
+
+* **Template cells** — a chi-squared test of baseline vs current hit /
+  miss counts per template (one 2x2 table per template, summed); drift
+  when it is significant and a cell moved by at least ``MIN_CELL_DELTA``.
+* **Heading churn** — total variation distance between the baseline and
+  current heading distributions.
+* **Overall hit rate** — linked documents over corpus documents.
+
+Every comparison is written to ``drift_checks``; detected drift also
+raises a ``drift_alerts`` row.  A rule without a baseline is reported as
+``status="no_baseline"``; only with ``promote_missing=True`` (and the corpus
+available to supply template totals) is its current profile promoted as the
+baseline, which its summary says (``status="baseline_created"`` and a
+``message``) instead of reporting a clean check.
+
+Baseline profiles written before this module existed are flat
+``{template_family: hit_rate}`` maps; they are read as template cells.
+
+Functions:
+
+* ``build_profile`` — profile dict from ``rule_drift_stats`` output.
+* ``compare_profiles`` — ``DriftComparison`` of a profile against a baseline.
+* ``chi2_sf`` — chi-squared p-value of a statistic.
+* ``run_drift_checks`` — check a batch of rules and persist the results.
+"""
+from __future__ import annotations
+
+import json
+import math
+import uuid
+from collections import Counter
+from collections.abc import Callable, Mapping, Sequence
+from dataclasses import dataclass
+from typing import Any
+
+# Template test: chi-squared p-value and minimum hit-rate move of one cell.
+DRIFT_P_VALUE = 0.01
+MIN_CELL_DELTA = 0.05
+# Heading distribution total variation distance that counts as drift.
+HEADING_CHURN_THRESHOLD = 0.25
+# Cell delta / churn at which an alert is critical rather than a warning.
+CRITICAL_CELL_DELTA = 0.15
+CRITICAL_HEADING_CHURN = 0.5
+
+_PROFILE_KEYS = frozenset({"templates", "headings", "tiers", "confidence_histogram"})
+
+
+@dataclass(frozen=True, slots=True)
+class DriftComparison:
+    overall_hit_rate: float
+    chi2_statistic: float
+    p_value: float
+    max_cell_delta: float
+    heading_churn: float
+    cells_affected: tuple[str, ...]
+    drift_detected: bool
+    severity: str | None
+    message: str
+
+
+def build_profile(
+    stats: Mapping[str, Any],
+    template_docs: Mapping[str, int],
+    total_docs: int,
+) -> dict[str, Any]:
+    """Profile of one rule from its ``LinkStore.rule_drift_stats`` entry.
+
+    *template_docs* maps template family to corpus document count and
+    *total_docs* is the corpus document count (0 when unknown).
+    """
+    hits = stats.get("templates") or {}
+    doc_count = int(stats.get("doc_count", 0))
+    return {
+        "link_count": int(stats.get("link_count", 0)),
+        "doc_count": doc_count,
+        "total_docs": total_docs,
+        "overall_hit_rate": round(doc_count / total_docs, 6) if total_docs else 0.0,
+        "tiers": dict(stats.get("tiers") or {}),
+        "confidence_histogram": dict(stats.get("confidence_histogram") or {}),
+        "headings": dict(stats.get("headings") or {}),
+        "templates": {
+            template: round(int(hits.get(template, 0)) / count, 6)
+            for template, count in sorted(template_docs.items())
+            if count > 0
+        },
+        "template_docs": {
+            template: int(count) for template, count in sorted(template_docs.items()) if count > 0
+        },
+    }
+
+
+def baseline_profile(baseline: Mapping[str, Any]) -> dict[str, Any]:
+    """Decoded ``profile_json`` of a ``rule_baselines`` row."""
+    raw = baseline.get("profile_json") or "{}"
+    profile = json.loads(raw) if isinstance(raw, str) else dict(raw)
+    if not isinstance(profile, dict):
+        return {}
+    if profile and not _PROFILE_KEYS & profile.keys():
+        return {"templates": {str(k): float(v) for k, v in profile.items()}}
+    return profile
+
+
+def heading_churn(base: Mapping[str, int], current: Mapping[str, int]) -> float:
+    """Total variation distance of two heading count maps (0 when either is empty)."""
+    base_total = sum(base.values())
+    current_total = sum(current.values())
+    if not base_total or not current_total:
+        return 0.0
+    return 0.5 * sum(
+        abs(base.get(key, 0) / base_total - current.get(key, 0) / current_total)
+        for key in base.keys() | current.keys()
+    )
+
+
+def compare_profiles(
+    baseline: Mapping[str, Any],
+    profile: Mapping[str, Any],
+    template_docs: Mapping[str, int],
+) -> DriftComparison:
+    """Compare a rule *profile* with its ``rule_baselines`` row."""
+    base = baseline_profile(baseline)
+    base_rates: Mapping[str, float] = base.get("templates") or {}
+    base_docs: Mapping[str, int] = base.get("template_docs") or template_docs
+    current_rates: Mapping[str, float] = profile.get("templates") or {}
+
+    statistic = 0.0
+    dof = 0
+    deltas: dict[str, float] = {}
+    for template, base_rate in base_rates.items():
+        n_current = int(template_docs.get(template, 0))
+        n_base = int(base_docs.get(template, 0))
+        if n_current <= 0 or n_base <= 0:
+            continue
+        current_rate = float(current_rates.get(template, 0.0))
+        deltas[template] = abs(current_rate - float(base_rate))
+        cell = _two_by_two_chi2(
+            round(float(base_rate) * n_base), n_base, round(current_rate * n_current), n_current,
+        )
+        if cell is not None:
+            statistic += cell
+            dof += 1
+    p_value = chi2_sf(statistic, dof) if dof else 1.0
+    max_cell_delta = max(deltas.values(), default=0.0)
+    cells_affected = tuple(
+        template for template, delta in sorted(deltas.items(), key=lambda kv: -kv[1])
+        if delta >= MIN_CELL_DELTA
+    )
+
+    overall = float(profile.get("overall_hit_rate", 0.0))
+    overall_delta = abs(overall - float(baseline.get("overall_hit_rate") or 0.0))
+    churn = heading_churn(base.get("headings") or {}, profile.get("headings") or {})
+
+    reasons: list[str] = []
+    if p_value < DRIFT_P_VALUE and max_cell_delta >= MIN_CELL_DELTA:
+        reasons.append(
+            f"{len(cells_affected)} template(s) moved up to {max_cell_delta:.0%} "
+            f"(chi2={statistic:.1f}, p={p_value:.2g})"
+        )
+    if churn >= HEADING_CHURN_THRESHOLD:
+        reasons.append(f"heading churn {churn:.0%}")
+    if profile.get("total_docs") and overall_delta >= MIN_CELL_DELTA:
+        reasons.append(f"hit rate moved {overall_delta:.0%}")
+    severity: str | None = None
+    if reasons:
+        critical = (
+            max_cell_delta >= CRITICAL_CELL_DELTA
+            or churn >= CRITICAL_HEADING_CHURN
+            or overall_delta >= CRITICAL_CELL_DELTA
+        )
+        severity = "critical" if critical else "warning"
+    return DriftComparison(
+        overall_hit_rate=overall,
+        chi2_statistic=round(statistic, 6),
+        p_value=p_value,
+        max_cell_delta=round(max_cell_delta, 6),
+        heading_churn=round(churn, 6),
+        cells_affected=cells_affected,
+        drift_detected=bool(reasons),
+        severity=severity,
+        message="; ".join(reasons),
+    )
+
+
+def chi2_sf(statistic: float, dof: int) -> float:
+    """Survival function (p-value) of the chi-squared distribution.
+
+    Closed form of the regularized upper gamma function ``Q(dof/2, x/2)``
+    for integer degrees of freedom, summed in log space so large statistics
+    underflow to 0 instead of overflowing.
+    """
+    if statistic <= 0.0:
+        return 1.0
+    half = statistic / 2.0
+    # Odd dof: Q(1/2, y) = erfc(sqrt(y)), then terms y^e e^-y / Gamma(e + 1)
+    # for e = 1/2, 3/2, ...; even dof: the same terms for e = 0, 1, ...
+    offset = 0.5 if dof % 2 else 0.0
+    total = math.erfc(math.sqrt(half)) if dof % 2 else 0.0
+    log_half = math.log(half)
+    for j in range(dof // 2):
+        exponent = j + offset
+        total += math.exp(exponent * log_half - half - math.lgamma(exponent + 1.0))
+    return min(total, 1.0)
+
+
+def _two_by_two_chi2(hits_a: int, n_a: int, hits_b: int, n_b: int) -> float | None:
+    """Pearson chi-squared of the hit / miss table of two samples (None if degenerate)."""
+    misses_a, misses_b = n_a - hits_a, n_b - hits_b
+    hits, misses = hits_a + hits_b, misses_a + misses_b
+    if not hits or not misses:
+        return None
+    total = n_a + n_b
+    return total * (hits_a * misses_b - misses_a * hits_b) ** 2 / (n_a * n_b * hits * misses)
+
+
+def run_drift_checks(
+    store: Any,
+    rules: Sequence[Mapping[str, Any]],
+    *,
+    doc_templates: Mapping[str, str] | None = None,
+    promote_missing: bool = False,
+    progress: Callable[[int, int], None] | None = None,
+) -> list[dict[str, Any]]:
+    """Check every rule in *rules* and write ``drift_checks`` / ``drift_alerts``.
+
+    *doc_templates* maps corpus ``doc_id`` to template family; without it
+    only heading churn and tier/confidence distributions are available.
+    Rules without a baseline are reported as ``no_baseline`` unless
+    *promote_missing* is set and *doc_templates* is given, in which case
+    their current profile is saved as the baseline.  *progress* receives
+    ``(rules_done, total_rules)``.  Returns one summary dict per rule.
+    """
+    rule_ids = [str(rule["rule_id"]) for rule in rules]
+    stats = store.rule_drift_stats(rule_ids, doc_templates=doc_templates)
+    baselines = store.get_latest_baselines(rule_ids)
+    template_docs: Counter[str] = Counter((doc_templates or {}).values())
+    corpus_docs = len(doc_templates or {})
+
+    results: list[dict[str, Any]] = []
+    for done, rule in enumerate(rules, start=1):
+        rule_id = str(rule["rule_id"])
+        baseline = baselines.get(rule_id)
+        total_docs = corpus_docs or int((baseline or {}).get("total_docs") or 0)
+        profile = build_profile(stats[rule_id], template_docs, total_docs)
+        summary: dict[str, Any] = {
+            "rule_id": rule_id,
+            "family_id": rule.get("family_id", ""),
+            "current_link_count": profile["link_count"],
+            "current_doc_count": profile["doc_count"],
+            "drift_detected": False,
+        }
+        if baseline is None:
+            if promote_missing and corpus_docs:
+                baseline_id = str(uuid.uuid4())
+                store.save_baseline({
+                    "baseline_id": baseline_id,
+                    "rule_id": rule_id,
+                    "rule_version": int(rule.get("version") or 1),
+                    "total_docs": total_docs,
+                    "total_hits": profile["doc_count"],
+                    "overall_hit_rate": profile["overall_hit_rate"],
+                    "profile": profile,
+                })
+                summary.update(
+                    status="baseline_created",
+                    baseline_id=baseline_id,
+                    message="no baseline: promoted the current profile as the baseline",
+                )
+            else:
+                summary["status"] = "no_baseline"
+        else:
+            comparison = compare_profiles(baseline, profile, template_docs)
+            check_id = str(uuid.uuid4())
+            store.save_drift_check({
+                "check_id": check_id,
+                "rule_id": rule_id,
+                "baseline_id": baseline["baseline_id"],
+                "overall_hit_rate": comparison.overall_hit_rate,
+                "chi2_statistic": comparison.chi2_statistic,
+                "p_value": comparison.p_value,
+                "max_cell_delta": comparison.max_cell_delta,
+                "drift_detected": comparison.drift_detected,
+                "current_profile": {**profile, "heading_churn": comparison.heading_churn},
+            })
+            if comparison.drift_detected:
+                store.create_drift_alert({
+                    "rule_id": rule_id,
+                    "check_id": check_id,
+                    "severity": comparison.severity,
+                    "message": comparison.message,
+                    "cells_affected": list(comparison.cells_affected),
+                })
+            summary.update(
+                status="checked",
+                baseline_id=baseline["baseline_id"],
+                check_id=check_id,
+                drift_detected=comparison.drift_detected,
+                severity=comparison.severity,
+                chi2_statistic=comparison.chi2_statistic,
+                p_value=comparison.p_value,
+                max_cell_delta=comparison.max_cell_delta,
+                heading_churn=comparison.heading_churn,
+                cells_affected=list(comparison.cells_affected),
+                message=comparison.message,
+            )
+        results.append(summary)
+        if progress is not None:
+            progress(done, len(rules))
+    return results
@@ -0,0 +1,772 @@
+"""Edge-case categories for the dashboard's corpus inspector.
+
+Each category is one SQL query over the corpus tables that yields one row
+per flagged document (38 categories in 6 tiers).  The dashboard used to
+run all of them as a single ``UNION ALL`` on every ``/api/edge-cases``
+page load; the corpus builder now materializes the union once into an
+``edge_cases`` table stamped with the build's run id, and the dashboard
+pages from that table (falling back to the live union for corpora built
+without it, or when the table's run id no longer matches the corpus run
+manifest).
+
+Rows are materialized for two scopes: ``all`` (every document) and
+``cohort`` (cohort documents only — the IQR fences of the distribution
+categories are recomputed over the cohort, so this is not a plain filter
+of ``all``).
+
+Functions:
+
+* ``build_doc_category_queries`` / ``build_join_category_queries`` /
+  ``build_iqr_category_queries`` — per-category ``(sql, params)`` parts.
+* ``build_edge_case_union`` — all parts merged into one ``UNION ALL``.
+* ``build_edge_case_table`` — (re)materialize ``edge_cases``.
+* ``edge_case_table_run_id`` — run id the table was built for, if any.
+"""
+from __future__ import annotations
+
+import math
+from typing import Any
+
+EDGE_CASES_TABLE = "edge_cases"
+EDGE_CASE_SCOPES: tuple[str, ...] = ("all", "cohort")
+
+EDGE_CASES_DDL = f"""\
+CREATE TABLE {EDGE_CASES_TABLE} (
+    run_id VARCHAR NOT NULL,
+    scope VARCHAR NOT NULL,
+    category VARCHAR NOT NULL,
+    tier VARCHAR NOT NULL,
+    doc_id VARCHAR NOT NULL,
+    borrower VARCHAR,
+    severity VARCHAR,
+    detail VARCHAR,
+    doc_type VARCHAR,
+    market_segment VARCHAR,
+    word_count INTEGER,
+    section_count INTEGER,
+    definition_count INTEGER,
+    clause_count INTEGER,
+    facility_size_mm DOUBLE,
+    PRIMARY KEY (run_id, scope, category, doc_id)
+)
+"""
+
+# Columns every category query yields, in order (after the table's
+# run_id / scope / ... / tier prefix).
+EDGE_CASE_COLUMNS: tuple[str, ...] = (
+    "doc_id", "borrower", "category", "severity", "detail",
+    "doc_type", "market_segment", "word_count", "section_count",
+    "definition_count", "clause_count", "facility_size_mm",
+)
+
+
+def _percentile(values: list[float], p: float) -> float:
+    if not values:
+        return 0.0
+    s = sorted(values)
+    k = (len(s) - 1) * p
+    f = math.floor(k)
+    c = math.ceil(k)
+    if f == c:
+        return s[int(k)]
+    return s[f] * (c - k) + s[c] * (k - f)
+
+
+# Edge-case anomaly thresholds (calibrated on current corpus)
+DEF_TRUNC_CAP = 1999
+DEF_TRUNC_MIN_PER_DOC = 5
+DEF_MALFORMED_MIN_PER_DOC = 20
+
+ROOT_REPEAT_THRESHOLD = 200
+
+DUP_BURST_MIN_STRUCTURAL = 200
+DUP_BURST_RATIO = 0.90
+
+DEEP_RESET_PREV_LEVEL = 4
+DEEP_RESET_MIN_PER_SECTION = 2
+
+# Tier-based category registry (38 categories across 6 tiers)
+EDGE_CASE_TIERS: dict[str, list[str]] = {
+    "structural": [
+        "missing_sections", "low_section_count", "excessive_section_count",
+        "section_fallback_used", "section_numbering_gap", "empty_section_headings",
+    ],
+    "clauses": [
+        "zero_clauses", "low_clause_density", "low_avg_clause_confidence",
+        "orphan_deep_clause", "inconsistent_sibling_depth",
+        "deep_nesting_outlier", "low_structural_ratio", "rootless_deep_clause",
+        "clause_root_label_repeat_explosion", "clause_dup_id_burst",
+        "clause_depth_reset_after_deep",
+    ],
+    "definitions": [
+        "low_definitions", "zero_definitions", "high_definition_count",
+        "duplicate_definitions", "single_engine_definitions",
+        "definition_truncated_at_cap", "definition_signature_leak",
+        "definition_malformed_term",
+    ],
+    "metadata": [
+        "extreme_facility", "missing_borrower", "missing_facility_size",
+        "missing_closing_date", "unknown_doc_type",
+    ],
+    "document": [
+        "extreme_word_count", "short_text", "extreme_text_ratio",
+        "very_short_document",
+    ],
+    "template": [
+        "orphan_template", "non_credit_agreement", "uncertain_market_segment",
+        "non_cohort_large_doc",
+    ],
+}
+
+CATEGORY_TO_TIER: dict[str, str] = {
+    cat: tier for tier, cats in EDGE_CASE_TIERS.items() for cat in cats
+}
+EDGE_CASE_CATEGORIES = {"all"} | set(CATEGORY_TO_TIER)
+
+
+def get_tier(category: str) -> str:
+    return CATEGORY_TO_TIER.get(category, "unknown")
+
+
+# Standard SELECT columns shared by all edge-case category queries
+_EC_COLS = (
+    "doc_id, borrower, {cat!r} as category, {sev!r} as severity, "
+    "{detail} as detail, "
+    "doc_type, market_segment, word_count, section_count, definition_count, "
+    "clause_count, facility_size_mm"
+)
+
+
+def _doc_q(cohort_where: str, cat: str, severity: str, detail: str, where: str) -> str:
+    """Build a simple documents-table-only category query."""
+    cols = _EC_COLS.format(cat=cat, sev=severity, detail=detail)
+    return f"SELECT {cols} FROM documents {cohort_where} {where}"
+
+
+def build_doc_category_queries(cohort_where: str) -> list[tuple[str, list[Any]]]:
+    """Categories querying only the documents table (no JOINs)."""
+    queries: list[tuple[str, list[Any]]] = []
+
+    # --- Structural ---
+    # 1. missing_sections (existing, enriched detail)
+    queries.append((
+        f"SELECT doc_id, borrower, 'missing_sections' as category, 'high' as severity, "
+        f"CASE "
+        f"  WHEN word_count < 500 THEN 'Short document (' || word_count "
+        f"|| ' words) — likely amendment or supplement' "
+        f"  WHEN doc_type NOT IN ('credit_agreement', 'other', '') "
+        f"    THEN 'Non-credit-agreement document (doc_type: ' || doc_type || ')' "
+        f"  WHEN word_count > 5000 "
+        f"    THEN 'Parser gap — ' || word_count || '-word CA with non-standard heading format' "
+        f"  ELSE 'No sections extracted from document' "
+        f"END as detail, "
+        f"doc_type, market_segment, word_count, section_count, definition_count, "
+        f"clause_count, facility_size_mm "
+        f"FROM documents {cohort_where} section_count = 0",
+        [],
+    ))
+    # 2. low_section_count
+    queries.append((_doc_q(
+        cohort_where, "low_section_count", "medium",
+        "'Only ' || section_count || ' sections in ' || word_count || '-word document'",
+        "section_count BETWEEN 1 AND 4 AND word_count > 5000",
+    ), []))
+    # 4. section_fallback_used
+    queries.append((_doc_q(
+        cohort_where, "section_fallback_used", "low",
+        "'Parser used fallback heuristic to detect ' || section_count || ' sections'",
+        "section_fallback_used = true AND section_count > 0",
+    ), []))
+
+    # --- Clauses ---
+    # 7. zero_clauses (existing)
+    queries.append((_doc_q(
+        cohort_where, "zero_clauses", "medium",
+        "'Sections exist but no clauses parsed'",
+        "clause_count = 0 AND section_count > 0",
+    ), []))
+    # 8. low_clause_density (uses only documents table columns)
+    queries.append((_doc_q(
+        cohort_where, "low_clause_density", "medium",
+        "'Clause density ' || ROUND(CAST(clause_count AS DOUBLE) / section_count, 1) "
+        "|| ' per section (expected >= 3)'",
+        "clause_count > 0 AND section_count > 0 AND "
+        "CAST(clause_count AS DOUBLE) / section_count < 2.0",
+    ), []))
+
+    # --- Definitions ---
+    # 15. low_definitions (existing)
+    queries.append((_doc_q(
+        cohort_where, "low_definitions", "medium",
+        "'Fewer than 20 definitions in document with >10K words'",
+        "definition_count < 20 AND word_count > 10000",
+    ), []))
+    # 16. zero_definitions
+    queries.append((_doc_q(
+        cohort_where, "zero_definitions", "high",
+        "'No definitions extracted from ' || word_count || '-word document'",
+        "definition_count = 0 AND word_count > 5000",
+    ), []))
+    # 17. high_definition_count
+    queries.append((_doc_q(
+        cohort_where, "high_definition_count", "medium",
+        "definition_count || ' definitions detected — possible extraction noise'",
+        "definition_count > 500",
+    ), []))
+
+    # --- Metadata ---
+    # 20. extreme_facility (existing)
+    queries.append((_doc_q(
+        cohort_where, "extreme_facility", "low",
+        "'Facility size outside typical range'",
+        "facility_size_mm IS NOT NULL AND (facility_size_mm > 10000 OR facility_size_mm < 1)",
+    ), []))
+    # 21. missing_borrower
+    queries.append((_doc_q(
+        cohort_where, "missing_borrower", "medium",
+        "'No borrower name extracted from document'",
+        "borrower IS NULL OR TRIM(borrower) = ''",
+    ), []))
+    # 22. missing_facility_size
+    queries.append((_doc_q(
+        cohort_where, "missing_facility_size", "medium",
+        "'No facility size extracted from ' || word_count || '-word document'",
+        "facility_size_mm IS NULL AND word_count > 5000",
+    ), []))
+    # 23. missing_closing_date
+    queries.append((_doc_q(
+        cohort_where, "missing_closing_date", "low",
+        "'No closing date extracted from document'",
+        "closing_date IS NULL AND word_count > 5000",
+    ), []))
+    # 24. unknown_doc_type
+    queries.append((_doc_q(
+        cohort_where, "unknown_doc_type", "high",
+        "'Low-confidence doc type classification: ' || COALESCE(doc_type, 'NULL')",
+        "doc_type_confidence = 'low' OR doc_type IN ('', 'other') OR doc_type IS NULL",
+    ), []))
+
+    # --- Document Quality ---
+    # 26. short_text
+    queries.append((_doc_q(
+        cohort_where, "short_text", "medium",
+        "'Document text is only ' || text_length || ' characters (expected > 10K)'",
+        "text_length < 10000 AND text_length > 0",
+    ), []))
+    # 27. extreme_text_ratio
+    queries.append((_doc_q(
+        cohort_where, "extreme_text_ratio", "medium",
+        "'Text/word ratio ' || ROUND(CAST(text_length AS DOUBLE) / word_count, 1) "
+        "|| ' (expected ~6) — possible HTML artifact bloat'",
+        "word_count > 0 AND CAST(text_length AS DOUBLE) / word_count > 15.0",
+    ), []))
+    # 28. very_short_document
+    queries.append((_doc_q(
+        cohort_where, "very_short_document", "high",
+        "'Only ' || word_count || ' words — likely amendment/supplement'",
+        "word_count < 5000 AND word_count > 0",
+    ), []))
+
+    # --- Template/Structure ---
+    # 29. orphan_template
+    queries.append((_doc_q(
+        cohort_where, "orphan_template", "low",
+        "'Document not assigned to any template family'",
+        "template_family IS NULL OR TRIM(template_family) = ''",
+    ), []))
+    # 30. non_credit_agreement
+    queries.append((_doc_q(
+        cohort_where, "non_credit_agreement", "medium",
+        "'Document classified as ' || doc_type || ' (confidence: ' || "
+        "COALESCE(doc_type_confidence, 'N/A') || ')'",
+        "doc_type NOT IN ('credit_agreement', '') AND doc_type IS NOT NULL AND word_count > 1000",
+    ), []))
+    # 31. uncertain_market_segment
+    queries.append((_doc_q(
+        cohort_where, "uncertain_market_segment", "low",
+        "'Market segment uncertain — could not determine leveraged vs. investment grade'",
+        "segment_confidence = 'low' AND market_segment = 'uncertain'",
+    ), []))
+    # 32. non_cohort_large_doc
+    queries.append((_doc_q(
+        cohort_where, "non_cohort_large_doc", "low",
+        "word_count || '-word document excluded from cohort'",
+        "cohort_included = false AND word_count > 10000",
+    ), []))
+
+    return queries
+
+
+def build_join_category_queries(cohort_where: str) -> list[tuple[str, list[Any]]]:
+    """Categories requiring JOINs against clauses, definitions, or sections tables."""
+    queries: list[tuple[str, list[Any]]] = []
+    # Subqueries start from non-documents tables: JOIN documents and apply
+    # the cohort filter there when needed.
+    cohort_doc_filter = " AND d.cohort_included = true" if "cohort_included" in cohort_where else ""
+
+    _cols = (
+        "sub.doc_id, d.borrower, {cat!r} as category, {sev!r} as severity, "
+        "{detail} as detail, "
+        "d.doc_type, d.market_segment, d.word_count, d.section_count, d.definition_count, "
+        "d.clause_count, d.facility_size_mm"
+    )
+
+    # --- Clause depth anomalies (user priority) ---
+
+    # 9. low_avg_clause_confidence
+    cols = _cols.format(
+        cat="low_avg_clause_confidence", sev="high",
+        detail=(
+            "'Average clause confidence ' || sub.avg_conf || ' across ' || sub.n_clauses "
+            "|| ' clauses (threshold 0.4)'"
+        ),
+    )
+    queries.append((
+        f"SELECT {cols} FROM ("
+        f"  SELECT c.doc_id, ROUND(AVG(c.parse_confidence), 3) as avg_conf, COUNT(*) as n_clauses"
+        f"  FROM clauses c JOIN documents dd ON c.doc_id = dd.doc_id"
+        f"  WHERE dd.clause_count > 10"
+        f"  GROUP BY c.doc_id HAVING AVG(c.parse_confidence) < 0.4"
+        f") sub JOIN documents d ON sub.doc_id = d.doc_id"
+        f"{cohort_doc_filter}",
+        [],
+    ))
+
+    # 10. orphan_deep_clause — uses tree_level >= 3 (from clause_id path)
+    cols = _cols.format(
+        cat="orphan_deep_clause", sev="high",
+        detail="sub.orphan_count || ' orphaned deep clauses (tree level >= 3, missing parent)'",
+    )
+    queries.append((
+        f"SELECT {cols} FROM ("
+        f"  SELECT ci.doc_id, COUNT(*) as orphan_count"
+        f"  FROM (SELECT *, ARRAY_LENGTH(STRING_SPLIT(clause_id, '.')) AS tree_level "
+        f"FROM clauses) ci"
+        f"  LEFT JOIN clauses p ON ci.doc_id = p.doc_id AND ci.section_number = p.section_number "
+        f"AND ci.parent_id = p.clause_id"
+        f"  WHERE ci.tree_level >= 3 AND ci.is_structural = true AND ci.parent_id != '' "
+        f"AND p.clause_id IS NULL"
+        f"  GROUP BY ci.doc_id"
+        f") sub JOIN documents d ON sub.doc_id = d.doc_id"
+        f"{cohort_doc_filter}",
+        [],
+    ))
+
+    # 12. inconsistent_sibling_depth — uses tree_level (from clause_id path)
+    cols = _cols.format(
+        cat="inconsistent_sibling_depth", sev="high",
+        detail=(
+            "sub.bad_groups || ' parent groups with inconsistent tree levels (' || sub.affected "
+            "|| ' clauses)'"
+        ),
+    )
+    queries.append((
+        f"SELECT {cols} FROM ("
+        f"  SELECT doc_id, COUNT(*) as bad_groups, SUM(n_siblings) as affected FROM ("
+        f"    SELECT doc_id, parent_id, section_number, COUNT(*) as n_siblings"
+        f"    FROM (SELECT *, ARRAY_LENGTH(STRING_SPLIT(clause_id, '.')) AS tree_level "
+        f"FROM clauses) c"
+        f"    WHERE c.is_structural = true AND c.parent_id != ''"
+        f"    GROUP BY doc_id, section_number, parent_id"
+        f"    HAVING COUNT(DISTINCT tree_level) > 1"
+        f"  ) g GROUP BY doc_id"
+        f") sub JOIN documents d ON sub.doc_id = d.doc_id"
+        f"{cohort_doc_filter}",
+        [],
+    ))
+
+    # 13. deep_nesting_outlier — uses tree_level > 4 (from clause_id path)
+    cols = _cols.format(
+        cat="deep_nesting_outlier", sev="low",
+        detail=(
+            "'Max tree level ' || sub.max_level || ' with ' || sub.deep_count "
+            "|| ' clauses beyond level 4'"
+        ),
+    )
+    queries.append((
+        f"SELECT {cols} FROM ("
+        f"  SELECT doc_id, MAX(tree_level) as max_level, COUNT(*) as deep_count"
+        f"  FROM (SELECT *, ARRAY_LENGTH(STRING_SPLIT(clause_id, '.')) AS tree_level "
+        f"FROM clauses) c"
+        f"  WHERE c.is_structural = true AND c.tree_level > 4"
+        f"  GROUP BY doc_id"
+        f") sub JOIN documents d ON sub.doc_id = d.doc_id"
+        f"{cohort_doc_filter}",
+        [],
+    ))
+
+    # 14. low_structural_ratio
+    cols = _cols.format(
+        cat="low_structural_ratio", sev="medium",
+        detail=(
+            "'Only ' || sub.pct || '% structural (' || sub.structural || '/' || sub.total || ')'"
+        ),
+    )
+    queries.append((
+        f"SELECT {cols} FROM ("
+        f"  SELECT doc_id, COUNT(*) as total,"
+        f"    SUM(CASE WHEN is_structural THEN 1 ELSE 0 END) as structural,"
+        f"    ROUND(100.0 * SUM(CASE WHEN is_structural THEN 1 ELSE 0 END) / COUNT(*), 1) as pct"
+        f"  FROM clauses GROUP BY doc_id HAVING COUNT(*) >= 10"
+        f") sub JOIN documents d ON sub.doc_id = d.doc_id"
+        f" WHERE sub.pct < 50.0{cohort_doc_filter}",
+        [],
+    ))
+
+    # 15. rootless_deep_clause — tree_level > 1 with empty parent_id
+    cols = _cols.format(
+        cat="rootless_deep_clause", sev="medium",
+        detail="sub.rootless_count || ' clauses with tree level > 1 but no parent link'",
+    )
+    queries.append((
+        f"SELECT {cols} FROM ("
+        f"  SELECT doc_id, COUNT(*) as rootless_count"
+        f"  FROM (SELECT *, ARRAY_LENGTH(STRING_SPLIT(clause_id, '.')) AS tree_level "
+        f"FROM clauses) c"
+        f"  WHERE c.tree_level > 1 AND c.is_structural = true AND (c.parent_id IS NULL "
+        f"OR c.parent_id = '')"
+        f"  GROUP BY doc_id"
+        f") sub JOIN documents d ON sub.doc_id = d.doc_id"
+        f"{cohort_doc_filter}",
+        [],
+    ))
+
+    # --- Definition JOINs ---
+
+    # 18. duplicate_definitions
+    cols = _cols.format(
+        cat="duplicate_definitions", sev="low",
+        detail="sub.dup_term_count || ' terms defined multiple times in same document'",
+    )
+    queries.append((
+        f"SELECT {cols} FROM ("
+        f"  SELECT doc_id, COUNT(*) as dup_term_count FROM ("
+        f"    SELECT doc_id, term FROM definitions GROUP BY doc_id, term HAVING COUNT(*) > 1"
+        f"  ) inner_sub GROUP BY doc_id"
+        f") sub JOIN documents d ON sub.doc_id = d.doc_id"
+        f"{cohort_doc_filter}",
+        [],
+    ))
+
+    # 19. single_engine_definitions
+    cols = _cols.format(
+        cat="single_engine_definitions", sev="low",
+        detail=(
+            "'All ' || sub.def_count || ' definitions extracted by single engine: ' "
+            "|| sub.sole_engine"
+        ),
+    )
+    queries.append((
+        f"SELECT {cols} FROM ("
+        f"  SELECT doc_id, MIN(pattern_engine) as sole_engine, COUNT(*) as def_count"
+        f"  FROM definitions GROUP BY doc_id"
+        f"  HAVING COUNT(DISTINCT pattern_engine) = 1 AND COUNT(*) >= 10"
+        f") sub JOIN documents d ON sub.doc_id = d.doc_id"
+        f"{cohort_doc_filter}",
+        [],
+    ))
+
+    # 33. definition_truncated_at_cap
+    cols = _cols.format(
+        cat="definition_truncated_at_cap", sev="high",
+        detail="sub.trunc_count || ' definitions hit extraction cap (>= ' || "
+        f"CAST({DEF_TRUNC_CAP} AS VARCHAR) || ' chars)'",
+    )
+    queries.append((
+        f"SELECT {cols} FROM ("
+        f"  SELECT doc_id, COUNT(*) as trunc_count"
+        f"  FROM definitions"
+        f"  WHERE LENGTH(COALESCE(definition_text, '')) >= {DEF_TRUNC_CAP}"
+        f"    AND pattern_engine IN ('quoted', 'smart_quote', 'parenthetical')"
+        f"    AND LENGTH(TRIM(COALESCE(term, ''))) >= 3"
+        f"  GROUP BY doc_id"
+        f"  HAVING COUNT(*) >= {DEF_TRUNC_MIN_PER_DOC}"
+        f") sub JOIN documents d ON sub.doc_id = d.doc_id"
+        f"{cohort_doc_filter}",
+        [],
+    ))
+
+    # 34. definition_signature_leak
+    cols = _cols.format(
+        cat="definition_signature_leak", sev="high",
+        detail="sub.bad_count || ' definition terms contain signature-page markers'",
+    )
+    queries.append((
+        f"SELECT {cols} FROM ("
+        f"  SELECT doc_id, COUNT(*) as bad_count"
+        f"  FROM definitions"
+        f"  WHERE regexp_matches(lower(COALESCE(term, '')), "
+        f"    '(by\\\\s*:|name\\\\s*:|title\\\\s*:|in witness whereof|signature page|"
+        f"authorized signatory)')"
+        f"  GROUP BY doc_id"
+        f") sub JOIN documents d ON sub.doc_id = d.doc_id"
+        f"{cohort_doc_filter}",
+        [],
+    ))
+
+    # 35. definition_malformed_term
+    cols = _cols.format(
+        cat="definition_malformed_term", sev="medium",
+        detail="sub.bad_terms || ' malformed definition terms detected'",
+    )
+    queries.append((
+        f"SELECT {cols} FROM ("
+        f"  SELECT doc_id, COUNT(*) as bad_terms"
+        f"  FROM definitions"
+        f"  WHERE regexp_matches(COALESCE(term, ''), '\\\\n')"
+        f"     OR LENGTH(TRIM(COALESCE(term, ''))) > 80"
+        f"     OR regexp_matches(lower(TRIM(COALESCE(term, ''))), "
+        f"        '^(the borrower|the lenders?|the administrative agent|the company|"
+        f"the issuer)\\\\b')"
+        f"  GROUP BY doc_id"
+        f"  HAVING COUNT(*) >= {DEF_MALFORMED_MIN_PER_DOC}"
+        f") sub JOIN documents d ON sub.doc_id = d.doc_id"
+        f"{cohort_doc_filter}",
+        [],
+    ))
+
+    # 36. clause_root_label_repeat_explosion
+    cols = _cols.format(
+        cat="clause_root_label_repeat_explosion", sev="high",
+        detail="'Root label repeated up to ' || sub.worst_repeat || ' times in one section'",
+    )
+    queries.append((
+        f"SELECT {cols} FROM ("
+        f"  WITH root_counts AS ("
+        f"    SELECT doc_id, section_number, "
+        f"      lower(regexp_extract(label, '\\(([A-Za-z0-9]+)\\)', 1)) as root_lbl, "
+        f"      COUNT(*) as n "
+        f"    FROM clauses "
+        f"    WHERE is_structural = true "
+        f"      AND array_length(string_split(clause_id, '.')) = 1 "
+        f"      AND regexp_extract(label, '\\(([A-Za-z0-9]+)\\)', 1) <> '' "
+        f"    GROUP BY 1, 2, 3"
+        f"  ), sec AS ("
+        f"    SELECT doc_id, section_number, MAX(n) as max_repeat "
+        f"    FROM root_counts "
+        f"    GROUP BY 1, 2 "
+        f"    HAVING MAX(n) >= {ROOT_REPEAT_THRESHOLD}"
+        f"  ) "
+        f"  SELECT doc_id, MAX(max_repeat) as worst_repeat "
+        f"  FROM sec GROUP BY doc_id"
+        f") sub JOIN documents d ON sub.doc_id = d.doc_id"
+        f"{cohort_doc_filter}",
+        [],
+    ))
+
+    # 37. clause_dup_id_burst
+    cols = _cols.format(
+        cat="clause_dup_id_burst", sev="high",
+        detail="'Structural clause_id _dup ratio ' || ROUND(100.0 * sub.dup_ratio, 1) || '%'",
+    )
+    queries.append((
+        f"SELECT {cols} FROM ("
+        f"  SELECT doc_id, "
+        f"    COUNT(*) as structural_count, "
+        f"    1.0 * SUM(CASE WHEN clause_id LIKE '%\\_dup%' ESCAPE '\\' "
+        f"THEN 1 ELSE 0 END) / COUNT(*) as dup_ratio "
+        f"  FROM clauses "
+        f"  WHERE is_structural = true "
+        f"  GROUP BY doc_id "
+        f"  HAVING COUNT(*) >= {DUP_BURST_MIN_STRUCTURAL} "
+        f"     AND 1.0 * SUM(CASE WHEN clause_id LIKE '%\\_dup%' ESCAPE '\\' "
+        f"THEN 1 ELSE 0 END) / COUNT(*) > {DUP_BURST_RATIO}"
+        f") sub JOIN documents d ON sub.doc_id = d.doc_id"
+        f"{cohort_doc_filter}",
+        [],
+    ))
+
+    # 38. clause_depth_reset_after_deep
+    cols = _cols.format(
+        cat="clause_depth_reset_after_deep", sev="high",
+        detail="'Depth resets after deep nesting in ' || sub.flagged_sections || "
+        "' sections (' || sub.total_resets || ' resets)'",
+    )
+    queries.append((
+        f"SELECT {cols} FROM ("
+        f"  WITH ordered AS ("
+        f"    SELECT doc_id, section_number, span_start, "
+        f"      array_length(string_split(clause_id, '.')) as tree_level, "
+        f"      lower(regexp_extract(label, '\\(([A-Za-z0-9]+)\\)', 1)) as label_inner, "
+        f"      lag(array_length(string_split(clause_id, '.'))) "
+        f"        OVER (PARTITION BY doc_id, section_number ORDER BY span_start) "
+        f"as prev_tree_level "
+        f"    FROM clauses "
+        f"    WHERE is_structural = true"
+        f"  ), sec AS ("
+        f"    SELECT doc_id, section_number, COUNT(*) as reset_count "
+        f"    FROM ordered "
+        f"    WHERE prev_tree_level >= {DEEP_RESET_PREV_LEVEL} "
+        f"      AND tree_level = 1 "
+        f"      AND length(label_inner) = 1 "
+        f"      AND label_inner BETWEEN 'm' AND 'z' "
+        f"    GROUP BY 1, 2 "
+        f"    HAVING COUNT(*) >= {DEEP_RESET_MIN_PER_SECTION}"
+        f"  ) "
+        f"  SELECT doc_id, COUNT(*) as flagged_sections, SUM(reset_count) as total_resets "
+        f"  FROM sec GROUP BY doc_id"
+        f") sub JOIN documents d ON sub.doc_id = d.doc_id"
+        f"{cohort_doc_filter}",
+        [],
+    ))
+
+    # --- Section JOINs ---
+
+    # 5. section_numbering_gap
+    cols = _cols.format(
+        cat="section_numbering_gap", sev="medium",
+        detail="sub.gap_count || ' numbering gaps detected in section sequence'",
+    )
+    queries.append((
+        f"SELECT {cols} FROM ("
+        f"  SELECT doc_id, COUNT(*) as gap_count FROM ("
+        f"    SELECT doc_id, CAST(section_number AS DOUBLE) as sn,"
+        f"      LAG(CAST(section_number AS DOUBLE)) OVER (PARTITION BY doc_id ORDER BY "
+        f"CAST(section_number AS DOUBLE)) AS prev_sn"
+        f"    FROM sections WHERE section_number NOT LIKE '%.%'"
+        f"  ) numbered WHERE prev_sn IS NOT NULL AND sn - prev_sn > 1.0 AND sn > 1.0"
+        f"  GROUP BY doc_id"
+        f") sub JOIN documents d ON sub.doc_id = d.doc_id"
+        f"{cohort_doc_filter}",
+        [],
+    ))
+
+    # 6. empty_section_headings
+    cols = _cols.format(
+        cat="empty_section_headings", sev="medium",
+        detail="sub.empty_count || ' sections with missing or empty headings'",
+    )
+    queries.append((
+        f"SELECT {cols} FROM ("
+        f"  SELECT doc_id, COUNT(*) as empty_count"
+        f"  FROM sections WHERE heading IS NULL OR TRIM(heading) = ''"
+        f"  GROUP BY doc_id"
+        f") sub JOIN documents d ON sub.doc_id = d.doc_id"
+        f"{cohort_doc_filter}",
+        [],
+    ))
+
+    return queries
+
+
+def build_iqr_category_queries(
+    corpus: Any, cohort_where: str, cohort_only: bool,
+) -> list[tuple[str, list[Any]]]:
+    """IQR-fence-based categories requiring pre-computation of percentiles."""
+    queries: list[tuple[str, list[Any]]] = []
+
+    def _compute_fences(col: str) -> tuple[float, float]:
+        base = "WHERE cohort_included = true AND" if cohort_only else "WHERE"
+        rows = corpus.query(f"SELECT {col} FROM documents {base} {col} IS NOT NULL")
+        vals = [float(r[0]) for r in rows if r[0] is not None]
+        if len(vals) < 4:
+            return 0.0, float("inf")
+        q1 = _percentile(vals, 0.25)
+        q3 = _percentile(vals, 0.75)
+        iqr = q3 - q1
+        if iqr <= 0:
+            return 0.0, float("inf")
+        return q1 - 1.5 * iqr, q3 + 1.5 * iqr
+
+    # 25. extreme_word_count (existing)
+    wc_lo, wc_hi = _compute_fences("word_count")
+    if wc_hi != float("inf"):
+        queries.append((
+            f"SELECT doc_id, borrower, 'extreme_word_count' as category, 'low' as severity, "
+            f"'Word count ' || word_count || ' outside IQR fences [' "
+            f"|| CAST(ROUND(?, 0) AS INTEGER) || ', ' || CAST(ROUND(?, 0) AS INTEGER) "
+            f"|| ']' as detail, "
+            f"doc_type, market_segment, word_count, section_count, definition_count, "
+            f"clause_count, facility_size_mm "
+            f"FROM documents {cohort_where} word_count IS NOT NULL "
+            f"AND (word_count < ? OR word_count > ?)",
+            [wc_lo, wc_hi, wc_lo, wc_hi],
+        ))
+
+    # 3. excessive_section_count
+    _, sc_hi = _compute_fences("section_count")
+    if sc_hi != float("inf"):
+        queries.append((
+            f"SELECT doc_id, borrower, 'excessive_section_count' as category, 'low' as severity, "
+            f"section_count || ' sections (IQR upper fence: ' || CAST(ROUND(?, 0) AS INTEGER) "
+            f"|| ')' as detail, "
+            f"doc_type, market_segment, word_count, section_count, definition_count, "
+            f"clause_count, facility_size_mm "
+            f"FROM documents {cohort_where} section_count IS NOT NULL "
+            f"AND section_count > ?",
+            [sc_hi, sc_hi],
+        ))
+
+    return queries
+
+# ---------------------------------------------------------------------------
+# Materialized table
+# ---------------------------------------------------------------------------
+
+
+class _ConnQuery:
+    """``corpus.query``-style adapter over a raw DuckDB connection."""
+
+    def __init__(self, conn: Any) -> None:
+        self._conn = conn
+
+    def query(self, sql: str, params: list[Any] | None = None) -> list[tuple[Any, ...]]:
+        return self._conn.execute(sql, params or []).fetchall()
+
+
+def build_edge_case_union(corpus: Any, *, cohort_only: bool) -> tuple[str, list[Any]]:
+    """All category queries merged into one ``UNION ALL`` and its params.
+
+    *corpus* is anything with a ``query(sql, params)`` method (used to
+    compute the IQR fences).
+    """
+    cohort_where = "WHERE cohort_included = true AND" if cohort_only else "WHERE"
+    parts: list[tuple[str, list[Any]]] = []
+    parts.extend(build_doc_category_queries(cohort_where))
+    parts.extend(build_join_category_queries(cohort_where))
+    parts.extend(build_iqr_category_queries(corpus, cohort_where, cohort_only))
+    params: list[Any] = []
+    for _sql, part_params in parts:
+        params.extend(part_params)
+    return " UNION ALL ".join(sql for sql, _params in parts), params
+
+
+def build_edge_case_table(conn: Any, *, run_id: str) -> int:
+    """(Re)build ``edge_cases`` for both scopes, stamped with *run_id*.
+
+    Rows are inserted in primary-key order so per-category pages read
+    contiguous row groups.  Returns the number of rows written.
+    """
+    corpus = _ConnQuery(conn)
+    tier_case = " ".join(
+        f"WHEN {cat!r} THEN {tier!r}" for cat, tier in CATEGORY_TO_TIER.items()
+    )
+    cols = ", ".join(EDGE_CASE_COLUMNS)
+    conn.execute("BEGIN")
+    try:
+        conn.execute(f"DROP TABLE IF EXISTS {EDGE_CASES_TABLE}")
+        conn.execute(EDGE_CASES_DDL)
+        for scope in EDGE_CASE_SCOPES:
+            union_sql, params = build_edge_case_union(corpus, cohort_only=scope == "cohort")
+            conn.execute(
+                f"INSERT INTO {EDGE_CASES_TABLE} "
+                f"(run_id, scope, tier, {cols}) "
+                f"SELECT ?, ?, CASE category {tier_case} ELSE 'unknown' END, {cols} "
+                f"FROM ({union_sql}) ORDER BY category, doc_id",
+                [run_id, scope, *params],
+            )
+        conn.execute("COMMIT")
+    except Exception:
+        conn.execute("ROLLBACK")
+        raise
+    row = conn.execute(f"SELECT COUNT(*) FROM {EDGE_CASES_TABLE}").fetchone()
+    return int(row[0]) if row else 0
+
+
+def edge_case_table_run_id(conn: Any) -> str | None:
+    """Run id stored in ``edge_cases``, or None if the table is absent/empty."""
+    tables = {str(r[0]) for r in conn.execute("SHOW TABLES").fetchall()}
+    if EDGE_CASES_TABLE not in tables:
+        return None
+    row = conn.execute(f"SELECT run_id FROM {EDGE_CASES_TABLE} LIMIT 1").fetchone()
+    return str(row[0]) if row and row[0] is not None else None
@@ -0,0 +1,505 @@
+"""Persisted IVF-flat nearest-neighbour index over ``section_embeddings``.
+
+Similarity queries used to decode and score every stored embedding.  This
+module keeps one inverted-file index per ``model_version`` under
+``<links db>.ann/`` (next to ``links.duckdb``): a spherical k-means coarse
+quantizer routes a query to its ``nprobe`` closest lists, and only the rows
+in those lists are scored exactly.  All vectors are stored L2-normalized, so
+inner product == cosine similarity.
+
+Layout of one model-version directory::
+
+    manifest.json    dim, trained row count, source signature, generation,
+                     segment list
+    centroids.npy    (nlist, dim) float32 coarse centroids (absent while flat)
+    seg-<uuid>.npz   doc_ids, section_numbers, vectors, list assignments
+
+Writes are incremental: ``add`` appends one segment holding only the new
+rows, assigned to the existing centroids.  Later segments shadow earlier
+rows with the same ``(doc_id, section_number)`` key.  When the index has
+grown ``RETRAIN_GROWTH`` times past the size it was trained on, or has
+accumulated ``MAX_SEGMENTS`` segments, the quantizer is retrained and all
+segments are compacted into one.
+
+Below ``TRAIN_MIN_ROWS`` rows the index stays flat (exact search with one
+matrix-vector product), which is already fast at that size.
+
+Several ``LinkStore`` instances (and processes) may share one directory.
+Writers hold an exclusive ``flock`` on ``<model dir>.lock`` and readers a
+shared one; every manifest write gets a new ``generation``, and ``refresh``
+reloads an instance whose in-memory copy is older than the manifest.
+Segment names are random, so concurrent writers never reuse one.
+"""
+from __future__ import annotations
+
+import contextlib
+import fcntl
+import hashlib
+import json
+import os
+import re
+import threading
+import uuid
+from collections.abc import Iterable, Sequence
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+
+from agent.embeddings import top_k_indices
+
+TRAIN_MIN_ROWS = 4096
+RETRAIN_GROWTH = 4.0
+MAX_SEGMENTS = 32
+DEFAULT_NPROBE = 8
+
+_F32 = np.dtype("<f4")
+_KMEANS_ITERS = 12
+_KMEANS_SAMPLE = 65_536
+_ASSIGN_CHUNK = 16_384
+_SEED = 0x5EC7
+_MANIFEST = "manifest.json"
+_CENTROIDS = "centroids.npy"
+
+SectionKey = tuple[str, str]
+
+
+def index_root_for(db_path: Path | str) -> Path:
+    """Directory holding the ANN indexes for a ``links.duckdb`` file."""
+    return Path(db_path).with_suffix(".ann")
+
+
+def _model_dir_name(model_version: str) -> str:
+    safe = re.sub(r"[^A-Za-z0-9._-]+", "_", model_version)[:64]
+    digest = hashlib.sha1(model_version.encode("utf-8")).hexdigest()[:8]
+    return f"{safe}-{digest}"
+
+
+# ---------------------------------------------------------------------------
+# Quantizer helpers
+# ---------------------------------------------------------------------------
+
+def _normalize_rows(matrix: np.ndarray) -> np.ndarray:
+    """Return a float32 copy with unit-length rows (zero rows stay zero)."""
+    out = np.asarray(matrix, dtype=_F32).copy()
+    norms = np.linalg.norm(out, axis=1)
+    nonzero = norms > 0
+    out[nonzero] /= norms[nonzero, None]
+    return out
+
+
+def _nlist_for(n_rows: int) -> int:
+    return int(min(4096, max(16, 4 * np.sqrt(n_rows))))
+
+
+def _assign(vectors: np.ndarray, centroids: np.ndarray) -> np.ndarray:
+    """Nearest-centroid list id for every row (chunked to bound memory)."""
+    out = np.empty(len(vectors), dtype=np.int32)
+    for start in range(0, len(vectors), _ASSIGN_CHUNK):
+        block = vectors[start:start + _ASSIGN_CHUNK]
+        out[start:start + len(block)] = np.argmax(block @ centroids.T, axis=1)
+    return out
+
+
+def _train_centroids(vectors: np.ndarray, nlist: int) -> np.ndarray:
+    """Spherical k-means on (a sample of) normalized vectors."""
+    rng = np.random.default_rng(_SEED)
+    sample = vectors
+    if len(sample) > _KMEANS_SAMPLE:
+        sample = vectors[rng.choice(len(vectors), _KMEANS_SAMPLE, replace=False)]
+    nlist = min(nlist, len(sample))
+    centroids = sample[rng.choice(len(sample), nlist, replace=False)].copy()
+    for _ in range(_KMEANS_ITERS):
+        assign = _assign(sample, centroids)
+        order = np.argsort(assign, kind="stable")
+        counts = np.bincount(assign, minlength=nlist)
+        sums = np.zeros_like(centroids)
+        filled = np.flatnonzero(counts)
+        offsets = np.concatenate(([0], np.cumsum(counts)[:-1]))[filled]
+        sums[filled] = np.add.reduceat(sample[order], offsets, axis=0)
+        empty = np.flatnonzero(counts == 0)
+        if len(empty):
+            # Re-seed empty lists from random rows so every list stays usable.
+            sums[empty] = sample[rng.choice(len(sample), len(empty), replace=False)]
+        centroids = _normalize_rows(sums)
+    return centroids
+
+
+class _FileLock:
+    """``flock`` on *path* (created on demand) for the duration of a ``with``."""
+
+    def __init__(self, path: Path, *, shared: bool) -> None:
+        self._path = path
+        self._mode = fcntl.LOCK_SH if shared else fcntl.LOCK_EX
+        self._fh: Any = None
+
+    def __enter__(self) -> None:
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        self._fh = self._path.open("a")
+        fcntl.flock(self._fh, self._mode)
+
+    def __exit__(self, *exc: object) -> None:
+        fcntl.flock(self._fh, fcntl.LOCK_UN)
+        self._fh.close()
+
+
+# ---------------------------------------------------------------------------
+# Index
+# ---------------------------------------------------------------------------
+
+class SectionEmbeddingIndex:
+    """IVF-flat cosine index for one embedding ``model_version``.
+
+    Parameters
+    ----------
+    directory:
+        Model-version directory (see ``SectionEmbeddingIndex.open``).
+    nprobe:
+        Number of inverted lists scanned per query once trained.
+    """
+
+    def __init__(self, directory: Path | str, *, nprobe: int = DEFAULT_NPROBE) -> None:
+        self._dir = Path(directory)
+        self.nprobe = nprobe
+        # Readers and the writer may share one index (dashboard thread pools).
+        self._lock = threading.RLock()
+        self._dim: int | None = None
+        self._keys: list[SectionKey] = []
+        self._row_of: dict[SectionKey, int] = {}
+        self._vectors = np.zeros((0, 0), dtype=_F32)
+        self._lists = np.zeros(0, dtype=np.int32)
+        self._alive = np.zeros(0, dtype=bool)
+        self._centroids: np.ndarray | None = None
+        self._trained_rows = 0
+        self._segments: list[str] = []
+        self._generation: str | None = None
+        self.source_signature: str | None = None
+        if self.exists:
+            with self._file_lock(shared=True):
+                self._load()
+
+    @classmethod
+    def open(
+        cls, db_path: Path | str, model_version: str, *, nprobe: int = DEFAULT_NPROBE,
+    ) -> SectionEmbeddingIndex:
+        """Open (or prepare to create) the index stored next to ``db_path``."""
+        return cls(index_root_for(db_path) / _model_dir_name(model_version), nprobe=nprobe)
+
+    # ─── Introspection ───────────────────────────────────────────
+
+    @property
+    def exists(self) -> bool:
+        return (self._dir / _MANIFEST).exists()
+
+    @property
+    def dim(self) -> int | None:
+        return self._dim
+
+    @property
+    def is_trained(self) -> bool:
+        return self._centroids is not None
+
+    def __len__(self) -> int:
+        return int(self._alive.sum())
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._row_of
+
+    # ─── Writes ──────────────────────────────────────────────────
+
+    def add(
+        self, keys: Sequence[SectionKey], vectors: Sequence[bytes],
+        *, source_signature: str | None = None, based_on: str | None = None,
+    ) -> int:
+        """Upsert ``(doc_id, section_number)`` rows and persist them as a segment.
+
+        Vectors whose dimension differs from the index dimension are skipped.
+        ``source_signature`` records the state of the source table this write
+        brings the index level with (used by callers to detect staleness).
+        With ``based_on``, it is only recorded if the index on disk was level
+        with that earlier table state; otherwise the index stays stale.
+
+        Returns the number of rows indexed.
+        """
+        with self._lock, self._file_lock(shared=False):
+            self._refresh()
+            if based_on is not None and self.source_signature != based_on:
+                source_signature = None
+            return self._add(keys, vectors, source_signature=source_signature)
+
+    def _add(
+        self, keys: Sequence[SectionKey], vectors: Sequence[bytes],
+        *, source_signature: str | None,
+    ) -> int:
+        new_keys, matrix = self._decode(keys, vectors)
+        if new_keys:
+            lists = (
+                _assign(matrix, self._centroids) if self._centroids is not None
+                else np.zeros(len(new_keys), dtype=np.int32)
+            )
+            self._append(new_keys, matrix, lists)
+        if source_signature is not None:
+            self.source_signature = source_signature
+        if self._needs_compaction():
+            self._compact()
+        elif new_keys:
+            self._write_segment(new_keys, matrix, lists)
+            self._write_manifest()
+        elif source_signature is not None and self.exists:
+            self._write_manifest()
+        return len(new_keys)
+
+    def rebuild(
+        self, rows: Iterable[tuple[str, str, bytes]], *, source_signature: str | None = None,
+    ) -> int:
+        """Replace the whole index with ``rows`` of ``(doc_id, section, vector)``.
+
+        The dimension is taken from the most common vector length.
+        """
+        materialized = [(str(d), str(s), bytes(v)) for d, s, v in rows]
+        with self._lock, self._file_lock(shared=False):
+            return self._rebuild(materialized, source_signature=source_signature)
+
+    def _rebuild(
+        self, materialized: list[tuple[str, str, bytes]], *, source_signature: str | None,
+    ) -> int:
+        self._reset()
+        with contextlib.suppress(FileNotFoundError):
+            for path in self._dir.iterdir():
+                path.unlink()
+        if materialized:
+            lengths = np.array([len(v) for _, _, v in materialized])
+            values, counts = np.unique(lengths, return_counts=True)
+            width = int(values[np.argmax(counts)])
+            materialized = [r for r in materialized if len(r[2]) == width]
+            new_keys, matrix = self._decode(
+                [(d, s) for d, s, _ in materialized], [v for _, _, v in materialized],
+            )
+            self._append(new_keys, matrix, np.zeros(len(new_keys), dtype=np.int32))
+        self.source_signature = source_signature
+        self._compact()
+        return len(self)
+
+    def refresh(self) -> None:
+        """Reload the index if another instance has rewritten its manifest."""
+        with self._lock:
+            generation = self._disk_generation()
+            if generation is None:
+                self._reset()
+            elif generation != self._generation:
+                with self._file_lock(shared=True):
+                    self._refresh()
+
+    # ─── Queries ─────────────────────────────────────────────────
+
+    def search(
+        self,
+        query: bytes | np.ndarray,
+        *,
+        top_k: int = 10,
+        nprobe: int | None = None,
+        exclude: Iterable[SectionKey] = (),
+    ) -> list[tuple[str, str, float]]:
+        """Top-k ``(doc_id, section_number, cosine)`` rows closest to ``query``.
+
+        Returns an empty list when the query dimension does not match.
+        """
+        with self._lock:
+            return self._search(query, top_k=top_k, nprobe=nprobe, exclude=exclude)
+
+    def _search(
+        self,
+        query: bytes | np.ndarray,
+        *,
+        top_k: int,
+        nprobe: int | None,
+        exclude: Iterable[SectionKey],
+    ) -> list[tuple[str, str, float]]:
+        if self._dim is None or top_k <= 0:
+            return []
+        q = np.frombuffer(query, dtype=_F32) if isinstance(query, bytes) else query
+        if q.shape != (self._dim,):
+            return []
+        norm = float(np.linalg.norm(q))
+        if norm == 0.0:
+            return []
+        q = (q / norm).astype(_F32, copy=False)
+
+        mask = self._alive.copy()
+        for key in exclude:
+            row = self._row_of.get(key)
+            if row is not None:
+                mask[row] = False
+        if self._centroids is not None:
+            probe = top_k_indices(self._centroids @ q, nprobe or self.nprobe)
+            mask &= np.isin(self._lists, probe)
+        rows = np.flatnonzero(mask)
+        if not len(rows):
+            return []
+        scores = self._vectors[rows] @ q
+        best = top_k_indices(scores, top_k)
+        return [
+            (self._keys[rows[i]][0], self._keys[rows[i]][1], float(scores[i]))
+            for i in best
+        ]
+
+    # ─── Internals ───────────────────────────────────────────────
+
+    def _reset(self) -> None:
+        self._dim = None
+        self._keys = []
+        self._row_of = {}
+        self._vectors = np.zeros((0, 0), dtype=_F32)
+        self._lists = np.zeros(0, dtype=np.int32)
+        self._alive = np.zeros(0, dtype=bool)
+        self._centroids = None
+        self._trained_rows = 0
+        self._segments = []
+        self._generation = None
+        self.source_signature = None
+
+    def _refresh(self) -> None:
+        if self._generation != self._disk_generation():
+            self._reset()
+            self._load()
+
+    def _disk_generation(self) -> str | None:
+        try:
+            manifest = json.loads((self._dir / _MANIFEST).read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            return None
+        return manifest.get("generation")
+
+    def _file_lock(self, *, shared: bool) -> _FileLock:
+        return _FileLock(self._dir.with_name(self._dir.name + ".lock"), shared=shared)
+
+    def _decode(
+        self, keys: Sequence[SectionKey], vectors: Sequence[bytes],
+    ) -> tuple[list[SectionKey], np.ndarray]:
+        if self._dim is None:
+            first = next((v for v in vectors if v and len(v) % 4 == 0), None)
+            if first is None:
+                return [], np.zeros((0, 0), dtype=_F32)
+            self._dim = len(first) // 4
+        width = self._dim * 4
+        kept = [
+            ((str(k[0]), str(k[1])), v)
+            for k, v in zip(keys, vectors, strict=True) if len(v) == width
+        ]
+        if not kept:
+            return [], np.zeros((0, self._dim), dtype=_F32)
+        matrix = np.frombuffer(b"".join(v for _, v in kept), dtype=_F32)
+        return [k for k, _ in kept], _normalize_rows(matrix.reshape(len(kept), self._dim))
+
+    def _append(self, keys: list[SectionKey], matrix: np.ndarray, lists: np.ndarray) -> None:
+        base = len(self._keys)
+        # Within one batch the last occurrence of a key wins, like INSERT OR REPLACE.
+        alive = np.ones(len(keys), dtype=bool)
+        for offset, key in enumerate(keys):
+            prev = self._row_of.get(key)
+            if prev is not None:
+                if prev >= base:
+                    alive[prev - base] = False
+                else:
+                    self._alive[prev] = False
+            self._row_of[key] = base + offset
+        self._keys.extend(keys)
+        self._vectors = (
+            matrix if not len(self._vectors) else np.concatenate([self._vectors, matrix])
+        )
+        self._lists = np.concatenate([self._lists, lists.astype(np.int32, copy=False)])
+        self._alive = np.concatenate([self._alive, alive])
+
+    def _needs_compaction(self) -> bool:
+        n = len(self)
+        if self._centroids is None:
+            return n >= TRAIN_MIN_ROWS or not self.exists
+        return n > RETRAIN_GROWTH * self._trained_rows or len(self._segments) >= MAX_SEGMENTS
+
+    def _compact(self) -> None:
+        """Drop shadowed rows, (re)train if large enough, rewrite as one segment."""
+        live = np.flatnonzero(self._alive)
+        keys = [self._keys[i] for i in live]
+        vectors = self._vectors[live] if len(live) else self._vectors[:0]
+        n = len(keys)
+        if n >= TRAIN_MIN_ROWS and (
+            self._centroids is None or n > RETRAIN_GROWTH * self._trained_rows
+        ):
+            self._centroids = _train_centroids(vectors, _nlist_for(n))
+            self._trained_rows = n
+        lists = (
+            _assign(vectors, self._centroids) if self._centroids is not None
+            else np.zeros(n, dtype=np.int32)
+        )
+        self._keys = keys
+        self._row_of = {k: i for i, k in enumerate(keys)}
+        self._vectors = vectors
+        self._lists = lists
+        self._alive = np.ones(n, dtype=bool)
+
+        stale = list(self._segments)
+        self._segments = []
+        self._dir.mkdir(parents=True, exist_ok=True)
+        if self._centroids is not None:
+            self._atomic_save(self._dir / _CENTROIDS, lambda fh: np.save(fh, self._centroids))
+        if n:
+            self._write_segment(keys, vectors, lists)
+        self._write_manifest()
+        for name in stale:
+            with contextlib.suppress(FileNotFoundError):
+                (self._dir / name).unlink()
+
+    def _write_segment(
+        self, keys: list[SectionKey], matrix: np.ndarray, lists: np.ndarray,
+    ) -> None:
+        self._dir.mkdir(parents=True, exist_ok=True)
+        name = f"seg-{uuid.uuid4().hex}.npz"
+        payload: dict[str, Any] = {
+            "doc_ids": np.array([k[0] for k in keys], dtype=str),
+            "section_numbers": np.array([k[1] for k in keys], dtype=str),
+            "vectors": matrix,
+            "lists": lists,
+        }
+        self._atomic_save(self._dir / name, lambda fh: np.savez(fh, **payload))
+        self._segments.append(name)
+
+    def _write_manifest(self) -> None:
+        self._generation = uuid.uuid4().hex
+        manifest = {
+            "dim": self._dim,
+            "trained_rows": self._trained_rows,
+            "source_signature": self.source_signature,
+            "generation": self._generation,
+            "segments": self._segments,
+        }
+        self._atomic_save(
+            self._dir / _MANIFEST,
+            lambda fh: fh.write(json.dumps(manifest, indent=2).encode("utf-8")),
+        )
+
+    @staticmethod
+    def _atomic_save(path: Path, write: Any) -> None:
+        tmp = path.with_name(path.name + ".tmp")
+        with tmp.open("wb") as fh:
+            write(fh)
+        os.replace(tmp, path)
+
+    def _load(self) -> None:
+        manifest_path = self._dir / _MANIFEST
+        if not manifest_path.exists():
+            return
+        manifest = json.loads(manifest_path.read_text(encoding="utf-8"))
+        self._dim = manifest.get("dim")
+        self._trained_rows = int(manifest.get("trained_rows") or 0)
+        self.source_signature = manifest.get("source_signature")
+        self._generation = manifest.get("generation")
+        centroids_path = self._dir / _CENTROIDS
+        if self._trained_rows and centroids_path.exists():
+            self._centroids = np.load(centroids_path, allow_pickle=False)
+        for name in manifest.get("segments") or []:
+            with np.load(self._dir / name, allow_pickle=False) as seg:
+                keys = list(zip(
+                    seg["doc_ids"].tolist(), seg["section_numbers"].tolist(), strict=True,
+                ))
+                self._append(keys, seg["vectors"].astype(_F32, copy=False), seg["lists"])
+            self._segments.append(name)
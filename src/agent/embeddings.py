@@ -9,7 +9,8 @@ Design:
 - ``EmbeddingModel`` is the abstract interface (API-backed and local variants)
 - ``EmbeddingManager`` orchestrates batch embedding, centroid updates, and
   similarity queries using a ``LinkStore`` backend
-- All vectors are stored as ``bytes`` (little-endian float32 arrays)
+- All vectors are stored as ``bytes`` (little-endian float32 arrays); math
+  runs on NumPy views decoded with ``np.frombuffer`` (no per-element unpacking)
 - Graceful degradation: when no model is configured, all methods return None
   or empty results — callers must handle the ``None`` case
 """
@@ -18,11 +19,12 @@ from __future__ import annotations
 import hashlib
 import json
 import math
-import struct
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from typing import Any
 
+import numpy as np
+
 # orjson with stdlib fallback
 _orjson: Any
 try:
@@ -42,19 +44,42 @@ def _json_dumps(obj: Any) -> str:
 # Vector utilities
 # ---------------------------------------------------------------------------
 
+_F32 = np.dtype("<f4")
+_NORM_EPS = 1e-10
+
+
 def floats_to_bytes(floats: list[float]) -> bytes:
     """Serialize a float list to little-endian float32 bytes."""
-    return struct.pack(f"<{len(floats)}f", *floats)
+    return np.asarray(floats, dtype=_F32).tobytes()
 
 
-def bytes_to_floats(data: bytes) -> list[float]:
-    """Deserialize little-endian float32 bytes to a float list."""
+def bytes_to_array(data: bytes | bytearray | memoryview) -> np.ndarray:
+    """Decode little-endian float32 bytes into a read-only array view (no copy)."""
     if len(data) == 0:
         raise ValueError("Empty embedding vector")
     if len(data) % 4 != 0:
         raise ValueError(f"Byte length {len(data)} is not a multiple of 4")
-    n = len(data) // 4
-    return list(struct.unpack(f"<{n}f", data))
+    return np.frombuffer(data, dtype=_F32)
+
+
+def bytes_to_floats(data: bytes) -> list[float]:
+    """Deserialize little-endian float32 bytes to a float list."""
+    return bytes_to_array(data).tolist()
+
+
+def stack_vectors(vectors: list[bytes]) -> np.ndarray:
+    """Stack same-dimension float32 byte vectors into an ``(n, dim)`` matrix.
+
+    Raises ValueError if the list is empty or dimensions mismatch.
+    """
+    if not vectors:
+        raise ValueError("Cannot stack empty vector list")
+    first_len = len(vectors[0])
+    if any(len(v) != first_len for v in vectors):
+        raise ValueError("All vectors must have the same dimension")
+    if first_len == 0 or first_len % 4 != 0:
+        raise ValueError(f"Byte length {first_len} is not a positive multiple of 4")
+    return np.frombuffer(b"".join(vectors), dtype=_F32).reshape(len(vectors), first_len // 4)
 
 
 def cosine_similarity(a: bytes, b: bytes) -> float:
@@ -70,17 +95,48 @@ def cosine_similarity(a: bytes, b: bytes) -> float:
             f"Dimension mismatch: {len(a) // 4} vs {len(b) // 4}"
         )
 
-    va = bytes_to_floats(a)
-    vb = bytes_to_floats(b)
+    va = bytes_to_array(a).astype(np.float64)
+    vb = bytes_to_array(b).astype(np.float64)
 
-    dot = sum(x * y for x, y in zip(va, vb, strict=True))
-    norm_a = math.sqrt(sum(x * x for x in va))
-    norm_b = math.sqrt(sum(x * x for x in vb))
-
-    if norm_a < 1e-10 or norm_b < 1e-10:
+    norm_a = float(np.linalg.norm(va))
+    norm_b = float(np.linalg.norm(vb))
+    if norm_a < _NORM_EPS or norm_b < _NORM_EPS:
         return 0.0
 
-    return dot / (norm_a * norm_b)
+    return float(va @ vb) / (norm_a * norm_b)
+
+
+def cosine_similarities(query: bytes | np.ndarray, matrix: np.ndarray) -> np.ndarray:
+    """Cosine similarity of *query* against every row of *matrix* (one matmul).
+
+    Zero-norm rows (or a zero-norm query) score 0.0, matching
+    ``cosine_similarity``. Raises ValueError on dimension mismatch.
+    """
+    q = bytes_to_array(query) if isinstance(query, bytes | bytearray | memoryview) else query
+    q = np.asarray(q, dtype=np.float64)
+    if matrix.ndim != 2 or matrix.shape[1] != q.shape[0]:
+        raise ValueError(
+            f"Dimension mismatch: {q.shape[0]} vs {matrix.shape[-1] if matrix.ndim else 0}"
+        )
+    m = np.asarray(matrix, dtype=np.float64)
+    q_norm = float(np.linalg.norm(q))
+    if q_norm < _NORM_EPS:
+        return np.zeros(m.shape[0], dtype=np.float64)
+    row_norms = np.linalg.norm(m, axis=1)
+    dots = m @ q
+    valid = row_norms >= _NORM_EPS
+    sims = np.zeros(m.shape[0], dtype=np.float64)
+    sims[valid] = dots[valid] / (row_norms[valid] * q_norm)
+    return sims
+
+
+def top_k_indices(scores: np.ndarray, k: int) -> np.ndarray:
+    """Indices of the *k* highest scores, best first (ties keep input order)."""
+    n = int(scores.shape[0])
+    if k <= 0 or n == 0:
+        return np.empty(0, dtype=np.intp)
+    idx = np.argpartition(-scores, k - 1)[:k] if k < n else np.arange(n)
+    return idx[np.lexsort((idx, -scores[idx]))]
 
 
 def vector_mean(vectors: list[bytes]) -> bytes:
@@ -91,29 +147,17 @@ def vector_mean(vectors: list[bytes]) -> bytes:
     """
     if not vectors:
         raise ValueError("Cannot compute mean of empty vector list")
-
-    first_len = len(vectors[0])
-    if any(len(v) != first_len for v in vectors):
-        raise ValueError("All vectors must have the same dimension")
-
-    dim = first_len // 4
-    all_floats = [bytes_to_floats(v) for v in vectors]
-
-    mean = [
-        sum(vf[i] for vf in all_floats) / len(all_floats)
-        for i in range(dim)
-    ]
-    return floats_to_bytes(mean)
+    matrix = stack_vectors(vectors)
+    return matrix.mean(axis=0, dtype=np.float64).astype(_F32).tobytes()
 
 
 def l2_normalize(v: bytes) -> bytes:
     """L2-normalize a float32 byte vector. Returns unit-length vector."""
-    floats = bytes_to_floats(v)
-    norm = math.sqrt(sum(x * x for x in floats))
-    if norm < 1e-10:
+    arr = bytes_to_array(v).astype(np.float64)
+    norm = float(np.linalg.norm(arr))
+    if norm < _NORM_EPS:
         return v  # Zero vector stays zero
-    normalized = [x / norm for x in floats]
-    return floats_to_bytes(normalized)
+    return (arr / norm).astype(_F32).tobytes()
 
 
 def text_hash(text: str) -> str:
@@ -186,17 +230,15 @@ class MockEmbeddingModel(EmbeddingModel):
         results: list[bytes] = []
         for t in texts:
             h = hashlib.sha256(t.encode("utf-8")).digest()
-            # Generate dim floats from hash bytes, cycling if needed
-            floats: list[float] = []
-            for i in range(self._dim):
-                byte_idx = i % len(h)
-                # Map byte (0-255) to float (-1, 1)
-                floats.append((h[byte_idx] / 127.5) - 1.0)
+            # Generate dim floats from hash bytes, cycling if needed;
+            # map each byte (0-255) to a float in (-1, 1)
+            raw = np.frombuffer(h, dtype=np.uint8)
+            floats = raw[np.arange(self._dim) % len(h)] / 127.5 - 1.0
             # L2-normalize
-            norm = math.sqrt(sum(x * x for x in floats))
+            norm = math.sqrt(float(floats @ floats))
             if norm > 1e-10:
-                floats = [x / norm for x in floats]
-            results.append(floats_to_bytes(floats))
+                floats = floats / norm
+            results.append(floats.astype(_F32).tobytes())
         return results
 
     def model_version(self) -> str:
@@ -549,15 +591,14 @@ class EmbeddingManager:
 
         mv = self._model.model_version()
         vectors: list[bytes] = []
-
-        for section in active_link_sections:
-            emb: bytes | None = None
-            if self._store is not None:
-                emb = self._store.get_section_embedding(
-                    section["doc_id"], section["section_number"], mv,
-                )
-            if emb is not None:
-                vectors.append(emb)
+        if self._store is not None:
+            found = self._store.get_section_embeddings(
+                [(s["doc_id"], s["section_number"]) for s in active_link_sections], mv,
+            )
+            for section in active_link_sections:
+                emb = found.get((str(section["doc_id"]), str(section["section_number"])))
+                if emb is not None:
+                    vectors.append(emb)
 
         if not vectors:
             return None
@@ -614,22 +655,54 @@ class EmbeddingManager:
         list[SimilarSection]
             Results sorted by similarity (highest first).
         """
-        scored: list[SimilarSection] = []
-        for cand in candidate_embeddings:
-            try:
-                sim = cosine_similarity(query_vector, cand["embedding_vector"])
-            except ValueError:
-                continue
-            if sim >= min_similarity:
-                scored.append(SimilarSection(
-                    doc_id=cand["doc_id"],
-                    section_number=cand["section_number"],
-                    similarity=sim,
-                    text_hash=cand.get("text_hash", ""),
-                ))
+        if len(query_vector) == 0 or len(query_vector) % 4 != 0:
+            return []
+        # Candidates that cannot be compared (wrong dimension) are skipped.
+        usable = [
+            cand for cand in candidate_embeddings
+            if len(cand["embedding_vector"]) == len(query_vector)
+        ]
+        if not usable:
+            return []
+
+        matrix = stack_vectors([bytes(c["embedding_vector"]) for c in usable])
+        sims = cosine_similarities(query_vector, matrix)
+        keep = np.flatnonzero(sims >= min_similarity)
+        best = keep[top_k_indices(sims[keep], top_k)]
+        return [
+            SimilarSection(
+                doc_id=usable[i]["doc_id"],
+                section_number=usable[i]["section_number"],
+                similarity=float(sims[i]),
+                text_hash=usable[i].get("text_hash", ""),
+            )
+            for i in best
+        ]
 
-        scored.sort(key=lambda s: s.similarity, reverse=True)
-        return scored[:top_k]
+    def find_similar_indexed(
+        self,
+        query_vector: bytes,
+        *,
+        top_k: int = 5,
+        min_similarity: float = 0.0,
+        exclude: list[tuple[str, str]] | None = None,
+    ) -> list[SimilarSection]:
+        """Corpus-wide nearest sections via the store's ANN index.
+
+        Unlike ``find_similar`` this needs no candidate list: every stored
+        embedding for the current model version is searchable.  ``exclude``
+        drops ``(doc_id, section_number)`` keys (e.g. the query section).
+        Returns an empty list when no model or store is configured.
+        """
+        if self._store is None or self._model is None:
+            return []
+        index = self._store.embedding_index(self._model.model_version())
+        hits = index.search(query_vector, top_k=top_k, exclude=exclude or ())
+        return [
+            SimilarSection(doc_id=d, section_number=s, similarity=sim, text_hash="")
+            for d, s, sim in hits
+            if sim >= min_similarity
+        ]
 
     def section_similarity(
         self,
@@ -47,6 +47,8 @@ type InverseMap = tuple[InverseMapEntry, ...]
 # Block-level tags that generate paragraph breaks
 # ---------------------------------------------------------------------------
 
+DEFAULT_HTML_PARSER = "html.parser"
+
 _BLOCK_TAGS: list[str] = [
     "p", "div", "br", "tr", "li",
     "h1", "h2", "h3", "h4", "h5", "h6",
@@ -115,6 +117,8 @@ def strip_html(
 
 def normalize_html(
     raw_html: str,
+    *,
+    parser: str = DEFAULT_HTML_PARSER,
 ) -> tuple[str, InverseMap]:
     """Convert HTML to structured text with character-level inverse map.
 
@@ -126,14 +130,19 @@ def normalize_html(
         1. Parse HTML, handle image-overlay PDF format.
         2. Insert newlines before block-level elements.
         3. Get full text with space separator.
-        4. Walk through text, applying whitespace collapse while recording
-           which raw-text segments survive into the normalized output.
-        5. Build InverseMapEntry runs from the surviving segments.
-        6. Adjust for leading whitespace strip().
-        7. Merge adjacent runs with contiguous offsets (RLE compression).
+        4. Collapse whitespace (horizontal runs -> one space, 3+ newlines
+           -> two), emitting one InverseMapEntry per unchanged stretch.
+        5. Adjust for leading whitespace strip().
+
+    The normalized text is also what ``strip_html`` returns for the same
+    input (bar image-overlay PDFs), so callers that only need a length
+    check can use it instead of parsing twice.
 
     Args:
         raw_html: Raw HTML string.
+        parser: BeautifulSoup tree builder.  ``"lxml"`` parses faster but
+            repairs malformed markup differently, which changes the text
+            (and so content-addressed doc_ids) for some documents.
 
     Returns:
         Tuple of (normalized_text, inverse_map).
@@ -141,7 +150,7 @@ def normalize_html(
     if not raw_html:
         return ("", ())
 
-    soup = BeautifulSoup(raw_html, "html.parser")
+    soup = BeautifulSoup(raw_html, parser)
 
     # Phase 0: Handle image-overlay PDFs
     if _is_image_overlay_pdf(raw_html):
@@ -158,102 +167,8 @@ def normalize_html(
     _insert_block_newlines(soup)
     raw_text = soup.get_text(separator=" ")
 
-    # Phase 2: Walk raw_text, apply whitespace collapse, record segments.
-    segments: list[tuple[int, int, str]] = []
-    i = 0
-    while i < len(raw_text):
-        if raw_text[i] != "\n" and raw_text[i].isspace():
-            j = i
-            while j < len(raw_text) and raw_text[j] != "\n" and raw_text[j].isspace():
-                j += 1
-            segments.append((i, j, " "))
-            i = j
-        elif raw_text[i] == "\n":
-            j = i
-            while j < len(raw_text) and raw_text[j] == "\n":
-                j += 1
-            if j - i >= 3:
-                segments.append((i, j, "\n\n"))
-            else:
-                segments.append((i, j, raw_text[i:j]))
-            i = j
-        else:
-            j = i
-            while j < len(raw_text) and not raw_text[j].isspace():
-                j += 1
-            segments.append((i, j, raw_text[i:j]))
-            i = j
-
-    # Phase 3: Build normalized text and InverseMapEntry runs.
-    runs: list[InverseMapEntry] = []
-    norm_pos = 0
-    result_parts: list[str] = []
-
-    for raw_start, raw_end, collapsed in segments:
-        if not collapsed:
-            continue
-        seg_len = len(collapsed)
-
-        if collapsed == raw_text[raw_start:raw_end]:
-            runs.append(InverseMapEntry(
-                normalized_start=norm_pos,
-                original_start=raw_start,
-                length=seg_len,
-            ))
-        else:
-            runs.append(InverseMapEntry(
-                normalized_start=norm_pos,
-                original_start=raw_start,
-                length=min(seg_len, 1),
-            ))
-
-        result_parts.append(collapsed)
-        norm_pos += seg_len
-
-    full_text = "".join(result_parts)
-    normalized = full_text.strip()
-
-    # Phase 4: Adjust for leading strip.
-    strip_start = len(full_text) - len(full_text.lstrip())
-
-    if strip_start > 0:
-        adjusted: list[InverseMapEntry] = []
-        for run in runs:
-            new_start = run.normalized_start - strip_start
-            if new_start + run.length <= 0:
-                continue
-            if new_start < 0:
-                clip = -new_start
-                adjusted.append(InverseMapEntry(
-                    normalized_start=0,
-                    original_start=run.original_start + clip,
-                    length=run.length - clip,
-                ))
-            else:
-                adjusted.append(InverseMapEntry(
-                    normalized_start=new_start,
-                    original_start=run.original_start,
-                    length=run.length,
-                ))
-        runs = adjusted
-
-    # Phase 5: Merge adjacent runs (RLE compression).
-    merged: list[InverseMapEntry] = []
-    for run in runs:
-        if run.length <= 0:
-            continue
-        if (
-            merged
-            and merged[-1].normalized_start + merged[-1].length == run.normalized_start
-            and merged[-1].original_start + merged[-1].length == run.original_start
-        ):
-            merged[-1] = InverseMapEntry(
-                normalized_start=merged[-1].normalized_start,
-                original_start=merged[-1].original_start,
-                length=merged[-1].length + run.length,
-            )
-        else:
-            merged.append(run)
+    # Phase 2: Collapse whitespace and emit merged inverse-map runs.
+    normalized, merged = _collapse_with_inverse_map(raw_text)
 
     # Block-2 Imps 13-15: post-extraction cleanup.
     # Applied after inverse map construction.  Inverse map offsets may be
@@ -309,6 +224,67 @@ def _insert_block_newlines(soup: BeautifulSoup) -> None:
         tag.insert_before("\n")
 
 
+# Whitespace that normalization rewrites: horizontal runs other than a
+# lone " ", and runs of three or more newlines.
+_CHANGED_WS_RE = re.compile(r"[^\S\n]{2,}|[^\S\n ]|\n{3,}")
+
+
+def _collapse_with_inverse_map(raw_text: str) -> tuple[str, InverseMap]:
+    """Collapse whitespace as ``_collapse_whitespace`` + ``strip()`` would.
+
+    Only the rewritten runs are visited; every unchanged stretch becomes a
+    single inverse-map run, and each rewritten run maps its first output
+    character to the run's first raw character.  Runs contiguous in both
+    coordinates are merged.
+    """
+    parts: list[str] = []
+    runs: list[list[int]] = []  # [normalized_start, original_start, length]
+    norm_pos = 0
+
+    def _emit(orig_start: int, length: int, text_len: int) -> None:
+        nonlocal norm_pos
+        if length > 0:
+            last = runs[-1] if runs else None
+            if (
+                last is not None
+                and last[0] + last[2] == norm_pos
+                and last[1] + last[2] == orig_start
+            ):
+                last[2] += length
+            else:
+                runs.append([norm_pos, orig_start, length])
+        norm_pos += text_len
+
+    prev = 0
+    for m in _CHANGED_WS_RE.finditer(raw_text):
+        start = m.start()
+        if start > prev:
+            parts.append(raw_text[prev:start])
+            _emit(prev, start - prev, start - prev)
+        collapsed = "\n\n" if raw_text[start] == "\n" else " "
+        parts.append(collapsed)
+        _emit(start, 1, len(collapsed))
+        prev = m.end()
+    if prev < len(raw_text):
+        parts.append(raw_text[prev:])
+        _emit(prev, len(raw_text) - prev, len(raw_text) - prev)
+
+    full_text = "".join(parts)
+    strip_start = len(full_text) - len(full_text.lstrip())
+    entries: list[InverseMapEntry] = []
+    for norm_start, orig_start, length in runs:
+        new_start = norm_start - strip_start
+        if new_start + length <= 0:
+            continue
+        clip = max(0, -new_start)
+        entries.append(InverseMapEntry(
+            normalized_start=new_start + clip,
+            original_start=orig_start + clip,
+            length=length - clip,
+        ))
+    return full_text.strip(), tuple(entries)
+
+
 def _collapse_whitespace(text: str) -> str:
     """Collapse horizontal whitespace (preserving newlines) and limit blanks."""
     text = re.sub(r"[^\S\n]+", " ", text)
@@ -335,6 +311,9 @@ def strip_zero_width(text: str) -> str:
 # ---------------------------------------------------------------------------
 
 
+_QUOTE_OR_NEWLINE_RE = re.compile(r'["\n]')
+
+
 def normalize_quotes(text: str) -> str:
     """Convert straight double quotes to smart quotes (U+201C / U+201D).
 
@@ -345,24 +324,31 @@ def normalize_quotes(text: str) -> str:
     Handles paragraph-spanning definitions by not resetting quote state at
     line breaks unless the next content line starts a new quoted term.
     """
+    if '"' not in text:
+        return text
     result: list[str] = []
     open_quote = False
-
-    for i, c in enumerate(text):
-        if c == '"':
+    prev = 0
+
+    # Only quotes (and, inside a quote, newlines) change state; jump
+    # between them instead of visiting every character.
+    for m in _QUOTE_OR_NEWLINE_RE.finditer(text):
+        i = m.start()
+        if text[i] == '"':
+            result.append(text[prev:i])
             if not open_quote:
                 result.append("\u201c")  # Left smart quote
                 open_quote = True
             else:
                 result.append("\u201d")  # Right smart quote
                 open_quote = False
-        else:
-            if c == "\n" and open_quote:
-                rest = text[i + 1:i + 200]
-                next_content = rest.lstrip("\n ")
-                if not next_content or next_content[0] == '"':
-                    open_quote = False
-            result.append(c)
+            prev = i + 1
+        elif open_quote:
+            rest = text[i + 1:i + 200]
+            next_content = rest.lstrip("\n ")
+            if not next_content or next_content[0] == '"':
+                open_quote = False
+    result.append(text[prev:])
 
     return "".join(result)
 
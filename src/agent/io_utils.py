@@ -1,11 +1,16 @@
 """I/O utilities for JSON, JSONL, and text file operations.
 
 Provides orjson-accelerated JSON I/O with stdlib fallback, JSONL support,
-and numpy-safe serialization. Ported from vantage_platform/infra/io.py.
+numpy-safe serialization, and CSV-staged bulk loading into DuckDB.
+Ported from vantage_platform/infra/io.py.
 """
 from __future__ import annotations
 
+import csv
 import json
+import os
+import tempfile
+from collections.abc import Iterable, Sequence
 from pathlib import Path
 from typing import Any, cast
 
@@ -94,3 +99,44 @@ def convert_numpy(obj: Any) -> Any:
     if isinstance(obj, np.bool_):
         return bool(cast(Any, obj))
     return obj
+
+
+# Sentinel written for Python ``None`` so genuine empty strings survive COPY.
+_CSV_NULL = "\\N"
+
+
+def copy_rows_into(
+    conn: Any,
+    table: str,
+    rows: Iterable[Sequence[Any]],
+    *,
+    columns: Sequence[str] | None = None,
+) -> int:
+    """Bulk-load *rows* into a DuckDB *table* via a staged CSV and ``COPY``.
+
+    ``executemany`` costs roughly a round-trip per row in DuckDB; staging
+    through a temp file and ``COPY ... FROM`` is orders of magnitude
+    faster for large batches. Column types come from the target table.
+
+    Returns:
+        Number of rows loaded.
+    """
+    fd, tmp_name = tempfile.mkstemp(prefix=f"{table}_", suffix=".csv")
+    count = 0
+    try:
+        with os.fdopen(fd, "w", newline="", encoding="utf-8") as f:
+            writer = csv.writer(f, lineterminator="\n")
+            for row in rows:
+                writer.writerow([_CSV_NULL if v is None else v for v in row])
+                count += 1
+        if count:
+            target = f"{table} ({', '.join(columns)})" if columns else table
+            path_literal = tmp_name.replace("'", "''")
+            conn.execute(
+                f"COPY {target} FROM '{path_literal}' "
+                "(FORMAT csv, HEADER false, AUTO_DETECT false, DELIM ',', "
+                "QUOTE '\"', ESCAPE '\"', NULLSTR '\\N', NEW_LINE '\\n')"
+            )
+    finally:
+        Path(tmp_name).unlink(missing_ok=True)
+    return count
@@ -0,0 +1,212 @@
+"""Wake-up channel from job submitters to link workers.
+
+Link workers claim jobs from ``job_queue`` in ``links.duckdb``.  Instead of
+polling the table, each worker process listens on a FIFO in a directory
+next to the database (``<links.duckdb>.workers/<pid>.fifo``); whoever
+submits or cancels a job writes one line to every FIFO there:
+
+* ``submit <job_id>`` — a job is pending; idle workers re-run ``claim_job``.
+* ``cancel <job_id>`` — the job was cancelled; running handlers see it via
+  ``JobListener.is_cancelled`` without waiting for their next read of the
+  job row.
+
+Notifications are hints, not the source of truth: claims still go through
+``job_queue`` and workers re-read the queue (and a running job's row) on a
+coarse timer, so a lost notification only delays a job or its cancellation.
+FIFOs of dead workers (no reader) are removed by the next notification; a
+listener creates its FIFO under a temporary name and only renames it into
+place once the read end is open, and ``JobListener.ensure_fifo`` recreates
+it if it goes missing anyway.  On platforms without ``os.mkfifo`` listeners
+fail to start and workers fall back to polling.
+
+Functions / classes:
+
+* ``job_notify_dir`` — notification directory of a links database.
+* ``notify_workers`` — write one event to every listening worker.
+* ``JobListener`` — a worker process's FIFO reader.
+"""
+from __future__ import annotations
+
+import contextlib
+import errno
+import os
+import threading
+from pathlib import Path
+
+NOTIFY_SUBMIT = "submit"
+NOTIFY_CANCEL = "cancel"
+_NOTIFY_STOP = "stop"
+_FIFO_SUFFIX = ".fifo"
+
+
+def job_notify_dir(links_db_path: Path | str) -> Path:
+    """Directory holding the worker FIFOs of *links_db_path*."""
+    path = Path(links_db_path)
+    return path.with_name(f"{path.name}.workers")
+
+
+def notify_workers(directory: Path, event: str, job_id: str) -> int:
+    """Write ``"<event> <job_id>"`` to every worker FIFO in *directory*.
+
+    Never blocks.  A worker whose FIFO is full already has unread wake-ups,
+    so a dropped ``submit`` still counts as delivered; any other dropped
+    event does not (workers catch up on their next read of the job row).
+    Returns the number of workers notified.
+    """
+    if not directory.is_dir():
+        return 0
+    message = f"{event} {job_id}\n".encode()
+    notified = 0
+    for fifo in directory.glob(f"*{_FIFO_SUFFIX}"):
+        try:
+            fd = os.open(fifo, os.O_WRONLY | os.O_NONBLOCK)
+        except FileNotFoundError:
+            continue
+        except OSError as exc:
+            if exc.errno == errno.ENXIO:
+                # No reader: the worker exited without cleaning up.
+                with contextlib.suppress(OSError):
+                    fifo.unlink()
+            continue
+        try:
+            os.write(fd, message)
+            notified += 1
+        except BlockingIOError:
+            if event == NOTIFY_SUBMIT:
+                notified += 1
+        except OSError:
+            pass
+        finally:
+            os.close(fd)
+    return notified
+
+
+class JobListener:
+    """Reads job notifications for one worker process.
+
+    A reader thread drains the FIFO; every ``submit`` event (and
+    :meth:`interrupt`) advances :attr:`generation`, which idle claim loops
+    wait on with :meth:`wait`.  Record the generation *before* an empty
+    ``claim_job`` so a job submitted in between is not missed.
+    """
+
+    def __init__(self, directory: Path) -> None:
+        self._path = directory / f"{os.getpid()}{_FIFO_SUFFIX}"
+        self._cond = threading.Condition()
+        self._restart_lock = threading.Lock()
+        self._generation = 0
+        self._cancelled: set[str] = set()
+        self._read_fd: int | None = None
+        self._write_fd: int | None = None
+        self._thread: threading.Thread | None = None
+
+    @property
+    def path(self) -> Path:
+        return self._path
+
+    @property
+    def generation(self) -> int:
+        with self._cond:
+            return self._generation
+
+    def start(self) -> None:
+        """Create the FIFO and start reading it (raises OSError if unsupported)."""
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        # Notifiers treat a reader-less FIFO as stale and unlink it, so only
+        # publish the FIFO under its ``*.fifo`` name once the read end is open.
+        staging = self._path.with_name(f".{self._path.name}.new")
+        with contextlib.suppress(FileNotFoundError):
+            staging.unlink()
+        os.mkfifo(staging, 0o600)
+        try:
+            self._read_fd = os.open(staging, os.O_RDONLY | os.O_NONBLOCK)
+            # Holding a write end keeps reads blocking instead of hitting EOF
+            # whenever the last notifier closes, and lets close() stop the reader.
+            self._write_fd = os.open(staging, os.O_WRONLY)
+            os.replace(staging, self._path)
+        except OSError:
+            self._stop_reader()
+            with contextlib.suppress(OSError):
+                staging.unlink()
+            raise
+        os.set_blocking(self._read_fd, True)
+        self._thread = threading.Thread(
+            target=self._read_loop, name="job-listener", daemon=True,
+        )
+        self._thread.start()
+
+    def wait(self, seen: int, timeout: float) -> int:
+        """Block until the generation moves past *seen* or *timeout* passes."""
+        with self._cond:
+            self._cond.wait_for(lambda: self._generation != seen, timeout)
+            return self._generation
+
+    def interrupt(self) -> None:
+        """Wake every waiter (e.g. on shutdown)."""
+        with self._cond:
+            self._generation += 1
+            self._cond.notify_all()
+
+    def is_cancelled(self, job_id: str) -> bool:
+        with self._cond:
+            return job_id in self._cancelled
+
+    def forget(self, job_id: str) -> None:
+        """Drop the cancel record of a finished job."""
+        with self._cond:
+            self._cancelled.discard(job_id)
+
+    def ensure_fifo(self) -> bool:
+        """Recreate the FIFO if something removed it; returns True if it did.
+
+        Waiters are woken afterwards, since submits sent while the FIFO was
+        missing never reached this listener.
+        """
+        with self._restart_lock:
+            if self._read_fd is None or self._path.exists():
+                return False
+            self._stop_reader()
+            self.start()
+        self.interrupt()
+        return True
+
+    def close(self) -> None:
+        with self._restart_lock:
+            self._stop_reader()
+            with contextlib.suppress(OSError):
+                self._path.unlink()
+
+    def _stop_reader(self) -> None:
+        if self._write_fd is not None:
+            with contextlib.suppress(OSError):
+                os.write(self._write_fd, f"{_NOTIFY_STOP} -\n".encode())
+            if self._thread is not None:
+                self._thread.join(timeout=5)
+            os.close(self._write_fd)
+            self._write_fd = None
+        if self._read_fd is not None:
+            os.close(self._read_fd)
+            self._read_fd = None
+
+    def _read_loop(self) -> None:
+        read_fd = self._read_fd
+        assert read_fd is not None
+        pending = b""
+        while True:
+            try:
+                chunk = os.read(read_fd, 4096)
+            except OSError:
+                return
+            if not chunk:
+                return
+            *lines, pending = (pending + chunk).split(b"\n")
+            for line in lines:
+                event, _, job_id = line.decode("utf-8", "replace").partition(" ")
+                if event == _NOTIFY_STOP:
+                    return
+                with self._cond:
+                    if event == NOTIFY_CANCEL:
+                        self._cancelled.add(job_id)
+                    elif event == NOTIFY_SUBMIT:
+                        self._generation += 1
+                        self._cond.notify_all()
@@ -18,11 +18,13 @@ Tier thresholds (calibratable per family):
 """
 from __future__ import annotations
 
-import math
-import struct
 from dataclasses import dataclass
 from typing import Any
 
+from agent.embeddings import (
+    cosine_similarity,
+    floats_to_bytes,  # noqa: F401  (re-exported; vector helpers live in agent.embeddings)
+)
 from agent.query_filters import FilterExpression, FilterMatch
 
 # ---------------------------------------------------------------------------
@@ -103,7 +105,8 @@ def compute_link_confidence(
     template_stats:
         Dict of template_family → historical hit rate (0.0–1.0).
     clause_signals:
-        Dict of signal_name → density score for clause text.
+        Dict of signal_name → density score for clause text (e.g. the
+        per-clause DNA densities from ``StrategyMatcher.clause_signals``).
     defined_terms_present:
         List of defined terms found in the section/document.
     expected_defined_terms:
@@ -405,49 +408,13 @@ def _semantic_similarity_score(
     """
     if section_embedding is None or family_centroid is None:
         return (0.5, {"reason": "embeddings_unavailable"})
-
     try:
         sim = cosine_similarity(section_embedding, family_centroid)
-        # Map cosine similarity [-1, 1] to [0, 1]
-        score = (sim + 1.0) / 2.0
-        return (score, {"reason": "cosine_similarity", "raw_similarity": sim})
-    except (ValueError, struct.error):
+    except ValueError:
         return (0.5, {"reason": "embedding_decode_error"})
-
-
-# ---------------------------------------------------------------------------
-# Embedding utilities
-# ---------------------------------------------------------------------------
-
-def cosine_similarity(a_bytes: bytes, b_bytes: bytes) -> float:
-    """Compute cosine similarity between two float32 vectors stored as bytes."""
-    a = _bytes_to_floats(a_bytes)
-    b = _bytes_to_floats(b_bytes)
-
-    if len(a) != len(b):
-        raise ValueError(f"Vector dimension mismatch: {len(a)} vs {len(b)}")
-    if len(a) == 0:
-        raise ValueError("Empty vectors")
-
-    dot = sum(x * y for x, y in zip(a, b, strict=True))
-    norm_a = math.sqrt(sum(x * x for x in a))
-    norm_b = math.sqrt(sum(x * x for x in b))
-
-    if norm_a < 1e-9 or norm_b < 1e-9:
-        return 0.0
-
-    return dot / (norm_a * norm_b)
-
-
-def _bytes_to_floats(data: bytes) -> list[float]:
-    """Decode bytes to a list of float32 values."""
-    n = len(data) // 4
-    return list(struct.unpack(f"<{n}f", data[:n * 4]))
-
-
-def floats_to_bytes(values: list[float]) -> bytes:
-    """Encode a list of float values to float32 bytes."""
-    return struct.pack(f"<{len(values)}f", *values)
+    # Map cosine similarity [-1, 1] to [0, 1]
+    score = (sim + 1.0) / 2.0
+    return (score, {"reason": "cosine_similarity", "raw_similarity": sim})
 
 
 # ---------------------------------------------------------------------------
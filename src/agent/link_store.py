@@ -19,12 +19,21 @@ from __future__ import annotations
 import contextlib
 import importlib
 import json
+import os
+import random
 import re
+import time
 import uuid
+from collections.abc import Callable, Mapping, Sequence
+from dataclasses import dataclass
 from datetime import UTC, datetime, timedelta
 from pathlib import Path
 from typing import Any
 
+from agent.embedding_index import SectionEmbeddingIndex
+from agent.embeddings import cosine_similarities, stack_vectors, top_k_indices
+from agent.io_utils import copy_rows_into
+from agent.job_notify import NOTIFY_CANCEL, NOTIFY_SUBMIT, job_notify_dir, notify_workers
 from agent.query_filters import (
     FilterExpression,
     build_filter_sql,
@@ -68,6 +77,32 @@ def _now() -> str:
     return datetime.now(UTC).isoformat()
 
 
+# Link export formats and the columns of the (flat) CSV export.
+EXPORT_FORMATS: frozenset[str] = frozenset({"csv", "jsonl", "parquet"})
+_EXPORT_CSV_COLUMNS = (
+    "link_id", "family_id", "doc_id", "section_number",
+    "heading", "confidence", "confidence_tier", "status",
+)
+
+
+# Job claim order (lower first): interactive jobs a user is waiting on run
+# ahead of bulk jobs.  Unknown job types get the default priority.
+JOB_PRIORITY_INTERACTIVE = 0
+JOB_PRIORITY_DEFAULT = 1
+JOB_PRIORITY_BATCH = 2
+JOB_PRIORITIES: dict[str, int] = {
+    "preview": JOB_PRIORITY_INTERACTIVE,
+    "apply": JOB_PRIORITY_INTERACTIVE,
+    "canary": JOB_PRIORITY_DEFAULT,
+    "check_drift": JOB_PRIORITY_DEFAULT,
+    "export": JOB_PRIORITY_DEFAULT,
+    "batch_run": JOB_PRIORITY_BATCH,
+    "embeddings_compute": JOB_PRIORITY_BATCH,
+}
+# Claim attempts when concurrent claimers race for the same job.
+_CLAIM_ATTEMPTS = 50
+
+
 def _to_dict(cols: list[str], row: tuple[Any, ...]) -> dict[str, Any]:
     """Zip column names with a row tuple into a dict (strict length check)."""
     return dict(zip(cols, row, strict=True))
@@ -79,6 +114,44 @@ def _opt_json(d: dict[str, Any], key: str) -> str | None:
     return _json_dumps(val) if val else None
 
 
+_LINK_COLUMNS = (
+    "link_id", "family_id", "ontology_node_id", "scope_id", "doc_id", "section_number",
+    "heading", "article_num", "article_concept", "rule_id", "rule_version", "rule_hash",
+    "run_id", "source", "section_char_start", "section_char_end", "section_text_hash",
+    "clause_id", "clause_char_start", "clause_char_end", "clause_text", "clause_key",
+    "link_role", "confidence", "confidence_tier", "confidence_breakdown", "status",
+    "corpus_version", "parser_version", "created_at",
+)
+
+_EVIDENCE_COLUMNS = (
+    "evidence_id", "link_id", "evidence_type", "char_start", "char_end",
+    "text_hash", "matched_pattern", "reason_code", "score", "metadata",
+)
+
+_PREVIEW_CANDIDATE_COLUMNS = (
+    "preview_id", "candidate_id", "doc_id", "section_number", "heading", "article_num",
+    "article_concept", "template_family", "confidence", "confidence_tier",
+    "confidence_breakdown", "why_matched", "priority_score",
+    "uncertainty_score", "impact_score", "drift_score",
+    "flags", "conflict_families", "clause_id", "clause_path", "clause_label",
+    "clause_char_start", "clause_char_end", "clause_text", "defined_term",
+    "definition_char_start", "definition_char_end", "definition_text", "clause_key",
+    "user_verdict",
+)
+
+_SECTION_EMBEDDING_COLUMNS = (
+    "doc_id", "section_number", "embedding_vector", "model_version", "text_hash", "created_at",
+)
+
+
+@dataclass(frozen=True, slots=True)
+class BulkInsertResult:
+    """Outcome of a set-at-a-time insert: rows written vs rows skipped."""
+
+    inserted: int
+    skipped: int
+
+
 def _canonical_family_token(value: Any) -> str:
     raw = str(value or "").strip().lower()
     if not raw:
@@ -375,6 +448,7 @@ CREATE TABLE IF NOT EXISTS job_queue (
     error_message VARCHAR,
     progress_pct DOUBLE NOT NULL DEFAULT 0.0,
     progress_message VARCHAR DEFAULT 'Queued',
+    priority INTEGER NOT NULL DEFAULT 1,
     worker_pid INTEGER,
     submitted_at TIMESTAMP DEFAULT current_timestamp,
     claimed_at TIMESTAMP,
@@ -587,6 +661,8 @@ class LinkStore:
             raise FileNotFoundError(f"Links database not found: {self._db_path}")
 
         self._conn: Any = _duckdb_mod.connect(str(self._db_path))
+        self._embedding_indexes: dict[str, SectionEmbeddingIndex] = {}
+        self._column_types: dict[str, dict[str, str]] = {}
 
         # Always run schema setup/migrations so older DB files receive
         # additive columns (for example `family_link_rules.name`).
@@ -760,6 +836,12 @@ class LinkStore:
             "ALTER TABLE family_links ADD COLUMN clause_key VARCHAR DEFAULT '__section__'",
             default="__section__",
         )
+        self._add_column_if_missing(
+            "job_queue",
+            "priority",
+            "ALTER TABLE job_queue ADD COLUMN priority INTEGER DEFAULT 1",
+            default=JOB_PRIORITY_DEFAULT,
+        )
 
         # Backfill additive fields for older databases.
         with contextlib.suppress(Exception):
@@ -1869,6 +1951,149 @@ class LinkStore:
         cols = [d[0] for d in self._conn.description]
         return [_to_dict(cols, row) for row in rows]
 
+    def export_links(
+        self,
+        path: Path,
+        *,
+        export_format: str = "csv",
+        family_id: str | None = None,
+        status: str | None = None,
+        include_evidence: bool = False,
+        include_defined_terms: bool = False,
+        batch_size: int = 10_000,
+        progress: Callable[[int, int], None] | None = None,
+    ) -> int:
+        """Stream links to *path* without materializing them in Python.
+
+        ``parquet`` and ``csv`` are written by DuckDB ``COPY ... TO``;
+        ``jsonl`` is written batch by batch from the query cursor (Arrow
+        record batches when pyarrow is installed).  ``csv`` carries the flat
+        link columns, the other formats every ``family_links`` column.
+        Evidence spans and defined terms are joined as per-link lists on
+        request (JSON-encoded strings in ``csv``).  *progress* receives
+        ``(rows_written, total_rows)``.  The file is written to a temp name
+        and renamed into place.  Returns the number of rows written.
+        """
+        if export_format not in EXPORT_FORMATS:
+            raise ValueError(f"Unsupported export format: {export_format}")
+        conditions: list[str] = []
+        params: list[Any] = []
+        if family_id:
+            scope_ids = self.resolve_scope_aliases(family_id) or [str(family_id).strip()]
+            conditions.append(f"{self._scope_sql_expr()} IN (SELECT UNNEST(?::VARCHAR[]))")
+            params.append(scope_ids)
+        if status:
+            conditions.append("status = ?")
+            params.append(status)
+        where = " WHERE " + " AND ".join(conditions) if conditions else ""
+        total = int(self._conn.execute(
+            f"SELECT COUNT(*) FROM family_links{where}", params,
+        ).fetchone()[0])
+        if progress is not None:
+            progress(0, total)
+
+        flat = export_format == "csv"
+        ctes: list[str] = []
+        select_cols = (
+            ", ".join(f"l.{col}" for col in _EXPORT_CSV_COLUMNS) if flat else "l.*"
+        )
+        joins = ""
+        for enabled, name, source in (
+            (
+                include_evidence,
+                "evidence",
+                "SELECT link_id, list({'evidence_type': evidence_type, "
+                "'char_start': char_start, 'char_end': char_end, "
+                "'matched_pattern': matched_pattern, 'reason_code': reason_code, "
+                "'score': score} ORDER BY char_start) AS evidence "
+                "FROM link_evidence GROUP BY link_id",
+            ),
+            (
+                include_defined_terms,
+                "defined_terms",
+                "SELECT link_id, list({'term': term, "
+                "'definition_section_path': definition_section_path, "
+                "'definition_char_start': definition_char_start, "
+                "'definition_char_end': definition_char_end, "
+                "'confidence': confidence} ORDER BY term) AS defined_terms "
+                "FROM link_defined_terms GROUP BY link_id",
+            ),
+        ):
+            if not enabled:
+                continue
+            ctes.append(f"{name}_agg AS ({source})")
+            value = f"CAST(to_json({name}_agg.{name}) AS VARCHAR)" if flat else f"{name}_agg.{name}"
+            select_cols += f", {value} AS {name}"
+            joins += f" LEFT JOIN {name}_agg ON {name}_agg.link_id = l.link_id"
+        with_sql = f"WITH {', '.join(ctes)} " if ctes else ""
+        query = (
+            f"{with_sql}SELECT {select_cols} FROM family_links l{joins}{where} "
+            "ORDER BY l.created_at DESC, l.link_id ASC"
+        )
+
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+        try:
+            if export_format == "jsonl":
+                written = self._write_jsonl(query, params, tmp, batch_size, total, progress)
+            else:
+                options = "FORMAT PARQUET" if export_format == "parquet" else "FORMAT CSV, HEADER"
+                path_literal = str(tmp).replace("'", "''")
+                row = self._conn.execute(
+                    f"COPY ({query}) TO '{path_literal}' ({options})", params,
+                ).fetchone()
+                written = int(row[0]) if row else 0
+            os.replace(tmp, path)
+        finally:
+            tmp.unlink(missing_ok=True)
+        if progress is not None:
+            progress(written, total)
+        return written
+
+    def _write_jsonl(
+        self,
+        query: str,
+        params: list[Any],
+        path: Path,
+        batch_size: int,
+        total: int,
+        progress: Callable[[int, int], None] | None,
+    ) -> int:
+        # A separate cursor: *progress* may write to the store mid-stream.
+        cursor = self._conn.cursor()
+        result = cursor.execute(query, params)
+        try:
+            import pyarrow  # type: ignore[import-not-found]  # noqa: F401
+        except ImportError:
+            names = [str(desc[0]) for desc in result.description]
+
+            def batches() -> Any:
+                while rows := result.fetchmany(batch_size):
+                    yield [dict(zip(names, row, strict=True)) for row in rows]
+        else:
+            reader = result.to_arrow_reader(batch_size)
+
+            def batches() -> Any:
+                for batch in reader:
+                    yield batch.to_pylist()
+
+        written = 0
+        try:
+            with path.open("wb") as f:
+                for batch in batches():
+                    for record in batch:
+                        if _orjson is not None:
+                            f.write(_orjson.dumps(record))
+                        else:
+                            f.write(json.dumps(record, default=str).encode("utf-8"))
+                        f.write(b"\n")
+                    written += len(batch)
+                    if progress is not None:
+                        progress(written, total)
+        finally:
+            cursor.close()
+        return written
+
     def count_links(
         self,
         *,
@@ -1914,9 +2139,107 @@ class LinkStore:
         ).fetchone()
         return int(row[0]) if row else 0
 
+    def _table_column_types(self, table: str) -> dict[str, str]:
+        types = self._column_types.get(table)
+        if types is None:
+            rows = self._conn.execute(
+                "SELECT column_name, data_type FROM information_schema.columns "
+                "WHERE table_name = ? AND table_schema = current_schema()",
+                [table],
+            ).fetchall()
+            types = {str(r[0]): str(r[1]) for r in rows}
+            self._column_types[table] = types
+        return types
+
+    def _bulk_insert(
+        self,
+        table: str,
+        columns: tuple[str, ...],
+        rows: list[tuple[Any, ...]],
+        *,
+        on_conflict: str = "error",
+    ) -> int:
+        """Insert *rows* set-at-a-time and return how many were written.
+
+        Rows are bulk-loaded into an all-VARCHAR temp staging table (CSV
+        ``COPY`` via ``copy_rows_into``; BLOBs travel hex-encoded) and cast into
+        *table* with a single ``INSERT ... SELECT``, replacing a statement
+        round-trip per row.  *on_conflict* is ``"error"``, ``"nothing"``
+        (``ON CONFLICT DO NOTHING``) or ``"replace"`` (``INSERT OR REPLACE``).
+
+        If the set statement is rejected (e.g. a value that does not convert
+        to the column type) the rows are retried one at a time so the rest
+        still land; with ``"nothing"`` offending rows are skipped, otherwise
+        the first error is raised.
+        """
+        if not rows:
+            return 0
+        types = self._table_column_types(table)
+        blob_idx = [i for i, c in enumerate(columns) if types[c] == "BLOB"]
+        stage = f"_bulk_stage_{table}"
+        stage_cols = ", ".join(f"{c} VARCHAR" for c in columns)
+        select = ", ".join(
+            f"from_hex({c})" if types[c] == "BLOB" else f"CAST({c} AS {types[c]})"
+            for c in columns
+        )
+        col_list = ", ".join(columns)
+        verb = "INSERT OR REPLACE INTO" if on_conflict == "replace" else "INSERT INTO"
+        suffix = " ON CONFLICT DO NOTHING" if on_conflict == "nothing" else ""
+
+        def staged(row: tuple[Any, ...]) -> tuple[Any, ...]:
+            if not blob_idx:
+                return row
+            out = list(row)
+            for i in blob_idx:
+                if out[i] is not None:
+                    out[i] = bytes(out[i]).hex()
+            return tuple(out)
+
+        self._conn.execute(f"CREATE OR REPLACE TEMP TABLE {stage} ({stage_cols})")
+        try:
+            copy_rows_into(self._conn, stage, (staged(r) for r in rows))
+            try:
+                result = self._conn.execute(
+                    f"{verb} {table} ({col_list}) SELECT {select} FROM {stage}{suffix}"
+                ).fetchone()
+                return int(result[0]) if result else 0
+            except _duckdb_mod.Error:
+                pass
+        finally:
+            self._conn.execute(f"DROP TABLE IF EXISTS {stage}")
+
+        row_sql = (
+            f"{verb} {table} ({col_list}) VALUES ({', '.join('?' for _ in columns)}){suffix}"
+        )
+        written = 0
+        for row in rows:
+            try:
+                result = self._conn.execute(row_sql, list(row)).fetchone()
+            except _duckdb_mod.Error:
+                if on_conflict == "nothing":
+                    continue
+                raise
+            written += int(result[0]) if result else 0
+        return written
+
     def create_links(self, links: list[dict[str, Any]], run_id: str) -> int:
-        created = 0
+        return self.bulk_create_links(links, run_id).inserted
+
+    def bulk_create_links(
+        self, links: list[dict[str, Any]], run_id: str,
+    ) -> BulkInsertResult:
+        """Insert links with one columnar ``INSERT ... ON CONFLICT DO NOTHING``.
+
+        A link is skipped when it lacks ``doc_id``/``section_number`` or
+        collides — with a stored row or an earlier link in the same batch —
+        on ``link_id`` or ``(scope_id, doc_id, section_number, clause_key)``.
+        Family aliases are upserted for every family/ontology pair seen.
+        """
+        rows: list[tuple[Any, ...]] = []
         alias_pairs: set[tuple[str, str]] = set()
+        seen_ids: set[str] = set()
+        seen_keys: set[tuple[str, str, str, str]] = set()
+        created_at = _now()
         for link in links:
             link_id = link.get("link_id") or _uuid()
             family_id = str(link.get("family_id") or "").strip()
@@ -1925,57 +2248,49 @@ class LinkStore:
             clause_key = _normalized_clause_key(link.get("clause_id"), link.get("clause_key"))
             if family_id and ontology_node_id:
                 alias_pairs.add((family_id, ontology_node_id))
-            try:
-                self._conn.execute("""
-                    INSERT INTO family_links
-                    (link_id, family_id, ontology_node_id, scope_id, doc_id, section_number, heading,
-                     article_num, article_concept, rule_id, rule_version,
-                     rule_hash, run_id, source, section_char_start,
-                     section_char_end, section_text_hash, clause_id,
-                     clause_char_start, clause_char_end, clause_text, clause_key, link_role,
-                     confidence, confidence_tier, confidence_breakdown,
-                     status, corpus_version, parser_version, created_at)
-                    VALUES (
-                        ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?,
-                        ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """, [
-                    link_id,
-                    family_id,
-                    ontology_node_id or None,
-                    scope_id,
-                    link["doc_id"],
-                    link["section_number"],
-                    link.get("heading", ""),
-                    link.get("article_num", 0),
-                    link.get("article_concept", ""),
-                    link.get("rule_id"),
-                    link.get("rule_version"),
-                    link.get("rule_hash"),
-                    run_id,
-                    link.get("source", "bulk_linker"),
-                    link.get("section_char_start"),
-                    link.get("section_char_end"),
-                    link.get("section_text_hash"),
-                    link.get("clause_id"),
-                    link.get("clause_char_start"),
-                    link.get("clause_char_end"),
-                    link.get("clause_text"),
-                    clause_key,
-                    link.get("link_role", "primary_covenant"),
-                    link.get("confidence", 1.0),
-                    link.get("confidence_tier", "high"),
-                    _opt_json(link, "confidence_breakdown"),
-                    link.get("status", "active"),
-                    link.get("corpus_version"),
-                    link.get("parser_version"),
-                    _now(),
-                ])
-                created += 1
-            except Exception:
-                pass  # Skip duplicates (UNIQUE constraint)
+            if link.get("doc_id") is None or link.get("section_number") is None:
+                continue
+            unique_key = (scope_id, str(link["doc_id"]), str(link["section_number"]), clause_key)
+            if link_id in seen_ids or unique_key in seen_keys:
+                continue
+            seen_ids.add(link_id)
+            seen_keys.add(unique_key)
+            rows.append((
+                link_id,
+                family_id,
+                ontology_node_id or None,
+                scope_id,
+                link["doc_id"],
+                link["section_number"],
+                link.get("heading", ""),
+                link.get("article_num", 0),
+                link.get("article_concept", ""),
+                link.get("rule_id"),
+                link.get("rule_version"),
+                link.get("rule_hash"),
+                run_id,
+                link.get("source", "bulk_linker"),
+                link.get("section_char_start"),
+                link.get("section_char_end"),
+                link.get("section_text_hash"),
+                link.get("clause_id"),
+                link.get("clause_char_start"),
+                link.get("clause_char_end"),
+                link.get("clause_text"),
+                clause_key,
+                link.get("link_role", "primary_covenant"),
+                link.get("confidence", 1.0),
+                link.get("confidence_tier", "high"),
+                _opt_json(link, "confidence_breakdown"),
+                link.get("status", "active"),
+                link.get("corpus_version"),
+                link.get("parser_version"),
+                created_at,
+            ))
+        inserted = self._bulk_insert("family_links", _LINK_COLUMNS, rows, on_conflict="nothing")
         for family_id, ontology_node_id in alias_pairs:
             self.upsert_family_alias(family_id, ontology_node_id, source="link_write")
-        return created
+        return BulkInsertResult(inserted=inserted, skipped=len(links) - inserted)
 
     def unlink(self, link_id: str, reason: str, note: str = "") -> None:
         self._conn.execute(
@@ -2159,23 +2474,18 @@ class LinkStore:
     # ─── Evidence ─────────────────────────────────────────────────
 
     def save_evidence(self, evidence: list[dict[str, Any]]) -> int:
-        count = 0
-        for ev in evidence:
-            self._conn.execute("""
-                INSERT INTO link_evidence
-                (evidence_id, link_id, evidence_type, char_start, char_end,
-                 text_hash, matched_pattern, reason_code, score, metadata)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """, [
+        rows = [
+            (
                 ev.get("evidence_id") or _uuid(),
                 ev["link_id"], ev["evidence_type"],
                 ev["char_start"], ev["char_end"], ev["text_hash"],
                 ev.get("matched_pattern"), ev["reason_code"],
                 ev.get("score", 1.0),
                 _json_dumps(ev["metadata"]) if ev.get("metadata") else None,
-            ])
-            count += 1
-        return count
+            )
+            for ev in evidence
+        ]
+        return self._bulk_insert("link_evidence", _EVIDENCE_COLUMNS, rows)
 
     def get_evidence(self, link_id: str) -> list[dict[str, Any]]:
         rows = self._conn.execute(
@@ -2351,7 +2661,7 @@ class LinkStore:
         return not (expires and str(expires) < _now())
 
     def save_preview_candidates(self, preview_id: str, candidates: list[dict[str, Any]]) -> int:
-        count = 0
+        rows: list[tuple[Any, ...]] = []
         for c in candidates:
             clause_key = _normalized_clause_key(c.get("clause_id"), c.get("clause_path"))
             candidate_id = str(c.get("candidate_id") or "").strip() or _preview_candidate_id(
@@ -2359,18 +2669,7 @@ class LinkStore:
                 c.get("section_number"),
                 clause_key,
             )
-            self._conn.execute("""
-                INSERT INTO preview_candidates
-                (preview_id, candidate_id, doc_id, section_number, heading, article_num,
-                 article_concept, template_family, confidence, confidence_tier,
-                 confidence_breakdown, why_matched, priority_score,
-                 uncertainty_score, impact_score, drift_score,
-                 flags, conflict_families, clause_id, clause_path, clause_label,
-                 clause_char_start, clause_char_end, clause_text, defined_term,
-                 definition_char_start, definition_char_end, definition_text, clause_key,
-                 user_verdict)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """, [
+            rows.append((
                 preview_id,
                 candidate_id,
                 c["doc_id"],
@@ -2398,9 +2697,8 @@ class LinkStore:
                 c.get("definition_text"),
                 clause_key,
                 c.get("user_verdict"),
-            ])
-            count += 1
-        return count
+            ))
+        return self._bulk_insert("preview_candidates", _PREVIEW_CANDIDATE_COLUMNS, rows)
 
     def get_preview_candidates(
         self,
@@ -2444,6 +2742,23 @@ class LinkStore:
         cols = [d[0] for d in self._conn.description]
         return [_to_dict(cols, row) for row in rows]
 
+    def get_preview_candidate_index(self, preview_id: str) -> dict[str, dict[str, Any]]:
+        """All candidates of a preview as ``candidate_id -> identity columns``."""
+        rows = self._conn.execute(
+            "SELECT candidate_id, doc_id, section_number, heading, clause_key "
+            "FROM preview_candidates WHERE preview_id = ?",
+            [preview_id],
+        ).fetchall()
+        return {
+            str(row[0]): {
+                "doc_id": row[1],
+                "section_number": row[2],
+                "heading": row[3],
+                "clause_key": row[4],
+            }
+            for row in rows
+        }
+
     def set_candidate_verdict(
         self,
         preview_id: str,
@@ -2526,52 +2841,71 @@ class LinkStore:
     # ─── Jobs ─────────────────────────────────────────────────────
 
     def submit_job(self, job: dict[str, Any]) -> None:
+        """Queue a job and wake listening workers (see ``agent.job_notify``).
+
+        ``priority`` defaults to the job type's ``JOB_PRIORITIES`` entry.
+        """
         job_id = job.get("job_id") or _uuid()
         idem_key = job.get("idempotency_key")
         params_json = _json_dumps(job.get("params", {}))
+        priority = job.get("priority")
+        if priority is None:
+            priority = JOB_PRIORITIES.get(job["job_type"], JOB_PRIORITY_DEFAULT)
         submitted_at = _now()
-        if idem_key:
-            self._conn.execute("""
-                INSERT INTO job_queue
-                (job_id, job_type, status, idempotency_key, params_json,
-                 progress_pct, progress_message, submitted_at)
-                VALUES (?, ?, 'pending', ?, ?, 0.0, 'Queued', ?)
-                ON CONFLICT (idempotency_key) DO NOTHING
-            """, [
-                job_id,
-                job["job_type"],
-                idem_key,
-                params_json,
-                submitted_at,
-            ])
-            return
-
-        self._conn.execute("""
+        self._conn.execute(f"""
             INSERT INTO job_queue
             (job_id, job_type, status, idempotency_key, params_json,
-             progress_pct, progress_message, submitted_at)
-            VALUES (?, ?, 'pending', ?, ?, 0.0, 'Queued', ?)
+             progress_pct, progress_message, priority, submitted_at)
+            VALUES (?, ?, 'pending', ?, ?, 0.0, 'Queued', ?, ?)
+            {"ON CONFLICT (idempotency_key) DO NOTHING" if idem_key else ""}
         """, [
             job_id,
             job["job_type"],
             idem_key,
             params_json,
+            int(priority),
             submitted_at,
         ])
+        notify_workers(job_notify_dir(self._db_path), NOTIFY_SUBMIT, job_id)
 
-    def claim_job(self, worker_pid: int) -> dict[str, Any] | None:
-        row = self._conn.execute("""
-            UPDATE job_queue SET status = 'claimed', claimed_at = current_timestamp,
-            worker_pid = ?
-            WHERE status = 'pending' AND job_id = (
-                SELECT job_id FROM job_queue WHERE status = 'pending'
-                ORDER BY submitted_at, job_id LIMIT 1
-            ) RETURNING *
-        """, [worker_pid]).fetchone()
-        if row is None:
-            return None
-        cols = [d[0] for d in self._conn.description]
-        return _to_dict(cols, row)
+    def claim_job(
+        self,
+        worker_pid: int,
+        *,
+        max_priority: int | None = None,
+    ) -> dict[str, Any] | None:
+        """Claim the next pending job: lowest priority value, then oldest.
+
+        The claim is one conditional UPDATE, so concurrent claimers never
+        get the same job; a claimer that loses the race retries with the
+        next job.  With *max_priority* only jobs at or below it are claimed.
+        """
+        where = "status = 'pending'"
+        params: list[Any] = [worker_pid]
+        if max_priority is not None:
+            where += " AND priority <= ?"
+            params.append(max_priority)
+        for attempt in range(_CLAIM_ATTEMPTS):
+            try:
+                row = self._conn.execute(f"""
+                    UPDATE job_queue SET status = 'claimed', claimed_at = current_timestamp,
+                    worker_pid = ?
+                    WHERE status = 'pending' AND job_id = (
+                        SELECT job_id FROM job_queue WHERE {where}
+                        ORDER BY priority, submitted_at, job_id LIMIT 1
+                    ) RETURNING *
+                """, params).fetchone()
+            except _duckdb_mod.TransactionException:
+                # Another claimer updated the same row first; back off a little.
+                if attempt == _CLAIM_ATTEMPTS - 1:
+                    raise
+                time.sleep(random.uniform(0.0, 0.001 * (attempt + 1)))
+                continue
+            if row is None:
+                return None
+            cols = [d[0] for d in self._conn.description]
+            return _to_dict(cols, row)
+        return None
 
     def update_job_progress(self, job_id: str, pct: float, message: str) -> None:
         self._conn.execute(
@@ -2601,12 +2935,14 @@ class LinkStore:
         return _to_dict(cols, row)
 
     def cancel_job(self, job_id: str) -> bool:
-        result = self._conn.execute(
+        cancelled = self._conn.execute(
             "UPDATE job_queue SET status = 'cancelled' "
-            "WHERE job_id = ? AND status IN ('pending', 'claimed')",
+            "WHERE job_id = ? AND status IN ('pending', 'claimed') RETURNING job_id",
             [job_id],
-        )
-        return result.fetchone() is not None if hasattr(result, 'fetchone') else True
+        ).fetchone() is not None
+        if cancelled:
+            notify_workers(job_notify_dir(self._db_path), NOTIFY_CANCEL, job_id)
+        return cancelled
 
     # ─── Undo / Redo ──────────────────────────────────────────────
 
@@ -2948,6 +3284,103 @@ class LinkStore:
         cols = [d[0] for d in self._conn.description]
         return _to_dict(cols, row)
 
+    def get_latest_baselines(self, rule_ids: Sequence[str]) -> dict[str, dict[str, Any]]:
+        """Latest ``rule_baselines`` row of each rule in *rule_ids*, in one query."""
+        if not rule_ids:
+            return {}
+        rows = self._conn.execute(
+            "SELECT * FROM rule_baselines WHERE rule_id IN (SELECT UNNEST(?::VARCHAR[])) "
+            "QUALIFY row_number() OVER (PARTITION BY rule_id ORDER BY promoted_at DESC) = 1",
+            [list(rule_ids)],
+        ).fetchall()
+        cols = [d[0] for d in self._conn.description]
+        baselines = (_to_dict(cols, row) for row in rows)
+        return {str(baseline["rule_id"]): baseline for baseline in baselines}
+
+    def rule_drift_stats(
+        self,
+        rule_ids: Sequence[str],
+        *,
+        doc_templates: Mapping[str, str] | None = None,
+    ) -> dict[str, dict[str, Any]]:
+        """Distribution of the active links of each rule, in one grouped scan.
+
+        Per rule: ``link_count``, ``doc_count``, link counts by
+        ``confidence_tier``, a ten-bucket ``confidence_histogram`` (keys
+        ``"0.0"`` .. ``"0.9"``), link counts by normalized heading and —
+        when *doc_templates* (``doc_id -> template_family`` from the corpus)
+        is given — linked-document counts by ``templates``.  Every rule in
+        *rule_ids* gets an entry, zeroed when it has no links.
+        """
+        stats: dict[str, dict[str, Any]] = {
+            str(rule_id): {
+                "link_count": 0, "doc_count": 0, "tiers": {},
+                "confidence_histogram": {}, "headings": {}, "templates": {},
+            }
+            for rule_id in rule_ids
+        }
+        if not stats:
+            return stats
+        template_join = ""
+        template_col = "NULL::VARCHAR"
+        template_set = ""
+        template_select = "NULL::VARCHAR AS template_family"
+        template_case = ""
+        if doc_templates:
+            self._conn.execute(
+                "CREATE OR REPLACE TEMP TABLE _drift_doc_templates AS "
+                "SELECT UNNEST(?::VARCHAR[]) AS doc_id, UNNEST(?::VARCHAR[]) AS template_family",
+                [list(doc_templates), [str(v) for v in doc_templates.values()]],
+            )
+            template_join = " LEFT JOIN _drift_doc_templates t ON t.doc_id = l.doc_id"
+            template_col = "COALESCE(t.template_family, 'unknown')"
+            template_set = ", (rule_id, template_family)"
+            template_select = "template_family"
+            template_case = "WHEN GROUPING(template_family) = 0 THEN 'template' "
+        try:
+            rows = self._conn.execute(f"""
+                WITH scoped AS (
+                    SELECT l.rule_id, l.doc_id, l.confidence_tier,
+                           LEAST(GREATEST(CAST(FLOOR(l.confidence * 10) AS INTEGER), 0), 9)
+                               AS bucket,
+                           lower(trim(l.heading)) AS heading_key,
+                           {template_col} AS template_family
+                    FROM family_links l{template_join}
+                    WHERE l.status = 'active'
+                      AND l.rule_id IN (SELECT UNNEST(?::VARCHAR[]))
+                )
+                SELECT CASE
+                           WHEN GROUPING(confidence_tier) = 0 THEN 'tier'
+                           WHEN GROUPING(bucket) = 0 THEN 'bucket'
+                           WHEN GROUPING(heading_key) = 0 THEN 'heading'
+                           {template_case}ELSE 'rule'
+                       END AS grouping_set,
+                       rule_id, confidence_tier, bucket, heading_key, {template_select},
+                       COUNT(*) AS links, COUNT(DISTINCT doc_id) AS docs
+                FROM scoped
+                GROUP BY GROUPING SETS (
+                    (rule_id), (rule_id, confidence_tier), (rule_id, bucket),
+                    (rule_id, heading_key){template_set}
+                )
+            """, [list(stats)]).fetchall()
+        finally:
+            if doc_templates:
+                self._conn.execute("DROP TABLE IF EXISTS _drift_doc_templates")
+        for grouping_set, rule_id, tier, bucket, heading_key, template, links, docs in rows:
+            entry = stats[str(rule_id)]
+            if grouping_set == "tier":
+                entry["tiers"][str(tier)] = int(links)
+            elif grouping_set == "bucket":
+                entry["confidence_histogram"][f"{int(bucket) / 10:.1f}"] = int(links)
+            elif grouping_set == "heading":
+                entry["headings"][str(heading_key)] = int(links)
+            elif grouping_set == "template":
+                entry["templates"][str(template)] = int(docs)
+            else:
+                entry["link_count"] = int(links)
+                entry["doc_count"] = int(docs)
+        return stats
+
     def save_drift_check(self, check: dict[str, Any]) -> None:
         self._conn.execute("""
             INSERT INTO drift_checks
@@ -3455,20 +3888,112 @@ class LinkStore:
         ).fetchone()
         return bytes(row[0]) if row else None
 
+    def get_section_embeddings(
+        self, keys: list[tuple[str, str]], model_version: str,
+    ) -> dict[tuple[str, str], bytes]:
+        """Batch lookup of section embeddings keyed by ``(doc_id, section_number)``."""
+        if not keys:
+            return {}
+        rows = self._conn.execute(
+            "SELECT e.doc_id, e.section_number, e.embedding_vector "
+            "FROM section_embeddings e "
+            "JOIN (SELECT UNNEST(?::VARCHAR[]) AS doc_id, "
+            "UNNEST(?::VARCHAR[]) AS section_number) k "
+            "ON e.doc_id = k.doc_id AND e.section_number = k.section_number "
+            "WHERE e.model_version = ?",
+            [[str(k[0]) for k in keys], [str(k[1]) for k in keys], model_version],
+        ).fetchall()
+        return {(str(r[0]), str(r[1])): bytes(r[2]) for r in rows}
+
     def save_section_embeddings(self, embeddings: list[dict[str, Any]]) -> int:
-        count = 0
+        created_at = _now()
+        # INSERT OR REPLACE semantics: within one batch the last row per key wins.
+        latest: dict[tuple[Any, Any, Any], tuple[Any, ...]] = {}
         for emb in embeddings:
-            self._conn.execute("""
-                INSERT OR REPLACE INTO section_embeddings
-                (doc_id, section_number, embedding_vector, model_version, text_hash, created_at)
-                VALUES (?, ?, ?, ?, ?, ?)
-            """, [
+            key = (emb["doc_id"], emb["section_number"], emb["model_version"])
+            latest.pop(key, None)
+            latest[key] = (
                 emb["doc_id"], emb["section_number"],
                 emb["embedding_vector"], emb["model_version"],
-                emb["text_hash"], _now(),
-            ])
-            count += 1
-        return count
+                emb["text_hash"], created_at,
+            )
+        signatures_before = {
+            model_version: self._section_embeddings_signature(model_version)
+            for model_version in {str(emb["model_version"]) for emb in embeddings}
+        }
+        self._bulk_insert(
+            "section_embeddings", _SECTION_EMBEDDING_COLUMNS, list(latest.values()),
+            on_conflict="replace",
+        )
+        self._update_embedding_indexes(embeddings, signatures_before)
+        return len(embeddings)
+
+    def embedding_index(self, model_version: str) -> SectionEmbeddingIndex:
+        """ANN index over ``section_embeddings`` for one model version.
+
+        The index lives in ``<links db>.ann/`` and is maintained incrementally
+        by ``save_section_embeddings``.  It is reloaded when another instance
+        has rewritten it, and (re)built from the table on first use or when
+        its recorded table signature no longer matches the table (e.g. rows
+        written by an older build that had no index, or a crash between a
+        table insert and its segment write).
+        """
+        index = self._embedding_indexes.get(model_version)
+        if index is None:
+            index = SectionEmbeddingIndex.open(self._db_path, model_version)
+            self._embedding_indexes[model_version] = index
+        index.refresh()
+        signature = self._section_embeddings_signature(model_version)
+        if not index.exists or index.source_signature != signature:
+            rows = self._conn.execute(
+                "SELECT doc_id, section_number, embedding_vector FROM section_embeddings "
+                "WHERE model_version = ? ORDER BY doc_id, section_number",
+                [model_version],
+            ).fetchall()
+            index.rebuild(rows, source_signature=signature)
+        return index
+
+    def _section_embeddings_signature(self, model_version: str) -> str:
+        """Row count and newest ``created_at`` of one model version's rows.
+
+        Every save stamps its rows with a fresh ``created_at``, so in-place
+        replacements change the signature even when the count does not.
+        """
+        row = self._conn.execute(
+            "SELECT COUNT(*), MAX(created_at) FROM section_embeddings WHERE model_version = ?",
+            [model_version],
+        ).fetchone()
+        count, newest = row if row else (0, None)
+        return f"{int(count)}@{newest}"
+
+    def _update_embedding_indexes(
+        self, embeddings: list[dict[str, Any]], signatures_before: dict[str, str],
+    ) -> None:
+        """Append freshly saved embeddings to any materialized ANN index.
+
+        *signatures_before* holds each model version's table signature before
+        the save.  The index only records the new signature when it was level
+        with the table before this save; an index that was already behind
+        (e.g. a crash between a table insert and its segment write) stays
+        stale so ``embedding_index`` rebuilds it.
+        """
+        by_version: dict[str, list[dict[str, Any]]] = {}
+        for emb in embeddings:
+            by_version.setdefault(str(emb["model_version"]), []).append(emb)
+        for model_version, rows in by_version.items():
+            index = self._embedding_indexes.get(model_version)
+            if index is None:
+                index = SectionEmbeddingIndex.open(self._db_path, model_version)
+                if not index.exists:
+                    # Built lazily from the table on first query.
+                    continue
+                self._embedding_indexes[model_version] = index
+            index.add(
+                [(str(r["doc_id"]), str(r["section_number"])) for r in rows],
+                [bytes(r["embedding_vector"]) for r in rows],
+                source_signature=self._section_embeddings_signature(model_version),
+                based_on=signatures_before[model_version],
+            )
 
     def get_family_centroid(
         self, family_id: str, template_family: str, model_version: str,
@@ -3500,17 +4025,104 @@ class LinkStore:
         """, [canonical_scope, template_family, centroid, model_version, sample_count, _now()])
 
     def find_similar_sections(
-        self, family_id: str, doc_id: str, *, top_k: int = 5,
+        self,
+        family_id: str | None = None,
+        doc_id: str | None = None,
+        *,
+        section_number: str | None = None,
+        model_version: str | None = None,
+        template_family: str = "_global",
+        top_k: int = 5,
     ) -> list[dict[str, Any]]:
-        # Simple: return sections from same doc that have embeddings
-        _ = family_id  # Reserved for future centroid-based similarity
-        rows = self._conn.execute(
-            "SELECT doc_id, section_number, model_version, text_hash "
-            "FROM section_embeddings WHERE doc_id = ? LIMIT ?",
-            [doc_id, top_k],
-        ).fetchall()
-        cols = ["doc_id", "section_number", "model_version", "text_hash"]
-        return [_to_dict(cols, row) for row in rows]
+        """Nearest sections by embedding cosine similarity.
+
+        The query vector is the embedding of ``(doc_id, section_number)`` when
+        ``section_number`` is given ("sections like this one"; the section
+        itself is excluded), otherwise the centroid of ``family_id``.  Without
+        ``section_number``, a ``doc_id`` restricts results to that document.
+        ``model_version`` defaults to the family's most recent centroid.
+
+        Corpus-wide queries are answered by the ANN index (see
+        ``embedding_index``); per-document queries are scored exactly.
+        """
+        if model_version is None:
+            model_version = self._latest_centroid_model_version(family_id)
+            if model_version is None:
+                return []
+
+        exclude: list[tuple[str, str]] = []
+        if section_number is not None:
+            if doc_id is None:
+                return []
+            query = self.get_section_embedding(doc_id, section_number, model_version)
+            exclude.append((doc_id, section_number))
+            restrict_doc = None
+        else:
+            if not family_id:
+                return []
+            query = self.get_family_centroid(family_id, template_family, model_version)
+            restrict_doc = doc_id
+        if query is None:
+            return []
+
+        if restrict_doc is not None:
+            rows = self._conn.execute(
+                "SELECT section_number, embedding_vector FROM section_embeddings "
+                "WHERE doc_id = ? AND model_version = ?",
+                [restrict_doc, model_version],
+            ).fetchall()
+            usable = [r for r in rows if len(r[1]) == len(query)]
+            matches = []
+            if usable:
+                sims = cosine_similarities(query, stack_vectors([bytes(r[1]) for r in usable]))
+                matches = [
+                    (restrict_doc, str(usable[i][0]), float(sims[i]))
+                    for i in top_k_indices(sims, top_k)
+                ]
+        else:
+            matches = self.embedding_index(model_version).search(
+                query, top_k=top_k, exclude=exclude,
+            )
+
+        hashes = {
+            (str(r[0]), str(r[1])): str(r[2])
+            for r in self._conn.execute(
+                "SELECT e.doc_id, e.section_number, e.text_hash FROM section_embeddings e "
+                "JOIN (SELECT UNNEST(?::VARCHAR[]) AS doc_id, "
+                "UNNEST(?::VARCHAR[]) AS section_number) k "
+                "ON e.doc_id = k.doc_id AND e.section_number = k.section_number "
+                "WHERE e.model_version = ?",
+                [[m[0] for m in matches], [m[1] for m in matches], model_version],
+            ).fetchall()
+        } if matches else {}
+        return [
+            {
+                "doc_id": m_doc,
+                "section_number": m_sec,
+                "model_version": model_version,
+                "text_hash": hashes.get((m_doc, m_sec), ""),
+                "similarity": sim,
+            }
+            for m_doc, m_sec, sim in matches
+        ]
+
+    def _latest_centroid_model_version(self, family_id: str | None) -> str | None:
+        if family_id:
+            scope_ids = self.resolve_scope_aliases(family_id) or [str(family_id).strip()]
+            placeholders = ", ".join("?" for _ in scope_ids)
+            row = self._conn.execute(
+                "SELECT model_version FROM family_centroids "
+                f"WHERE family_id IN ({placeholders}) "
+                "ORDER BY last_updated_at DESC LIMIT 1",
+                scope_ids,
+            ).fetchone()
+            if row:
+                return str(row[0])
+        row = self._conn.execute(
+            "SELECT model_version FROM section_embeddings "
+            "ORDER BY created_at DESC LIMIT 1",
+        ).fetchone()
+        return str(row[0]) if row else None
 
     # ─── Starter kits ─────────────────────────────────────────────
 
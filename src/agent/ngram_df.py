@@ -0,0 +1,263 @@
+"""Corpus-wide n-gram document frequencies for DNA discovery.
+
+DNA discovery (:mod:`agent.dna`) scores target-section n-grams against a
+background.  Sampling a few hundred background sections and tokenizing
+them on every call is slow and makes the result depend on the sample;
+the corpus builder instead materializes the document frequency of every
+1-3-gram over all sections once:
+
+* ``ngram_df`` — ``(scope, scope_value, n, ngram, df, tf)``: sections
+  containing the n-gram and its total occurrences, for the scopes
+  ``all`` and ``cohort`` (``scope_value`` empty), ``template_family``
+  and ``concept`` (article concept).  N-grams below ``min_df`` sections
+  in a scope are dropped; the table is sorted by
+  ``(scope, scope_value, ngram)`` so lookups prune by zone map.
+* ``ngram_df_totals`` — ``(scope, scope_value, n, sections, ngrams,
+  min_df)``: section count and total n-gram occurrences per scope and n,
+  pruned n-grams included (the log-odds denominators).
+
+Tokenization is :func:`agent.dna.extract_ngrams`, so table counts and
+counts of tokenized texts agree exactly.  When the targets are corpus
+sections, :func:`subtract_counts` turns scope counts into the exact
+counts of the rest of the scope, i.e. every non-target section is the
+background and only the targets are tokenized.
+
+Functions:
+
+* ``build_ngram_df_table`` — (re)build both tables from ``section_text``.
+* ``load_ngram_counts`` — :class:`~agent.dna.NgramCounts` of a scope.
+* ``subtract_counts`` — scope counts minus a subset of its sections.
+"""
+from __future__ import annotations
+
+from collections import Counter
+from collections.abc import Iterable
+from typing import Any
+
+from agent.dna import NgramCounts, extract_ngrams
+from agent.io_utils import copy_rows_into
+
+NGRAM_DF_TABLE = "ngram_df"
+NGRAM_DF_TOTALS_TABLE = "ngram_df_totals"
+NGRAM_DF_SCOPES: tuple[str, ...] = ("all", "cohort", "template_family", "concept")
+# N-grams in fewer sections of a scope than this are not stored.
+DEFAULT_MIN_DF = 2
+DEFAULT_MAX_N = 3
+
+NGRAM_DF_DDL = f"""\
+CREATE TABLE {NGRAM_DF_TABLE} (
+    scope VARCHAR NOT NULL,
+    scope_value VARCHAR NOT NULL,
+    n TINYINT NOT NULL,
+    ngram VARCHAR NOT NULL,
+    df INTEGER NOT NULL,
+    tf BIGINT NOT NULL
+)
+"""
+
+NGRAM_DF_TOTALS_DDL = f"""\
+CREATE TABLE {NGRAM_DF_TOTALS_TABLE} (
+    scope VARCHAR NOT NULL,
+    scope_value VARCHAR NOT NULL,
+    n TINYINT NOT NULL,
+    sections INTEGER NOT NULL,
+    ngrams BIGINT NOT NULL,
+    min_df INTEGER NOT NULL,
+    PRIMARY KEY (scope, scope_value, n)
+)
+"""
+
+_STAGE_TABLE = "_ngram_df_stage"
+_STAGE_DDL = f"""\
+CREATE TEMP TABLE {_STAGE_TABLE} (
+    cohort VARCHAR,
+    template_family VARCHAR,
+    concept VARCHAR,
+    n TINYINT,
+    ngram VARCHAR,
+    df INTEGER,
+    tf BIGINT
+)
+"""
+
+# Section text with the section's scope keys (NULL when the section has none).
+_SECTIONS_SQL = """\
+SELECT st.text,
+       CASE WHEN d.cohort_included THEN 'cohort' END,
+       NULLIF(d.template_family, ''),
+       NULLIF(a.concept, '')
+FROM section_text st
+JOIN documents d ON d.doc_id = st.doc_id
+LEFT JOIN sections s ON s.doc_id = st.doc_id AND s.section_number = st.section_number
+LEFT JOIN articles a ON a.doc_id = s.doc_id AND a.article_num = s.article_num
+"""
+
+
+def build_ngram_df_table(
+    conn: Any,
+    *,
+    max_n: int = DEFAULT_MAX_N,
+    min_df: int = DEFAULT_MIN_DF,
+    batch_sections: int = 2000,
+) -> int:
+    """(Re)build ``ngram_df`` and ``ngram_df_totals`` for the whole corpus.
+
+    Sections are tokenized in batches; each batch is pre-aggregated per
+    scope key and staged, and one grouped query sums the stages into
+    every scope.  Returns the number of ``ngram_df`` rows.
+    """
+    conn.execute(f"DROP TABLE IF EXISTS {NGRAM_DF_TABLE}")
+    conn.execute(f"DROP TABLE IF EXISTS {NGRAM_DF_TOTALS_TABLE}")
+    conn.execute(f"DROP TABLE IF EXISTS {_STAGE_TABLE}")
+    conn.execute(_STAGE_DDL)
+    totals: Counter[tuple[str, str, int]] = Counter()
+    sections: Counter[tuple[str, str]] = Counter()
+    try:
+        reader = conn.cursor()
+        reader.execute(_SECTIONS_SQL)
+        while True:
+            chunk = reader.fetchmany(batch_sections)
+            if not chunk:
+                break
+            df: Counter[tuple[Any, ...]] = Counter()
+            tf: Counter[tuple[Any, ...]] = Counter()
+            for text, cohort, family, concept in chunk:
+                ngrams = extract_ngrams(str(text or ""), 1, max_n)
+                keys = _scope_keys(cohort, family, concept)
+                per_n = Counter(ngram.count(" ") + 1 for ngram in ngrams)
+                for key in keys:
+                    sections[key] += 1
+                    for n, count in per_n.items():
+                        totals[(*key, n)] += count
+                for ngram, count in Counter(ngrams).items():
+                    stage_key = (cohort, family, concept, ngram.count(" ") + 1, ngram)
+                    df[stage_key] += 1
+                    tf[stage_key] += count
+            copy_rows_into(
+                conn, _STAGE_TABLE, ((*key, count, tf[key]) for key, count in df.items()),
+            )
+        reader.close()
+
+        conn.execute(
+            f"CREATE TABLE {NGRAM_DF_TABLE} AS "
+            "SELECT CASE "
+            "    WHEN GROUPING(cohort) = 0 THEN 'cohort' "
+            "    WHEN GROUPING(template_family) = 0 THEN 'template_family' "
+            "    WHEN GROUPING(concept) = 0 THEN 'concept' "
+            "    ELSE 'all' END AS scope, "
+            "  CASE "
+            "    WHEN GROUPING(template_family) = 0 THEN template_family "
+            "    WHEN GROUPING(concept) = 0 THEN concept "
+            "    ELSE '' END AS scope_value, "
+            "  n, ngram, SUM(df)::INTEGER AS df, SUM(tf)::BIGINT AS tf "
+            f"FROM {_STAGE_TABLE} "
+            "GROUP BY GROUPING SETS ("
+            "  (n, ngram), (cohort, n, ngram), "
+            "  (template_family, n, ngram), (concept, n, ngram)) "
+            "HAVING SUM(df) >= ? "
+            "  AND (GROUPING(cohort) = 1 OR cohort IS NOT NULL) "
+            "  AND (GROUPING(template_family) = 1 OR template_family IS NOT NULL) "
+            "  AND (GROUPING(concept) = 1 OR concept IS NOT NULL) "
+            "ORDER BY scope, scope_value, ngram",
+            [min_df],
+        )
+        conn.execute(NGRAM_DF_TOTALS_DDL)
+        copy_rows_into(
+            conn,
+            NGRAM_DF_TOTALS_TABLE,
+            (
+                (scope, value, n, sections[(scope, value)], count, min_df)
+                for (scope, value, n), count in sorted(totals.items())
+            ),
+        )
+    finally:
+        conn.execute(f"DROP TABLE IF EXISTS {_STAGE_TABLE}")
+    row = conn.execute(f"SELECT COUNT(*) FROM {NGRAM_DF_TABLE}").fetchone()
+    return int(row[0]) if row else 0
+
+
+def _scope_keys(cohort: Any, family: Any, concept: Any) -> list[tuple[str, str]]:
+    keys = [("all", "")]
+    if cohort:
+        keys.append(("cohort", ""))
+    if family:
+        keys.append(("template_family", str(family)))
+    if concept:
+        keys.append(("concept", str(concept)))
+    return keys
+
+
+def load_ngram_counts(
+    corpus: Any,
+    *,
+    scope: str = "all",
+    scope_value: str = "",
+    phrases: Iterable[str] | None = None,
+    min_df: int | None = None,
+    ngram_range: tuple[int, int] = (1, DEFAULT_MAX_N),
+) -> NgramCounts | None:
+    """Counts of one scope from ``ngram_df`` (None if the table or scope is missing).
+
+    *corpus* is anything with ``query(sql, params)`` (e.g. ``CorpusIndex``).
+    With *phrases* only those n-grams are loaded (enough to score them);
+    with *min_df* only n-grams in at least that many sections.
+    """
+    if scope not in NGRAM_DF_SCOPES:
+        raise ValueError(f"Unknown ngram_df scope: {scope!r}")
+    min_n, max_n = ngram_range
+    try:
+        total_rows = corpus.query(
+            f"SELECT MAX(sections), SUM(ngrams) FROM {NGRAM_DF_TOTALS_TABLE} "
+            "WHERE scope = ? AND scope_value = ? AND n BETWEEN ? AND ?",
+            [scope, scope_value, min_n, max_n],
+        )
+    except Exception:
+        return None
+    if not total_rows or total_rows[0][0] is None:
+        return None
+
+    sql = (
+        f"SELECT ngram, df, tf FROM {NGRAM_DF_TABLE} "
+        "WHERE scope = ? AND scope_value = ? AND n BETWEEN ? AND ?"
+    )
+    params: list[Any] = [scope, scope_value, min_n, max_n]
+    if phrases is not None:
+        wanted = sorted(set(phrases))
+        if not wanted:
+            return NgramCounts(
+                docs=int(total_rows[0][0]), df={}, tf={}, total=int(total_rows[0][1] or 0),
+            )
+        sql += " AND ngram IN (SELECT UNNEST(?::VARCHAR[]))"
+        params.append(wanted)
+    if min_df is not None:
+        sql += " AND df >= ?"
+        params.append(min_df)
+    df: dict[str, int] = {}
+    tf: dict[str, int] = {}
+    for ngram, ngram_df, ngram_tf in corpus.query(sql, params):
+        df[str(ngram)] = int(ngram_df)
+        tf[str(ngram)] = int(ngram_tf)
+    return NgramCounts(
+        docs=int(total_rows[0][0]), df=df, tf=tf, total=int(total_rows[0][1] or 0),
+    )
+
+
+def subtract_counts(scope_counts: NgramCounts, subset: NgramCounts) -> NgramCounts:
+    """Counts of the scope's sections outside *subset* (a subset of the scope).
+
+    N-grams pruned from the table count as occurring only in *subset*.
+    """
+    df = {
+        ngram: max(0, count - subset.df.get(ngram, 0))
+        for ngram, count in scope_counts.df.items()
+    }
+    tf = {
+        ngram: max(0, count - subset.tf.get(ngram, 0))
+        for ngram, count in scope_counts.tf.items()
+    }
+    return NgramCounts(
+        docs=max(0, scope_counts.docs - subset.docs),
+        df={k: v for k, v in df.items() if v},
+        tf={k: v for k, v in tf.items() if v},
+        total=max(0, scope_counts.total - subset.total),
+    )
@@ -0,0 +1,337 @@
+"""Sub-expression-cached candidate sets for link rule previews.
+
+A reviewer iterating on a rule re-runs the preview after every edit, and an
+edit usually touches one term.  ``PreviewEngine`` evaluates the DSL text
+fields of a rule as sets of section keys (``"doc_id::section_number"``) and
+memoizes the set of every AST node it evaluates, keyed by corpus version,
+field and node (the AST dataclasses are frozen, so a node is its own cache
+key).  Re-evaluating an edited rule sends only the changed nodes to SQL; the
+rest of the tree is rebuilt from cached sets:
+
+* ``heading`` and ``section`` terms test one column of the section row, so
+  an AND group is the intersection of its children's sets and an OR group
+  their union.  Negation only occurs on leaves, which keeps this exact
+  under SQL's three-valued logic (a NULL heading matches no leaf).
+* ``article``, ``clause`` and ``defined_term`` terms are correlated on one
+  joined article / clause / definition row, so each of those field
+  expressions is evaluated as a single leaf.
+* Fields are ANDed, i.e. their sets are intersected.
+
+Sets are evaluated within a scope (the candidate documents, or the cohort)
+and never grow past ``max_set_keys``: a broad term such as a lone negation
+is fetched with ``LIMIT max_set_keys + 1`` and, when it overflows, is not
+materialized.  An AND group with an oversized child is evaluated by SQL
+inside the intersection of its bounded children; a field (or an OR group)
+with no bounded set makes ``section_keys`` return None, and the caller
+compiles the fields inline instead of binding a huge key list.  The cache
+is bounded by the total number of section keys it holds, not by entry
+count.
+
+Functions:
+
+* ``PreviewEngine.section_keys`` — section keys matching a rule's text fields.
+* ``corpus_version`` — cache version of an open corpus database.
+* ``candidate_delta`` — added / removed candidates between two previews.
+"""
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from collections.abc import Collection, Mapping
+from pathlib import Path
+from typing import Any
+
+from agent.query_filters import FilterGroup, build_filter_sql, build_multi_field_sql
+
+# Total section keys held across all cached sets, and the largest set cached.
+DEFAULT_MAX_KEYS = 2_000_000
+DEFAULT_MAX_SET_KEYS = 100_000
+
+# Fields whose terms each test a single ``sections`` column: (column, wrap_wildcards).
+# Must match how ``build_multi_field_sql`` compiles the same fields.
+_ROW_LOCAL_FIELDS: dict[str, tuple[str, bool]] = {
+    "heading": ("s.heading", True),
+    "section": ("s.section_number", False),
+}
+
+# Candidate columns reported for added / removed entries.
+DELTA_FIELDS: tuple[str, ...] = (
+    "candidate_id", "doc_id", "section_number", "heading", "clause_key",
+)
+
+# (cohort only, candidate doc ids) that every evaluated set is restricted to.
+_Scope = tuple[bool, frozenset[str] | None]
+_CacheKey = tuple[str, bool, Any, _Scope]
+
+
+def section_key(doc_id: Any, section_number: Any) -> str:
+    """``"doc_id::section_number"`` — the key used in preview scope filters."""
+    return f"{doc_id}::{section_number}"
+
+
+def corpus_version(corpus: Any, db_path: Path) -> str | None:
+    """Cache version of *corpus*, opened from *db_path* (None if unreadable).
+
+    The run id from the corpus run manifest, plus the DB file's mtime/size
+    so incremental rebuilds (which keep the run id) also change it.
+    """
+    try:
+        manifest = corpus.get_run_manifest()
+    except (OSError, ValueError):
+        manifest = None
+    run_id = str((manifest or {}).get("run_id") or "no-run-manifest")
+    try:
+        st = Path(db_path).stat()
+    except OSError:
+        return None
+    return f"{run_id}-{st.st_mtime_ns}-{st.st_size}"
+
+
+class PreviewEngine:
+    """LRU map of ``(field, AST node) -> frozenset of section keys``.
+
+    Entries belong to one corpus version; evaluating against a new version
+    drops them all.
+
+    Parameters
+    ----------
+    max_keys:
+        Bound on the section keys held by all cached sets together; least
+        recently used sets are evicted.
+    max_set_keys:
+        Largest set evaluated; a term matching more sections than this is
+        left to inline SQL.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_keys: int = DEFAULT_MAX_KEYS,
+        max_set_keys: int = DEFAULT_MAX_SET_KEYS,
+    ) -> None:
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[_CacheKey, frozenset[str]] = OrderedDict()
+        self.max_keys = max(1, max_keys)
+        self.max_set_keys = min(max(0, max_set_keys), self.max_keys)
+        self._version: str | None = None
+        self._keys = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._skipped = 0
+
+    def clear(self) -> None:
+        """Drop all cached sets and reset the counters."""
+        with self._lock:
+            self._entries.clear()
+            self._version = None
+            self._keys = 0
+            self._hits = 0
+            self._misses = 0
+            self._evictions = 0
+            self._skipped = 0
+
+    # ─── Evaluation ──────────────────────────────────────────────
+
+    def section_keys(
+        self,
+        corpus: Any,
+        version: str,
+        text_fields: Mapping[str, Any],
+        *,
+        positional_index: bool = True,
+        doc_ids: Collection[str] | None = None,
+        cohort_only: bool = False,
+    ) -> frozenset[str] | None:
+        """Keys of the sections matching every expression in *text_fields*.
+
+        *text_fields* maps DSL text field names to parsed expressions, as in
+        ``build_multi_field_sql``.  Only sections of *doc_ids* (when given)
+        and of cohort documents (with *cohort_only*) are evaluated, so the
+        result holds no keys outside that scope.
+
+        Returns None when *text_fields* cannot be served as a bounded set:
+        it has no expressions, or no field matches ``max_set_keys`` sections
+        or fewer.  The caller then compiles *text_fields* inline.
+        """
+        with self._lock:
+            if version != self._version:
+                self._entries.clear()
+                self._keys = 0
+                self._version = version
+        scope: _Scope = (cohort_only, None if doc_ids is None else frozenset(doc_ids))
+        result: frozenset[str] | None = None
+        unbounded: dict[str, Any] = {}
+        for field in sorted(text_fields):
+            expr = text_fields[field]
+            if expr is None:
+                continue
+            if field in _ROW_LOCAL_FIELDS:
+                keys = self._node_keys(corpus, field, expr, scope)
+            else:
+                keys = self._field_keys(corpus, field, expr, positional_index, scope)
+            if keys is None:
+                unbounded[field] = expr
+                continue
+            result = keys if result is None else result & keys
+            if not result:
+                return result
+        if unbounded and result is not None:
+            sql, params, joins = build_multi_field_sql(
+                unbounded, positional_index=positional_index,
+            )
+            result = self._fetch(corpus, sql, params, joins, scope, within=result)
+        return result
+
+    def _node_keys(
+        self, corpus: Any, field: str, node: Any, scope: _Scope,
+    ) -> frozenset[str] | None:
+        key: _CacheKey = (field, True, node, scope)
+        cached = self._get(key)
+        if cached is not None:
+            return cached
+        column, wrap_wildcards = _ROW_LOCAL_FIELDS[field]
+        keys: frozenset[str] | None
+        if isinstance(node, FilterGroup) and node.children:
+            child_sets = [self._node_keys(corpus, field, child, scope) for child in node.children]
+            bounded = sorted((s for s in child_sets if s is not None), key=len)
+            if node.operator != "and":
+                keys = None
+                if len(bounded) == len(child_sets):
+                    keys = frozenset.union(*bounded)
+                    if len(keys) > self.max_set_keys:
+                        keys = None
+            elif len(bounded) == len(child_sets):
+                keys = frozenset.intersection(*bounded)
+            elif bounded:
+                # Only the oversized children are left to SQL, inside the
+                # intersection of the bounded ones.
+                sql, params = build_filter_sql(node, column, wrap_wildcards=wrap_wildcards)
+                within = frozenset.intersection(*bounded)
+                keys = self._fetch(corpus, sql, params, set(), scope, within=within)
+            else:
+                keys = None
+        else:
+            sql, params = build_filter_sql(node, column, wrap_wildcards=wrap_wildcards)
+            keys = self._fetch(corpus, sql, params, set(), scope)
+        self._put(key, keys)
+        return keys
+
+    def _field_keys(
+        self, corpus: Any, field: str, expr: Any, positional_index: bool, scope: _Scope,
+    ) -> frozenset[str] | None:
+        key: _CacheKey = (field, positional_index, expr, scope)
+        cached = self._get(key)
+        if cached is not None:
+            return cached
+        sql, params, joins = build_multi_field_sql(
+            {field: expr}, positional_index=positional_index,
+        )
+        keys = self._fetch(corpus, sql, params, joins, scope)
+        self._put(key, keys)
+        return keys
+
+    def _fetch(
+        self,
+        corpus: Any,
+        where: str,
+        params: list[Any],
+        joins: set[str],
+        scope: _Scope,
+        *,
+        within: frozenset[str] | None = None,
+    ) -> frozenset[str] | None:
+        """Section keys matching *where* in *scope*; None past ``max_set_keys``."""
+        cohort_only, doc_ids = scope
+        where_parts = [f"({where})"]
+        params = list(params)
+        if cohort_only:
+            where_parts.append(
+                "s.doc_id IN (SELECT doc_id FROM documents WHERE cohort_included = true)",
+            )
+        if doc_ids is not None:
+            where_parts.append("s.doc_id IN (SELECT UNNEST(?::VARCHAR[]))")
+            params.append(sorted(doc_ids))
+        if within is not None:
+            where_parts.append(
+                "(s.doc_id || '::' || s.section_number) IN (SELECT UNNEST(?::VARCHAR[]))",
+            )
+            params.append(sorted(within))
+        join_sql = "".join(f" {join}" for join in sorted(joins))
+        rows = corpus.query(
+            f"SELECT DISTINCT s.doc_id, s.section_number FROM sections s{join_sql} "
+            f"WHERE {' AND '.join(where_parts)} LIMIT {self.max_set_keys + 1}",
+            params,
+        )
+        if len(rows) > self.max_set_keys:
+            return None
+        return frozenset(section_key(doc_id, number) for doc_id, number in rows)
+
+    def _get(self, key: _CacheKey) -> frozenset[str] | None:
+        with self._lock:
+            keys = self._entries.get(key)
+            if keys is None:
+                self._misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return keys
+
+    def _put(self, key: _CacheKey, keys: frozenset[str] | None) -> None:
+        with self._lock:
+            if keys is None:
+                self._skipped += 1
+                return
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._keys -= len(previous)
+            self._entries[key] = keys
+            self._keys += len(keys)
+            while self._keys > self.max_keys:
+                _, evicted = self._entries.popitem(last=False)
+                self._keys -= len(evicted)
+                self._evictions += 1
+
+    # ─── Reporting ───────────────────────────────────────────────
+
+    def stats(self) -> dict[str, Any]:
+        """Counters for ``/api/health``."""
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {
+                "entries": len(self._entries),
+                "keys": self._keys,
+                "max_keys": self.max_keys,
+                "max_set_keys": self.max_set_keys,
+                "hits": self._hits,
+                "misses": self._misses,
+                "evictions": self._evictions,
+                "skipped": self._skipped,
+                "hit_rate": round(self._hits / lookups, 3) if lookups else 0.0,
+            }
+
+
+def candidate_delta(
+    base: Mapping[str, Mapping[str, Any]],
+    current: Mapping[str, Mapping[str, Any]],
+) -> dict[str, Any]:
+    """Compare two ``candidate_id -> candidate`` maps (base preview first).
+
+    Added / removed entries carry the ``DELTA_FIELDS`` columns, sorted by
+    candidate id.
+    """
+    added = sorted(current.keys() - base.keys())
+    removed = sorted(base.keys() - current.keys())
+
+    def project(row: Mapping[str, Any], candidate_id: str) -> dict[str, Any]:
+        out = {name: row.get(name) for name in DELTA_FIELDS}
+        out["candidate_id"] = candidate_id
+        return out
+
+    return {
+        "added_count": len(added),
+        "removed_count": len(removed),
+        "unchanged_count": len(current) - len(added),
+        "added": [project(current[c], c) for c in added],
+        "removed": [project(base[c], c) for c in removed],
+    }
@@ -0,0 +1,692 @@
+"""Positional token index and proximity evaluation for DSL ``/s``, ``/p``, ``/N``.
+
+The corpus builder writes a ``section_tokens`` postings table (one row per
+word occurrence in ``section_text``) carrying the word offset, sentence id,
+paragraph id and global character span of every token.  Proximity operators
+are then answered by joining posting lists instead of scanning section text
+with regexes.  A companion ``section_token_vocab`` table (distinct tokens)
+lets substring searches expand partial words without scanning postings.
+
+Operand semantics (left and right side of a ``ProximityOp``):
+
+* a bare word or quoted phrase is one anchor (phrases must be consecutive);
+* a trailing ``%`` turns a single word into a prefix match (``indebted%``);
+* an OR group matches any of its anchors;
+* an AND group requires *each* positive child to satisfy the proximity
+  constraint independently, i.e. ``(a & b) /s c`` == ``a /s c`` and ``b /s c``;
+* negated leaves exclude the whole section when they occur anywhere in it.
+
+Regex leaves and nesting deeper than AND-of-OR are rejected by
+``validate_proximity_operands``.
+
+Functions:
+
+* ``tokenize_positions`` — tokenizer shared by the index builder and evaluator.
+* ``build_section_token_index`` — (re)build postings from ``section_text``.
+* ``build_substring_candidates_sql`` — sections that may contain a literal
+  substring, for index-backed text search.
+* ``proximity_matches`` / ``find_proximity_hits`` — in-memory evaluation
+  over a single text using sorted posting-list merges.
+* ``build_proximity_sql`` — section-level boolean predicate over postings.
+* ``build_proximity_hits_sql`` — matching spans with global char offsets.
+* ``build_proximity_span_sql`` — predicate: a hit lies inside a clause span.
+* ``build_proximity_prefilter_sql`` — coarse ILIKE superset for corpora
+  built without the positional index (callers post-filter in Python).
+"""
+from __future__ import annotations
+
+import bisect
+import re
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+from agent.io_utils import copy_rows_into
+from agent.query_filters import FilterExpression, FilterGroup, FilterMatch, escape_like
+
+if TYPE_CHECKING:
+    from agent.rule_dsl import ProximityOp
+
+SECTION_TOKENS_TABLE = "section_tokens"
+SECTION_TOKEN_VOCAB_TABLE = "section_token_vocab"
+
+SECTION_TOKENS_DDL = """\
+CREATE TABLE section_tokens (
+    token VARCHAR NOT NULL,
+    doc_id VARCHAR NOT NULL,
+    section_number VARCHAR NOT NULL,
+    word_pos INTEGER NOT NULL,
+    sentence_id INTEGER NOT NULL,
+    paragraph_id INTEGER NOT NULL,
+    char_start INTEGER NOT NULL,
+    char_end INTEGER NOT NULL
+)"""
+
+# Words are ASCII alphanumeric runs so lowercasing never changes span length.
+# Sentences end at . ? ! (plus closing quotes/brackets) followed by whitespace;
+# paragraphs end at a blank line, matching normalize_html's block separators.
+_LEX_RE = re.compile(
+    r"(?P<para>\n[ \t\r\f\v]*\n)"
+    r"|(?P<sent>[.?!][\"'”’)\]]*(?=\s|$))"
+    r"|(?P<word>[A-Za-z0-9]+)"
+)
+_TERM_WORD_RE = re.compile(r"[A-Za-z0-9]+")
+
+
+@dataclass(frozen=True, slots=True)
+class TokenPosition:
+    """One word occurrence with its structural coordinates."""
+
+    token: str
+    word_pos: int
+    sentence_id: int
+    paragraph_id: int
+    char_start: int
+    char_end: int
+
+
+@dataclass(frozen=True, slots=True)
+class _Span:
+    """A matched phrase occurrence (word range plus char range)."""
+
+    pos_start: int
+    pos_end: int
+    sentence_id: int
+    paragraph_id: int
+    char_start: int
+    char_end: int
+
+
+# A phrase is a tuple of (token, is_prefix) pairs that must appear consecutively.
+_Phrase = tuple[tuple[str, bool], ...]
+
+
+@dataclass(frozen=True, slots=True)
+class _Operand:
+    """Compiled operand: AND over ``clauses``, each clause an OR of phrases."""
+
+    clauses: tuple[tuple[_Phrase, ...], ...]
+    excluded: tuple[_Phrase, ...]
+
+
+# ---------------------------------------------------------------------------
+# Tokenization
+# ---------------------------------------------------------------------------
+
+def tokenize_positions(text: str, *, offset: int = 0) -> list[TokenPosition]:
+    """Split *text* into lowercase word tokens with sentence/paragraph ids.
+
+    Args:
+        text: Section text to tokenize.
+        offset: Added to every char span (pass the section's global
+            ``char_start`` to get document-global offsets).
+
+    Returns:
+        Tokens in reading order; ``word_pos`` is 0-based within *text*.
+    """
+    tokens: list[TokenPosition] = []
+    sentence_id = 0
+    paragraph_id = 0
+    sentence_open = False
+    for m in _LEX_RE.finditer(text):
+        kind = m.lastgroup
+        if kind == "word":
+            tokens.append(TokenPosition(
+                token=m.group().lower(),
+                word_pos=len(tokens),
+                sentence_id=sentence_id,
+                paragraph_id=paragraph_id,
+                char_start=offset + m.start(),
+                char_end=offset + m.end(),
+            ))
+            sentence_open = True
+        elif kind == "para":
+            if tokens and tokens[-1].paragraph_id == paragraph_id:
+                paragraph_id += 1
+                if sentence_open:
+                    sentence_id += 1
+                    sentence_open = False
+        elif sentence_open:
+            sentence_id += 1
+            sentence_open = False
+    return tokens
+
+
+def build_section_token_index(
+    conn: Any,
+    *,
+    doc_ids: list[str] | None = None,
+    batch_sections: int = 2000,
+) -> int:
+    """Build (or refresh) the ``section_tokens`` postings table from ``section_text``.
+
+    With *doc_ids* ``None`` the table is dropped and rebuilt for the whole
+    corpus, then physically sorted by ``(token, doc_id, section_number,
+    word_pos)`` so DuckDB zone maps prune posting lookups by token.  With
+    an explicit list only those documents' postings are replaced (used by
+    incremental and table-specific rebuilds).
+
+    Returns:
+        Number of posting rows written.
+    """
+    full_rebuild = doc_ids is None
+    if full_rebuild:
+        conn.execute(f"DROP TABLE IF EXISTS {SECTION_TOKENS_TABLE}")
+        conn.execute(SECTION_TOKENS_DDL)
+    else:
+        tables = {str(r[0]) for r in conn.execute("SHOW TABLES").fetchall()}
+        if SECTION_TOKENS_TABLE not in tables:
+            conn.execute(SECTION_TOKENS_DDL)
+        if SECTION_TOKEN_VOCAB_TABLE not in tables:
+            conn.execute(
+                f"CREATE TABLE {SECTION_TOKEN_VOCAB_TABLE} AS "
+                f"SELECT DISTINCT token FROM {SECTION_TOKENS_TABLE}"
+            )
+        if not doc_ids:
+            return 0
+        placeholders = ", ".join("?" for _ in doc_ids)
+        conn.execute(
+            f"DELETE FROM {SECTION_TOKENS_TABLE} WHERE doc_id IN ({placeholders})",
+            doc_ids,
+        )
+
+    sql = (
+        "SELECT st.doc_id, st.section_number, st.text, COALESCE(s.char_start, 0) "
+        "FROM section_text st "
+        "LEFT JOIN sections s ON s.doc_id = st.doc_id "
+        "AND s.section_number = st.section_number"
+    )
+    params: list[Any] = []
+    if not full_rebuild and doc_ids:
+        sql += f" WHERE st.doc_id IN ({', '.join('?' for _ in doc_ids)})"
+        params.extend(doc_ids)
+    sql += " ORDER BY st.doc_id, st.section_number"
+
+    reader = conn.cursor()
+    reader.execute(sql, params)
+    total = 0
+    while True:
+        chunk = reader.fetchmany(batch_sections)
+        if not chunk:
+            break
+        rows: list[tuple[Any, ...]] = []
+        for doc_id, section_number, text, section_start in chunk:
+            for tok in tokenize_positions(str(text or ""), offset=int(section_start or 0)):
+                rows.append((
+                    tok.token, str(doc_id), str(section_number), tok.word_pos,
+                    tok.sentence_id, tok.paragraph_id, tok.char_start, tok.char_end,
+                ))
+        total += copy_rows_into(conn, SECTION_TOKENS_TABLE, rows)
+    reader.close()
+
+    if full_rebuild:
+        conn.execute(
+            f"CREATE TABLE _{SECTION_TOKENS_TABLE}_sorted AS "
+            f"SELECT * FROM {SECTION_TOKENS_TABLE} "
+            "ORDER BY token, doc_id, section_number, word_pos"
+        )
+        conn.execute(f"DROP TABLE {SECTION_TOKENS_TABLE}")
+        conn.execute(
+            f"ALTER TABLE _{SECTION_TOKENS_TABLE}_sorted RENAME TO {SECTION_TOKENS_TABLE}"
+        )
+        conn.execute(f"DROP TABLE IF EXISTS {SECTION_TOKEN_VOCAB_TABLE}")
+        conn.execute(
+            f"CREATE TABLE {SECTION_TOKEN_VOCAB_TABLE} AS "
+            f"SELECT DISTINCT token FROM {SECTION_TOKENS_TABLE} ORDER BY token"
+        )
+    else:
+        # Vocab is append-only: stale tokens only widen candidate expansion,
+        # which is verified against text anyway.
+        placeholders = ", ".join("?" for _ in doc_ids or [])
+        conn.execute(
+            f"INSERT INTO {SECTION_TOKEN_VOCAB_TABLE} "
+            f"SELECT DISTINCT t.token FROM {SECTION_TOKENS_TABLE} t "
+            f"WHERE t.doc_id IN ({placeholders}) "
+            f"AND t.token NOT IN (SELECT token FROM {SECTION_TOKEN_VOCAB_TABLE})",
+            list(doc_ids or []),
+        )
+    return total
+
+
+def build_substring_candidates_sql(pattern: str) -> tuple[str, list[Any]] | None:
+    """SELECT of ``(doc_id, section_number)`` that may contain *pattern*.
+
+    *pattern* is a literal, case-insensitive substring.  Each word in it is
+    looked up in the postings: interior words must match whole tokens, the
+    first word may be the tail of a longer token and the last word its head
+    (when the pattern starts/ends mid-word), so the candidate set is a
+    superset of true matches.  Callers verify against ``section_text``.
+
+    Returns ``None`` when the pattern has no indexable words.
+    """
+    matches = list(_TERM_WORD_RE.finditer(pattern))
+    if not matches:
+        return None
+    lowered = pattern.lower()
+    parts: list[str] = []
+    params: list[Any] = []
+    seen: set[tuple[str, bool, bool]] = set()
+    for i, m in enumerate(matches):
+        word = m.group().lower()
+        open_left = i == 0 and m.start() == 0
+        open_right = i == len(matches) - 1 and m.end() == len(lowered)
+        key = (word, open_left, open_right)
+        if key in seen:
+            continue
+        seen.add(key)
+        if not open_left and not open_right:
+            parts.append(
+                f"SELECT doc_id, section_number, {len(seen)} AS term "
+                f"FROM {SECTION_TOKENS_TABLE} WHERE token = ?"
+            )
+            params.append(word)
+            continue
+        like = f"{'%' if open_left else ''}{escape_like(word)}{'%' if open_right else ''}"
+        parts.append(
+            f"SELECT doc_id, section_number, {len(seen)} AS term "
+            f"FROM {SECTION_TOKENS_TABLE} WHERE token IN ("
+            f"SELECT token FROM {SECTION_TOKEN_VOCAB_TABLE} WHERE token LIKE ? ESCAPE '\\')"
+        )
+        params.append(like)
+    sql = (
+        f"SELECT doc_id, section_number FROM ({' UNION ALL '.join(parts)}) terms "
+        f"GROUP BY doc_id, section_number HAVING COUNT(DISTINCT term) = {len(seen)}"
+    )
+    return sql, params
+
+
+# ---------------------------------------------------------------------------
+# Operand compilation
+# ---------------------------------------------------------------------------
+
+def _is_regex_value(value: str) -> bool:
+    return len(value) >= 2 and value.startswith("/") and value.endswith("/")
+
+
+def _phrase_from_value(value: str) -> _Phrase:
+    """Compile a match value into a consecutive-token phrase."""
+    raw = value.strip()
+    prefix = raw.endswith("%")
+    words = [w.lower() for w in _TERM_WORD_RE.findall(raw.rstrip("%"))]
+    if not words:
+        raise ValueError(f"Proximity term {value!r} contains no searchable words")
+    if prefix and len(words) > 1:
+        raise ValueError(f"Prefix wildcard is only supported on single words: {value!r}")
+    return tuple((w, prefix and i == len(words) - 1) for i, w in enumerate(words))
+
+
+def _compile_or(expr: FilterExpression) -> tuple[list[_Phrase], list[_Phrase]]:
+    """Compile a leaf or OR group into (alternatives, excluded)."""
+    if isinstance(expr, FilterMatch):
+        if _is_regex_value(expr.value):
+            raise ValueError(f"Regex terms are not supported in proximity operands: {expr.value}")
+        phrase = _phrase_from_value(expr.value)
+        return ([], [phrase]) if expr.negate else ([phrase], [])
+    if expr.operator != "or":
+        raise ValueError("Proximity operands support AND groups of OR groups, not deeper nesting")
+    alternatives: list[_Phrase] = []
+    for child in expr.children:
+        if not isinstance(child, FilterMatch):
+            raise ValueError(
+                "Proximity operands support AND groups of OR groups, not deeper nesting"
+            )
+        if child.negate:
+            raise ValueError(
+                "Negated terms inside an OR group are not supported in proximity operands"
+            )
+        alternatives.extend(_compile_or(child)[0])
+    return alternatives, []
+
+
+def _compile_operand(expr: FilterExpression) -> _Operand:
+    if isinstance(expr, FilterGroup) and expr.operator == "and":
+        clauses: list[tuple[_Phrase, ...]] = []
+        excluded: list[_Phrase] = []
+        for child in expr.children:
+            alternatives, negated = _compile_or(child)
+            if alternatives:
+                clauses.append(tuple(alternatives))
+            excluded.extend(negated)
+    else:
+        alternatives, excluded = _compile_or(expr)
+        clauses = [tuple(alternatives)] if alternatives else []
+    if not clauses:
+        raise ValueError("Proximity operand needs at least one positive term")
+    return _Operand(clauses=tuple(clauses), excluded=tuple(excluded))
+
+
+def validate_proximity_operands(prox: ProximityOp) -> list[str]:
+    """Return human-readable errors for operands the evaluator cannot run."""
+    errors: list[str] = []
+    for side, expr in (("left", prox.left), ("right", prox.right)):
+        try:
+            _compile_operand(expr)
+        except ValueError as exc:
+            errors.append(f"{side}: {exc}")
+    if prox.kind == "words" and prox.distance <= 0:
+        errors.append("Word distance must be a positive integer")
+    return errors
+
+
+# ---------------------------------------------------------------------------
+# In-memory evaluation (sorted posting-list merges)
+# ---------------------------------------------------------------------------
+
+def _phrase_spans(
+    phrase: _Phrase,
+    tokens: list[TokenPosition],
+    postings: dict[str, list[int]],
+) -> list[_Span]:
+    first, first_prefix = phrase[0]
+    if first_prefix:
+        starts = sorted(p for tok, ps in postings.items() if tok.startswith(first) for p in ps)
+    else:
+        starts = postings.get(first, [])
+    spans: list[_Span] = []
+    for start in starts:
+        end = start + len(phrase) - 1
+        if end >= len(tokens):
+            continue
+        ok = True
+        for i, (word, prefix) in enumerate(phrase[1:], start=1):
+            actual = tokens[start + i].token
+            if not (actual.startswith(word) if prefix else actual == word):
+                ok = False
+                break
+        if ok:
+            head, tail = tokens[start], tokens[end]
+            spans.append(_Span(
+                start, end, head.sentence_id, head.paragraph_id,
+                head.char_start, tail.char_end,
+            ))
+    return spans
+
+
+def _clause_spans(
+    alternatives: tuple[_Phrase, ...],
+    tokens: list[TokenPosition],
+    postings: dict[str, list[int]],
+) -> list[_Span]:
+    spans: list[_Span] = []
+    for phrase in alternatives:
+        spans.extend(_phrase_spans(phrase, tokens, postings))
+    spans.sort(key=lambda s: (s.pos_start, s.pos_end))
+    return spans
+
+
+def _within(left: _Span, right: _Span, kind: str, distance: int) -> bool:
+    if kind == "sentence":
+        return left.sentence_id == right.sentence_id
+    if kind == "paragraph":
+        return left.paragraph_id == right.paragraph_id
+    return right.pos_start - left.pos_end <= distance and left.pos_start - right.pos_end <= distance
+
+
+def _any_pair_within(left: list[_Span], right: list[_Span], kind: str, distance: int) -> bool:
+    """Merge two pos-sorted span lists and report whether any pair qualifies."""
+    if kind in ("sentence", "paragraph"):
+        attr = "sentence_id" if kind == "sentence" else "paragraph_id"
+        units = {getattr(s, attr) for s in left}
+        return any(getattr(s, attr) in units for s in right)
+    i = j = 0
+    while i < len(left) and j < len(right):
+        lspan, rspan = left[i], right[j]
+        if lspan.pos_end + distance < rspan.pos_start:
+            i += 1
+        elif rspan.pos_end + distance < lspan.pos_start:
+            j += 1
+        else:
+            return True
+    return False
+
+
+def _pair_hits(
+    left: list[_Span], right: list[_Span], kind: str, distance: int,
+) -> list[tuple[int, int]]:
+    hits: list[tuple[int, int]] = []
+    if kind == "words" and right:
+        right_starts = [s.pos_start for s in right]
+        max_len = max(s.pos_end - s.pos_start for s in right)
+        for lspan in left:
+            lo = bisect.bisect_left(right_starts, lspan.pos_start - distance - max_len)
+            for rspan in right[lo:]:
+                if rspan.pos_start - lspan.pos_end > distance:
+                    break
+                if _within(lspan, rspan, kind, distance):
+                    hits.append((
+                        min(lspan.char_start, rspan.char_start),
+                        max(lspan.char_end, rspan.char_end),
+                    ))
+        return hits
+    for lspan in left:
+        for rspan in right:
+            if _within(lspan, rspan, kind, distance):
+                hits.append((
+                    min(lspan.char_start, rspan.char_start),
+                    max(lspan.char_end, rspan.char_end),
+                ))
+    return hits
+
+
+def _evaluate(
+    prox: ProximityOp,
+    text: str,
+    *,
+    offset: int,
+    collect: bool,
+) -> tuple[bool, list[tuple[int, int]]]:
+    left_op = _compile_operand(prox.left)
+    right_op = _compile_operand(prox.right)
+    tokens = tokenize_positions(text, offset=offset)
+    postings: dict[str, list[int]] = {}
+    for tok in tokens:
+        postings.setdefault(tok.token, []).append(tok.word_pos)
+
+    for phrase in (*left_op.excluded, *right_op.excluded):
+        if _phrase_spans(phrase, tokens, postings):
+            return False, []
+
+    hits: list[tuple[int, int]] = []
+    for lclause in left_op.clauses:
+        lspans = _clause_spans(lclause, tokens, postings)
+        for rclause in right_op.clauses:
+            rspans = _clause_spans(rclause, tokens, postings)
+            if not _any_pair_within(lspans, rspans, prox.kind, prox.distance):
+                return False, []
+            if collect:
+                hits.extend(_pair_hits(lspans, rspans, prox.kind, prox.distance))
+    return True, sorted(set(hits))
+
+
+def proximity_matches(prox: ProximityOp, text: str) -> bool:
+    """Whether *text* satisfies the proximity expression."""
+    matched, _ = _evaluate(prox, text, offset=0, collect=False)
+    return matched
+
+
+def find_proximity_hits(
+    prox: ProximityOp,
+    text: str,
+    *,
+    offset: int = 0,
+) -> list[tuple[int, int]]:
+    """Return sorted ``(char_start, char_end)`` spans covering each qualifying pair.
+
+    Offsets are relative to *text* plus *offset*.  Empty when the
+    expression does not match.
+    """
+    _, hits = _evaluate(prox, text, offset=offset, collect=True)
+    return hits
+
+
+# ---------------------------------------------------------------------------
+# SQL generation over the postings table
+# ---------------------------------------------------------------------------
+
+def _phrase_hits_sql(phrase: _Phrase) -> tuple[str, list[Any]]:
+    """SELECT producing one row per phrase occurrence."""
+    froms = [f"{SECTION_TOKENS_TABLE} t0"]
+    conds: list[str] = []
+    params: list[Any] = []
+    for i, (word, prefix) in enumerate(phrase):
+        alias = f"t{i}"
+        if i > 0:
+            froms.append(
+                f"JOIN {SECTION_TOKENS_TABLE} {alias} ON {alias}.doc_id = t0.doc_id "
+                f"AND {alias}.section_number = t0.section_number "
+                f"AND {alias}.word_pos = t0.word_pos + {i}"
+            )
+        if prefix:
+            conds.append(f"{alias}.token LIKE ? ESCAPE '\\'")
+            params.append(f"{escape_like(word)}%")
+        else:
+            conds.append(f"{alias}.token = ?")
+            params.append(word)
+    last = f"t{len(phrase) - 1}"
+    sql = (
+        "SELECT t0.doc_id, t0.section_number, t0.word_pos AS pos_start, "
+        f"{last}.word_pos AS pos_end, t0.sentence_id, t0.paragraph_id, "
+        f"t0.char_start, {last}.char_end "
+        f"FROM {' '.join(froms)} WHERE {' AND '.join(conds)}"
+    )
+    return sql, params
+
+
+def _clause_hits_sql(alternatives: tuple[_Phrase, ...]) -> tuple[str, list[Any]]:
+    parts: list[str] = []
+    params: list[Any] = []
+    for phrase in alternatives:
+        sql, p = _phrase_hits_sql(phrase)
+        parts.append(sql)
+        params.extend(p)
+    return " UNION ALL ".join(parts), params
+
+
+def _pair_condition(kind: str, distance: int) -> str:
+    if kind == "sentence":
+        return "r.sentence_id = l.sentence_id"
+    if kind == "paragraph":
+        return "r.paragraph_id = l.paragraph_id"
+    return (
+        f"r.pos_start - l.pos_end <= {int(distance)} "
+        f"AND l.pos_start - r.pos_end <= {int(distance)}"
+    )
+
+
+def _pairs_sql(
+    lclause: tuple[_Phrase, ...],
+    rclause: tuple[_Phrase, ...],
+    kind: str,
+    distance: int,
+) -> tuple[str, list[Any]]:
+    lsql, lparams = _clause_hits_sql(lclause)
+    rsql, rparams = _clause_hits_sql(rclause)
+    sql = (
+        "SELECT l.doc_id, l.section_number, "
+        "LEAST(l.char_start, r.char_start) AS char_start, "
+        "GREATEST(l.char_end, r.char_end) AS char_end "
+        f"FROM ({lsql}) l JOIN ({rsql}) r "
+        "ON r.doc_id = l.doc_id AND r.section_number = l.section_number "
+        f"AND {_pair_condition(kind, distance)}"
+    )
+    return sql, [*lparams, *rparams]
+
+
+def build_proximity_sql(
+    prox: ProximityOp,
+    *,
+    section_alias: str = "s",
+) -> tuple[str, list[Any]]:
+    """Compile *prox* into a boolean predicate over ``section_tokens``.
+
+    The fragment is correlated on ``{section_alias}.doc_id`` and
+    ``{section_alias}.section_number`` so it drops into the same WHERE
+    clause as the other ``build_multi_field_sql`` fields.
+
+    Raises ``ValueError`` for operands rejected by
+    ``validate_proximity_operands``.
+    """
+    left_op = _compile_operand(prox.left)
+    right_op = _compile_operand(prox.right)
+    correlate = (
+        f"p.doc_id = {section_alias}.doc_id "
+        f"AND p.section_number = {section_alias}.section_number"
+    )
+    parts: list[str] = []
+    params: list[Any] = []
+    for lclause in left_op.clauses:
+        for rclause in right_op.clauses:
+            pair_sql, pair_params = _pairs_sql(lclause, rclause, prox.kind, prox.distance)
+            parts.append(f"EXISTS (SELECT 1 FROM ({pair_sql}) p WHERE {correlate})")
+            params.extend(pair_params)
+    for phrase in (*left_op.excluded, *right_op.excluded):
+        phrase_sql, phrase_params = _phrase_hits_sql(phrase)
+        parts.append(f"NOT EXISTS (SELECT 1 FROM ({phrase_sql}) p WHERE {correlate})")
+        params.extend(phrase_params)
+    return "(" + " AND ".join(parts) + ")", params
+
+
+def build_proximity_hits_sql(prox: ProximityOp) -> tuple[str, list[Any]]:
+    """SELECT of ``(doc_id, section_number, char_start, char_end)`` hit spans.
+
+    Only spans from sections that satisfy the full predicate are returned;
+    char offsets are document-global (same frame as ``clauses.span_start``).
+    """
+    left_op = _compile_operand(prox.left)
+    right_op = _compile_operand(prox.right)
+    hit_parts: list[str] = []
+    params: list[Any] = []
+    for lclause in left_op.clauses:
+        for rclause in right_op.clauses:
+            pair_sql, pair_params = _pairs_sql(lclause, rclause, prox.kind, prox.distance)
+            hit_parts.append(pair_sql)
+            params.extend(pair_params)
+    predicate, predicate_params = build_proximity_sql(prox, section_alias="h")
+    sql = (
+        "SELECT DISTINCT h.doc_id, h.section_number, h.char_start, h.char_end "
+        f"FROM ({' UNION ALL '.join(hit_parts)}) h WHERE {predicate}"
+    )
+    return sql, [*params, *predicate_params]
+
+
+def build_proximity_span_sql(
+    prox: ProximityOp,
+    *,
+    alias: str,
+    start_col: str = "span_start",
+    end_col: str = "span_end",
+) -> tuple[str, list[Any]]:
+    """Predicate: some qualifying hit span lies inside ``{alias}``'s char span.
+
+    Used to narrow clause-granularity results to the clauses that actually
+    contain the proximity match, e.g. ``alias="clause_match"``.
+    """
+    hits_sql, params = build_proximity_hits_sql(prox)
+    sql = (
+        f"EXISTS (SELECT 1 FROM ({hits_sql}) ph "
+        f"WHERE ph.doc_id = {alias}.doc_id "
+        f"AND ph.section_number = {alias}.section_number "
+        f"AND ph.char_start >= {alias}.{start_col} "
+        f"AND ph.char_end <= {alias}.{end_col})"
+    )
+    return sql, params
+
+
+def build_proximity_prefilter_sql(
+    prox: ProximityOp,
+    column: str,
+) -> tuple[str, list[Any]]:
+    """Coarse ILIKE predicate: every positive clause of both operands occurs in *column*.
+
+    This is a superset of the true matches, for corpora built without
+    ``section_tokens``; callers must confirm rows with ``proximity_matches``.
+    """
+    parts: list[str] = []
+    params: list[Any] = []
+    for operand in (_compile_operand(prox.left), _compile_operand(prox.right)):
+        for clause in operand.clauses:
+            ors: list[str] = []
+            for phrase in clause:
+                ors.append(f"{column} ILIKE ? ESCAPE '\\'")
+                params.append(f"%{escape_like(phrase[0][0])}%")
+            parts.append("(" + " OR ".join(ors) + ")")
+    return "(" + " AND ".join(parts) + ")", params
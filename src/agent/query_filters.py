@@ -690,8 +690,10 @@ def _build_article_filter_sql(expr: FilterExpression) -> tuple[str, list[Any]]:
 # ---------------------------------------------------------------------------
 
 def build_multi_field_sql(
-    text_fields: Mapping[str, FilterExpression],
+    text_fields: Mapping[str, Any],
     meta_filters: Mapping[str, Any] | None = None,
+    *,
+    positional_index: bool = True,
 ) -> tuple[str, list[Any], set[str]]:
     """Build SQL WHERE clauses from parsed DSL text fields + meta filters.
 
@@ -703,6 +705,12 @@ def build_multi_field_sql(
         ``defined_term``.
     meta_filters:
         Optional mapping of metadata field names to ``MetaFilter`` objects.
+    positional_index:
+        Whether the corpus has the ``section_tokens`` postings table.  A
+        ``clause`` proximity expression (``ProximityOp``) compiles to an
+        exact postings join when True; when False it compiles to a coarse
+        ILIKE prefilter over ``section_text`` and callers must confirm rows
+        with ``agent.proximity.proximity_matches``.
 
     Returns
     -------
@@ -747,7 +755,25 @@ def build_multi_field_sql(
     # Match against either clause header text or body text so clause-mode
     # preview and batch-run paths use the same textual scope.
     clause_expr = text_fields.get("clause")
-    if clause_expr is not None:
+    if clause_expr is not None and not isinstance(clause_expr, FilterMatch | FilterGroup):
+        # ProximityOp (/s, /p, /N) — imported lazily: rule_dsl imports this module.
+        from agent.proximity import (  # noqa: F811
+            build_proximity_prefilter_sql,
+            build_proximity_sql,
+        )
+        if positional_index:
+            prox_sql, prox_p = build_proximity_sql(clause_expr, section_alias="s")
+            where_parts.append(prox_sql)
+        else:
+            pre_sql, prox_p = build_proximity_prefilter_sql(clause_expr, "st.text")
+            where_parts.append(
+                f"EXISTS (SELECT 1 FROM section_text st"
+                f" WHERE st.doc_id = s.doc_id"
+                f" AND st.section_number = s.section_number"
+                f" AND {pre_sql})"
+            )
+        params.extend(prox_p)
+    elif clause_expr is not None:
         header_sql, header_p = build_filter_sql(
             clause_expr, "c.header_text", wrap_wildcards=True,
         )
@@ -751,6 +751,13 @@ def validate_dsl(
                         position=0,
                         field=fname,
                     ))
+            from agent.proximity import validate_proximity_operands  # noqa: F811
+            for message in validate_proximity_operands(expr):
+                all_errors.append(DslParseError(
+                    message=f"[{fname}/proximity] {message}",
+                    position=0,
+                    field=fname,
+                ))
         else:
             vr = validate_filter_expr(expr)
             for e in vr:
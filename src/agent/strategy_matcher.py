@@ -0,0 +1,173 @@
+"""Compiled per-strategy text signals for section and clause scoring.
+
+``pattern_tester``, ``coverage_reporter`` and clause-level confidence
+scoring all ask the same questions of every section: which heading pattern
+matches, which keyword anchors and DNA phrases occur, and whether any
+negative signal fires.  ``strategy_matcher`` compiles a ``Strategy``'s
+vocabulary once (cached by vocabulary, so reloading an identical strategy
+reuses it) into a ``StrategyMatcher`` whose ``signals`` answers all of them
+from a single scan.
+
+Phrases are located with one ``str.find`` per distinct lowered phrase:
+on CPython that beats a pure-Python multi-pattern automaton by an order of
+magnitude for the tens-to-hundreds of phrases a strategy carries.
+"""
+from __future__ import annotations
+
+import re
+from collections.abc import Mapping
+from dataclasses import dataclass, field
+from functools import lru_cache
+
+from agent.strategy import Strategy
+from agent.textmatch import PhraseHit, PhraseMatcher, dna_density
+
+_KEYWORD = "keyword"
+_DNA_TIER1 = "dna_tier1"
+_DNA_TIER2 = "dna_tier2"
+_NEG_DNA_TIER1 = "dna_negative_tier1"
+_NEG_DNA_TIER2 = "dna_negative_tier2"
+_HEADING = "heading"
+
+_POSITIVE_CHANNELS = (_KEYWORD, _DNA_TIER1, _DNA_TIER2)
+_ALL_CHANNELS = (*_POSITIVE_CHANNELS, _NEG_DNA_TIER1, _NEG_DNA_TIER2)
+
+
+@dataclass(frozen=True, slots=True)
+class SectionSignals:
+    """Every strategy channel's result for one section."""
+
+    heading_pattern: str | None
+    keyword_hits: list[PhraseHit] = field(default_factory=list)
+    keyword_density: float = 0.0
+    dna_hits: list[PhraseHit] = field(default_factory=list)
+    dna_density: float = 0.0
+    negative_dna_density: float = 0.0
+    negative_keyword_hits: int = 0
+
+
+class StrategyMatcher:
+    """A strategy's heading/keyword/DNA/negative vocabulary, compiled."""
+
+    __slots__ = ("_matcher", "_negative_patterns")
+
+    def __init__(
+        self,
+        *,
+        heading_patterns: tuple[str, ...],
+        keyword_anchors: tuple[str, ...],
+        dna_tier1: tuple[str, ...],
+        dna_tier2: tuple[str, ...],
+        dna_negative_tier1: tuple[str, ...] = (),
+        dna_negative_tier2: tuple[str, ...] = (),
+        negative_keyword_patterns: tuple[str, ...] = (),
+    ) -> None:
+        self._matcher = PhraseMatcher(
+            {
+                _HEADING: heading_patterns,
+                _KEYWORD: keyword_anchors,
+                _DNA_TIER1: dna_tier1,
+                _DNA_TIER2: dna_tier2,
+                _NEG_DNA_TIER1: dna_negative_tier1,
+                _NEG_DNA_TIER2: dna_negative_tier2,
+            },
+            tiers={_DNA_TIER2: 2, _NEG_DNA_TIER2: 2},
+        )
+        negatives: list[tuple[re.Pattern[str] | None, str]] = []
+        for pat in negative_keyword_patterns:
+            raw = pat.strip()
+            if not raw:
+                continue
+            try:
+                negatives.append((re.compile(raw, flags=re.IGNORECASE), raw.lower()))
+            except re.error:
+                negatives.append((None, raw.lower()))
+        self._negative_patterns = tuple(negatives)
+
+    def signals(
+        self,
+        heading: str,
+        text_lower: str,
+        *,
+        negatives: bool = False,
+    ) -> SectionSignals:
+        """Score every channel of one section in a single scan.
+
+        Args:
+            heading: Section heading (any case).
+            text_lower: Pre-lowercased section text.
+            negatives: Also evaluate negative DNA tiers and negative
+                keyword patterns (left at zero otherwise).
+        """
+        hits = self._matcher.scan(
+            text_lower, _ALL_CHANNELS if negatives else _POSITIVE_CHANNELS,
+        )
+        keyword_hits = hits[_KEYWORD]
+        keyword_total = self._matcher.channel_size(_KEYWORD)
+        negative_keyword_hits = 0
+        negative_dna = 0.0
+        if negatives:
+            negative_dna = dna_density(len(hits[_NEG_DNA_TIER1]), len(hits[_NEG_DNA_TIER2]))
+            for compiled, literal in self._negative_patterns:
+                if compiled is not None:
+                    if compiled.search(text_lower):
+                        negative_keyword_hits += 1
+                elif literal in text_lower:
+                    negative_keyword_hits += 1
+        return SectionSignals(
+            heading_pattern=self._matcher.match_heading(heading, _HEADING),
+            keyword_hits=keyword_hits,
+            keyword_density=len(keyword_hits) / keyword_total if keyword_total else 0.0,
+            dna_hits=hits[_DNA_TIER1] + hits[_DNA_TIER2],
+            dna_density=dna_density(len(hits[_DNA_TIER1]), len(hits[_DNA_TIER2])),
+            negative_dna_density=negative_dna,
+            negative_keyword_hits=negative_keyword_hits,
+        )
+
+    def clause_signals(self, clause_texts: Mapping[str, str]) -> dict[str, float]:
+        """DNA density per clause, for ``compute_link_confidence(clause_signals=...)``.
+
+        Clauses without any DNA hit are omitted, so an empty result means
+        "checked, nothing found".
+        """
+        out: dict[str, float] = {}
+        for clause_id, text in clause_texts.items():
+            hits = self._matcher.scan(text.lower(), (_DNA_TIER1, _DNA_TIER2))
+            density = dna_density(len(hits[_DNA_TIER1]), len(hits[_DNA_TIER2]))
+            if density > 0:
+                out[clause_id] = density
+        return out
+
+
+@lru_cache(maxsize=64)
+def _compiled(
+    heading_patterns: tuple[str, ...],
+    keyword_anchors: tuple[str, ...],
+    dna_tier1: tuple[str, ...],
+    dna_tier2: tuple[str, ...],
+    dna_negative_tier1: tuple[str, ...],
+    dna_negative_tier2: tuple[str, ...],
+    negative_keyword_patterns: tuple[str, ...],
+) -> StrategyMatcher:
+    return StrategyMatcher(
+        heading_patterns=heading_patterns,
+        keyword_anchors=keyword_anchors,
+        dna_tier1=dna_tier1,
+        dna_tier2=dna_tier2,
+        dna_negative_tier1=dna_negative_tier1,
+        dna_negative_tier2=dna_negative_tier2,
+        negative_keyword_patterns=negative_keyword_patterns,
+    )
+
+
+def strategy_matcher(strategy: Strategy) -> StrategyMatcher:
+    """The compiled matcher for *strategy* (cached by its vocabulary)."""
+    return _compiled(
+        tuple(strategy.heading_patterns),
+        tuple(strategy.keyword_anchors),
+        tuple(strategy.dna_tier1),
+        tuple(strategy.dna_tier2),
+        tuple(strategy.dna_negative_tier1),
+        tuple(strategy.dna_negative_tier2),
+        tuple(strategy.negative_keyword_patterns),
+    )
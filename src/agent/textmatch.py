@@ -2,9 +2,14 @@
 
 Pure text operations with zero domain dependencies.
 Ported from vantage_platform/infra/textmatch.py.
+
+``PhraseMatcher`` compiles several named phrase lists ("channels") once so
+repeated scans skip the per-call lowercasing and search each distinct
+phrase only once, however many channels share it.
 """
 from __future__ import annotations
 
+from collections.abc import Iterable, Mapping, Sequence
 from dataclasses import dataclass
 
 
@@ -67,10 +72,14 @@ def section_dna_density(
         if pos >= 0:
             t2_hits += 1
             hits.append(PhraseHit(phrase, pos, 2))
-    total = t1_hits * 2 + t2_hits
+    return dna_density(t1_hits, t2_hits), hits
+
+
+def dna_density(tier1_hits: int, tier2_hits: int) -> float:
+    """Weighted DNA density from hit counts (see ``section_dna_density``)."""
+    total = tier1_hits * 2 + tier2_hits
     # Normalize: 6+ signals -> density 1.0
-    density = min(1.0, total / 6.0) if total > 0 else 0.0
-    return density, hits
+    return min(1.0, total / 6.0) if total > 0 else 0.0
 
 
 def heading_matches(
@@ -127,3 +136,86 @@ def keyword_density(
             hits.append(PhraseHit(kw, pos, 1))
     density = len(hits) / len(keywords)
     return density, hits
+
+
+class PhraseMatcher:
+    """Named phrase lists compiled once and scanned together.
+
+    Each channel keeps its phrases in order (duplicates included, so
+    per-channel densities match ``keyword_density`` /
+    ``section_dna_density``); the lowered phrases are deduplicated across
+    channels, and each distinct phrase is searched once per scan.
+
+    Args:
+        channels: Channel name -> phrases.
+        tiers: Optional channel name -> ``PhraseHit.tier`` (default 1).
+    """
+
+    __slots__ = ("_channels", "_distinct", "_headings")
+
+    def __init__(
+        self,
+        channels: Mapping[str, Sequence[str]],
+        *,
+        tiers: Mapping[str, int] | None = None,
+    ) -> None:
+        tiers = tiers or {}
+        self._channels: dict[str, tuple[tuple[str, str, int], ...]] = {
+            name: tuple((p, p.lower(), tiers.get(name, 1)) for p in phrases)
+            for name, phrases in channels.items()
+        }
+        self._distinct: dict[str, tuple[str, ...]] = {
+            name: tuple(dict.fromkeys(lowered for _, lowered, _ in entries))
+            for name, entries in self._channels.items()
+        }
+        self._headings: dict[str, tuple[tuple[str, str, str], ...]] = {}
+
+    def channel_size(self, channel: str) -> int:
+        """Number of phrases in *channel* (0 if unknown)."""
+        return len(self._channels.get(channel, ()))
+
+    def scan(
+        self,
+        text_lower: str,
+        channels: Iterable[str] | None = None,
+    ) -> dict[str, list[PhraseHit]]:
+        """First-occurrence hits for every phrase of the requested channels.
+
+        Args:
+            text_lower: Pre-lowercased text to search.
+            channels: Channel names to report (default: all).
+
+        Returns:
+            Channel name -> hits in phrase order, offsets into text_lower.
+        """
+        names = list(self._channels) if channels is None else list(channels)
+        offsets: dict[str, int] = {}
+        for name in names:
+            for lowered in self._distinct.get(name, ()):
+                if lowered not in offsets:
+                    offsets[lowered] = text_lower.find(lowered)
+        out: dict[str, list[PhraseHit]] = {}
+        for name in names:
+            hits: list[PhraseHit] = []
+            for phrase, lowered, tier in self._channels.get(name, ()):
+                pos = offsets[lowered]
+                if pos >= 0:
+                    hits.append(PhraseHit(phrase, pos, tier))
+            out[name] = hits
+        return out
+
+    def match_heading(self, heading: str, channel: str) -> str | None:
+        """``heading_matches`` (case-insensitive) against *channel*'s phrases."""
+        compiled = self._headings.get(channel)
+        if compiled is None:
+            compiled = tuple(
+                (phrase, lowered, lowered.replace(" ", ""))
+                for phrase, lowered, _ in self._channels.get(channel, ())
+            )
+            self._headings[channel] = compiled
+        h = heading.lower()
+        h_nospace = h.replace(" ", "")
+        for phrase, lowered, nospace in compiled:
+            if lowered in h or nospace in h_nospace:
+                return phrase
+        return None
@@ -0,0 +1,108 @@
+"""Client side of the corpus tool daemon (see :mod:`agent.tool_daemon`).
+
+Kept to a handful of stdlib imports: this module is loaded by every
+``scripts/tool_client.py`` invocation, whose whole point is to start fast.
+
+Protocol, one request per Unix-socket connection: the client sends a JSON
+line ``{"tool", "argv", "cwd", "env"}`` and reads back a JSON line
+``{"exit_code", "stdout_bytes", "stderr_bytes", "unknown_tool"}`` followed
+by the raw stdout and stderr bytes.  ``env`` carries the caller's
+``AGENT_*`` variables (e.g. ``AGENT_CONCEPT_WHITELIST``), which the tools
+read from ``os.environ``.
+"""
+from __future__ import annotations
+
+import json
+import os
+import socket
+from collections.abc import Mapping, Sequence
+from typing import BinaryIO, NamedTuple
+
+SOCKET_ENV = "AGENT_TOOL_DAEMON_SOCKET"
+PING = "__ping__"
+# Prefix of the caller environment variables forwarded to the tool.
+FORWARDED_ENV_PREFIX = "AGENT_"
+
+
+class ToolRequestLost(ConnectionError):
+    """The connection broke after the request was sent.
+
+    The daemon may already have run the tool, so callers must not retry
+    it (tools such as ``strategy_writer`` write files).
+    """
+
+
+class ToolResult(NamedTuple):
+    """Outcome of one tool invocation."""
+
+    exit_code: int
+    stdout: bytes = b""
+    stderr: bytes = b""
+    unknown_tool: bool = False
+
+
+def default_socket_path() -> str:
+    """``$AGENT_TOOL_DAEMON_SOCKET``, else a per-user socket under ``$TMPDIR``."""
+    env = os.environ.get(SOCKET_ENV, "").strip()
+    if env:
+        return env
+    tmpdir = os.environ.get("TMPDIR") or "/tmp"
+    return os.path.join(tmpdir, f"agent-tools-{os.getuid()}.sock")
+
+
+def call_tool(
+    tool: str,
+    argv: Sequence[str],
+    *,
+    socket_path: str | os.PathLike[str] | None = None,
+    cwd: str | os.PathLike[str] | None = None,
+    env: Mapping[str, str] | None = None,
+) -> ToolResult:
+    """Run *tool* with *argv* on the daemon listening at *socket_path*.
+
+    The ``AGENT_*`` variables of *env* (default: ``os.environ``) are
+    forwarded and set for the duration of the tool run.
+
+    Raises:
+        ToolRequestLost: The connection broke after the request was sent.
+        OSError: No daemon is listening (nothing was run).
+    """
+    path = os.fspath(socket_path) if socket_path else default_socket_path()
+    source_env = os.environ if env is None else env
+    request = {
+        "tool": tool,
+        "argv": [str(a) for a in argv],
+        "cwd": os.fspath(cwd) if cwd else os.getcwd(),
+        "env": {
+            key: value for key, value in source_env.items()
+            if key.startswith(FORWARDED_ENV_PREFIX)
+        },
+    }
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.connect(path)
+        # A partial request line is rejected by the daemon without running
+        # anything, so send failures are still safe to retry.
+        sock.sendall(json.dumps(request).encode("utf-8") + b"\n")
+        try:
+            with sock.makefile("rb") as stream:
+                header_line = stream.readline()
+                if not header_line:
+                    raise ConnectionError(f"tool daemon closed the connection: {path}")
+                header = json.loads(header_line)
+                stdout = _read_exact(stream, int(header["stdout_bytes"]))
+                stderr = _read_exact(stream, int(header["stderr_bytes"]))
+        except (OSError, ValueError, KeyError) as exc:
+            raise ToolRequestLost(f"tool daemon request interrupted: {exc}") from exc
+    return ToolResult(
+        exit_code=int(header["exit_code"]),
+        stdout=stdout,
+        stderr=stderr,
+        unknown_tool=bool(header.get("unknown_tool", False)),
+    )
+
+
+def _read_exact(stream: BinaryIO, size: int) -> bytes:
+    data = stream.read(size) if size else b""
+    if len(data) != size:
+        raise ConnectionError("tool daemon response truncated")
+    return data
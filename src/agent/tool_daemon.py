@@ -0,0 +1,392 @@
+"""Long-lived local server for the corpus CLI tools used by swarm agents.
+
+Every ``python3 scripts/<tool>.py`` call from an agent pays interpreter
+startup, the duckdb/sklearn/lark imports and a DuckDB open before doing a
+few milliseconds of work.  ``ToolDaemon`` imports the tools once and
+pre-forks worker processes that run a tool's unmodified ``main()``
+in-process with the caller's argv, working directory and ``AGENT_*``
+environment variables, returning its exit code, stdout and stderr.
+
+Workers also pin one read-only DuckDB connection per ``--db`` they serve.
+DuckDB shares a database instance among a process's connections to the
+same file, so the tools' own ``duckdb.connect``/``CorpusIndex`` opens then
+attach to the already-open database and its warm block cache.  A pin is
+dropped when the file changes on disk (a rebuild) and after an idle
+period, so writers are not locked out by a quiet daemon.  Module-level
+caches (compiled strategies, lru_caches) stay warm for the life of a
+worker; workers are recycled after ``max_requests`` requests.
+
+The wire protocol and the client live in :mod:`agent.tool_client`;
+``scripts/tool_client.py`` wraps it with the tools' own CLI.
+"""
+from __future__ import annotations
+
+import contextlib
+import importlib
+import importlib.util
+import io
+import json
+import logging
+import os
+import select
+import signal
+import socket
+import sys
+import time
+import traceback
+from collections.abc import Mapping, Sequence
+from pathlib import Path
+from types import ModuleType
+from typing import Any
+
+from agent.tool_client import (
+    FORWARDED_ENV_PREFIX,
+    PING,
+    ToolResult,
+    call_tool,
+    default_socket_path,
+)
+
+# Corpus tools that are safe to run in-process repeatedly.  Most only read;
+# evidence_collector and strategy_writer write workspace files and enforce
+# per-agent settings (AGENT_CONCEPT_WHITELIST) read from the forwarded
+# client environment.
+DEFAULT_TOOLS: tuple[str, ...] = (
+    "child_locator",
+    "corpus_search",
+    "coverage_reporter",
+    "definition_finder",
+    "dna_discoverer",
+    "evidence_collector",
+    "heading_discoverer",
+    "metadata_reader",
+    "pattern_tester",
+    "sample_selector",
+    "section_reader",
+    "strategy_writer",
+    "structural_mapper",
+)
+
+_SCRIPTS_DIR = Path(__file__).resolve().parents[2] / "scripts"
+_DB_FLAG = "--db"
+_MAX_REQUEST_BYTES = 1 << 20
+# Workers wake at least this often to notice a dead supervisor.
+_POLL_SECONDS = 5.0
+
+
+# ---------------------------------------------------------------------------
+# In-process tool execution
+# ---------------------------------------------------------------------------
+
+
+def load_tool(name: str, scripts_dir: Path = _SCRIPTS_DIR) -> ModuleType:
+    """Import ``scripts/<name>.py`` as a module (its ``main`` is not run)."""
+    path = scripts_dir / f"{name}.py"
+    module_name = f"_agent_tool_{name}"
+    spec = importlib.util.spec_from_file_location(module_name, path)
+    if spec is None or spec.loader is None:
+        raise ImportError(f"cannot load tool script: {path}")
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[module_name] = module
+    spec.loader.exec_module(module)
+    if not callable(getattr(module, "main", None)):
+        raise ImportError(f"tool script has no main(): {path}")
+    return module
+
+
+def run_tool_in_process(
+    module: ModuleType,
+    argv: Sequence[str],
+    *,
+    cwd: Path,
+    env: Mapping[str, str] | None = None,
+) -> ToolResult:
+    """Call ``module.main()`` as if run as ``python3 <script> *argv`` in *cwd*.
+
+    The process's ``AGENT_*`` environment variables are replaced by those
+    in *env* (the caller's), so per-agent settings never leak between
+    requests.  stdout/stderr (text and ``.buffer``) are captured;
+    ``sys.exit`` and uncaught exceptions map to exit codes the way the
+    interpreter maps them.  ``sys.argv``, the working directory, the
+    environment and root logging handlers are restored afterwards.
+    """
+    out_bytes, err_bytes = io.BytesIO(), io.BytesIO()
+    out = io.TextIOWrapper(out_bytes, encoding="utf-8", write_through=True)
+    err = io.TextIOWrapper(err_bytes, encoding="utf-8", write_through=True)
+    saved_argv = sys.argv
+    saved_cwd = os.getcwd()
+    root_logger = logging.getLogger()
+    saved_handlers = list(root_logger.handlers)
+    saved_level = root_logger.level
+    saved_env = {
+        key: value for key, value in os.environ.items()
+        if key.startswith(FORWARDED_ENV_PREFIX)
+    }
+    exit_code = 0
+    try:
+        _replace_agent_env(env or {})
+        os.chdir(cwd)
+        sys.argv = [str(getattr(module, "__file__", "") or module.__name__), *argv]
+        with contextlib.redirect_stdout(out), contextlib.redirect_stderr(err):
+            try:
+                returned = module.main()
+                exit_code = returned if isinstance(returned, int) else 0
+            except SystemExit as exc:
+                if exc.code is None:
+                    exit_code = 0
+                elif isinstance(exc.code, int):
+                    exit_code = exc.code
+                else:
+                    print(exc.code, file=sys.stderr)
+                    exit_code = 1
+            except Exception:
+                traceback.print_exc()
+                exit_code = 1
+    finally:
+        out.flush()
+        err.flush()
+        sys.argv = saved_argv
+        os.chdir(saved_cwd)
+        _replace_agent_env(saved_env)
+        root_logger.handlers[:] = saved_handlers
+        root_logger.setLevel(saved_level)
+    return ToolResult(
+        exit_code=exit_code,
+        stdout=out_bytes.getvalue(),
+        stderr=err_bytes.getvalue(),
+    )
+
+
+def _replace_agent_env(values: Mapping[str, str]) -> None:
+    """Make *values* the process's only ``AGENT_*`` environment variables."""
+    for key in [k for k in os.environ if k.startswith(FORWARDED_ENV_PREFIX)]:
+        if key not in values:
+            del os.environ[key]
+    for key, value in values.items():
+        if key.startswith(FORWARDED_ENV_PREFIX):
+            os.environ[key] = value
+
+
+def _db_paths(argv: Sequence[str], cwd: Path) -> list[Path]:
+    """Resolved ``--db`` arguments in *argv*."""
+    paths: list[Path] = []
+    for i, arg in enumerate(argv):
+        value: str | None = None
+        if arg == _DB_FLAG and i + 1 < len(argv):
+            value = argv[i + 1]
+        elif arg.startswith(_DB_FLAG + "="):
+            value = arg[len(_DB_FLAG) + 1:]
+        if value:
+            paths.append((cwd / value).resolve())
+    return paths
+
+
+class _DatabasePins:
+    """One open read-only DuckDB connection per database a worker serves."""
+
+    def __init__(self) -> None:
+        self._pins: dict[Path, tuple[tuple[int, int, int], Any]] = {}
+
+    def pin(self, path: Path) -> None:
+        try:
+            st = path.stat()
+        except OSError:
+            self.release(path)
+            return
+        identity = (st.st_dev, st.st_ino, st.st_mtime_ns)
+        current = self._pins.get(path)
+        if current is not None and current[0] == identity:
+            return
+        # A stale pin would keep DuckDB handing out the replaced file.
+        self.release(path)
+        try:
+            conn = importlib.import_module("duckdb").connect(str(path), read_only=True)
+        except Exception:
+            return
+        self._pins[path] = (identity, conn)
+
+    def release(self, path: Path) -> None:
+        current = self._pins.pop(path, None)
+        if current is not None:
+            with contextlib.suppress(Exception):
+                current[1].close()
+
+    def release_all(self) -> None:
+        for path in list(self._pins):
+            self.release(path)
+
+    def __len__(self) -> int:
+        return len(self._pins)
+
+
+# ---------------------------------------------------------------------------
+# Server
+# ---------------------------------------------------------------------------
+
+
+class _Shutdown(Exception):
+    pass
+
+
+def _raise_shutdown(_signum: int, _frame: object) -> None:
+    raise _Shutdown
+
+
+class ToolDaemon:
+    """Pre-forking Unix-socket server for the corpus CLI tools."""
+
+    def __init__(
+        self,
+        socket_path: Path | None = None,
+        *,
+        workers: int = 4,
+        tools: Sequence[str] = DEFAULT_TOOLS,
+        scripts_dir: Path = _SCRIPTS_DIR,
+        max_requests: int = 500,
+        idle_release_seconds: float = 60.0,
+    ) -> None:
+        self.socket_path = socket_path or Path(default_socket_path())
+        self.workers = max(1, workers)
+        self.tools = tuple(tools)
+        self.scripts_dir = scripts_dir
+        self.max_requests = max_requests
+        self.idle_release_seconds = idle_release_seconds
+        self._supervisor_pid = os.getpid()
+
+    def serve_forever(self) -> None:
+        """Import the tools, bind the socket and supervise workers until signalled."""
+        modules = {name: load_tool(name, self.scripts_dir) for name in self.tools}
+        listener = self._bind()
+        self._supervisor_pid = os.getpid()
+        children: dict[int, float] = {}
+        previous = {
+            sig: signal.signal(sig, _raise_shutdown)
+            for sig in (signal.SIGTERM, signal.SIGINT, signal.SIGHUP)
+        }
+        try:
+            while True:
+                while len(children) < self.workers:
+                    children[self._spawn(listener, modules)] = time.monotonic()
+                pid, _status = os.wait()
+                started = children.pop(pid, None)
+                if started is not None and time.monotonic() - started < 1.0:
+                    time.sleep(1.0)  # crashing on startup: don't spin
+        except _Shutdown:
+            pass
+        finally:
+            for sig, handler in previous.items():
+                signal.signal(sig, handler)
+            for pid in children:
+                with contextlib.suppress(ProcessLookupError):
+                    os.kill(pid, signal.SIGTERM)
+            for pid in children:
+                with contextlib.suppress(ChildProcessError):
+                    os.waitpid(pid, 0)
+            listener.close()
+            with contextlib.suppress(FileNotFoundError):
+                self.socket_path.unlink()
+
+    def _bind(self) -> socket.socket:
+        if self.socket_path.exists():
+            try:
+                call_tool(PING, [], socket_path=self.socket_path)
+            except OSError:
+                self.socket_path.unlink()  # stale socket from a dead daemon
+            else:
+                raise RuntimeError(f"tool daemon already running at {self.socket_path}")
+        self.socket_path.parent.mkdir(parents=True, exist_ok=True)
+        listener = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        listener.bind(str(self.socket_path))
+        os.chmod(self.socket_path, 0o600)
+        listener.listen(128)
+        # Workers race for each connection; the losers see BlockingIOError.
+        listener.setblocking(False)
+        return listener
+
+    def _spawn(self, listener: socket.socket, modules: Mapping[str, ModuleType]) -> int:
+        pid = os.fork()
+        if pid:
+            return pid
+        code = 0
+        try:
+            for sig in (signal.SIGTERM, signal.SIGINT, signal.SIGHUP):
+                signal.signal(sig, signal.SIG_DFL)
+            self._worker_loop(listener, modules)
+        except BaseException:
+            traceback.print_exc()
+            code = 1
+        finally:
+            os._exit(code)
+
+    def _worker_loop(
+        self, listener: socket.socket, modules: Mapping[str, ModuleType],
+    ) -> None:
+        pins = _DatabasePins()
+        served = 0
+        last_request = time.monotonic()
+        while self.max_requests <= 0 or served < self.max_requests:
+            if os.getppid() != self._supervisor_pid:
+                return
+            ready, _, _ = select.select([listener], [], [], _POLL_SECONDS)
+            if not ready:
+                idle = time.monotonic() - last_request
+                if pins and idle >= self.idle_release_seconds:
+                    pins.release_all()
+                continue
+            try:
+                conn, _addr = listener.accept()
+            except BlockingIOError:
+                continue
+            with conn:
+                self._handle(conn, modules, pins)
+            served += 1
+            last_request = time.monotonic()
+        pins.release_all()
+
+    def _handle(
+        self,
+        conn: socket.socket,
+        modules: Mapping[str, ModuleType],
+        pins: _DatabasePins,
+    ) -> None:
+        conn.setblocking(True)
+        with conn.makefile("rb") as stream:
+            line = stream.readline(_MAX_REQUEST_BYTES)
+        try:
+            request = json.loads(line)
+            tool = str(request["tool"])
+            argv = [str(a) for a in request.get("argv", [])]
+            cwd = Path(str(request.get("cwd") or os.getcwd()))
+            env = {str(k): str(v) for k, v in (request.get("env") or {}).items()}
+        except (ValueError, KeyError, TypeError, AttributeError) as exc:
+            result = ToolResult(exit_code=2, stderr=f"bad tool request: {exc}\n".encode())
+        else:
+            if tool == PING:
+                status = {
+                    "pid": self._supervisor_pid,
+                    "worker_pid": os.getpid(),
+                    "socket": str(self.socket_path),
+                    "tools": sorted(modules),
+                    "pinned_dbs": len(pins),
+                }
+                result = ToolResult(exit_code=0, stdout=json.dumps(status).encode())
+            elif tool not in modules:
+                result = ToolResult(
+                    exit_code=2,
+                    stderr=f"tool not served by daemon: {tool}\n".encode(),
+                    unknown_tool=True,
+                )
+            else:
+                for db_path in _db_paths(argv, cwd):
+                    pins.pin(db_path)
+                result = run_tool_in_process(modules[tool], argv, cwd=cwd, env=env)
+        header = {
+            "exit_code": result.exit_code,
+            "stdout_bytes": len(result.stdout),
+            "stderr_bytes": len(result.stderr),
+            "unknown_tool": result.unknown_tool,
+        }
+        with contextlib.suppress(OSError):  # client went away
+            conn.sendall(json.dumps(header).encode("utf-8") + b"\n")
+            conn.sendall(result.stdout)
+            conn.sendall(result.stderr)
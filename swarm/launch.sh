@@ -9,6 +9,7 @@ require_tmux
 session="$(default_session_name)"
 panes="$(default_panes)"
 workdir="$ROOT_DIR"
+tool_daemon=1
 
 while [[ $# -gt 0 ]]; do
   case "$1" in
@@ -24,9 +25,13 @@ while [[ $# -gt 0 ]]; do
       workdir="${2:?missing workdir path}"
       shift 2
       ;;
+    --no-tool-daemon)
+      tool_daemon=0
+      shift
+      ;;
     *)
       echo "Unknown argument: $1" >&2
-      echo "Usage: $0 [--session NAME] [--panes N] [--workdir PATH]" >&2
+      echo "Usage: $0 [--session NAME] [--panes N] [--workdir PATH] [--no-tool-daemon]" >&2
       exit 1
       ;;
   esac
@@ -59,5 +64,11 @@ if [[ "$i" -ne "$panes" ]]; then
   echo "Warning: expected $panes panes but found $i in $window_target" >&2
 fi
 
+if [[ "$tool_daemon" -eq 1 ]]; then
+  # Serves scripts/tool_client.py calls from warm workers; stops with the session.
+  tmux new-window -d -t "$session" -n tools -c "$workdir" \
+    "PYTHONPATH=\"$ROOT_DIR/src\${PYTHONPATH:+:\$PYTHONPATH}\" python3 \"$ROOT_DIR/scripts/tool_daemon.py\" serve"
+fi
+
 echo "Launched tmux session '$session' with $panes pane(s) in $workdir"
 echo "Attach with: tmux attach -t $session"
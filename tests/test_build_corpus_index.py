@@ -558,6 +558,114 @@ class TestBatchedWrites:
         assert stats.cohort_count == 1
         assert stats.doc_type_counts.get("credit_agreement") == 2
 
+    def test_run_stats_folds_stage_timings_into_profiler(self) -> None:
+        mod = _load_build_module()
+        from agent.document_processor import PipelineProfiler
+
+        stats = mod._RunStats(PipelineProfiler(slowest_n=1))
+        result = _make_doc_result("a")
+        result["timing"] = {
+            "key": "a.htm", "worker": 7, "total_sec": 0.5,
+            "stages": {"outline": 0.4, "clauses": 0.1}, "counters": {"sections": 2},
+        }
+        stats.accumulate(result)
+        stats.accumulate(_make_doc_result("b"))  # no timing: counted, not profiled
+
+        profile = stats.profiler.summary()
+        assert stats.processed_docs == 2
+        assert profile["docs"] == 1
+        assert profile["stages"]["outline"]["total_sec"] == 0.4
+        assert profile["workers"] == {"7": {"docs": 1, "total_sec": 0.5}}
+        assert profile["slowest_docs"][0]["key"] == "a.htm"
+
+
+class TestParquetShards:
+    """Tests for worker-side shards + parent merge (full rebuild)."""
+
+    def test_merge_resolves_collisions_by_path_and_dedups_keys(self) -> None:
+        mod = _load_build_module()
+        with tempfile.TemporaryDirectory() as tmpdir:
+            shard_dir = Path(tmpdir) / "shards"
+            shard_dir.mkdir()
+            late = _make_doc_result("dup")
+            late["sections"] = [
+                {
+                    "doc_id": "dup", "section_number": "1.01", "heading": "First",
+                    "char_start": 0, "char_end": 10, "article_num": 1, "word_count": 2,
+                },
+                {
+                    "doc_id": "dup", "section_number": "1.01", "heading": "Repeat",
+                    "char_start": 10, "char_end": 20, "article_num": 1, "word_count": 2,
+                },
+            ]
+            early = _make_doc_result("dup")
+            early["doc"]["path"] = "documents/aaa.htm"
+            mod._write_doc_shard([late, _make_doc_result("other")], shard_dir, 0)
+            mod._write_doc_shard([early], shard_dir, 1)
+
+            conn = mod._init_db(Path(tmpdir) / "corpus.duckdb")
+            try:
+                counts = mod._merge_doc_shards(
+                    conn, shard_dir, {"other": "cluster_001"}, False,
+                )
+                docs = dict(
+                    conn.execute(
+                        "SELECT path, doc_id FROM documents",
+                    ).fetchall()
+                )
+                sections = conn.execute(
+                    "SELECT doc_id, heading FROM sections",
+                ).fetchall()
+                family = conn.execute(
+                    "SELECT template_family FROM documents WHERE doc_id = 'other'",
+                ).fetchone()[0]
+                leftovers = conn.execute(
+                    "SELECT COUNT(*) FROM duckdb_tables() WHERE temporary",
+                ).fetchone()[0]
+            finally:
+                conn.close()
+
+            assert docs == {
+                "documents/aaa.htm": "dup",
+                late["doc"]["path"]: "dup_1",
+                _make_doc_result("other")["doc"]["path"]: "other",
+            }
+            assert sections == [("dup_1", "First")]
+            assert counts["documents"] == 3
+            assert counts["sections"] == 1
+            assert family == "cluster_001"
+            assert leftovers == 0
+
+    def test_process_doc_chunk_reports_failures_without_shards(self) -> None:
+        mod = _load_build_module()
+        with tempfile.TemporaryDirectory() as tmpdir:
+            corpus_dir = Path(tmpdir) / "corpus"
+            corpus_dir.mkdir()
+            empty = corpus_dir / "empty.htm"
+            empty.write_text("")
+            shard_dir = Path(tmpdir) / "shards"
+            shard_dir.mkdir()
+            summaries = mod._process_doc_chunk(([empty], corpus_dir, shard_dir, 0))
+            assert summaries == [None]
+            assert list(shard_dir.iterdir()) == []
+
+    def test_clear_doc_shards_leaves_other_files(self) -> None:
+        mod = _load_build_module()
+        with tempfile.TemporaryDirectory() as tmpdir:
+            shard_dir = Path(tmpdir)
+            for name in (
+                "sections_00003.parquet", "section_text_00012.parquet",
+                "documents_2024.parquet", "notes.txt",
+            ):
+                (shard_dir / name).write_text("")
+            assert mod._foreign_shard_dir_entries(shard_dir) == [
+                "documents_2024.parquet", "notes.txt",
+            ]
+            mod._clear_doc_shards(shard_dir)
+            assert sorted(p.name for p in shard_dir.iterdir()) == [
+                "documents_2024.parquet", "notes.txt",
+            ]
+
 
 class TestProgressReporter:
     """Tests for _ProgressReporter (Step 2)."""
@@ -713,6 +821,40 @@ class TestDeleteDocIds:
             finally:
                 conn.close()
 
+    def test_delete_and_refresh_keep_positional_index_in_sync(self) -> None:
+        mod = _load_build_module()
+        with tempfile.TemporaryDirectory() as tmpdir:
+            out = Path(tmpdir) / "corpus.duckdb"
+            conn = mod._init_db(out)
+            try:
+                result = _make_doc_result("tok1")
+                result["sections"] = [{
+                    "doc_id": "tok1",
+                    "section_number": "7.01",
+                    "heading": "Indebtedness",
+                    "char_start": 0,
+                    "char_end": 30,
+                    "article_num": 7,
+                    "word_count": 4,
+                }]
+                result["section_texts"] = [{
+                    "doc_id": "tok1",
+                    "section_number": "7.01",
+                    "text": "Borrower shall not incur Debt.",
+                }]
+                mod._write_batch(conn, [result], set(), None, False)
+
+                # Corpora built without the index stay without it.
+                assert mod._refresh_positional_index(conn, ["tok1"], enabled=False) == 0
+                assert not mod._has_table(conn, "section_tokens")
+
+                assert mod._refresh_positional_index(conn, ["tok1"], enabled=True) == 5
+                mod._delete_doc_ids(conn, ["tok1"])
+                count = conn.execute("SELECT COUNT(*) FROM section_tokens").fetchone()[0]
+                assert count == 0
+            finally:
+                conn.close()
+
 
 class TestAnomalyFromDb:
     """Tests for _build_anomaly_rows_from_db (Step 3)."""
@@ -769,6 +769,249 @@ class TestScanCorpusForFamily:
         assert "doc2" not in doc_ids_found
 
 
+# ─────────────────── TestSetAtATimeScan ──────────────────
+
+
+def _make_duckdb_corpus(tmp_path: Path) -> Path:
+    """Write a small corpus.duckdb with documents/sections/articles/definitions."""
+    import duckdb
+
+    from agent.corpus import SCHEMA_VERSION
+
+    db_path = tmp_path / "corpus.duckdb"
+    con = duckdb.connect(str(db_path))
+    con.execute(
+        "CREATE TABLE _schema_version (table_name VARCHAR, version VARCHAR, created_at TIMESTAMP)"
+    )
+    con.execute(
+        "INSERT INTO _schema_version VALUES ('corpus', ?, current_timestamp)",
+        [SCHEMA_VERSION],
+    )
+    con.execute(
+        "CREATE TABLE documents (doc_id VARCHAR, template_family VARCHAR, cohort_included BOOLEAN)"
+    )
+    con.execute(
+        "INSERT INTO documents VALUES "
+        "('doc1', 'kirkland', true), ('doc2', 'cahill', true), ('doc3', 'kirkland', false)"
+    )
+    con.execute(
+        "CREATE TABLE sections (doc_id VARCHAR, section_number VARCHAR, heading VARCHAR, "
+        "char_start INTEGER, char_end INTEGER, article_num INTEGER, word_count INTEGER)"
+    )
+    con.execute(
+        "INSERT INTO sections VALUES "
+        "('doc1', '7.01', 'Indebtedness', 100, 500, 7, 80), "
+        "('doc1', '7.02', 'Liens', 500, 900, 7, 60), "
+        "('doc1', '1.01', 'Defined Terms', 0, 100, 1, 20), "
+        "('doc2', '6.01', 'Limitation on Indebtedness', 50, 400, 6, 70), "
+        "('doc2', '6.02', 'Restricted 100%_Payments', 400, 800, 6, 70), "
+        "('doc3', '7.01', 'Indebtedness', 0, 300, 7, 50)"
+    )
+    con.execute(
+        "CREATE TABLE articles (doc_id VARCHAR, article_num INTEGER, label VARCHAR, "
+        "title VARCHAR, concept VARCHAR, char_start INTEGER, char_end INTEGER, "
+        "is_synthetic BOOLEAN)"
+    )
+    con.execute(
+        "INSERT INTO articles VALUES "
+        "('doc1', 1, 'ARTICLE I', 'Definitions', 'definitions', 0, 100, false), "
+        "('doc1', 7, 'ARTICLE VII', 'Negative Covenants', 'negative_covenants', 100, 900, false), "
+        "('doc2', 6, 'ARTICLE VI', 'Negative Covenants', 'negative_covenants', 50, 800, false)"
+    )
+    con.execute(
+        "CREATE TABLE definitions (doc_id VARCHAR, term VARCHAR, definition_text VARCHAR, "
+        "char_start INTEGER, char_end INTEGER, pattern_engine VARCHAR, confidence DOUBLE)"
+    )
+    con.execute(
+        "INSERT INTO definitions VALUES "
+        "('doc1', 'Indebtedness', 'means debt', 10, 40, 'quoted', 1.0), "
+        "('doc1', 'Lien', 'means any lien', 520, 560, 'quoted', 1.0)"
+    )
+    con.close()
+    return db_path
+
+
+class _PerDocCorpus:
+    """Delegates to a CorpusIndex but hides ``has_table`` (forces the per-doc path)."""
+
+    def __init__(self, corpus: Any) -> None:
+        self._corpus = corpus
+
+    def __getattr__(self, name: str) -> Any:
+        if name == "has_table":
+            raise AttributeError(name)
+        return getattr(self._corpus, name)
+
+
+class TestSetAtATimeScan:
+    """The SQL plan must return exactly what the per-document path returns."""
+
+    def _both(
+        self, tmp_path: Path, rule: dict[str, Any], **kwargs: Any,
+    ) -> tuple[list[dict[str, Any]], list[dict[str, Any]]]:
+        from agent.corpus import CorpusIndex
+
+        with CorpusIndex(_make_duckdb_corpus(tmp_path)) as corpus:
+            set_based = scan_corpus_for_family(corpus, rule, **kwargs)
+            per_doc = scan_corpus_for_family(_PerDocCorpus(corpus), rule, **kwargs)
+        return set_based, per_doc
+
+    def test_heading_and_article_parity(self, tmp_path: Path) -> None:
+        rule = _make_rule(
+            heading_values=["Indebtedness", "Restricted Payments"],
+            article_concepts=["negative_covenants"],
+        )
+        set_based, per_doc = self._both(tmp_path, rule)
+        assert set_based == per_doc
+        assert [(c["doc_id"], c["section_number"]) for c in set_based] == [
+            ("doc1", "7.01"),
+            ("doc2", "6.01"),
+            ("doc2", "6.02"),
+        ]
+
+    def test_explicit_doc_ids_skip_cohort_filter(self, tmp_path: Path) -> None:
+        rule = _make_rule(heading_values=["Indebtedness"])
+        set_based, per_doc = self._both(tmp_path, rule, doc_ids=["doc3"])
+        assert set_based == per_doc
+        assert [c["doc_id"] for c in set_based] == ["doc3"]
+
+    def test_expected_terms_grounding_parity(self, tmp_path: Path) -> None:
+        rule = _make_rule(heading_values=["Indebtedness"])
+        rule["required_defined_terms"] = ["Indebtedness", "Permitted Liens"]
+        set_based, per_doc = self._both(tmp_path, rule)
+        assert set_based == per_doc
+        grounding = {
+            c["doc_id"]: c["confidence_breakdown"]["defined_term_grounding"] for c in set_based
+        }
+        assert grounding == {"doc1": 0.5, "doc2": 0.0}
+
+    def test_defined_term_granularity_parity(self, tmp_path: Path) -> None:
+        rule = _make_rule(heading_values=["Liens"])
+        rule["filter_dsl"] = 'heading:"Liens" defined_term:"Lien"'
+        set_based, per_doc = self._both(tmp_path, rule)
+        assert set_based == per_doc
+        assert [c.get("defined_term") for c in set_based] == ["Lien"]
+
+    def test_inherited_scope_restricts_sections(self, tmp_path: Path) -> None:
+        rule = _make_rule(heading_values=["Indebtedness"])
+        scope = {"doc2": {"6.01"}}
+        set_based, per_doc = self._both(tmp_path, rule, allowed_sections_by_doc=scope)
+        assert set_based == per_doc
+        assert [(c["doc_id"], c["section_number"]) for c in set_based] == [("doc2", "6.01")]
+
+    def test_meta_filter_applies_in_sql(self, tmp_path: Path) -> None:
+        from agent.corpus import CorpusIndex
+
+        rule = _make_rule(heading_values=["Indebtedness"])
+        rule["filter_dsl"] = 'heading:"Indebtedness" template:"kirkland"'
+        with CorpusIndex(_make_duckdb_corpus(tmp_path)) as corpus:
+            candidates = scan_corpus_for_family(corpus, rule)
+        assert [c["doc_id"] for c in candidates] == ["doc1"]
+
+    def test_preview_engine_scope_matches_sql_scope(self, tmp_path: Path) -> None:
+        from agent.corpus import CorpusIndex
+        from agent.preview_engine import PreviewEngine
+
+        engine = PreviewEngine()
+        dsl_only = _make_rule()
+        dsl_only["heading_filter_ast"] = {}
+        edits = [
+            (dsl_only, "heading: indebtedness & !limitation"),
+            (dsl_only, "heading: indebtedness | liens template: kirkland"),
+            (_make_rule(heading_values=["Liens"]), 'heading:"Liens" defined_term:"Lien"'),
+        ]
+        with CorpusIndex(_make_duckdb_corpus(tmp_path)) as corpus:
+            for base, filter_dsl in edits:
+                rule = {**base, "filter_dsl": filter_dsl}
+                scoped = scan_corpus_for_family(
+                    corpus, rule, preview_engine=engine, corpus_version="v1",
+                )
+                assert scoped == scan_corpus_for_family(corpus, rule), filter_dsl
+                assert scoped
+        # The second edit re-used the cached "indebtedness" leaf.
+        assert engine.stats()["hits"] >= 1
+
+
+# ─────────────────── TestSweep ──────────────────
+
+
+class TestSweep:
+    """--sweep evaluates every rule in one corpus pass with per-rule parity."""
+
+    def _rules(self) -> list[dict[str, Any]]:
+        parent = _make_rule(
+            family_id="debt",
+            heading_values=["Indebtedness", "Liens"],
+            rule_id="rule-parent",
+        )
+        child = _make_rule(
+            family_id="debt.indebtedness",
+            heading_values=["Indebtedness"],
+            rule_id="rule-child",
+            scope_mode="inherited",
+        )
+        terms = _make_rule(
+            family_id="liens",
+            heading_values=["Liens"],
+            rule_id="rule-terms",
+        )
+        terms["filter_dsl"] = 'heading:"Liens" defined_term:"Lien"'
+        return [child, terms, parent]
+
+    def _candidate_keys(self, summary: dict[str, Any]) -> list[tuple[Any, ...]]:
+        return [
+            (c["family_id"], c["doc_id"], c["section_number"], c.get("defined_term"),
+             c["confidence"], tuple(sorted(x["other_family"] for x in c["conflicts"])))
+            for c in summary["candidates"]
+        ]
+
+    def test_dry_run_sweep_matches_per_rule(self, tmp_path: Path) -> None:
+        from agent.corpus import CorpusIndex
+
+        with CorpusIndex(_make_duckdb_corpus(tmp_path)) as corpus:
+            per_rule = run_bulk_linking(corpus, None, self._rules(), dry_run=True)
+            swept = run_bulk_linking(corpus, None, self._rules(), dry_run=True, sweep=True)
+        assert swept["candidates"] == per_rule["candidates"]
+        assert swept["by_family"] == per_rule["by_family"]
+
+    def test_sharded_sweep_matches_single_process(self, tmp_path: Path) -> None:
+        from agent.corpus import CorpusIndex
+
+        with CorpusIndex(_make_duckdb_corpus(tmp_path)) as corpus:
+            single = run_bulk_linking(corpus, None, self._rules(), dry_run=True, sweep=True)
+            sharded = run_bulk_linking(
+                corpus, None, self._rules(), dry_run=True, sweep=True, sweep_workers=2,
+            )
+        assert self._candidate_keys(sharded) == self._candidate_keys(single)
+
+    def test_inherited_scope_follows_parent_links_in_sweep(self, tmp_path: Path) -> None:
+        from agent.corpus import CorpusIndex
+
+        def active_links(sweep: bool, name: str) -> set[tuple[str, str, str]]:
+            store = LinkStore(tmp_path / f"{name}.duckdb", create_if_missing=True)
+            with CorpusIndex(tmp_path / "corpus.duckdb") as corpus:
+                run_bulk_linking(corpus, store, self._rules(), sweep=sweep)
+            rows = store._conn.execute(  # noqa: SLF001
+                "SELECT family_id, doc_id, section_number FROM family_links "
+                "WHERE status <> 'unlinked'",
+            ).fetchall()
+            store.close()
+            return {(str(r[0]), str(r[1]), str(r[2])) for r in rows}
+
+        _make_duckdb_corpus(tmp_path)
+        per_rule = active_links(False, "per_rule")
+        swept = active_links(True, "swept")
+        assert swept == per_rule
+        assert {r for r in swept if r[0] == "debt.indebtedness"}
+
+    def test_parser_accepts_sweep_flags(self) -> None:
+        args = build_parser().parse_args(
+            ["--db", "c.duckdb", "--links-db", "l.duckdb", "--sweep", "--sweep-workers", "3"],
+        )
+        assert args.sweep is True
+        assert args.sweep_workers == 3
+
+
 # ─────────────────── TestRunBulkLinking ──────────────────
 
 
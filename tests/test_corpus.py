@@ -14,6 +14,7 @@ from agent.corpus import (
     ensure_schema_version,
     load_candidate_doc_ids,
 )
+from agent.proximity import build_section_token_index
 
 
 def _create_min_corpus_db(path: Path, *, schema_version: str = SCHEMA_VERSION) -> None:
@@ -253,6 +254,63 @@ class TestCorpusIndex:
                 assert feats["7.01"].scope_label == "NARROW"
                 assert feats["7.01"].definition_types == ("FORMULAIC",)
 
+    def test_search_text_returns_every_hit_with_or_without_index(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            db_path = Path(tmpdir) / "corpus.duckdb"
+            _create_min_corpus_db(db_path)
+            with CorpusIndex(db_path) as corpus:
+                scanned = corpus.search_text("debt", cohort_only=False, context_chars=5)
+            con = duckdb.connect(str(db_path))
+            build_section_token_index(con)
+            con.close()
+            with CorpusIndex(db_path) as corpus:
+                assert corpus.has_table("section_tokens") is True
+                indexed = corpus.search_text("debt", cohort_only=False, context_chars=5)
+                assert corpus.search_text("on Indebted", cohort_only=False)
+                assert corpus.search_text("Limitation Debt", cohort_only=False) == []
+                capped = corpus.search_text("debt", cohort_only=False, max_results=1)
+
+            assert scanned == indexed
+            assert [r["char_offset"] for r in indexed] == [16, 41]
+            assert [r["matched_text"] for r in indexed] == ["debt", "Debt"]
+            assert len(capped) == 1
+
+    def test_iter_doc_bundles_matches_per_doc_lookups(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            db_path = Path(tmpdir) / "corpus.duckdb"
+            _create_min_corpus_db(db_path)
+            con = duckdb.connect(str(db_path))
+            con.execute(
+                "INSERT INTO sections VALUES ('doc1', '1.01', 'Definitions', 0, 0, 1, 5)"
+            )
+            con.execute(
+                "INSERT INTO sections VALUES ('doc2', '2.01', 'Orphan', 0, 10, 2, 5)"
+            )
+            con.close()
+            with CorpusIndex(db_path) as corpus:
+                bundles = list(
+                    corpus.iter_doc_bundles(
+                        ["doc1", "missing", "doc2", "doc1"], cohort_only=False, chunk_size=2,
+                    )
+                )
+                expected = corpus.search_sections(doc_id="doc1", cohort_only=False)
+
+            assert [b.doc_id for b in bundles] == ["doc1", "missing", "doc2", "doc1"]
+            first = bundles[0]
+            assert first.doc is not None
+            assert first.doc.borrower == "Borrower LLC"
+            assert first.sections == expected
+            assert first.section_texts == {
+                "7.01": "Limitation on Indebtedness and Permitted Debt",
+            }
+            assert first.section_features == {}
+            assert bundles[1].doc is None
+            assert bundles[1].sections == []
+            assert bundles[2].doc is None
+            assert [s.section_number for s in bundles[2].sections] == ["2.01"]
+            assert bundles[2].section_texts == {}
+            assert bundles[3].sections == expected
+
     def test_load_candidate_doc_ids_from_text_and_dedup(self, tmp_path: Path) -> None:
         txt_path = tmp_path / "candidates.txt"
         txt_path.write_text("doc1\ndoc2\ndoc1\n\n")
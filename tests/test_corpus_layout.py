@@ -0,0 +1,115 @@
+"""Tests for agent.corpus_layout — post-build sort + index stage."""
+from __future__ import annotations
+
+from pathlib import Path
+
+import duckdb
+import pytest
+
+from agent.corpus import SCHEMA_VERSION, CorpusIndex
+from agent.corpus_layout import corpus_layout_plan, optimize_corpus_layout
+
+
+def _build_unsorted_db(path: Path) -> None:
+    con = duckdb.connect(str(path))
+    con.execute(
+        "CREATE TABLE _schema_version (table_name VARCHAR PRIMARY KEY, "
+        "version VARCHAR NOT NULL, created_at TIMESTAMP)"
+    )
+    con.execute(
+        "INSERT INTO _schema_version VALUES ('corpus', ?, current_timestamp)",
+        [SCHEMA_VERSION],
+    )
+    con.execute("CREATE TABLE documents (doc_id VARCHAR PRIMARY KEY, path VARCHAR)")
+    con.execute(
+        "CREATE TABLE sections (doc_id VARCHAR NOT NULL, section_number VARCHAR NOT NULL, "
+        "heading VARCHAR, char_start INTEGER, char_end INTEGER, article_num INTEGER, "
+        "word_count INTEGER, PRIMARY KEY (doc_id, section_number))"
+    )
+    con.execute(
+        "CREATE TABLE section_text (doc_id VARCHAR NOT NULL, "
+        "section_number VARCHAR NOT NULL, text VARCHAR, "
+        "PRIMARY KEY (doc_id, section_number))"
+    )
+    # Worker completion order: documents and sections arrive interleaved.
+    for doc_id in ("d3", "d1", "d2"):
+        con.execute("INSERT INTO documents VALUES (?, ?)", [doc_id, f"{doc_id}.htm"])
+        for section_number, start in (("2.01", 500), ("1.01", 0)):
+            con.execute(
+                "INSERT INTO sections VALUES (?, ?, 'H', ?, ?, 1, 5)",
+                [doc_id, section_number, start, start + 100],
+            )
+            con.execute(
+                "INSERT INTO section_text VALUES (?, ?, ?)",
+                [doc_id, section_number, f"{doc_id} text {section_number}"],
+            )
+    con.close()
+
+
+def test_tables_sorted_and_indexed(tmp_path: Path) -> None:
+    db_path = tmp_path / "corpus.duckdb"
+    _build_unsorted_db(db_path)
+
+    con = duckdb.connect(str(db_path))
+    counts = optimize_corpus_layout(con)
+    assert counts == {"documents": 3, "sections": 6, "section_text": 6}
+
+    expected = [
+        (d, s) for d in ("d1", "d2", "d3") for s in ("1.01", "2.01")
+    ]
+    assert con.execute("SELECT doc_id, section_number FROM sections").fetchall() == expected
+    assert con.execute(
+        "SELECT doc_id, section_number FROM section_text"
+    ).fetchall() == expected
+
+    indexes = {
+        row[0] for row in con.execute("SELECT index_name FROM duckdb_indexes()").fetchall()
+    }
+    assert {"idx_sections_doc", "idx_section_text_doc"} <= indexes
+
+    # Primary keys survive the rewrite.
+    with pytest.raises(duckdb.ConstraintException):
+        con.execute("INSERT INTO sections VALUES ('d1', '1.01', 'dup', 0, 1, 1, 1)")
+    con.close()
+
+    with CorpusIndex(db_path) as corpus:
+        assert corpus.get_section_text("d2", "2.01") == "d2 text 2.01"
+
+
+def test_rerun_after_append_is_idempotent(tmp_path: Path) -> None:
+    db_path = tmp_path / "corpus.duckdb"
+    _build_unsorted_db(db_path)
+
+    con = duckdb.connect(str(db_path))
+    optimize_corpus_layout(con)
+    # Incremental build appends a document that sorts first.
+    con.execute("INSERT INTO sections VALUES ('d0', '1.01', 'H', 0, 10, 1, 1)")
+    con.execute("INSERT INTO section_text VALUES ('d0', '1.01', 'new')")
+    counts = optimize_corpus_layout(con)
+    assert counts["sections"] == 7
+    first = con.execute("SELECT doc_id FROM section_text LIMIT 1").fetchone()
+    assert first == ("d0",)
+    assert not con.execute(
+        "SELECT table_name FROM duckdb_tables() WHERE table_name LIKE '%_sorted'"
+    ).fetchall()
+    con.close()
+
+
+def test_plan_covers_lookup_tables() -> None:
+    tables = {layout.table for layout in corpus_layout_plan()}
+    assert {"sections", "section_text", "clauses", "section_features"} <= tables
+
+
+def test_tables_filter_only_rewrites_named_tables(tmp_path: Path) -> None:
+    db_path = tmp_path / "corpus.duckdb"
+    _build_unsorted_db(db_path)
+
+    con = duckdb.connect(str(db_path))
+    counts = optimize_corpus_layout(con, tables={"sections"})
+    assert counts == {"sections": 6}
+    indexes = {
+        row[0] for row in con.execute("SELECT index_name FROM duckdb_indexes()").fetchall()
+    }
+    assert "idx_sections_doc" in indexes
+    assert "idx_section_text_doc" not in indexes
+    con.close()
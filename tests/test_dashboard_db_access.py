@@ -0,0 +1,172 @@
+"""Tests for dashboard.api.db_access — off-event-loop DuckDB execution."""
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from pathlib import Path
+
+import duckdb
+import pytest
+
+from dashboard.api.db_access import DbAccess
+
+
+class _Holder:
+    """Minimal stand-in for CorpusIndex/LinkStore: a ``_conn`` attribute."""
+
+    def __init__(self, path: Path) -> None:
+        self._conn = duckdb.connect(str(path))
+        self._conn.execute("CREATE TABLE t (x INTEGER)")
+        self._conn.execute("INSERT INTO t VALUES (1), (2), (3)")
+
+    def total(self) -> int:
+        return int(self._conn.execute("SELECT SUM(x) FROM t").fetchone()[0])
+
+
+@pytest.fixture()
+def db() -> DbAccess:
+    access = DbAccess(read_workers=2)
+    yield access  # type: ignore[misc]
+    access.shutdown()
+
+
+def test_view_is_identity_off_pool(tmp_path: Path, db: DbAccess) -> None:
+    holder = _Holder(tmp_path / "a.duckdb")
+    assert db.view(holder) is holder
+
+
+def test_reads_use_per_thread_cursors(tmp_path: Path, db: DbAccess) -> None:
+    holder = _Holder(tmp_path / "a.duckdb")
+
+    def work() -> tuple[int, int, int]:
+        view = db.view(holder)
+        assert view is not holder
+        assert db.view(holder) is view  # cached per thread
+        return threading.get_ident(), id(view._conn), view.total()
+
+    async def run() -> list[tuple[int, int, int]]:
+        return await asyncio.gather(*(db.read("work", work) for _ in range(6)))
+
+    results = asyncio.run(run())
+    assert {r[2] for r in results} == {6}
+    assert all(r[1] != id(holder._conn) for r in results)
+
+
+def test_writes_are_serialized_and_timed(db: DbAccess) -> None:
+    active = 0
+    peak = 0
+    lock = threading.Lock()
+
+    def write() -> None:
+        nonlocal active, peak
+        with lock:
+            active += 1
+            peak = max(peak, active)
+        time.sleep(0.01)
+        with lock:
+            active -= 1
+
+    def fail() -> None:
+        raise ValueError("boom")
+
+    async def run() -> None:
+        await asyncio.gather(*(db.write("save", write) for _ in range(4)))
+        with pytest.raises(ValueError):
+            await db.read("broken", fail)
+
+    asyncio.run(run())
+    assert peak == 1
+    timings = db.timings()
+    assert timings["save"]["calls"] == 4
+    assert timings["save"]["exec_max_ms"] >= 10.0
+    # Later writes queued behind earlier ones.
+    assert timings["save"]["queue_wait_max_ms"] > 0.0
+    assert timings["broken"]["errors"] == 1
+
+
+def test_request_mutations_queue_behind_running_write_job(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path, db: DbAccess,
+) -> None:
+    from agent.link_store import LinkStore
+    from dashboard.api import server as dashboard_server
+
+    store = LinkStore(tmp_path / "links.duckdb", create_if_missing=True)
+    monkeypatch.setattr(dashboard_server, "_db", db)
+    monkeypatch.setattr(dashboard_server, "_link_store", store)
+    monkeypatch.setattr(dashboard_server, "_require_links_admin", lambda _request: None)
+    started = threading.Event()
+    release = threading.Event()
+
+    def long_job() -> None:
+        started.set()
+        assert release.wait(5)
+
+    async def run() -> dict:
+        job = asyncio.create_task(db.write("compute_embeddings", long_job))
+        assert await asyncio.to_thread(started.wait, 5)
+        note = asyncio.create_task(
+            dashboard_server.note_link(None, "link-1", {"note": "checked"}),
+        )
+        await asyncio.sleep(0.05)
+        assert not note.done()  # waits for the writer, not the event-loop connection
+        assert store.get_events("link-1") == []
+        release.set()
+        await job
+        return await note
+
+    try:
+        assert asyncio.run(run())["updated"]
+        assert [e["event_type"] for e in store.get_events("link-1")] == ["note"]
+        assert db.timings()["note_link"]["queue_wait_max_ms"] >= 50.0
+    finally:
+        store.close()
+
+
+def test_review_listing_and_family_reads_run_off_the_event_loop(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path, db: DbAccess,
+) -> None:
+    from agent.link_store import LinkStore
+    from dashboard.api import server as dashboard_server
+
+    store = LinkStore(tmp_path / "links.duckdb", create_if_missing=True)
+    monkeypatch.setattr(dashboard_server, "_db", db)
+    monkeypatch.setattr(dashboard_server, "_link_store", store)
+
+    async def run() -> None:
+        session = await dashboard_server.create_session({"family_id": "debt"})
+        await dashboard_server.get_session_progress(session["session_id"])
+        await dashboard_server.links_dashboard()
+        await dashboard_server.unlink_reasons()
+        await dashboard_server.list_conflicts()
+
+    try:
+        asyncio.run(run())
+    finally:
+        store.close()
+    assert {
+        "create_session", "get_session_progress", "links_dashboard",
+        "unlink_reasons", "list_conflicts",
+    } <= db.timings().keys()
+
+
+def test_write_soon_queues_off_writer_and_runs_inline_on_it(db: DbAccess) -> None:
+    threads: list[str] = []
+
+    def record(tag: str) -> None:
+        threads.append(f"{tag}:{threading.current_thread().name.split('_')[0]}")
+
+    def job() -> None:
+        db.write_soon("alias", record, "inline")
+        threads.append("job done")
+
+    async def run() -> None:
+        await db.write("job", job)
+        db.write_soon("alias", record, "queued")
+        await db.write("barrier", lambda: None)
+
+    asyncio.run(run())
+    assert threads == [
+        "inline:dashboard-db-write", "job done", "queued:dashboard-db-write",
+    ]
+    assert db.timings()["alias"]["calls"] == 2
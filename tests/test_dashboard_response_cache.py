@@ -0,0 +1,90 @@
+"""Tests for the dashboard analytics response cache."""
+from __future__ import annotations
+
+import asyncio
+import inspect
+from pathlib import Path
+
+import duckdb
+import pytest
+from fastapi import HTTPException
+
+from agent.corpus import CorpusIndex
+from dashboard.api import server as dashboard_server
+from dashboard.api.response_cache import DEFAULT_MAX_ENTRIES, ResponseCache
+
+
+def test_lru_eviction_and_param_normalization() -> None:
+    cache = ResponseCache(max_entries=2)
+    cache.put("v1", "kpis", {"a": 1, "b": True}, {"x": 1})
+    cache.put("v1", "kpis", {"a": 2}, {"x": 2})
+
+    assert cache.get("v1", "kpis", {"b": True, "a": 1}) == (True, {"x": 1})
+    assert cache.get("v2", "kpis", {"a": 1, "b": True}) == (False, None)
+    cache.put("v1", "funnel", {}, {"x": 3})  # evicts {"a": 2}, the LRU entry
+    assert cache.get("v1", "kpis", {"a": 2}) == (False, None)
+
+    stats = cache.stats()
+    assert (stats["entries"], stats["hits"], stats["misses"], stats["evictions"]) == (2, 1, 2, 1)
+
+
+def test_disk_copy_warms_a_new_cache_and_prunes_old_versions(tmp_path: Path) -> None:
+    cache = ResponseCache(persist_dir=tmp_path)
+    cache.put("run-1", "kpis", {"cohort_only": True}, {"total_docs": 3})
+    cache.put("run-1", "funnel", {}, {"by": {1, 2}})  # not JSON: memory only
+
+    restarted = ResponseCache(persist_dir=tmp_path)
+    assert restarted.get("run-1", "kpis", {"cohort_only": True}) == (True, {"total_docs": 3})
+    assert restarted.get("run-1", "funnel", {}) == (False, None)
+    assert restarted.stats()["disk_hits"] == 1
+
+    restarted.put("run-2", "kpis", {"cohort_only": True}, {"total_docs": 4})
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["run-2"]
+
+
+def test_analytics_endpoints_are_cached_per_corpus_version(monkeypatch, tmp_path: Path) -> None:
+    db_path = tmp_path / "corpus.duckdb"
+    conn = duckdb.connect(str(db_path))
+    conn.execute(
+        "CREATE TABLE documents (doc_id VARCHAR, doc_type VARCHAR, market_segment VARCHAR, "
+        "cohort_included BOOLEAN, word_count INTEGER)"
+    )
+    conn.execute(
+        "INSERT INTO documents VALUES ('a', 'credit_agreement', 'leveraged', true, 100), "
+        "('b', 'credit_agreement', 'leveraged', true, 200), ('c', 'other', 'uncertain', false, 300)"
+    )
+    conn.close()
+    corpus = CorpusIndex(db_path, enforce_schema=False)
+    cache = dashboard_server._response_cache
+    cache.configure(max_entries=8, persist_dir=None)
+    monkeypatch.setattr(dashboard_server, "_corpus", corpus)
+    monkeypatch.setattr(dashboard_server, "_corpus_db_path", db_path)
+    monkeypatch.setattr(dashboard_server, "_corpus_version_memo", None)
+
+    def distributions(**kwargs: object) -> dict:
+        return asyncio.run(dashboard_server.overview_distributions(**kwargs))
+
+    try:
+        # FastAPI still sees the endpoint's own query parameters.
+        params = inspect.signature(dashboard_server.overview_distributions).parameters
+        assert list(params) == ["metric", "bins", "cohort_only"]
+
+        first = distributions(metric="doc_type", bins=25, cohort_only=False)
+        assert distributions(metric="doc_type", bins=25, cohort_only=False) is first
+        assert first["categories"] == [
+            {"label": "credit_agreement", "count": 2}, {"label": "other", "count": 1},
+        ]
+        assert distributions(metric="word_count", bins=5, cohort_only=True)["stats"]["count"] == 2
+        with pytest.raises(HTTPException):  # errors are not cached
+            distributions(metric="nope", bins=25, cohort_only=False)
+        stats = asyncio.run(dashboard_server.health())["response_cache"]
+        assert (stats["hits"], stats["misses"], stats["entries"]) == (1, 3, 2)
+
+        version = dashboard_server._corpus_version()
+        assert version is not None and version.startswith("no-run-manifest-")
+        monkeypatch.setattr(dashboard_server, "_corpus", None)
+        with pytest.raises(HTTPException):  # no corpus: bypass, endpoint raises 503
+            distributions(metric="doc_type", bins=25, cohort_only=False)
+    finally:
+        corpus.close()
+        cache.configure(max_entries=DEFAULT_MAX_ENTRIES, persist_dir=None)
@@ -331,3 +331,115 @@ class TestMergeAndValidate:
         content = json.loads(files[0].read_bytes())
         assert content["dna_tier1"] == ["test phrase"]
         assert content["version"] == 1
+
+
+def _duckdb_corpus(path: Path) -> None:
+    import duckdb
+
+    conn = duckdb.connect(str(path))
+    conn.execute("CREATE TABLE documents (doc_id VARCHAR, cohort_included BOOLEAN)")
+    conn.execute(
+        "CREATE TABLE sections (doc_id VARCHAR, section_number VARCHAR, heading VARCHAR, "
+        "article_num INTEGER, char_start INTEGER, word_count INTEGER)"
+    )
+    conn.execute(
+        "CREATE TABLE section_text (doc_id VARCHAR, section_number VARCHAR, text VARCHAR)"
+    )
+    conn.execute(
+        "CREATE TABLE definitions (doc_id VARCHAR, term VARCHAR, char_start INTEGER)"
+    )
+    conn.execute(
+        "INSERT INTO documents VALUES ('doc1', true), ('doc2', true), ('doc3', false)"
+    )
+    rows = [
+        ("doc1", "7.01", "Indebtedness", 7, "The Borrower shall not incur Indebtedness § 7."),
+        ("doc1", "7.02", "Liens", 7, "The Borrower shall not create any Lien."),
+        ("doc1", "7.03", "Investments", 7, None),
+        ("doc2", "6.01", "Limitation on Indebtedness", 6, "No Indebtedness may be incurred."),
+        ("doc2", "6.02", "Limitation on Liens", 6, "No Lien shall secure Indebtedness."),
+        ("doc3", "1.01", "Indebtedness", 1, "Outside the cohort."),
+    ]
+    for i, (doc_id, number, heading, article_num, text) in enumerate(rows):
+        conn.execute(
+            "INSERT INTO sections VALUES (?, ?, ?, ?, ?, 100)",
+            [doc_id, number, heading, article_num, i * 100],
+        )
+        if text is not None:
+            conn.execute("INSERT INTO section_text VALUES (?, ?, ?)", [doc_id, number, text])
+    conn.execute(
+        "INSERT INTO definitions VALUES ('doc1', 'Lien', 20), ('doc1', 'Indebtedness', 10), "
+        "('doc2', 'Indebtedness', 5)"
+    )
+    conn.close()
+
+
+class TestBatchDiscovery:
+    def test_snapshot_matches_corpus(self, tmp_path: Path) -> None:
+        from agent.corpus import CorpusIndex
+        from scripts.discovery_seeder import DiscoverySnapshot, match_family_sections
+
+        _duckdb_corpus(tmp_path / "corpus.duckdb")
+        with CorpusIndex(tmp_path / "corpus.duckdb", enforce_schema=False) as corpus:
+            snapshot = DiscoverySnapshot.build(corpus, tmp_path / "snapshot")
+            try:
+                assert snapshot.doc_ids() == ["doc1", "doc2"]
+                assert snapshot.section_count == 5
+                patterns = ["Indebtedness", "Limitation on Indebtedness"]
+                doc_ids = corpus.doc_ids()
+                assert match_family_sections(snapshot, patterns, doc_ids) == (
+                    match_family_sections(corpus, patterns, doc_ids)
+                )
+                for doc_id, number in [("doc1", "7.01"), ("doc1", "7.03"), ("doc2", "6.02")]:
+                    assert snapshot.get_section_text(doc_id, number) == (
+                        corpus.get_section_text(doc_id, number)
+                    )
+                assert snapshot.get_section_text("doc3", "1.01") is None
+                assert [d.term for d in snapshot.get_definitions("doc1")] == [
+                    "Indebtedness", "Lien",
+                ]
+                assert not snapshot.has_table("ngram_df")
+                assert snapshot.query("SELECT COUNT(*) FROM documents") == [(3,)]
+            finally:
+                snapshot.close()
+
+    def test_parallel_run_matches_sequential(self, tmp_path: Path) -> None:
+        from agent.corpus import CorpusIndex
+        from scripts.discovery_seeder import (
+            DiscoverySnapshot,
+            family_seed,
+            load_family_concepts,
+            run_families,
+        )
+
+        _duckdb_corpus(tmp_path / "corpus.duckdb")
+        concepts = load_family_concepts(_make_bootstrap(tmp_path))
+        families = ["debt_capacity.indebtedness", "debt_capacity.liens"]
+        concepts["debt_capacity.liens"] = [
+            {"family_id": "debt_capacity.liens",
+             "search_strategy": {"heading_patterns": ["Liens", "Limitation on Liens"]}},
+        ]
+        concepts["unmatched"] = [{"search_strategy": {"heading_patterns": ["Nothing"]}}]
+        tasks = [
+            {
+                "family_id": family_id,
+                "concepts": concepts[family_id],
+                "workspace": tmp_path / family_id,
+                "seed": family_seed(42, family_id),
+            }
+            for family_id in [*families, "unmatched"]
+        ]
+        shared = {"family_notes": {}, "exploratory_report": None, "dry_run": True}
+        with CorpusIndex(tmp_path / "corpus.duckdb", enforce_schema=False) as corpus:
+            snapshot = DiscoverySnapshot.build(corpus, tmp_path / "snapshot")
+            try:
+                sequential = run_families(snapshot, tasks, shared=shared)
+                parallel = run_families(snapshot, tasks, shared=shared, jobs=2)
+            finally:
+                snapshot.close()
+
+        assert [s["family_id"] for s in parallel] == [*families, "unmatched"]
+        assert parallel == sequential
+        assert [s["status"] for s in parallel] == ["ok", "ok", "no_matches"]
+        assert parallel[0]["matched"] == 2
+        assert family_seed(42, families[0]) != family_seed(42, families[1])
+        assert family_seed(42, families[0]) == family_seed(42, families[0])
@@ -1,12 +1,17 @@
 """Tests for agent.document_processor — shared NLP pipeline module."""
 from __future__ import annotations
 
+from pathlib import Path
+from typing import Any
+
 import pytest
 
 from agent.document_processor import (
     ACCESSION_RE,
     CIK_DIR_RE,
+    PIPELINE_STAGES,
     DocumentResult,
+    PipelineProfiler,
     SidecarMetadata,
     accession_sort_key,
     compute_doc_id,
@@ -524,6 +529,125 @@ class TestProcessDocumentText:
         # Accession not overridden, falls back to path
         assert result.doc["accession"] == "0001234567-22-012345"
 
+    def test_definitions_scan_only_the_outline_definitions_span(
+        self, monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """One span-limited extraction feeds the definitions and the classifier."""
+        import agent.classifier as classifier
+        import agent.document_processor as document_processor
+
+        def fail(_text: str) -> int:
+            raise AssertionError("classifier re-counted definitions")
+
+        monkeypatch.setattr(classifier, "count_definitions", fail)
+
+        defs = "".join(
+            f"<p>&quot;Term{i}&quot; means definition number {i}.</p>\n"
+            for i in range(40)
+        )
+        html = (
+            "<html><body><h1>CREDIT AGREEMENT</h1>\n"
+            "<h2>ARTICLE I DEFINITIONS</h2>\n<p>Section 1.01 Defined Terms.</p>\n"
+            + defs
+            + "<h2>ARTICLE II THE CREDITS</h2>\n<p>Section 2.01 Loans.</p>\n"
+            + "<p>" + "word " * 3000 + "</p>\n"
+            # quoted definitions outside the definitions article
+            + "".join(
+                f"<p>&quot;Extra{i}&quot; means a term defined in a covenant.</p>\n"
+                for i in range(15)
+            )
+            + "<h2>ARTICLE VII NEGATIVE COVENANTS</h2>\n"
+            + "<p>Section 7.01 Indebtedness.</p>\n"
+            + "<p>" + "word " * 3000 + "</p></body></html>"
+        )
+
+        signals_by_mode: dict[bool, Any] = {}
+        real_extract = document_processor.extract_classification_signals
+        results: dict[bool, Any] = {}
+        for cohort_only in (False, True):
+            def spy(
+                text: str, filename: str = "", *,
+                definition_count: int | None = None, _mode: bool = cohort_only,
+            ) -> Any:
+                signals_by_mode[_mode] = real_extract(
+                    text, filename, definition_count=definition_count,
+                )
+                return signals_by_mode[_mode]
+
+            monkeypatch.setattr(document_processor, "extract_classification_signals", spy)
+            results[cohort_only] = process_document_text(
+                html=html, path_or_key="x.htm", filename="x.htm",
+                cohort_only_nlp=cohort_only,
+            )
+        full, cohort_only_result = results[False], results[True]
+        assert full is not None and cohort_only_result is not None
+        terms = {d["term"] for d in full.definitions}
+        assert terms == {f"Term{i}" for i in range(40)}
+        assert full.doc["definition_count"] == 40
+
+        # Both modes count the span's terms, not the 15 outside the article.
+        assert signals_by_mode[False].definition_count == 40
+        assert signals_by_mode[True].definition_count == 40
+        assert full.doc["doc_type"] == cohort_only_result.doc["doc_type"]
+        assert full.doc["cohort_included"] == cohort_only_result.doc["cohort_included"]
+
+
+# ── PipelineProfiler ────────────────────────────────────────────────
+
+
+class TestPipelineProfiler:
+    def test_stage_timings_and_slowest_report(self, tmp_path: Path) -> None:
+        profiler = PipelineProfiler(
+            slowest_n=1, cprofile_over_sec=0.0, cprofile_dir=tmp_path, max_cprofiles=1,
+        )
+        html = _make_leveraged_ca_html()
+        result = process_document_text(
+            html=html, path_or_key="cik=0000000001/a.htm", filename="a.htm",
+            profiler=profiler,
+        )
+        assert result is not None
+        timing = profiler.last_timing
+        assert timing is not None
+        assert set(timing["stages"]) == set(PIPELINE_STAGES)
+        assert timing["stages"]["outline"] > 0
+        assert timing["total_sec"] == pytest.approx(sum(timing["stages"].values()), abs=1e-5)
+        assert timing["counters"]["sections"] == len(result.sections)
+        assert timing["counters"]["definitions"] == len(result.definitions)
+        # Over the threshold: re-run under cProfile once, then the budget is spent.
+        assert Path(timing["cprofile"]).exists()
+        process_document_text(html=html, path_or_key="b.htm", filename="b.htm", profiler=profiler)
+        assert "cprofile" not in profiler.last_timing
+        assert len(list(tmp_path.glob("*.prof"))) == 1
+
+        # Records from other processes merge into one summary.
+        merged = PipelineProfiler(slowest_n=2)
+        merged.add_timing(timing)
+        merged.add_timing({
+            "key": "slow.htm", "worker": 1, "total_sec": 9.0,
+            "stages": {"clauses": 9.0}, "counters": {"sections": 3},
+        })
+        merged.add_timing({"key": "fast.htm", "worker": 1, "total_sec": 0.0, "stages": {}})
+        summary = merged.summary()
+        assert summary["docs"] == 3
+        assert [t["key"] for t in summary["slowest_docs"]] == [
+            "slow.htm", "cik=0000000001/a.htm",
+        ]
+        assert summary["stages"]["clauses"]["max_sec"] == 9.0
+        assert summary["counters"]["sections"] == len(result.sections) + 3
+        assert summary["workers"]["1"]["docs"] == 2
+        folded = dict(line.rsplit(" ", 1) for line in merged.folded_stacks().splitlines())
+        assert int(folded["process_document_text;clauses"]) >= 9_000_000
+        assert "slow.htm" in merged.report()
+
+    def test_profiler_does_not_change_results(self) -> None:
+        html = _make_leveraged_ca_html()
+        plain = process_document_text(html=html, path_or_key="a.htm", filename="a.htm")
+        profiled = process_document_text(
+            html=html, path_or_key="a.htm", filename="a.htm", profiler=PipelineProfiler(),
+        )
+        assert plain is not None and profiled is not None
+        assert profiled.to_dict() == plain.to_dict()
+
 
 # ── Regex constants ─────────────────────────────────────────────────
 
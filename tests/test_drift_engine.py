@@ -0,0 +1,40 @@
+"""Tests for agent.drift_engine."""
+from __future__ import annotations
+
+import pytest
+
+from agent.drift_engine import chi2_sf, compare_profiles
+
+
+@pytest.mark.parametrize(
+    ("statistic", "dof", "expected"),
+    [
+        # 5% critical values of the chi-squared distribution.
+        (3.841458820694124, 1, 0.05),
+        (5.991464547107979, 2, 0.05),
+        (11.070497693516351, 5, 0.05),
+        (18.307038053275146, 10, 0.05),
+        (124.34211340400408, 100, 0.05),
+        # 1% critical value and a degenerate statistic.
+        (6.6348966010212145, 1, 0.01),
+        (0.0, 3, 1.0),
+    ],
+)
+def test_chi2_sf_matches_reference_values(statistic: float, dof: int, expected: float) -> None:
+    assert chi2_sf(statistic, dof) == pytest.approx(expected, rel=1e-9)
+
+
+def test_chi2_sf_extreme_statistic_underflows_to_zero() -> None:
+    assert chi2_sf(1e6, 400) == 0.0
+
+
+def test_compare_profiles_flags_a_moved_template() -> None:
+    baseline = {
+        "overall_hit_rate": 0.5,
+        "profile_json": '{"templates": {"t1": 0.5, "t2": 0.5}}',
+    }
+    profile = {"overall_hit_rate": 0.5, "templates": {"t1": 0.5, "t2": 1.0}}
+    comparison = compare_profiles(baseline, profile, {"t1": 100, "t2": 100})
+    assert comparison.cells_affected == ("t2",)
+    assert comparison.p_value < 1e-9
+    assert comparison.drift_detected
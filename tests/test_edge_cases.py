@@ -5,14 +5,14 @@ from typing import Any
 
 import pytest
 
-from dashboard.api.server import (
-    _CATEGORY_TO_TIER,
-    _EDGE_CASE_CATEGORIES,
-    _EDGE_CASE_TIERS,
-    _build_doc_category_queries,
-    _build_iqr_category_queries,
-    _build_join_category_queries,
-    _get_tier,
+from agent.edge_cases import (
+    CATEGORY_TO_TIER,
+    EDGE_CASE_CATEGORIES,
+    EDGE_CASE_TIERS,
+    build_doc_category_queries,
+    build_iqr_category_queries,
+    build_join_category_queries,
+    get_tier,
 )
 
 try:
@@ -165,10 +165,10 @@ def _run_all_queries(
     """Execute all category queries, return by category."""
     corpus = FakeCorpus(conn)
     parts: list[tuple[str, list[Any]]] = []
-    parts.extend(_build_doc_category_queries(cohort_where))
-    parts.extend(_build_join_category_queries(cohort_where))
+    parts.extend(build_doc_category_queries(cohort_where))
+    parts.extend(build_join_category_queries(cohort_where))
     parts.extend(
-        _build_iqr_category_queries(corpus, cohort_where, cohort_only),
+        build_iqr_category_queries(corpus, cohort_where, cohort_only),
     )
     results: dict[str, list[tuple[Any, ...]]] = {}
     for sql, params in parts:
@@ -190,25 +190,25 @@ def _run_all_queries(
 
 def test_tier_registry_completeness() -> None:
     all_cats = {
-        cat for cats in _EDGE_CASE_TIERS.values() for cat in cats
+        cat for cats in EDGE_CASE_TIERS.values() for cat in cats
     }
-    assert all_cats == set(_CATEGORY_TO_TIER)
-    assert all_cats | {"all"} == _EDGE_CASE_CATEGORIES
+    assert all_cats == set(CATEGORY_TO_TIER)
+    assert all_cats | {"all"} == EDGE_CASE_CATEGORIES
 
 
 def test_tier_count() -> None:
-    total = sum(len(c) for c in _EDGE_CASE_TIERS.values())
+    total = sum(len(c) for c in EDGE_CASE_TIERS.values())
     assert total == 38
-    assert len(_EDGE_CASE_TIERS) == 6
+    assert len(EDGE_CASE_TIERS) == 6
 
 
 def test_get_tier() -> None:
-    assert _get_tier("missing_sections") == "structural"
-    assert _get_tier("low_definitions") == "definitions"
-    assert _get_tier("extreme_facility") == "metadata"
-    assert _get_tier("extreme_word_count") == "document"
-    assert _get_tier("orphan_template") == "template"
-    assert _get_tier("nonexistent") == "unknown"
+    assert get_tier("missing_sections") == "structural"
+    assert get_tier("low_definitions") == "definitions"
+    assert get_tier("extreme_facility") == "metadata"
+    assert get_tier("extreme_word_count") == "document"
+    assert get_tier("orphan_template") == "template"
+    assert get_tier("nonexistent") == "unknown"
 
 
 # ---------------------------------------------------------------------------
@@ -772,9 +772,9 @@ def test_all_queries_valid_sql() -> None:
     conn = _make_db()
     corpus = FakeCorpus(conn)
     parts: list[tuple[str, list[Any]]] = []
-    parts.extend(_build_doc_category_queries("WHERE"))
-    parts.extend(_build_join_category_queries("WHERE"))
-    parts.extend(_build_iqr_category_queries(corpus, "WHERE", False))
+    parts.extend(build_doc_category_queries("WHERE"))
+    parts.extend(build_join_category_queries("WHERE"))
+    parts.extend(build_iqr_category_queries(corpus, "WHERE", False))
     for sql, params in parts:
         if params:
             conn.execute(sql, params).fetchall()
@@ -787,9 +787,9 @@ def test_union_all_executes() -> None:
     conn = _make_db()
     corpus = FakeCorpus(conn)
     parts: list[tuple[str, list[Any]]] = []
-    parts.extend(_build_doc_category_queries("WHERE"))
-    parts.extend(_build_join_category_queries("WHERE"))
-    parts.extend(_build_iqr_category_queries(corpus, "WHERE", False))
+    parts.extend(build_doc_category_queries("WHERE"))
+    parts.extend(build_join_category_queries("WHERE"))
+    parts.extend(build_iqr_category_queries(corpus, "WHERE", False))
     all_q = [p[0] for p in parts]
     all_p: list[Any] = []
     for p in parts:
@@ -801,3 +801,110 @@ def test_union_all_executes() -> None:
         all_p,
     ).fetchall()
     assert isinstance(rows, list)
+
+
+# ---------------------------------------------------------------------------
+# Materialized edge_cases table
+# ---------------------------------------------------------------------------
+
+
+def _populate_mixed_corpus(conn: duckdb.DuckDBPyConnection) -> None:
+    """Docs hitting document, join and IQR categories, in and out of cohort."""
+    for i in range(12):
+        _ins_doc(
+            conn, doc_id=f"d{i:02d}", borrower="" if i % 4 == 0 else f"B{i}",
+            doc_type="credit_agreement", doc_type_confidence="high",
+            market_segment="leveraged", segment_confidence="high",
+            cohort_included=i % 3 != 0, template_family="kirkland" if i % 2 else "",
+            word_count=200_000 if i == 11 else 20_000 + 1_000 * i,
+            section_count=0 if i == 5 else 60 + i, clause_count=40,
+            definition_count=5 if i == 7 else 150, text_length=120_000,
+            facility_size_mm=None if i == 2 else 500.0,
+        )
+    for j in range(12):
+        _ins_clause(conn, "d03", "1.01", f"c{j}", conf=0.1)
+
+
+def test_edge_case_table_matches_live_union() -> None:
+    from agent.edge_cases import (
+        EDGE_CASE_COLUMNS,
+        EDGE_CASES_TABLE,
+        build_edge_case_table,
+        build_edge_case_union,
+        edge_case_table_run_id,
+    )
+
+    conn = _make_db()
+    assert edge_case_table_run_id(conn) is None
+    _populate_mixed_corpus(conn)
+    written = build_edge_case_table(conn, run_id="run-1")
+    assert edge_case_table_run_id(conn) == "run-1"
+
+    cols = ", ".join(EDGE_CASE_COLUMNS)
+    total = 0
+    for scope, cohort_only in (("all", False), ("cohort", True)):
+        union_sql, params = build_edge_case_union(FakeCorpus(conn), cohort_only=cohort_only)
+        live = conn.execute(f"SELECT {cols} FROM ({union_sql})", params).fetchall()
+        stored = conn.execute(
+            f"SELECT {cols} FROM {EDGE_CASES_TABLE} WHERE run_id = ? AND scope = ?",
+            ["run-1", scope],
+        ).fetchall()
+        assert sorted(stored, key=repr) == sorted(live, key=repr)
+        total += len(live)
+    assert written == total
+    cats = {str(r[0]) for r in conn.execute(f"SELECT category FROM {EDGE_CASES_TABLE}").fetchall()}
+    assert {"missing_borrower", "extreme_word_count", "low_avg_clause_confidence"} <= cats
+
+    # Rebuilding replaces the previous run's rows.
+    assert build_edge_case_table(conn, run_id="run-2") == written
+    assert edge_case_table_run_id(conn) == "run-2"
+
+
+def test_edge_cases_endpoint_pages_from_table(monkeypatch, tmp_path) -> None:
+    import json
+
+    from agent.corpus import CorpusIndex
+    from agent.edge_cases import build_edge_case_table
+    from dashboard.api import server as dashboard_server
+
+    db_path = tmp_path / "corpus.duckdb"
+    conn = duckdb.connect(str(db_path))
+    conn.execute(_SCHEMA_SQL)
+    _populate_mixed_corpus(conn)
+    conn.close()
+
+    requests = [
+        ("all", 0, 5, False), ("all", 1, 5, False), ("all", 0, 200, True),
+        ("missing_borrower", 0, 50, False), ("extreme_word_count", 0, 50, True),
+        ("zero_clauses", 0, 50, False),
+    ]
+
+    def run_all() -> list[Any]:
+        corpus = CorpusIndex(db_path, enforce_schema=False)
+        monkeypatch.setattr(dashboard_server, "_corpus", corpus)
+        try:
+            table_run_id = dashboard_server._edge_case_table_run_id(corpus)
+            results = [dashboard_server._edge_cases_sync(*req) for req in requests]
+        finally:
+            corpus.close()
+        for result in results:
+            result["categories"].sort(key=lambda c: c["category"])
+        return [table_run_id, results]
+
+    live_run_id, live = run_all()
+    assert live_run_id is None
+
+    conn = duckdb.connect(str(db_path))
+    build_edge_case_table(conn, run_id="run-1")
+    conn.close()
+    (tmp_path / "run_manifest.json").write_text(json.dumps({"run_id": "run-1"}))
+    table_run_id, from_table = run_all()
+    assert table_run_id == "run-1"
+    assert from_table == live
+    assert from_table[0]["total"] > 5 and len(from_table[0]["cases"]) == 5
+
+    # A newer corpus run without a refreshed table falls back to the union.
+    (tmp_path / "run_manifest.json").write_text(json.dumps({"run_id": "run-2"}))
+    stale_run_id, stale = run_all()
+    assert stale_run_id is None
+    assert stale == live
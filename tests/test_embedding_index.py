@@ -0,0 +1,106 @@
+"""Tests for agent.embedding_index — persisted IVF-flat section index."""
+from __future__ import annotations
+
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from agent import embedding_index as ei
+from agent.embedding_index import SectionEmbeddingIndex, index_root_for
+
+
+def _vectors(n: int, dim: int = 16, seed: int = 7) -> np.ndarray:
+    return np.random.default_rng(seed).normal(size=(n, dim)).astype("<f4")
+
+
+def _keys(n: int, prefix: str = "d") -> list[tuple[str, str]]:
+    return [(f"{prefix}{i}", "1.01") for i in range(n)]
+
+
+def _exact_top(matrix: np.ndarray, query: np.ndarray, k: int) -> list[int]:
+    unit = matrix / np.linalg.norm(matrix, axis=1, keepdims=True)
+    return list(np.argsort(-(unit @ (query / np.linalg.norm(query))), kind="stable")[:k])
+
+
+class TestFlatIndex:
+    def test_exact_search_below_training_threshold(self, tmp_path: Path) -> None:
+        matrix = _vectors(50)
+        index = SectionEmbeddingIndex(tmp_path / "v1")
+        assert index.add(_keys(50), [row.tobytes() for row in matrix]) == 50
+        assert not index.is_trained
+
+        query = matrix[3]
+        hits = index.search(query.tobytes(), top_k=5)
+        assert [int(d[1:]) for d, _, _ in hits] == _exact_top(matrix, query, 5)
+        assert hits[0][2] == pytest.approx(1.0, abs=1e-5)
+
+    def test_upsert_exclude_and_dimension_mismatch(self, tmp_path: Path) -> None:
+        index = SectionEmbeddingIndex(tmp_path / "v1")
+        a = np.array([1.0, 0.0], dtype="<f4").tobytes()
+        b = np.array([0.0, 1.0], dtype="<f4").tobytes()
+        index.add([("d1", "1"), ("d2", "1")], [a, a])
+        assert index.add([("d1", "1"), ("d3", "1")], [b, b"\x00" * 12]) == 1
+        assert len(index) == 2
+        assert [h[0] for h in index.search(b, top_k=1)] == ["d1"]
+        assert [h[0] for h in index.search(a, top_k=1, exclude=[("d2", "1")])] == ["d1"]
+        assert index.search(b"\x00" * 12, top_k=1) == []
+
+    def test_segments_persist_and_reload(self, tmp_path: Path) -> None:
+        matrix = _vectors(30)
+        index = SectionEmbeddingIndex.open(tmp_path / "links.duckdb", "model/v1")
+        index.add(_keys(10), [row.tobytes() for row in matrix[:10]])
+        index.add(_keys(20)[10:], [row.tobytes() for row in matrix[10:20]], source_signature="20")
+        assert index_root_for(tmp_path / "links.duckdb").is_dir()
+
+        reopened = SectionEmbeddingIndex.open(tmp_path / "links.duckdb", "model/v1")
+        assert len(reopened) == 20
+        assert reopened.source_signature == "20"
+        assert reopened.search(matrix[15].tobytes(), top_k=1)[0][0] == "d15"
+
+    def test_instances_sharing_a_directory_keep_each_others_segments(
+        self, tmp_path: Path,
+    ) -> None:
+        matrix = _vectors(30)
+        first = SectionEmbeddingIndex(tmp_path / "v1")
+        first.add(_keys(10), [row.tobytes() for row in matrix[:10]], source_signature="a")
+        second = SectionEmbeddingIndex(tmp_path / "v1")
+
+        # Each writer picks up the other's segments before appending its own.
+        first.add(_keys(20)[10:], [row.tobytes() for row in matrix[10:20]])
+        second.add(
+            _keys(30)[20:], [row.tobytes() for row in matrix[20:30]],
+            source_signature="c", based_on="b",
+        )
+        assert len(second) == 30
+        assert second.source_signature == "a"  # not level with "b": stays stale
+        first.refresh()
+        assert len(first) == 30
+        assert len(SectionEmbeddingIndex(tmp_path / "v1")) == 30
+        assert len(list((tmp_path / "v1").glob("seg-*.npz"))) == 3
+
+
+class TestTrainedIndex:
+    def test_ivf_recall_and_compaction(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        monkeypatch.setattr(ei, "TRAIN_MIN_ROWS", 200)
+        matrix = _vectors(400, dim=8)
+        index = SectionEmbeddingIndex(tmp_path / "v1", nprobe=16)
+        index.rebuild([(f"d{i}", "1.01", row.tobytes()) for i, row in enumerate(matrix)])
+        assert index.is_trained
+
+        recall = 0
+        for qi in range(0, 400, 20):
+            got = {int(d[1:]) for d, _, _ in index.search(matrix[qi].tobytes(), top_k=10)}
+            recall += len(got & set(_exact_top(matrix, matrix[qi], 10)))
+        assert recall / (20 * 10) >= 0.9
+
+        # Incremental adds go to new segments assigned to existing lists.
+        extra = _vectors(5, dim=8, seed=11)
+        index.add(_keys(5, prefix="x"), [row.tobytes() for row in extra])
+        assert len(index) == 405
+        assert index.search(extra[2].tobytes(), top_k=1, nprobe=64)[0][0] == "x2"
+        reopened = SectionEmbeddingIndex(tmp_path / "v1")
+        assert reopened.is_trained
+        assert len(reopened) == 405
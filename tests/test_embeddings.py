@@ -12,11 +12,15 @@ from agent.embeddings import (
     EmbeddingResult,
     MockEmbeddingModel,
     SimilarSection,
+    bytes_to_array,
     bytes_to_floats,
+    cosine_similarities,
     cosine_similarity,
     floats_to_bytes,
     l2_normalize,
+    stack_vectors,
     text_hash,
+    top_k_indices,
     vector_mean,
 )
 from agent.link_store import LinkStore
@@ -118,6 +122,41 @@ class TestCosineSimilarity:
         assert abs(cosine_similarity(a, b) - (1.0 / math.sqrt(2))) < 1e-5
 
 
+class TestVectorBatch:
+    def test_bytes_to_array_is_zero_copy_view(self) -> None:
+        data = floats_to_bytes([1.0, 2.0])
+        arr = bytes_to_array(data)
+        assert arr.tolist() == [1.0, 2.0]
+        assert not arr.flags.writeable
+
+    def test_stack_vectors_shape(self) -> None:
+        matrix = stack_vectors([floats_to_bytes([1.0, 0.0]), floats_to_bytes([0.0, 1.0])])
+        assert matrix.shape == (2, 2)
+
+    def test_stack_vectors_dimension_mismatch_raises(self) -> None:
+        with pytest.raises(ValueError):
+            stack_vectors([floats_to_bytes([1.0]), floats_to_bytes([1.0, 2.0])])
+
+    def test_cosine_similarities_match_pairwise(self) -> None:
+        query = floats_to_bytes([1.0, 2.0, 3.0])
+        rows = [
+            floats_to_bytes([1.0, 2.0, 3.0]),
+            floats_to_bytes([-1.0, 0.5, 0.0]),
+            floats_to_bytes([0.0, 0.0, 0.0]),
+        ]
+        sims = cosine_similarities(query, stack_vectors(rows))
+        for row, sim in zip(rows, sims, strict=True):
+            assert abs(cosine_similarity(query, row) - float(sim)) < 1e-9
+
+    def test_top_k_indices_orders_best_first_with_stable_ties(self) -> None:
+        import numpy as np
+
+        scores = np.array([0.2, 0.9, 0.5, 0.9, 0.1])
+        assert top_k_indices(scores, 3).tolist() == [1, 3, 2]
+        assert top_k_indices(scores, 10).tolist() == [1, 3, 2, 0, 4]
+        assert top_k_indices(scores, 0).tolist() == []
+
+
 class TestVectorMean:
     def test_single_vector(self) -> None:
         v = floats_to_bytes([2.0, 4.0, 6.0])
@@ -530,6 +569,23 @@ class TestSimilaritySearch:
             assert results[i].similarity >= results[i + 1].similarity
 
 
+    def test_find_similar_skips_mismatched_dimensions(
+        self, mock_model: MockEmbeddingModel,
+    ) -> None:
+        mgr = EmbeddingManager(model=mock_model)
+        query = floats_to_bytes([1.0, 0.0])
+        candidates = [
+            {"doc_id": "d1", "section_number": "1", "embedding_vector": floats_to_bytes([1.0])},
+            {
+                "doc_id": "d2",
+                "section_number": "2",
+                "embedding_vector": floats_to_bytes([0.5, 0.5]),
+            },
+        ]
+        results = mgr.find_similar(query, candidates, top_k=5)
+        assert [r.doc_id for r in results] == ["d2"]
+
+
 class TestSectionSimilarity:
     def test_section_similarity(self, manager: EmbeddingManager) -> None:
         manager.embed_and_store([
@@ -67,6 +67,22 @@ class TestNormalizeHtml:
         assert "First paragraph" in text
         assert "Second paragraph" in text
 
+    def test_inverse_map_runs_and_strip_html_parity(self) -> None:
+        html = "<div>\n\n\n  Alpha\t beta</div>\n\n\n\n<p>gamma delta</p>"
+        text, inv_map = normalize_html(html)
+        assert text == strip_html(html)
+        assert text == "Alpha beta \n \n gamma delta"
+        # Leading whitespace is clipped; the rewritten "\t " ends a run.
+        assert inv_map[0] == InverseMapEntry(
+            normalized_start=0, original_start=7, length=6,
+        )
+        assert inv_map[1].normalized_start == 6
+        assert inv_map[1].normalized_start + inv_map[1].length == len(text)
+
+    def test_lxml_parser(self) -> None:
+        html = "<p>Hello <b>world</b></p><p>again</p>"
+        assert normalize_html(html, parser="lxml")[0] == normalize_html(html)[0]
+
 
 class TestInverseMapEntry:
     def test_negative_length_raises(self) -> None:
@@ -0,0 +1,118 @@
+"""Tests for job notifications (agent.job_notify) and job_queue claiming."""
+from __future__ import annotations
+
+import os
+import threading
+from pathlib import Path
+
+import pytest
+
+from agent.job_notify import JobListener, job_notify_dir, notify_workers
+from agent.link_store import JOB_PRIORITY_INTERACTIVE, LinkStore
+
+pytestmark = pytest.mark.skipif(not hasattr(os, "mkfifo"), reason="needs FIFOs")
+
+
+def test_listener_wakes_on_submit_and_records_cancel(tmp_path: Path) -> None:
+    db_path = tmp_path / "links.duckdb"
+    store = LinkStore(db_path, create_if_missing=True)
+    listener = JobListener(job_notify_dir(db_path))
+    listener.start()
+    try:
+        seen = listener.generation
+        store.submit_job({"job_id": "job-1", "job_type": "preview"})
+        assert listener.wait(seen, 5.0) != seen
+
+        assert store.claim_job(os.getpid()) is not None
+        assert store.cancel_job("job-1")
+        assert not store.cancel_job("job-1")  # already cancelled: no notification
+        for _ in range(100):
+            if listener.is_cancelled("job-1"):
+                break
+            listener.wait(listener.generation, 0.05)
+        assert listener.is_cancelled("job-1")
+        assert not listener.is_cancelled("job-2")
+
+        # A FIFO without a reader belongs to a dead worker and is removed.
+        stale = listener.path.with_name("999999999.fifo")
+        os.mkfifo(stale)
+        assert notify_workers(listener.path.parent, "submit", "job-3") == 1
+        assert not stale.exists()
+    finally:
+        listener.close()
+        store.close()
+    assert not listener.path.exists()
+    assert notify_workers(tmp_path / "missing", "submit", "job-4") == 0
+
+
+def test_claims_follow_priority_and_stay_disjoint(tmp_path: Path) -> None:
+    db_path = tmp_path / "links.duckdb"
+    stores = [LinkStore(db_path, create_if_missing=True) for _ in range(4)]
+    try:
+        for i in range(60):
+            job_type = "preview" if i % 3 == 0 else "batch_run"
+            stores[0].submit_job({"job_id": f"job-{i:02d}", "job_type": job_type})
+        stores[0].submit_job({"job_id": "job-urgent", "job_type": "export", "priority": -1})
+
+        first = stores[0].claim_job(1)
+        assert first is not None and first["job_id"] == "job-urgent"
+        preview = stores[0].claim_job(1, max_priority=JOB_PRIORITY_INTERACTIVE)
+        assert preview is not None and preview["job_id"] == "job-00"
+
+        claimed: list[list[str]] = [[] for _ in stores]
+
+        def claim_all(k: int) -> None:
+            while (job := stores[k].claim_job(100 + k)) is not None:
+                claimed[k].append(job["job_id"])
+
+        threads = [threading.Thread(target=claim_all, args=(k,)) for k in range(len(stores))]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        everything = [job_id for ids in claimed for job_id in ids]
+        assert len(everything) == len(set(everything)) == 59
+        # Each claimer sees the remaining previews before any batch run.
+        for ids in claimed:
+            kinds = [int(job_id[-2:]) % 3 == 0 for job_id in ids]
+            assert kinds == sorted(kinds, reverse=True)
+    finally:
+        for store in stores:
+            store.close()
+
+
+def test_listener_recreates_missing_fifo_and_forgets_finished_jobs(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    directory = job_notify_dir(tmp_path / "links.duckdb")
+    listener = JobListener(directory)
+    listener.start()
+    try:
+        assert not listener.ensure_fifo()
+        listener.path.unlink()
+        seen = listener.generation
+        assert listener.ensure_fifo()
+        assert listener.generation != seen  # waiters re-claim after the gap
+        assert listener.path.exists()
+        assert [p.name for p in directory.iterdir()] == [listener.path.name]
+
+        assert notify_workers(directory, "cancel", "job-1") == 1
+        for _ in range(100):
+            if listener.is_cancelled("job-1"):
+                break
+            listener.wait(listener.generation, 0.05)
+        assert listener.is_cancelled("job-1")
+        listener.forget("job-1")
+        assert not listener.is_cancelled("job-1")
+
+        # A full FIFO still has pending wake-ups, but a dropped cancel is lost.
+        def full(fd: int, data: bytes) -> int:
+            raise BlockingIOError
+
+        monkeypatch.setattr(os, "write", full)
+        assert notify_workers(directory, "submit", "job-2") == 1
+        assert notify_workers(directory, "cancel", "job-2") == 0
+        monkeypatch.undo()
+    finally:
+        listener.close()
+    assert not listener.path.exists()
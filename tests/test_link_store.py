@@ -6,6 +6,7 @@ import struct
 import uuid
 from pathlib import Path
 from typing import Any
+from unittest.mock import patch
 
 import duckdb
 import pytest
@@ -373,6 +374,36 @@ class TestLinksCrud:
         created = store.create_links([link2], run_id)
         assert created == 0
 
+    def test_bulk_create_reports_inserted_and_skipped(self, store: LinkStore) -> None:
+        run_id = str(uuid.uuid4())
+        store.create_links([_make_link(doc_id="d0")], run_id)
+        shared_id = str(uuid.uuid4())
+        result = store.bulk_create_links([
+            _make_link(doc_id="d0", link_id=str(uuid.uuid4())),  # stored duplicate
+            _make_link(doc_id="d1", link_id=shared_id),
+            _make_link(doc_id="d2", link_id=shared_id),  # link_id repeated in batch
+            _make_link(doc_id="d3"),
+            _make_link(doc_id="d3", link_id=str(uuid.uuid4())),  # key repeated in batch
+            {**_make_link(doc_id="d4"), "article_num": "not-a-number"},  # unconvertible
+            {"family_id": "debt", "section_number": "7.01"},  # missing doc_id
+        ], run_id)
+        assert (result.inserted, result.skipped) == (2, 5)
+        assert store.count_links(family_id="debt") == 3
+
+    def test_bulk_create_round_trips_values(self, store: LinkStore) -> None:
+        run_id = str(uuid.uuid4())
+        link = {
+            **_make_link(doc_id="d1", heading=""),
+            "clause_text": 'line one\n"quoted", comma',
+            "confidence_breakdown": {"heading": 0.9},
+        }
+        assert store.create_links([link], run_id) == 1
+        stored = store.get_links(family_id="debt")[0]
+        assert stored["heading"] == ""
+        assert stored["clause_text"] == 'line one\n"quoted", comma'
+        assert stored["confidence"] == pytest.approx(0.85)
+        assert stored["corpus_version"] is None
+
     def test_allows_multiple_clause_links_same_section_scope(self, store: LinkStore) -> None:
         run_id = str(uuid.uuid4())
         created = store.create_links([
@@ -665,6 +696,16 @@ class TestEvidence:
         assert result[0]["metadata"] is not None
 
 
+    def test_duplicate_evidence_id_raises(self, store: LinkStore) -> None:
+        row = {
+            "evidence_id": "ev1", "link_id": "link_003", "evidence_type": "heading_match",
+            "char_start": 0, "char_end": 5, "text_hash": "h", "reason_code": "heading_exact",
+        }
+        store.save_evidence([row])
+        with pytest.raises(duckdb.Error):
+            store.save_evidence([row])
+
+
 # ───────────────────── Runs ──────────────────────────────────────────
 
 
@@ -1144,6 +1185,41 @@ class TestDrift:
         assert bl is not None
         assert bl["baseline_id"] == "bl_2"
 
+    def test_latest_baselines_and_rule_drift_stats(self, store: LinkStore) -> None:
+        for baseline_id, rule_id, promoted_at in (
+            ("bl_1", "r1", "2025-01-01T00:00:00Z"),
+            ("bl_2", "r1", "2025-06-01T00:00:00Z"),
+            ("bl_3", "r2", "2025-03-01T00:00:00Z"),
+        ):
+            store.save_baseline({
+                "baseline_id": baseline_id, "rule_id": rule_id, "rule_version": 1,
+                "promoted_at": promoted_at, "total_docs": 10, "total_hits": 5,
+                "overall_hit_rate": 0.5, "profile": {},
+            })
+        latest = store.get_latest_baselines(["r1", "r2", "r3"])
+        assert {k: v["baseline_id"] for k, v in latest.items()} == {"r1": "bl_2", "r2": "bl_3"}
+
+        store.create_links([
+            {"family_id": "fam", "doc_id": doc_id, "section_number": number,
+             "heading": heading, "rule_id": "r1", "confidence": confidence,
+             "confidence_tier": tier, "status": status}
+            for doc_id, number, heading, confidence, tier, status in (
+                ("d1", "7.01", "Liens", 0.95, "high", "active"),
+                ("d1", "7.02", " LIENS ", 0.55, "medium", "active"),
+                ("d2", "7.01", "Permitted Liens", 1.0, "high", "active"),
+                ("d3", "7.01", "Liens", 0.9, "high", "unlinked"),
+            )
+        ], "run_1")
+        stats = store.rule_drift_stats(["r1", "r2"], doc_templates={"d1": "t1", "d2": "t2"})
+        assert stats["r2"]["link_count"] == 0
+        r1 = stats["r1"]
+        assert (r1["link_count"], r1["doc_count"]) == (3, 2)
+        assert r1["tiers"] == {"high": 2, "medium": 1}
+        assert r1["confidence_histogram"] == {"0.5": 1, "0.9": 2}
+        assert r1["headings"] == {"liens": 2, "permitted liens": 1}
+        assert r1["templates"] == {"t1": 1, "t2": 1}
+        assert store.rule_drift_stats(["r1"])["r1"]["templates"] == {}
+
     def test_save_drift_check(self, store: LinkStore) -> None:
         store.save_drift_check({
             "rule_id": "r1", "baseline_id": "bl_1",
@@ -1456,16 +1532,130 @@ class TestEmbeddings:
         assert store.get_family_centroid("x", "y", "z") is None
 
     def test_find_similar_sections(self, store: LinkStore) -> None:
+        def vec(*xs: float) -> bytes:
+            return struct.pack(f"<{len(xs)}f", *xs)
+
         store.save_section_embeddings([
             {"doc_id": "d1", "section_number": "7.01",
-             "embedding_vector": _make_embedding(), "model_version": "v1",
+             "embedding_vector": vec(1.0, 0.0, 0.0), "model_version": "v1",
              "text_hash": "h1"},
             {"doc_id": "d1", "section_number": "7.02",
-             "embedding_vector": _make_embedding(), "model_version": "v1",
+             "embedding_vector": vec(0.0, 1.0, 0.0), "model_version": "v1",
              "text_hash": "h2"},
+            {"doc_id": "d2", "section_number": "7.01",
+             "embedding_vector": vec(0.9, 0.1, 0.0), "model_version": "v1",
+             "text_hash": "h3"},
+        ])
+        store.save_family_centroid("debt", "_global", vec(1.0, 0.0, 0.0), "v1", sample_count=2)
+
+        near_centroid = store.find_similar_sections("debt", top_k=2)
+        assert [(r["doc_id"], r["section_number"]) for r in near_centroid] == [
+            ("d1", "7.01"), ("d2", "7.01"),
+        ]
+        assert near_centroid[0]["text_hash"] == "h1"
+        assert near_centroid[0]["similarity"] == pytest.approx(1.0)
+
+        in_doc = store.find_similar_sections("debt", "d1", top_k=5)
+        assert [r["section_number"] for r in in_doc] == ["7.01", "7.02"]
+
+        like_this = store.find_similar_sections(
+            doc_id="d1", section_number="7.01", model_version="v1", top_k=1,
+        )
+        assert [(r["doc_id"], r["section_number"]) for r in like_this] == [("d2", "7.01")]
+
+    def test_find_similar_sections_without_centroid(self, store: LinkStore) -> None:
+        assert store.find_similar_sections("debt", "d1") == []
+
+    def test_embedding_index_tracks_saves(self, store: LinkStore, tmp_path: Path) -> None:
+        def vec(*xs: float) -> bytes:
+            return struct.pack(f"<{len(xs)}f", *xs)
+
+        store.save_section_embeddings([{
+            "doc_id": "d1", "section_number": "1", "embedding_vector": vec(1.0, 0.0),
+            "model_version": "v1", "text_hash": "h1",
+        }])
+        index = store.embedding_index("v1")
+        assert len(index) == 1
+        assert (tmp_path / "links.ann").is_dir()
+
+        # Incremental append and upsert once the index is materialized.
+        store.save_section_embeddings([
+            {"doc_id": "d2", "section_number": "1", "embedding_vector": vec(0.0, 1.0),
+             "model_version": "v1", "text_hash": "h2"},
+            {"doc_id": "d1", "section_number": "1", "embedding_vector": vec(0.0, 1.0),
+             "model_version": "v1", "text_hash": "h3"},
+        ])
+        assert len(index) == 2
+        hits = index.search(vec(0.0, 1.0), top_k=5)
+        assert {(d, s) for d, s, _ in hits} == {("d1", "1"), ("d2", "1")}
+
+        reopened = LinkStore(tmp_path / "links.duckdb")
+        try:
+            assert len(reopened.embedding_index("v1")) == 2
+        finally:
+            reopened.close()
+
+    def test_embedding_index_behind_table_is_rebuilt(
+        self, store: LinkStore, tmp_path: Path,
+    ) -> None:
+        def vec(*xs: float) -> bytes:
+            return struct.pack(f"<{len(xs)}f", *xs)
+
+        def emb(doc_id: str, vector: bytes) -> dict[str, Any]:
+            return {"doc_id": doc_id, "section_number": "1", "embedding_vector": vector,
+                    "model_version": "v1", "text_hash": doc_id}
+
+        store.save_section_embeddings([emb("d1", vec(1.0, 0.0))])
+        assert len(store.embedding_index("v1")) == 1
+
+        # A row that reached the table but never its index segment (a crash
+        # between the two writes), then a normal save.
+        with patch.object(store, "_update_embedding_indexes"):
+            store.save_section_embeddings([emb("d2", vec(0.0, 1.0))])
+        store.save_section_embeddings([emb("d3", vec(1.0, 1.0))])
+
+        reopened = LinkStore(tmp_path / "links.duckdb")
+        try:
+            index = reopened.embedding_index("v1")
+            assert str(index.source_signature).startswith("3@")
+            assert len(index) == 3
+            assert ("d2", "1") in index
+        finally:
+            reopened.close()
+
+    def test_embedding_index_sees_replacements_by_another_store(
+        self, store: LinkStore, tmp_path: Path,
+    ) -> None:
+        def emb(vector: tuple[float, float]) -> dict[str, Any]:
+            return {"doc_id": "d1", "section_number": "1",
+                    "embedding_vector": struct.pack("<2f", *vector),
+                    "model_version": "v1", "text_hash": str(vector)}
+
+        store.save_section_embeddings([emb((1.0, 0.0))])
+        store.save_section_embeddings([{**emb((0.0, 1.0)), "doc_id": "d2"}])
+        assert len(store.embedding_index("v1")) == 2
+
+        # Same row count, new vector: the other store rewrites the shared index
+        # and this store reloads it instead of serving the old vector.
+        other = LinkStore(tmp_path / "links.duckdb")
+        try:
+            other.save_section_embeddings([emb((0.0, 1.0))])
+            other.embedding_index("v1")
+        finally:
+            other.close()
+        hits = store.embedding_index("v1").search(struct.pack("<2f", 0.0, 1.0), top_k=2)
+        assert [round(score, 3) for _, _, score in hits] == [1.0, 1.0]
+
+    def test_embedding_batch_last_write_wins(self, store: LinkStore) -> None:
+        first, second = _make_embedding(3), _make_embedding(4)
+        saved = store.save_section_embeddings([
+            {"doc_id": "d1", "section_number": "1", "embedding_vector": first,
+             "model_version": "v1", "text_hash": "h1"},
+            {"doc_id": "d1", "section_number": "1", "embedding_vector": second,
+             "model_version": "v1", "text_hash": "h2"},
         ])
-        similar = store.find_similar_sections("debt", "d1", top_k=5)
-        assert len(similar) == 2
+        assert saved == 2
+        assert store.get_section_embedding("d1", "1", "v1") == second
 
     def test_embedding_upsert(self, store: LinkStore) -> None:
         """Re-saving embedding for same (doc, section, model) overwrites."""
@@ -10,6 +10,7 @@ import json
 import os
 import signal
 import sys
+import time
 import uuid
 from dataclasses import dataclass
 from datetime import UTC, datetime, timedelta
@@ -401,6 +402,19 @@ class TestIsCancelled:
         store.cancel_job(jid)
         assert worker._is_cancelled(jid) is True
 
+    def test_lost_notification_caught_by_row_recheck(self, tmp_path: Path) -> None:
+        """With a listener the job row is re-read on a coarse throttle."""
+        worker, store = _make_worker(tmp_path)
+        worker._listener = MagicMock()
+        worker._listener.is_cancelled.return_value = False
+        jid = _submit_job(store, "preview")
+        store.cancel_job(jid)
+
+        worker._cancel_checked_at = time.monotonic()
+        assert worker._is_cancelled(jid) is False
+        worker._cancel_checked_at -= _mod._CANCEL_RECHECK_SEC
+        assert worker._is_cancelled(jid) is True
+
 
 # ─────────────────── TestProcessJob ──────────────────
 
@@ -557,6 +571,51 @@ class TestHandlePreview:
         assert "error" not in result
         assert result["candidate_count"] == 0
 
+    def test_preview_delta_and_rule_version_cache(self, tmp_path: Path) -> None:
+        """Scans are reused per rule version; base_preview_id yields a delta."""
+        worker, store = _make_worker(tmp_path)
+        worker._corpus = FakeCorpus()
+        worker._corpus_version = "run-1"
+        worker._preview_engine = object()
+        ast = {"op": "contains", "field": "heading", "value": "Indebtedness"}
+        scans = [
+            [{"doc_id": "d1", "section_number": "7.01", "heading": "Indebtedness"},
+             {"doc_id": "d2", "section_number": "6.01", "heading": "Indebtedness"}],
+            [{"doc_id": "d2", "section_number": "6.01", "heading": "Indebtedness"},
+             {"doc_id": "d3", "section_number": "7.01", "heading": "Debt"}],
+        ]
+        fake_module = MagicMock()
+        fake_module.scan_corpus_for_family = MagicMock(side_effect=scans)
+
+        with patch.dict("sys.modules", {"scripts.bulk_family_linker": fake_module}):
+            first = worker._handle_preview(
+                _submit_job(store, "preview"), {"family_id": "fam_a", "heading_filter_ast": ast},
+            )
+            # Same rule version: served from the cache, nothing added/removed.
+            again = worker._handle_preview(
+                _submit_job(store, "preview"),
+                {"family_id": "fam_a", "heading_filter_ast": ast,
+                 "base_preview_id": first["preview_id"]},
+            )
+            edited = worker._handle_preview(
+                _submit_job(store, "preview"),
+                {"family_id": "fam_a", "heading_filter_ast": {**ast, "value": "Debt"},
+                 "base_preview_id": first["preview_id"]},
+            )
+
+        assert fake_module.scan_corpus_for_family.call_count == 2
+        # Scans go through the shared per-node cache, keyed by corpus version.
+        for call in fake_module.scan_corpus_for_family.call_args_list:
+            assert call.kwargs["preview_engine"] is worker._preview_engine
+            assert call.kwargs["corpus_version"] == "run-1"
+        assert {key[0] for key in worker._preview_scan_cache} == {"run-1"}
+        assert "delta" not in first
+        assert (again["delta"]["added_count"], again["delta"]["removed_count"]) == (0, 0)
+        delta = edited["delta"]
+        assert [c["candidate_id"] for c in delta["added"]] == ["d3::7.01::__section__"]
+        assert [c["candidate_id"] for c in delta["removed"]] == ["d1::7.01::__section__"]
+        assert delta["unchanged_count"] == 1
+
 
 # ─────────────────── TestHandleApply ──────────────────
 
@@ -865,6 +924,7 @@ class TestHandleCheckDrift:
 
         assert result["drift_detected"] is False
         assert result["rule_id"] == "rule_d"
+        assert result["status"] == "no_baseline"
 
     def test_drift_detected(self, tmp_path: Path) -> None:
         """Detects >10% drift between baseline and current count."""
@@ -931,6 +991,84 @@ class TestHandleCheckDrift:
 
         assert result["drift_detected"] is False
 
+    def test_drift_batch_over_published_rules(self, tmp_path: Path) -> None:
+        """A rule-less job checks every published rule against its baseline."""
+        import duckdb
+
+        from agent.corpus import CorpusIndex
+
+        corpus_path = tmp_path / "corpus.duckdb"
+        con = duckdb.connect(str(corpus_path))
+        con.execute(
+            "CREATE TABLE documents (doc_id VARCHAR, template_family VARCHAR, "
+            "cohort_included BOOLEAN)"
+        )
+        for i in range(10):
+            con.execute(
+                "INSERT INTO documents VALUES (?, ?, true)",
+                [f"doc_{i}", "tpl_a" if i < 5 else "tpl_b"],
+            )
+        con.close()
+
+        worker, store = _make_worker(tmp_path)
+        worker._corpus = CorpusIndex(corpus_path, enforce_schema=False)
+        _make_rule(store, "rule_x", "fam_a")
+        _make_rule(store, "rule_y", "fam_b")
+        for i in range(5):
+            _make_link(store, family_id="fam_a", doc_id=f"doc_{i}", rule_id="rule_x")
+        _make_link(store, family_id="fam_b", doc_id="doc_0", rule_id="rule_y")
+        _make_link(store, family_id="fam_b", doc_id="doc_5", rule_id="rule_y")
+
+        try:
+            unseeded = worker._handle_check_drift(_submit_job(store, "check_drift"), {})
+            assert unseeded["baselines_created"] == 0
+            assert {c["status"] for c in unseeded["checks"]} == {"no_baseline"}
+            assert store.get_latest_baseline("rule_x") is None
+
+            seeded = worker._handle_check_drift(
+                _submit_job(store, "check_drift"), {"promote_missing": True},
+            )
+            assert seeded["rules_checked"] == 2
+            assert seeded["baselines_created"] == 2
+            assert {c["status"] for c in seeded["checks"]} == {"baseline_created"}
+            assert all("promoted" in c["message"] for c in seeded["checks"])
+            baseline = store.get_latest_baseline("rule_x")
+            assert baseline is not None
+            assert baseline["overall_hit_rate"] == 0.5
+
+            # rule_x starts matching every tpl_b document under a new heading.
+            store.create_links([
+                {
+                    "family_id": "fam_a", "doc_id": f"doc_{i}", "section_number": "2.0",
+                    "heading": "Other Heading", "rule_id": "rule_x", "source": "test",
+                    "confidence": 0.4, "confidence_tier": "low", "status": "active",
+                }
+                for i in range(5, 10)
+            ], "run_test")
+
+            result = worker._handle_check_drift(_submit_job(store, "check_drift"), {})
+            by_rule = {c["rule_id"]: c for c in result["checks"]}
+            assert result["drift_detected_count"] == 1
+            assert by_rule["rule_y"]["drift_detected"] is False
+            drifted = by_rule["rule_x"]
+            assert drifted["drift_detected"] is True
+            assert drifted["cells_affected"] == ["tpl_b"]
+            assert drifted["max_cell_delta"] == 1.0
+            assert drifted["heading_churn"] == 0.5
+            assert drifted["severity"] == "critical"
+
+            checks = store.get_drift_checks(rule_id="rule_x")
+            assert len(checks) == 1
+            profile = json.loads(checks[0]["current_profile_json"])
+            assert profile["tiers"] == {"high": 5, "low": 5}
+            assert profile["confidence_histogram"] == {"0.4": 5, "0.9": 5}
+            assert profile["templates"] == {"tpl_a": 1.0, "tpl_b": 1.0}
+            alerts = store.get_drift_alerts(rule_id="rule_x")
+            assert [a["check_id"] for a in alerts] == [drifted["check_id"]]
+            assert store.get_drift_alerts(rule_id="rule_y") == []
+        finally:
+            worker._corpus.close()
+
 
 # ─────────────────── TestHandleExport ──────────────────
 
@@ -953,6 +1091,21 @@ class TestHandleExport:
         assert result["format"] == "csv"
         assert result["row_count"] == 2
         assert result["data_length"] > 0
+        # Streamed to a file in the export directory next to links.duckdb.
+        path = Path(result["path"])
+        assert path == tmp_path / "exports" / f"links_{jid}.csv"
+        assert path.read_text().startswith("link_id,family_id,")
+        assert store.get_job(jid)["progress_message"] == "Export complete"
+
+    def test_export_unsupported_format(self, tmp_path: Path) -> None:
+        """Unknown formats are rejected without writing a file."""
+        worker, store = _make_worker(tmp_path)
+        jid = _submit_job(store, "export")
+
+        result = worker._handle_export(jid, {"format": "xlsx"})
+
+        assert "error" in result
+        assert not (tmp_path / "exports").exists()
 
     def test_export_jsonl(self, tmp_path: Path) -> None:
         """Exports links in JSONL format."""
@@ -1012,6 +1165,8 @@ class TestBuildParser:
         args = parser.parse_args(["--links-db", "/tmp/links.duckdb"])
         assert args.db is None
         assert args.poll_interval == 2.0
+        assert args.export_dir is None
+        assert args.concurrency == 1
 
 
 # ─────────────────── TestPollLoop ──────────────────
@@ -1059,6 +1214,39 @@ class TestPollLoop:
         assert sleep_times[2] >= sleep_times[1]
 
 
+    @pytest.mark.skipif(not hasattr(os, "mkfifo"), reason="needs FIFOs")
+    def test_notified_loop_wakes_on_submit(self, tmp_path: Path) -> None:
+        """With a listener an idle loop claims a new job without polling."""
+        import threading
+
+        from agent.job_notify import JobListener, job_notify_dir
+
+        worker, _store = _make_worker(tmp_path, poll_interval=60.0)
+        worker._listener = JobListener(job_notify_dir(tmp_path / "links.duckdb"))
+        worker._listener.start()
+        processed = threading.Event()
+
+        def process(job: dict[str, Any]) -> None:
+            processed.set()
+            worker.stop()
+
+        # The API server submits over its own connection.
+        server_store = LinkStore(tmp_path / "links.duckdb")
+        try:
+            with patch.object(worker, "_process_job", side_effect=process):
+                loop = threading.Thread(target=worker._poll_loop)
+                loop.start()
+                jid = _submit_job(server_store, "export", {"format": "csv"})
+                assert processed.wait(10.0)
+                loop.join(10.0)
+            assert not loop.is_alive()
+            assert server_store.get_job(jid)["status"] == "claimed"
+            assert not worker._is_cancelled(jid)
+        finally:
+            worker._listener.close()
+            server_store.close()
+
+
 # ─────────────────── TestWriteDiscipline ──────────────────
 
 
@@ -0,0 +1,132 @@
+"""Tests for streaming link exports (LinkStore.export_links + download endpoint)."""
+from __future__ import annotations
+
+import asyncio
+import csv
+import json
+from pathlib import Path
+
+import duckdb
+import pytest
+from fastapi import HTTPException
+
+from agent.link_store import LinkStore
+from dashboard.api import server as dashboard_server
+
+
+def _seed(store: LinkStore) -> list[str]:
+    link_ids = ["link-a", "link-b", "link-c"]
+    store.create_links([
+        {
+            "link_id": link_id,
+            "family_id": family_id,
+            "doc_id": f"doc_{i}",
+            "section_number": "7.01",
+            "heading": "Indebtedness",
+            "source": "test",
+            "confidence": 0.9,
+            "confidence_tier": "high",
+            "status": "active",
+        }
+        for i, (link_id, family_id) in enumerate(
+            zip(link_ids, ["fam_a", "fam_a", "fam_b"], strict=True),
+        )
+    ], "run_test")
+    store.save_evidence([
+        {"link_id": "link-a", "evidence_type": "heading", "char_start": 10, "char_end": 20,
+         "text_hash": "h1", "reason_code": "heading_match"},
+        {"link_id": "link-a", "evidence_type": "keyword", "char_start": 5, "char_end": 9,
+         "text_hash": "h2", "reason_code": "keyword_match"},
+    ])
+    store.save_link_defined_terms("link-b", [
+        {"term": "Indebtedness", "definition_section_path": "1.01",
+         "definition_char_start": 100, "definition_char_end": 180},
+    ])
+    return link_ids
+
+
+def test_export_formats_with_evidence_and_defined_terms(tmp_path: Path) -> None:
+    store = LinkStore(tmp_path / "links.duckdb", create_if_missing=True)
+    try:
+        _seed(store)
+        progress: list[tuple[int, int]] = []
+
+        parquet = tmp_path / "out" / "links.parquet"
+        written = store.export_links(
+            parquet, export_format="parquet", family_id="fam_a",
+            include_evidence=True, include_defined_terms=True,
+            progress=lambda done, total: progress.append((done, total)),
+        )
+        assert written == 2
+        assert progress[0] == (0, 2) and progress[-1] == (2, 2)
+        rows = duckdb.sql(
+            "SELECT link_id, evidence, defined_terms "
+            f"FROM read_parquet('{parquet}') ORDER BY link_id"
+        ).fetchall()
+        assert [r[0] for r in rows] == ["link-a", "link-b"]
+        assert [e["char_start"] for e in rows[0][1]] == [5, 10]
+        assert rows[0][2] is None
+        assert rows[1][2][0]["term"] == "Indebtedness"
+
+        jsonl = tmp_path / "out" / "links.jsonl"
+        written = store.export_links(
+            jsonl, export_format="jsonl", include_evidence=True, batch_size=2,
+        )
+        assert written == 3
+        records = [json.loads(line) for line in jsonl.read_text().splitlines()]
+        assert {r["link_id"] for r in records} == {"link-a", "link-b", "link-c"}
+        assert "rule_id" in records[0]  # full family_links row
+        by_id = {r["link_id"]: r for r in records}
+        assert len(by_id["link-a"]["evidence"]) == 2
+
+        flat = tmp_path / "out" / "links.csv"
+        assert store.export_links(flat, export_format="csv", include_evidence=True) == 3
+        with flat.open(newline="") as f:
+            csv_rows = list(csv.DictReader(f))
+        assert list(csv_rows[0]) == [
+            "link_id", "family_id", "doc_id", "section_number", "heading",
+            "confidence", "confidence_tier", "status", "evidence",
+        ]
+        evidence = {r["link_id"]: r["evidence"] for r in csv_rows}
+        assert len(json.loads(evidence["link-a"])) == 2
+
+        with pytest.raises(ValueError):
+            store.export_links(tmp_path / "x.xlsx", export_format="xlsx")
+        assert sorted(p.name for p in (tmp_path / "out").iterdir()) == [
+            "links.csv", "links.jsonl", "links.parquet",
+        ]
+    finally:
+        store.close()
+
+
+def test_download_endpoint_serves_completed_export(monkeypatch, tmp_path: Path) -> None:
+    store = LinkStore(tmp_path / "links.duckdb", create_if_missing=True)
+    export_dir = tmp_path / "exports"
+    monkeypatch.setattr(dashboard_server, "_link_store", store)
+    monkeypatch.setattr(dashboard_server, "_links_export_dir", export_dir)
+    monkeypatch.setattr(dashboard_server, "_require_links_admin", lambda _request: None)
+
+    def download(job_id: str):
+        return asyncio.run(dashboard_server.download_links_export(None, job_id))
+
+    try:
+        _seed(store)
+        store.export_links(export_dir / "links_job-1.csv", export_format="csv")
+        store.submit_job({"job_id": "job-1", "job_type": "export", "params": {"format": "csv"}})
+        with pytest.raises(HTTPException) as pending:
+            download("job-1")
+        assert pending.value.status_code == 409
+
+        store.complete_job("job-1", {"file_name": "links_job-1.csv", "row_count": 3})
+        response = download("job-1")
+        assert Path(response.path) == export_dir / "links_job-1.csv"
+        assert response.media_type == "text/csv"
+
+        # Recorded names are confined to the export directory.
+        store.submit_job({"job_id": "job-2", "job_type": "export", "params": {}})
+        store.complete_job("job-2", {"file_name": "../links.duckdb"})
+        with pytest.raises(HTTPException) as escaped:
+            download("job-2")
+        assert escaped.value.status_code == 404
+    finally:
+        store.close()
@@ -0,0 +1,124 @@
+"""Tests for the corpus-wide n-gram document-frequency table (agent.ngram_df)."""
+from __future__ import annotations
+
+from pathlib import Path
+
+import duckdb
+import pytest
+
+from agent.corpus import CorpusIndex
+from agent.dna import count_ngrams, discover_dna_phrases, rank_dna_phrases
+from agent.ngram_df import build_ngram_df_table, load_ngram_counts, subtract_counts
+
+# doc_id, section_number, article_num, text
+_SECTIONS = [
+    ("d1", "7.01", 7, "The Borrower may incur ratio debt if the leverage ratio test is met."),
+    ("d1", "7.02", 7, "The Borrower shall not create any Lien except Permitted Liens."),
+    ("d1", "5.01", 5, "The Borrower shall deliver quarterly financial statements."),
+    ("d2", "6.01", 6, "Ratio debt is permitted under the leverage ratio covenant."),
+    ("d2", "6.02", 6, "No Lien shall secure Indebtedness except Permitted Liens."),
+    ("d3", "7.01", 7, "Additional ratio debt may be incurred by the Borrower."),
+    ("d3", "9.01", 9, "Representations and warranties survive the closing."),
+]
+_FAMILY = {("d1", "7.01"), ("d2", "6.01"), ("d3", "7.01")}
+
+
+def _build_corpus(path: Path) -> None:
+    conn = duckdb.connect(str(path))
+    conn.execute(
+        "CREATE TABLE documents (doc_id VARCHAR, cohort_included BOOLEAN, "
+        "template_family VARCHAR)"
+    )
+    conn.execute(
+        "CREATE TABLE sections (doc_id VARCHAR, section_number VARCHAR, heading VARCHAR, "
+        "article_num INTEGER, char_start INTEGER, word_count INTEGER)"
+    )
+    conn.execute("CREATE TABLE articles (doc_id VARCHAR, article_num INTEGER, concept VARCHAR)")
+    conn.execute(
+        "CREATE TABLE section_text (doc_id VARCHAR, section_number VARCHAR, text VARCHAR)"
+    )
+    conn.execute(
+        "INSERT INTO documents VALUES ('d1', true, 'fam_a'), ('d2', true, ''), "
+        "('d3', true, 'fam_a'), ('d4', false, 'fam_a')"
+    )
+    conn.execute(
+        "INSERT INTO articles VALUES ('d1', 7, 'negative_covenants'), "
+        "('d2', 6, 'negative_covenants'), ('d3', 7, 'negative_covenants')"
+    )
+    rows = [*_SECTIONS, ("d4", "1.01", 1, "Ratio debt outside the cohort.")]
+    for i, (doc_id, number, article_num, text) in enumerate(rows):
+        conn.execute(
+            "INSERT INTO sections VALUES (?, ?, '', ?, ?, 10)",
+            [doc_id, number, article_num, i * 100],
+        )
+        conn.execute("INSERT INTO section_text VALUES (?, ?, ?)", [doc_id, number, text])
+    assert build_ngram_df_table(conn, min_df=1, batch_sections=3) > 0
+    conn.close()
+
+
+def _texts(keys: set[tuple[str, str]] | None = None, *, exclude: bool = False) -> list[str]:
+    return [
+        text for doc_id, number, _article, text in _SECTIONS
+        if keys is None or (((doc_id, number) in keys) != exclude)
+    ]
+
+
+def test_scope_counts_match_tokenized_texts(tmp_path: Path) -> None:
+    db_path = tmp_path / "corpus.duckdb"
+    _build_corpus(db_path)
+    with CorpusIndex(db_path, enforce_schema=False) as corpus:
+        cohort = load_ngram_counts(corpus, scope="cohort")
+        expected = count_ngrams(_texts())
+        assert cohort is not None
+        assert (cohort.docs, cohort.total) == (expected.docs, expected.total)
+        assert cohort.df == dict(expected.df)
+        assert cohort.tf == dict(expected.tf)
+
+        everything = load_ngram_counts(corpus, phrases=["ratio debt", "missing phrase"])
+        assert everything is not None
+        assert everything.docs == len(_SECTIONS) + 1
+        assert everything.df == {"ratio debt": 4}
+
+        family = load_ngram_counts(corpus, scope="template_family", scope_value="fam_a")
+        assert family is not None and family.docs == 6  # d1, d3 and non-cohort d4
+        concept = load_ngram_counts(corpus, scope="concept", scope_value="negative_covenants")
+        assert concept is not None and concept.docs == 5
+        assert load_ngram_counts(corpus, scope="template_family", scope_value="none") is None
+        with pytest.raises(ValueError):
+            load_ngram_counts(corpus, scope="bogus")
+
+
+def test_corpus_background_matches_explicit_background(tmp_path: Path) -> None:
+    db_path = tmp_path / "corpus.duckdb"
+    _build_corpus(db_path)
+    targets = _texts(_FAMILY)
+    explicit = discover_dna_phrases(
+        targets, _texts(_FAMILY, exclude=True), min_section_rate=0.5, max_bg_rate=0.5,
+    )
+    assert explicit
+
+    target = count_ngrams(targets)
+    with CorpusIndex(db_path, enforce_schema=False) as corpus:
+        cohort = load_ngram_counts(corpus, scope="cohort", phrases=target.tf.keys())
+    assert cohort is not None
+    from_table = rank_dna_phrases(
+        target, subtract_counts(cohort, target), min_section_rate=0.5, max_bg_rate=0.5,
+    )
+    assert from_table == explicit
+
+
+def test_seeder_uses_table_when_present(tmp_path: Path) -> None:
+    from scripts.discovery_seeder import discover_anti_dna
+    from scripts.discovery_seeder import discover_dna_phrases as seeder_dna
+
+    db_path = tmp_path / "corpus.duckdb"
+    _build_corpus(db_path)
+    sections = [{"doc_id": d, "section_number": n} for d, n, _a, _t in _SECTIONS]
+    matched = [s for s in sections if (s["doc_id"], s["section_number"]) in _FAMILY]
+    non_matched = [s for s in sections if (s["doc_id"], s["section_number"]) not in _FAMILY]
+    with CorpusIndex(db_path, enforce_schema=False) as corpus:
+        result = seeder_dna(corpus, matched, non_matched)
+        anti = discover_anti_dna(corpus, matched, non_matched)
+    assert result["dna_background"] == "corpus"
+    assert "ratio debt" in result["dna_tier1"] + result["dna_tier2"]
+    assert "permitted liens" in anti["dna_negative_tier1"] + anti["dna_negative_tier2"]
@@ -0,0 +1,184 @@
+"""Tests for the pattern_tester library API and incremental re-evaluation."""
+from __future__ import annotations
+
+import importlib.util
+import json
+from dataclasses import replace
+from pathlib import Path
+from typing import Any
+
+import duckdb
+
+from agent.corpus import CorpusIndex
+from agent.strategy import Strategy
+
+_SECTIONS = [
+    # doc_id, section_number, heading, text
+    ("d1", "7.01", "Limitation on Indebtedness", "The Borrower shall not incur Indebtedness."),
+    ("d1", "7.02", "Liens", "No Liens except Permitted Liens."),
+    ("d2", "6.01", "Limitation on Debt", "The Borrower shall not incur Debt or Indebtedness."),
+    ("d3", "7.01", "Restricted Payments", "No dividends; restricted payments are limited."),
+    ("d4", "8.01", "Events of Default", "Failure to pay principal when due."),
+]
+
+
+def _load_pattern_tester_module() -> Any:
+    root = Path(__file__).resolve().parents[1]
+    script_path = root / "scripts" / "pattern_tester.py"
+    spec = importlib.util.spec_from_file_location("pattern_tester", script_path)
+    assert spec is not None
+    module = importlib.util.module_from_spec(spec)
+    assert spec.loader is not None
+    spec.loader.exec_module(module)
+    return module
+
+
+def _load_strategy_writer_module() -> Any:
+    root = Path(__file__).resolve().parents[1]
+    script_path = root / "scripts" / "strategy_writer.py"
+    spec = importlib.util.spec_from_file_location("strategy_writer", script_path)
+    assert spec is not None
+    module = importlib.util.module_from_spec(spec)
+    assert spec.loader is not None
+    spec.loader.exec_module(module)
+    return module
+
+
+def _build_db(path: Path) -> None:
+    con = duckdb.connect(str(path))
+    con.execute(
+        "CREATE TABLE _schema_version (table_name VARCHAR PRIMARY KEY, "
+        "version VARCHAR NOT NULL, created_at TIMESTAMP)"
+    )
+    con.execute("INSERT INTO _schema_version VALUES ('corpus', '0.2.0', current_timestamp)")
+    con.execute(
+        "CREATE TABLE documents (doc_id VARCHAR PRIMARY KEY, template_family VARCHAR, "
+        "cohort_included BOOLEAN)"
+    )
+    con.execute(
+        "CREATE TABLE sections (doc_id VARCHAR, section_number VARCHAR, heading VARCHAR, "
+        "char_start INTEGER, char_end INTEGER, article_num INTEGER, word_count INTEGER)"
+    )
+    con.execute("CREATE TABLE section_text (doc_id VARCHAR, section_number VARCHAR, text VARCHAR)")
+    for doc_id in ("d1", "d2", "d3", "d4", "d5"):  # d5 has no sections
+        con.execute("INSERT INTO documents VALUES (?, 'cluster_001', true)", [doc_id])
+    for i, (doc_id, number, heading, text) in enumerate(_SECTIONS):
+        con.execute(
+            "INSERT INTO sections VALUES (?, ?, ?, ?, ?, ?, ?)",
+            [doc_id, number, heading, i * 100, i * 100 + 90, int(number[0]), 40],
+        )
+        con.execute("INSERT INTO section_text VALUES (?, ?, ?)", [doc_id, number, text])
+    con.close()
+
+
+def _strategy(**updates: Any) -> Strategy:
+    base = Strategy(
+        concept_id="debt_capacity.indebtedness",
+        concept_name="Indebtedness",
+        family="indebtedness",
+        heading_patterns=("Limitation on Indebtedness",),
+        keyword_anchors=("indebtedness", "incur"),
+        dna_tier1=("shall not incur",),
+    )
+    return replace(base, **updates)
+
+
+def _comparable(result: Any) -> tuple[Any, ...]:
+    summary = {k: v for k, v in result.summary.items() if k != "incremental"}
+    return summary, result.hits, result.misses
+
+
+def test_incremental_rescores_only_docs_the_diff_can_affect(tmp_path: Path) -> None:
+    pt = _load_pattern_tester_module()
+    db_path = tmp_path / "corpus.duckdb"
+    _build_db(db_path)
+    doc_ids = ["d1", "d2", "d3", "d4", "d5"]
+
+    with CorpusIndex(db_path) as corpus:
+        baseline = pt.evaluate_strategy(corpus, _strategy(), doc_ids, run_id="r1")
+        assert baseline.rescored_doc_ids == doc_ids
+        assert baseline.summary["total_docs"] == 5
+
+        cases = {
+            # provenance / summary-only policy: nothing to rescore
+            "version": (_strategy(version=2, outlier_policy={"max_outlier_rate": 0.5}), []),
+            # new heading pattern only matches d2's heading
+            "heading": (
+                _strategy(heading_patterns=("Limitation on Indebtedness", "Limitation on Debt")),
+                ["d2"],
+            ),
+            # new DNA phrase only occurs in d3
+            "dna": (_strategy(dna_tier1=("shall not incur", "restricted payments")), ["d3"]),
+            # anchor count changed: every doc with any anchor moves
+            "anchors": (
+                _strategy(keyword_anchors=("indebtedness", "incur", "liens")),
+                ["d1", "d2"],
+            ),
+            # acceptance gate changed: full rescore
+            "gate": (_strategy(min_score_margin=0.2), doc_ids),
+        }
+        for name, (updated, expected) in cases.items():
+            full = pt.evaluate_strategy(corpus, updated, doc_ids, run_id="r2")
+            incremental = pt.evaluate_strategy(
+                corpus, updated, doc_ids, run_id="r2", baseline=baseline,
+            )
+            assert sorted(incremental.rescored_doc_ids) == expected, name
+            assert _comparable(incremental) == _comparable(full), name
+            assert incremental.summary["incremental"]["reused_docs"] == 5 - len(expected)
+
+        # Different run options never reuse outcomes.
+        settings = pt.ScoringSettings(hit_threshold=0.9)
+        rerun = pt.evaluate_strategy(
+            corpus, _strategy(), doc_ids, settings=settings, baseline=baseline,
+        )
+        assert rerun.summary["incremental"]["full_rescore"] is True
+
+
+def test_baseline_file_round_trip_and_strategy_writer_probe(tmp_path: Path) -> None:
+    pt = _load_pattern_tester_module()
+    db_path = tmp_path / "corpus.duckdb"
+    _build_db(db_path)
+    baseline_path = tmp_path / "baseline.json"
+
+    with CorpusIndex(db_path) as corpus:
+        first = pt.evaluate_strategy(corpus, _strategy(), ["d1", "d2", "d3"])
+        pt.save_baseline(first, baseline_path, corpus)
+        loaded = pt.load_baseline(baseline_path, corpus)
+        assert loaded is not None
+        assert loaded.strategy == first.strategy
+        assert loaded.outcomes == first.outcomes
+        # d4 is not in the baseline, so it is scored; d1-d3 are reused.
+        again = pt.evaluate_strategy(corpus, _strategy(), ["d1", "d2", "d3", "d4"], baseline=loaded)
+        assert again.rescored_doc_ids == ["d4"]
+
+    # A rebuilt corpus invalidates the baseline.
+    con = duckdb.connect(str(db_path))
+    con.execute("INSERT INTO documents VALUES ('d6', 'cluster_002', true)")
+    con.close()
+    with CorpusIndex(db_path) as corpus:
+        assert pt.load_baseline(baseline_path, corpus) is None
+
+    strategy_path = tmp_path / "strategy.json"
+    strategy_path.write_text(json.dumps({
+        "concept_id": "debt_capacity.indebtedness",
+        "concept_name": "Indebtedness",
+        "family": "indebtedness",
+        "heading_patterns": ["Limitation on Indebtedness"],
+        "keyword_anchors": ["indebtedness", "incur"],
+    }))
+    writer = _load_strategy_writer_module()
+    probe_baseline = tmp_path / "results" / "probe_baseline.json"
+    for expected_reused in (None, 6):
+        ok, _reason, details = writer.run_outlier_policy_probe(
+            strategy_path,
+            db_path,
+            {"sample_size": 25},
+            {},
+            {},
+            include_all=False,
+            baseline_path=probe_baseline,
+        )
+        assert ok is True
+        assert details["total_docs"] == 6
+        assert details.get("incremental", {}).get("reused_docs") == expected_reused
+    assert probe_baseline.exists()
@@ -0,0 +1,204 @@
+"""Tests for sub-expression-cached link preview evaluation."""
+from __future__ import annotations
+
+import asyncio
+from pathlib import Path
+
+import duckdb
+
+from agent.corpus import CorpusIndex
+from agent.link_store import LinkStore
+from agent.preview_engine import PreviewEngine, candidate_delta
+from agent.query_filters import build_multi_field_sql
+from agent.rule_dsl import parse_dsl
+from dashboard.api import server as dashboard_server
+
+_SECTIONS = [
+    # doc_id, section_number, heading, article_num
+    ("d1", "7.01", "Limitation on Indebtedness", 7),
+    ("d1", "7.02", "Liens", 7),
+    ("d1", "7.03", "Permitted Liens", 7),
+    ("d2", "6.01", "Limitation on Debt", 6),
+    ("d2", "6.02", None, 6),
+    ("d3", "7.01", "Restricted Payments", 7),
+]
+
+
+def _build_corpus(path: Path) -> None:
+    conn = duckdb.connect(str(path))
+    conn.execute("CREATE TABLE documents (doc_id VARCHAR, cohort_included BOOLEAN)")
+    conn.execute(
+        "CREATE TABLE sections (doc_id VARCHAR, section_number VARCHAR, heading VARCHAR, "
+        "char_start INTEGER, char_end INTEGER, article_num INTEGER, word_count INTEGER)"
+    )
+    conn.execute(
+        "CREATE TABLE articles (doc_id VARCHAR, article_num INTEGER, label VARCHAR, "
+        "title VARCHAR, concept VARCHAR)"
+    )
+    for doc_id in ("d1", "d2", "d3"):
+        conn.execute("INSERT INTO documents VALUES (?, true)", [doc_id])
+    for i, (doc_id, number, heading, article_num) in enumerate(_SECTIONS):
+        conn.execute(
+            "INSERT INTO sections VALUES (?, ?, ?, ?, ?, ?, 50)",
+            [doc_id, number, heading, i * 100, i * 100 + 90, article_num],
+        )
+    conn.execute(
+        "INSERT INTO articles VALUES ('d1', 7, 'VII', 'Negative Covenants', 'negative_covenants'), "
+        "('d2', 6, 'VI', 'Negative Covenants', 'negative_covenants'), "
+        "('d3', 7, 'VII', 'Payments', 'payments')"
+    )
+    conn.close()
+
+
+def _fields(dsl: str) -> dict:
+    result = parse_dsl(dsl)
+    assert result.ok, result.errors
+    return dict(result.text_fields)
+
+
+def _direct_keys(corpus: CorpusIndex, fields: dict) -> frozenset[str]:
+    where, params, joins = build_multi_field_sql(fields)
+    join_sql = "".join(f" {j}" for j in sorted(joins))
+    rows = corpus.query(
+        f"SELECT s.doc_id, s.section_number FROM sections s{join_sql} WHERE {where}", params,
+    )
+    return frozenset(f"{d}::{n}" for d, n in rows)
+
+
+def test_sub_expression_sets_match_sql_and_edits_reuse_them(tmp_path: Path) -> None:
+    db_path = tmp_path / "corpus.duckdb"
+    _build_corpus(db_path)
+    engine = PreviewEngine()
+    with CorpusIndex(db_path, enforce_schema=False) as corpus:
+        for dsl in (
+            "heading: liens",
+            "heading: (debt | indebtedness) & limitation",
+            "heading: liens & !permitted",
+            "heading: !liens",  # NULL headings match neither liens nor !liens
+            "heading: liens section: 7.0%",
+            "heading: limitation article: negative",
+        ):
+            fields = _fields(dsl)
+            assert engine.section_keys(corpus, "v1", fields) == _direct_keys(corpus, fields), dsl
+        assert engine.section_keys(corpus, "v1", {}) is None
+
+        # Tightening a heading term only evaluates the new term; the new AND
+        # group is the intersection with the cached set of the old one.
+        engine.section_keys(corpus, "v1", _fields("heading: limitation"))
+        before = engine.stats()
+        keys = engine.section_keys(corpus, "v1", _fields("heading: limitation & on"))
+        after = engine.stats()
+        assert keys == frozenset({"d1::7.01", "d2::6.01"})
+        assert after["hits"] - before["hits"] == 1  # "limitation"
+        assert after["misses"] - before["misses"] == 2  # the new AND group + "on"
+
+        # A new corpus version starts from an empty cache.
+        engine.section_keys(corpus, "v2", _fields("heading: limitation"))
+        assert engine.stats()["entries"] == 1
+
+
+def test_cache_is_bounded_by_total_keys_and_skips_large_sets(tmp_path: Path) -> None:
+    db_path = tmp_path / "corpus.duckdb"
+    _build_corpus(db_path)
+    engine = PreviewEngine(max_keys=3, max_set_keys=2)
+    with CorpusIndex(db_path, enforce_schema=False) as corpus:
+        # The OR group's 3 keys are over the limit: the caller compiles it
+        # inline; its leaves are cached.
+        fields = _fields("heading: liens | restricted")
+        assert engine.section_keys(corpus, "v1", fields) is None
+        stats = engine.stats()
+        assert (stats["entries"], stats["keys"], stats["skipped"]) == (2, 3, 1)
+
+        engine.clear()
+        engine.section_keys(corpus, "v1", _fields("heading: liens"))  # 2 keys
+        engine.section_keys(corpus, "v1", _fields("heading: restricted"))  # 1 key
+        assert (engine.stats()["entries"], engine.stats()["keys"]) == (2, 3)
+        engine.section_keys(corpus, "v1", _fields("heading: permitted"))  # 1 key
+        stats = engine.stats()
+        assert (stats["entries"], stats["keys"], stats["evictions"]) == (2, 2, 1)
+        engine.section_keys(corpus, "v1", _fields("heading: liens"))
+        assert engine.stats()["misses"] == 4  # "liens" was the LRU set evicted
+
+
+def test_broad_terms_are_scoped_and_never_materialized(tmp_path: Path) -> None:
+    db_path = tmp_path / "corpus.duckdb"
+    _build_corpus(db_path)
+    engine = PreviewEngine(max_set_keys=2)
+    with CorpusIndex(db_path, enforce_schema=False) as corpus:
+        # "!liens" matches 3 sections: it is only evaluated inside the
+        # bounded intersection of the AND group.
+        fields = _fields("heading: limitation & !liens")
+        assert engine.section_keys(corpus, "v1", fields) == _direct_keys(corpus, fields)
+        assert engine.section_keys(corpus, "v1", _fields("heading: !liens")) is None
+        # Fields that overflow are checked inside the bounded fields' keys.
+        fields = _fields("heading: limitation article: negative")
+        assert engine.section_keys(corpus, "v1", fields) == _direct_keys(corpus, fields)
+
+        # Within the candidate documents the same term is small enough.
+        scoped = engine.section_keys(corpus, "v1", _fields("heading: !liens"), doc_ids=["d1"])
+        assert scoped == frozenset({"d1::7.01"})
+        assert engine.section_keys(
+            corpus, "v1", _fields("heading: restricted"), doc_ids=["d1", "d2"],
+        ) == frozenset()
+
+
+def test_candidate_delta_reports_added_and_removed() -> None:
+    base = {
+        "d1::7.01::__section__": {"doc_id": "d1", "section_number": "7.01", "heading": "A"},
+        "d1::7.02::__section__": {"doc_id": "d1", "section_number": "7.02", "heading": "B"},
+    }
+    current = {
+        "d1::7.02::__section__": {"doc_id": "d1", "section_number": "7.02", "heading": "B"},
+        "d2::6.01::__section__": {"doc_id": "d2", "section_number": "6.01", "heading": "C"},
+    }
+    delta = candidate_delta(base, current)
+    assert (delta["added_count"], delta["removed_count"], delta["unchanged_count"]) == (1, 1, 1)
+    assert delta["added"][0]["candidate_id"] == "d2::6.01::__section__"
+    assert delta["removed"][0]["heading"] == "A"
+
+
+def test_create_preview_returns_delta_against_base_preview(monkeypatch, tmp_path: Path) -> None:
+    db_path = tmp_path / "corpus.duckdb"
+    _build_corpus(db_path)
+    corpus = CorpusIndex(db_path, enforce_schema=False)
+    store = LinkStore(tmp_path / "links.duckdb", create_if_missing=True)
+    monkeypatch.setattr(dashboard_server, "_corpus", corpus)
+    monkeypatch.setattr(dashboard_server, "_corpus_db_path", db_path)
+    monkeypatch.setattr(dashboard_server, "_corpus_version_memo", None)
+    monkeypatch.setattr(dashboard_server, "_link_store", store)
+    monkeypatch.setattr(dashboard_server, "_require_links_admin", lambda _request: None)
+    monkeypatch.setattr(dashboard_server, "_preview_engine", PreviewEngine())
+
+    def preview(**kwargs: object) -> dict:
+        body = dashboard_server.LinkPreviewRequest(family_id="debt_capacity.liens", **kwargs)
+        return asyncio.run(dashboard_server.create_preview(None, body))
+
+    try:
+        first = preview(filter_dsl="heading: liens")
+        assert first["candidate_count"] == 2
+        assert "delta" not in first
+
+        second = preview(
+            filter_dsl="heading: liens | debt", base_preview_id=first["preview_id"],
+        )
+        assert second["candidate_count"] == 4  # "debt" also matches "Indebtedness"
+        delta = second["delta"]
+        assert delta["base_preview_id"] == first["preview_id"]
+        assert [c["candidate_id"] for c in delta["added"]] == [
+            "d1::7.01::__section__", "d2::6.01::__section__",
+        ]
+        assert delta["removed"] == []
+
+        # Legacy heading AST previews go through the same cached sets.
+        third = preview(
+            heading_filter_ast={"type": "match", "value": "permitted"},
+            base_preview_id=second["preview_id"],
+        )
+        assert third["candidate_count"] == 1
+        assert third["delta"]["removed_count"] == 3
+        assert dashboard_server._preview_engine.stats()["hits"] >= 1
+
+        assert preview(filter_dsl="heading: liens", base_preview_id="missing")["delta"] is None
+    finally:
+        corpus.close()
+        store.close()
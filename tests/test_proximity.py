@@ -0,0 +1,183 @@
+"""Tests for agent.proximity (positional token index + proximity operators)."""
+from __future__ import annotations
+
+import duckdb
+
+from agent.proximity import (
+    SECTION_TOKENS_TABLE,
+    TokenPosition,
+    build_proximity_hits_sql,
+    build_proximity_sql,
+    build_section_token_index,
+    find_proximity_hits,
+    proximity_matches,
+    tokenize_positions,
+    validate_proximity_operands,
+)
+from agent.query_filters import FilterGroup, FilterMatch, build_multi_field_sql
+from agent.rule_dsl import ProximityOp, parse_dsl, validate_dsl
+
+_TEXT_A = (
+    "The Borrower shall not incur any Indebtedness. "
+    "Liens are permitted only as set forth below. \n \n "
+    "No Lien shall secure Indebtedness except Permitted Liens."
+)
+_TEXT_B = "The Borrower may incur Debt. Indebtedness is defined elsewhere."
+
+
+def _prox(dsl: str) -> ProximityOp:
+    result = parse_dsl(dsl)
+    assert result.ok, result.errors
+    expr = result.text_fields["clause"]
+    assert isinstance(expr, ProximityOp)
+    return expr
+
+
+def _make_token_db() -> duckdb.DuckDBPyConnection:
+    conn = duckdb.connect()
+    conn.execute(
+        "CREATE TABLE sections (doc_id VARCHAR, section_number VARCHAR, "
+        "heading VARCHAR, char_start INTEGER, char_end INTEGER)"
+    )
+    conn.execute(
+        "CREATE TABLE section_text (doc_id VARCHAR, section_number VARCHAR, text VARCHAR)"
+    )
+    for doc_id, text, start in (("d1", _TEXT_A, 100), ("d2", _TEXT_B, 0)):
+        conn.execute(
+            "INSERT INTO sections VALUES (?, '7.01', 'Indebtedness', ?, ?)",
+            [doc_id, start, start + len(text)],
+        )
+        conn.execute("INSERT INTO section_text VALUES (?, '7.01', ?)", [doc_id, text])
+    build_section_token_index(conn)
+    return conn
+
+
+def _matching_docs(conn: duckdb.DuckDBPyConnection, prox: ProximityOp) -> set[str]:
+    where, params = build_proximity_sql(prox)
+    rows = conn.execute(f"SELECT s.doc_id FROM sections s WHERE {where}", params).fetchall()
+    return {str(r[0]) for r in rows}
+
+
+class TestTokenizePositions:
+    def test_sentence_and_paragraph_ids(self) -> None:
+        tokens = tokenize_positions(_TEXT_A)
+        by_word: dict[str, TokenPosition] = {}
+        for t in tokens:
+            by_word.setdefault(t.token, t)
+        assert by_word["incur"].sentence_id == 0
+        assert by_word["liens"].sentence_id == 1
+        assert by_word["lien"].sentence_id == 2
+        assert by_word["liens"].paragraph_id == 0
+        assert by_word["lien"].paragraph_id == 1
+        assert [t.word_pos for t in tokens] == list(range(len(tokens)))
+
+    def test_offsets_are_shifted(self) -> None:
+        tokens = tokenize_positions("Section 2.01 Debt", offset=10)
+        assert [t.token for t in tokens] == ["section", "2", "01", "debt"]
+        assert tokens[0].char_start == 10
+        # "2.01" is not a sentence boundary.
+        assert {t.sentence_id for t in tokens} == {0}
+
+
+class TestInMemoryEvaluation:
+    def test_same_sentence(self) -> None:
+        assert proximity_matches(_prox('clause: "incur" /s "Indebtedness"'), _TEXT_A)
+        assert not proximity_matches(_prox('clause: "incur" /s "Indebtedness"'), _TEXT_B)
+
+    def test_same_paragraph(self) -> None:
+        prox = _prox('clause: "incur" /p "Liens"')
+        assert proximity_matches(prox, _TEXT_A)
+        assert not proximity_matches(_prox('clause: "incur" /p "Permitted Liens"'), _TEXT_A)
+
+    def test_within_n_words(self) -> None:
+        assert proximity_matches(_prox('clause: "incur" /2 "Indebtedness"'), _TEXT_A)
+        assert not proximity_matches(_prox('clause: "incur" /1 "Indebtedness"'), _TEXT_A)
+
+    def test_prefix_and_or_operands(self) -> None:
+        assert proximity_matches(_prox('clause: "indebted%" /s "secure"'), _TEXT_A)
+        assert proximity_matches(_prox('clause: (Debt | Lien) /s "incur"'), _TEXT_B)
+
+    def test_negated_term_excludes_section(self) -> None:
+        prox = ProximityOp(
+            left=FilterGroup(
+                operator="and",
+                children=(FilterMatch(value="incur"), FilterMatch(value="Lien", negate=True)),
+            ),
+            right=FilterMatch(value="Indebtedness"),
+            kind="sentence",
+        )
+        assert not proximity_matches(prox, _TEXT_A)
+
+    def test_hits_cover_both_operands(self) -> None:
+        hits = find_proximity_hits(_prox('clause: "incur" /s "Indebtedness"'), _TEXT_A, offset=5)
+        start, end = hits[0]
+        assert _TEXT_A[start - 5:end - 5] == "incur any Indebtedness"
+
+
+class TestValidation:
+    def test_regex_operand_rejected(self) -> None:
+        prox = ProximityOp(
+            left=FilterMatch(value="/incur\\w+/"),
+            right=FilterMatch(value="Debt"),
+            kind="sentence",
+        )
+        errors = validate_proximity_operands(prox)
+        assert errors and "left" in errors[0]
+
+    def test_validate_dsl_surfaces_operand_errors(self) -> None:
+        result = validate_dsl('clause: "incur" /s "Debt"')
+        assert result.ok
+        result = validate_dsl('clause: "senior debt%" /s "incur"')
+        assert not result.ok
+
+
+class TestSqlEvaluation:
+    def test_index_rows_match_tokenizer(self) -> None:
+        conn = _make_token_db()
+        count = conn.execute(
+            f"SELECT COUNT(*) FROM {SECTION_TOKENS_TABLE} WHERE doc_id = 'd1'",
+        ).fetchone()[0]
+        assert count == len(tokenize_positions(_TEXT_A))
+
+    def test_sql_agrees_with_in_memory(self) -> None:
+        conn = _make_token_db()
+        texts = {"d1": _TEXT_A, "d2": _TEXT_B}
+        for dsl in (
+            'clause: "incur" /s "Indebtedness"',
+            'clause: "incur" /p "Liens"',
+            'clause: "incur" /1 "Indebtedness"',
+            'clause: "Borrower" /3 "incur"',
+            'clause: "indebted%" /s "secure"',
+            'clause: "Permitted Liens" /5 Lien',
+        ):
+            prox = _prox(dsl)
+            expected = {d for d, t in texts.items() if proximity_matches(prox, t)}
+            assert _matching_docs(conn, prox) == expected, dsl
+
+    def test_hit_spans_are_document_global(self) -> None:
+        conn = _make_token_db()
+        prox = _prox('clause: "incur" /s "Indebtedness"')
+        sql, params = build_proximity_hits_sql(prox)
+        rows = conn.execute(sql, params).fetchall()
+        expected = find_proximity_hits(prox, _TEXT_A, offset=100)
+        assert [(r[0], r[2], r[3]) for r in rows] == [("d1", *expected[0])]
+
+    def test_partial_refresh_replaces_doc_postings(self) -> None:
+        conn = _make_token_db()
+        conn.execute("UPDATE section_text SET text = 'Nothing here' WHERE doc_id = 'd1'")
+        build_section_token_index(conn, doc_ids=["d1"])
+        assert _matching_docs(conn, _prox('clause: "incur" /s "Indebtedness"')) == set()
+
+    def test_multi_field_sql_uses_index_or_prefilter(self) -> None:
+        conn = _make_token_db()
+        fields = {"clause": _prox('clause: "incur" /s "Indebtedness"')}
+        where, params, _ = build_multi_field_sql(fields)
+        assert SECTION_TOKENS_TABLE in where
+        rows = conn.execute(f"SELECT s.doc_id FROM sections s WHERE {where}", params).fetchall()
+        assert {r[0] for r in rows} == {"d1"}
+
+        where, params, _ = build_multi_field_sql(fields, positional_index=False)
+        assert SECTION_TOKENS_TABLE not in where
+        rows = conn.execute(f"SELECT s.doc_id FROM sections s WHERE {where}", params).fetchall()
+        # Prefilter is a superset: d2 contains both words in different sentences.
+        assert {r[0] for r in rows} == {"d1", "d2"}
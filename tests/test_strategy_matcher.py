@@ -0,0 +1,53 @@
+"""Tests for agent.strategy_matcher — compiled per-strategy signals."""
+from __future__ import annotations
+
+from agent.strategy import Strategy
+from agent.strategy_matcher import strategy_matcher
+from agent.textmatch import heading_matches, keyword_density, section_dna_density
+
+
+def _strategy() -> Strategy:
+    return Strategy(
+        concept_id="debt_capacity.indebtedness",
+        concept_name="Indebtedness",
+        family="indebtedness",
+        heading_patterns=("Limitation on Indebtedness", "Debt"),
+        keyword_anchors=("indebtedness", "permitted debt", "liens"),
+        dna_tier1=("permitted debt",),
+        dna_tier2=("borrower", "ratio debt"),
+        dna_negative_tier1=("restricted payment",),
+        negative_keyword_patterns=(r"dividend(s)?\b", "[unbalanced", ""),
+    )
+
+
+def test_signals_match_textmatch_functions() -> None:
+    strategy = _strategy()
+    text = "the borrower shall not incur indebtedness other than permitted debt"
+    signals = strategy_matcher(strategy).signals("Section 7.01 Indebtedness", text)
+
+    kw_density, kw_hits = keyword_density(text, list(strategy.keyword_anchors))
+    dna_density, dna_hits = section_dna_density(
+        text, list(strategy.dna_tier1), list(strategy.dna_tier2),
+    )
+    assert signals.heading_pattern == heading_matches(
+        "Section 7.01 Indebtedness", list(strategy.heading_patterns),
+    )
+    assert (signals.keyword_density, signals.keyword_hits) == (kw_density, kw_hits)
+    assert (signals.dna_density, signals.dna_hits) == (dna_density, dna_hits)
+    assert signals.negative_keyword_hits == 0
+    assert signals.negative_dna_density == 0.0
+
+
+def test_negative_channels_and_cache() -> None:
+    strategy = _strategy()
+    matcher = strategy_matcher(strategy)
+    assert strategy_matcher(_strategy()) is matcher
+
+    text = "no restricted payment or dividends; see [unbalanced bracket"
+    signals = matcher.signals("Restricted Payments", text, negatives=True)
+    assert signals.heading_pattern is None
+    assert signals.negative_keyword_hits == 2
+    assert signals.negative_dna_density > 0
+
+    clause = matcher.clause_signals({"a": "Permitted Debt", "b": "Liens"})
+    assert list(clause) == ["a"]
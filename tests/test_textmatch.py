@@ -1,6 +1,7 @@
 """Tests for agent.textmatch module."""
 from agent.textmatch import (
     PhraseHit,
+    PhraseMatcher,
     heading_matches,
     keyword_density,
     score_in_range,
@@ -114,3 +115,26 @@ class TestKeywordDensity:
         text = "hello world"
         _, hits = keyword_density(text, ["world"])
         assert hits[0].char_offset == 6
+
+
+class TestPhraseMatcher:
+    def test_scan_matches_per_channel_functions(self) -> None:
+        text = "the borrower shall not incur indebtedness except permitted debt"
+        kws = ["Indebtedness", "liens", "indebtedness"]
+        t1, t2 = ["permitted debt"], ["borrower", "indebtedness"]
+        matcher = PhraseMatcher(
+            {"kw": kws, "t1": t1, "t2": t2}, tiers={"t2": 2},
+        )
+        hits = matcher.scan(text)
+        assert hits["kw"] == keyword_density(text, kws)[1]
+        assert hits["t1"] + hits["t2"] == section_dna_density(text, t1, t2)[1]
+        assert matcher.channel_size("kw") == 3
+        assert list(matcher.scan(text, ["t1"])) == ["t1"]
+
+    def test_match_heading_agrees_with_heading_matches(self) -> None:
+        patterns = ["Limitation on Debt", "Indebtedness"]
+        matcher = PhraseMatcher({"heading": patterns})
+        for heading in ("Section 7.01 INDEBTEDNESS", "Limitationon Debt", "Liens"):
+            assert matcher.match_heading(heading, "heading") == heading_matches(
+                heading, patterns,
+            )
@@ -0,0 +1,179 @@
+"""Tests for agent.tool_daemon / agent.tool_client."""
+from __future__ import annotations
+
+import json
+import os
+import signal
+import socket
+import subprocess
+import sys
+import threading
+import time
+from pathlib import Path
+
+import duckdb
+import pytest
+
+from agent.tool_client import PING, ToolRequestLost, call_tool
+from agent.tool_daemon import _DatabasePins, _db_paths, load_tool, run_tool_in_process
+
+ROOT = Path(__file__).resolve().parents[1]
+
+_FAKE_TOOL = '''
+import json
+import logging
+import os
+import sys
+
+
+def main():
+    logging.basicConfig(level=logging.INFO, force=True)
+    logging.info("to stderr")
+    if sys.argv[1:] == ["--boom"]:
+        raise ValueError("boom")
+    if sys.argv[1:] == ["--env"]:
+        print(os.environ.get("AGENT_CONCEPT_WHITELIST", "<unset>"))
+        return 0
+    sys.stdout.buffer.write(json.dumps({"argv": sys.argv[1:]}).encode() + b"\\n")
+    print(os.getcwd())
+    sys.exit(3)
+'''
+
+
+def test_run_tool_in_process_captures_output_and_restores_state(tmp_path: Path) -> None:
+    (tmp_path / "fake_tool.py").write_text(_FAKE_TOOL)
+    module = load_tool("fake_tool", tmp_path)
+    saved_argv, saved_cwd = list(sys.argv), os.getcwd()
+    root_handlers = list(__import__("logging").getLogger().handlers)
+
+    result = run_tool_in_process(module, ["--x", "1"], cwd=tmp_path)
+    assert result.exit_code == 3
+    assert result.stdout.splitlines() == [b'{"argv": ["--x", "1"]}', str(tmp_path).encode()]
+    assert b"to stderr" in result.stderr
+
+    crashed = run_tool_in_process(module, ["--boom"], cwd=tmp_path)
+    assert crashed.exit_code == 1
+    assert b"ValueError: boom" in crashed.stderr
+    assert sys.argv == saved_argv
+    assert os.getcwd() == saved_cwd
+    assert __import__("logging").getLogger().handlers == root_handlers
+
+
+def test_run_tool_in_process_applies_and_restores_agent_env(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    (tmp_path / "fake_tool.py").write_text(_FAKE_TOOL)
+    module = load_tool("fake_tool", tmp_path)
+    monkeypatch.setenv("AGENT_CONCEPT_WHITELIST", "daemon_value")
+
+    forwarded = run_tool_in_process(
+        module, ["--env"], cwd=tmp_path, env={"AGENT_CONCEPT_WHITELIST": "debt.*"},
+    )
+    assert forwarded.stdout == b"debt.*\n"
+    # The daemon's own AGENT_* settings never reach a request that lacks them.
+    unset = run_tool_in_process(module, ["--env"], cwd=tmp_path, env={})
+    assert unset.stdout == b"<unset>\n"
+    assert os.environ["AGENT_CONCEPT_WHITELIST"] == "daemon_value"
+
+
+def test_call_tool_reports_a_request_lost_after_sending(tmp_path: Path) -> None:
+    socket_path = tmp_path / "lost.sock"
+    with pytest.raises(OSError) as unavailable:
+        call_tool("section_reader", [], socket_path=socket_path)
+    assert not isinstance(unavailable.value, ToolRequestLost)
+
+    listener = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    listener.bind(str(socket_path))
+    listener.listen(1)
+    received: list[bytes] = []
+
+    def accept_then_drop() -> None:
+        conn, _ = listener.accept()
+        with conn, conn.makefile("rb") as stream:
+            received.append(stream.readline())
+
+    thread = threading.Thread(target=accept_then_drop)
+    thread.start()
+    try:
+        with pytest.raises(ToolRequestLost):
+            call_tool(
+                "strategy_writer", ["--x"], socket_path=socket_path,
+                env={"AGENT_CONCEPT_WHITELIST": "debt.*", "HOME": "/root"},
+            )
+    finally:
+        thread.join(timeout=10)
+        listener.close()
+    request = json.loads(received[0])
+    assert request["env"] == {"AGENT_CONCEPT_WHITELIST": "debt.*"}
+
+
+def test_db_paths_and_pins_follow_replaced_files(tmp_path: Path) -> None:
+    assert _db_paths(["--db", "a.duckdb", "--x", "--db=/abs/b.duckdb"], tmp_path) == [
+        tmp_path / "a.duckdb",
+        Path("/abs/b.duckdb"),
+    ]
+
+    db = tmp_path / "corpus.duckdb"
+
+    def write_db(path: Path, value: int) -> None:
+        con = duckdb.connect(str(path))
+        con.execute("CREATE TABLE t AS SELECT ? AS v", [value])
+        con.close()
+
+    write_db(db, 1)
+    pins = _DatabasePins()
+    pins.pin(db)
+    con = duckdb.connect(str(db), read_only=True)
+    assert con.execute("SELECT v FROM t").fetchone() == (1,)
+    con.close()
+
+    # A rebuild replaces the file; re-pinning must not serve the old one.
+    write_db(tmp_path / "next.duckdb", 2)
+    os.replace(tmp_path / "next.duckdb", db)
+    pins.pin(db)
+    con = duckdb.connect(str(db), read_only=True)
+    assert con.execute("SELECT v FROM t").fetchone() == (2,)
+    con.close()
+    pins.release_all()
+    assert len(pins) == 0
+
+
+def test_daemon_matches_direct_cli_run(tmp_path: Path) -> None:
+    socket_path = tmp_path / "tools.sock"
+    env = {**os.environ, "PYTHONPATH": str(ROOT / "src")}
+    proc = subprocess.Popen(
+        [
+            sys.executable, str(ROOT / "scripts" / "tool_daemon.py"),
+            "--socket", str(socket_path),
+            "serve", "--workers", "1", "--tools", "section_reader",
+        ],
+        env=env,
+        stderr=subprocess.DEVNULL,
+    )
+    try:
+        deadline = time.monotonic() + 30
+        while True:
+            try:
+                status = call_tool(PING, [], socket_path=socket_path)
+                break
+            except OSError:
+                assert time.monotonic() < deadline, "daemon did not start"
+                time.sleep(0.1)
+        assert b'"section_reader"' in status.stdout
+
+        args = ["--db", "missing.duckdb", "--doc-id", "x"]
+        served = call_tool("section_reader", args, socket_path=socket_path, cwd=tmp_path)
+        direct = subprocess.run(
+            [sys.executable, str(ROOT / "scripts" / "section_reader.py"), *args],
+            cwd=tmp_path,
+            env=env,
+            capture_output=True,
+        )
+        assert (served.exit_code, served.stdout, served.stderr) == (
+            direct.returncode, direct.stdout, direct.stderr,
+        )
+        assert call_tool("pattern_tester", [], socket_path=socket_path).unknown_tool
+    finally:
+        proc.send_signal(signal.SIGTERM)
+        proc.wait(timeout=30)
+    assert not socket_path.exists()